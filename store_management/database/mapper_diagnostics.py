@@ -1,4 +1,3 @@
-from database.models.base import metadata
 # database/mapper_diagnostics.py
 import logging
 import sqlalchemy
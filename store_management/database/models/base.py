@@ -1,4 +1,5 @@
 # database/models/base.py
+import os
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -11,6 +12,39 @@ class Base(DeclarativeBase):
     metadata = MetaData()
 
 
+# Environment variable that turns accidental lazy loads into errors
+STRICT_LOADING_ENV = "STORE_MANAGEMENT_STRICT_LOADING"
+
+
+def strict_loading_enabled() -> bool:
+    """
+    Check whether strict relationship loading is switched on.
+
+    Returns:
+        True if the STORE_MANAGEMENT_STRICT_LOADING environment variable is set to a true value
+    """
+    return os.environ.get(STRICT_LOADING_ENV, "").lower() in ("1", "true", "yes")
+
+
+# Default loader strategy for model relationships. Nothing is eager-loaded by default;
+# repositories name the relationships each use case needs through loader profiles
+# (database.repositories.loader_profiles). Under strict loading, any relationship
+# that was not loaded that way raises instead of quietly issuing a query, which is
+# how the tests catch missing profile entries. The strategy is fixed when the models
+# are mapped, so the variable must be set before they are imported.
+RELATIONSHIP_LAZY = "raise_on_sql" if strict_loading_enabled() else "select"
+
+
+# Length limits ValidationMixin enforces on common string fields
+DEFAULT_MAX_LENGTHS = {
+    'name': 255,
+    'description': 500,
+    'email': 255,
+    'created_by': 100,
+    'last_modified_by': 100
+}
+
+
 # Move validate_length out of Base to be a standalone function
 def validate_length(key, value, max_lengths=None):
     """
@@ -28,13 +62,7 @@ def validate_length(key, value, max_lengths=None):
         ValueError: If validation fails
     """
     if not max_lengths:
-        max_lengths = {
-            'name': 255,
-            'description': 500,
-            'email': 255,
-            'created_by': 100,
-            'last_modified_by': 100
-        }
+        max_lengths = DEFAULT_MAX_LENGTHS
 
     if isinstance(value, str) and key in max_lengths and len(value) > max_lengths[key]:
         raise ValueError(f"{key} cannot exceed {max_lengths[key]} characters")
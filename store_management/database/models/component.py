@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import Enum, JSON, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from database.models.base import AbstractBase, ValidationMixin, ModelValidationError
+from database.models.base import AbstractBase, ValidationMixin, ModelValidationError, RELATIONSHIP_LAZY
 from database.models.enums import ComponentType
 from database.models.component_material import component_material_table
 
@@ -64,7 +64,7 @@ class Component(AbstractBase, ValidationMixin):
         "PickingListItem",
         back_populates="component",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     # These relationships will be added back later
@@ -82,6 +82,12 @@ class Component(AbstractBase, ValidationMixin):
     #     lazy="selectin"
     # )
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'name': {'required': True},
+        'component_type': {'required': True},
+    }
+
     def __init__(self, **kwargs):
         """
         Initialize a Component instance with validation.
@@ -52,6 +52,13 @@ class ComponentMaterial(Base, ValidationMixin):
         back_populates="component_materials"
     )
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'component_id': {'required': True, 'gt': 0},
+        'material_id': {'required': True, 'gt': 0},
+        'quantity': {'required': True, 'gt': 0},
+    }
+
     def __init__(self, component_id, material_id, quantity=1.0):
         self.component_id = component_id
         self.material_id = material_id
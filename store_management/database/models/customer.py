@@ -9,7 +9,7 @@ from typing import Any, Dict, Optional
 from sqlalchemy import Enum, JSON, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from database.models.base import AbstractBase, ModelValidationError, ValidationMixin
+from database.models.base import AbstractBase, ModelValidationError, ValidationMixin, RELATIONSHIP_LAZY
 from database.models.enums import CustomerStatus, CustomerTier, CustomerSource
 
 
@@ -51,9 +51,17 @@ class Customer(AbstractBase, ValidationMixin):
         "Sales",
         back_populates="customer",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'first_name': {'required': True},
+        'last_name': {'required': True},
+        'email': {'required': True},
+        'status': {'required': True},
+    }
+
     def __init__(self, **kwargs):
         """
         Initialize a Customer instance with validation.
@@ -195,6 +195,7 @@ class InventoryStatus(Enum):
     SUFFICIENT = "sufficient"
     LOW_STOCK = "low_stock"
     CRITICALLY_LOW = "critically_low"
+    PENDING_REORDER = "pending_reorder"
     OUT_OF_STOCK = "out_of_stock"
     DISCONTINUED = "discontinued"
     ON_ORDER = "on_order"
@@ -1355,6 +1356,14 @@ class StorageLocationType(Enum):
     OTHER = "other"
 
 
+class StorageLocationLevel(Enum):
+    """Enumeration of levels in the storage location hierarchy, outermost first."""
+    ZONE = "zone"
+    AISLE = "aisle"
+    SHELF = "shelf"
+    BIN = "bin"
+
+
 # Measurement and Quality Enums
 class MeasurementUnit(Enum):
     """Enumeration of measurement units."""
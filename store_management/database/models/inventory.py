@@ -5,11 +5,44 @@ This module defines the Inventory model for the leatherworking application.
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import Column, Enum, Float, ForeignKey, Integer, JSON, String, Text, UniqueConstraint, and_
+from sqlalchemy import (
+    DDL, Boolean, Column, Enum, Float, ForeignKey, Index, Integer, JSON, String, Text, UniqueConstraint, and_, case,
+    event, literal, text
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from database.models.base import AbstractBase, AuditMixin, ModelValidationError, TrackingMixin, ValidationMixin
+from database.models.base import AbstractBase, AuditMixin, ModelValidationError, TrackingMixin, ValidationMixin, RELATIONSHIP_LAZY
 from database.models.enums import InventoryAdjustmentType, InventoryStatus, TransactionType
+from database.schema_upgrade import register_upgrade
+
+# Statuses that mean an item needs replenishing; rows in these states carry low_stock = 1
+REORDER_STATUSES = (
+    InventoryStatus.OUT_OF_STOCK,
+    InventoryStatus.LOW_STOCK,
+    InventoryStatus.PENDING_REORDER,
+)
+
+
+def compute_status(quantity: float, min_stock_level: Optional[float],
+                   reorder_point: Optional[float]) -> InventoryStatus:
+    """
+    Compute the inventory status for a quantity and its thresholds.
+
+    Args:
+        quantity: Quantity in stock
+        min_stock_level: Low stock threshold, if any
+        reorder_point: Reorder threshold, if any
+
+    Returns:
+        The status; mirrored in SQL by Inventory.status_expression()
+    """
+    if quantity <= 0:
+        return InventoryStatus.OUT_OF_STOCK
+    if min_stock_level is not None and quantity <= min_stock_level:
+        return InventoryStatus.LOW_STOCK
+    if reorder_point is not None and quantity <= reorder_point:
+        return InventoryStatus.PENDING_REORDER
+    return InventoryStatus.IN_STOCK
 
 
 class Inventory(AbstractBase, ValidationMixin, AuditMixin, TrackingMixin):
@@ -24,7 +57,9 @@ class Inventory(AbstractBase, ValidationMixin, AuditMixin, TrackingMixin):
         min_stock_level: Threshold for low stock warning
         reorder_point: Quantity at which to reorder
         reorder_quantity: Standard quantity to reorder
-        storage_location: Physical storage location
+        low_stock: Denormalized flag set while status is one of REORDER_STATUSES
+        storage_location: Physical storage location code (mirrors location.code when location_id is set)
+        location_id: Foreign key to the storage location hierarchy
         location_details: Additional location information (aisle, shelf, bin, etc.)
         last_count_date: Date of last physical inventory count
         last_movement_date: Date of last inventory movement
@@ -35,6 +70,11 @@ class Inventory(AbstractBase, ValidationMixin, AuditMixin, TrackingMixin):
     __tablename__ = 'inventory'
     __table_args__ = (
         UniqueConstraint('item_type', 'item_id', name='uix_inventory_item'),
+        Index('ix_inventory_status', 'status'),
+        # Partial index: only rows that need replenishing are indexed, so dashboard
+        # counts and the reorder path read a small set instead of scanning the table
+        Index('ix_inventory_low_stock', 'item_type', 'item_id',
+              sqlite_where=text('low_stock = 1'), postgresql_where=text('low_stock')),
         {"extend_existing": True}
     )
 
@@ -48,8 +88,15 @@ class Inventory(AbstractBase, ValidationMixin, AuditMixin, TrackingMixin):
     min_stock_level: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     reorder_point: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     reorder_quantity: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    low_stock: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     storage_location: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    location_id: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        ForeignKey('storage_locations.id', ondelete='SET NULL'),
+        nullable=True,
+        index=True
+    )
     location_details: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
 
     last_count_date: Mapped[Optional[datetime]] = mapped_column(nullable=True)
@@ -68,7 +115,7 @@ class Inventory(AbstractBase, ValidationMixin, AuditMixin, TrackingMixin):
         foreign_keys="[Inventory.item_id]",
         back_populates="inventory",
         uselist=False,
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
         overlaps="inventory"  # Add this parameter
     )
 
@@ -78,7 +125,7 @@ class Inventory(AbstractBase, ValidationMixin, AuditMixin, TrackingMixin):
         foreign_keys="[Inventory.item_id]",
         back_populates="inventory",
         uselist=False,
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
         overlaps="inventory,material"  # Add this parameter
     )
 
@@ -88,10 +135,25 @@ class Inventory(AbstractBase, ValidationMixin, AuditMixin, TrackingMixin):
         foreign_keys="[Inventory.item_id]",
         back_populates="inventory",
         uselist=False,
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
         overlaps="inventory,inventory,material,product"  # Add this parameter
     )
 
+    location = relationship(
+        "StorageLocation",
+        foreign_keys="[Inventory.location_id]",
+        lazy="select"
+    )
+
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'quantity': {'min': 0},
+        'item_type': {'choices': ('material', 'product', 'tool')},
+        'min_stock_level': {'min': 0},
+        'reorder_point': {'min': 0},
+        'reorder_quantity': {'gt': 0},
+    }
+
     def __init__(self, **kwargs):
         """
         Initialize an Inventory instance with validation.
@@ -107,6 +169,8 @@ class Inventory(AbstractBase, ValidationMixin, AuditMixin, TrackingMixin):
         # Set default status based on quantity
         if 'status' not in kwargs:
             self._update_status()
+        else:
+            self.low_stock = self.status in REORDER_STATUSES
 
         # Initialize location_details if not provided
         if not self.location_details:
@@ -114,6 +178,28 @@ class Inventory(AbstractBase, ValidationMixin, AuditMixin, TrackingMixin):
 
         self.validate()
 
+    @classmethod
+    def prepare_bulk_columns(cls, columns: Dict[str, List[Any]], size: int) -> None:
+        """
+        Fill the derived columns of a bulk load, as __init__ does for one instance.
+
+        Args:
+            columns: Validated values by attribute name, one list per column
+            size: Number of rows
+        """
+        quantities = columns['quantity']
+        min_levels = columns.get('min_stock_level') or [None] * size
+        reorder_points = columns.get('reorder_point') or [None] * size
+        statuses = columns.get('status') or [None] * size
+        columns['status'] = [
+            status if status is not None else compute_status(quantity, min_level, reorder_point)
+            for status, quantity, min_level, reorder_point in zip(statuses, quantities, min_levels, reorder_points)
+        ]
+        columns['low_stock'] = [status in REORDER_STATUSES for status in columns['status']]
+        for key, empty in (('transaction_history', list), ('location_details', dict)):
+            values = columns.get(key) or [None] * size
+            columns[key] = [value if value else empty() for value in values]
+
     def validate(self) -> None:
         """
         Validate inventory data.
@@ -143,16 +229,54 @@ class Inventory(AbstractBase, ValidationMixin, AuditMixin, TrackingMixin):
 
     def _update_status(self) -> None:
         """
-        Update inventory status based on current quantity and thresholds.
+        Update inventory status and the low-stock flag based on current quantity and thresholds.
+
+        Mirrors status_expression(), which applies the same rules in SQL.
         """
-        if self.quantity <= 0:
-            self.status = InventoryStatus.OUT_OF_STOCK
-        elif self.min_stock_level is not None and self.quantity <= self.min_stock_level:
-            self.status = InventoryStatus.LOW_STOCK
-        elif self.reorder_point is not None and self.quantity <= self.reorder_point:
-            self.status = InventoryStatus.PENDING_REORDER
-        else:
-            self.status = InventoryStatus.IN_STOCK
+        self.status = compute_status(self.quantity, self.min_stock_level, self.reorder_point)
+        self.low_stock = self.status in REORDER_STATUSES
+
+    @classmethod
+    def status_expression(cls, quantity=None):
+        """
+        Build a SQL CASE expression computing status from quantity and thresholds.
+
+        Args:
+            quantity: Optional SQL expression for the quantity (defaults to the quantity column),
+                allowing a quantity change and its status to be written in one UPDATE
+
+        Returns:
+            SQL expression evaluating to an InventoryStatus
+        """
+        quantity = cls.quantity if quantity is None else quantity
+        status_type = cls.__table__.c.status.type
+        return case(
+            (quantity <= 0, literal(InventoryStatus.OUT_OF_STOCK, status_type)),
+            (and_(cls.min_stock_level.isnot(None), quantity <= cls.min_stock_level),
+             literal(InventoryStatus.LOW_STOCK, status_type)),
+            (and_(cls.reorder_point.isnot(None), quantity <= cls.reorder_point),
+             literal(InventoryStatus.PENDING_REORDER, status_type)),
+            else_=literal(InventoryStatus.IN_STOCK, status_type)
+        )
+
+    @classmethod
+    def low_stock_expression(cls, quantity=None):
+        """
+        Build a SQL expression computing the low-stock flag from quantity and thresholds.
+
+        Args:
+            quantity: Optional SQL expression for the quantity (defaults to the quantity column)
+
+        Returns:
+            Boolean SQL expression
+        """
+        quantity = cls.quantity if quantity is None else quantity
+        return case(
+            (quantity <= 0, True),
+            (and_(cls.min_stock_level.isnot(None), quantity <= cls.min_stock_level), True),
+            (and_(cls.reorder_point.isnot(None), quantity <= cls.reorder_point), True),
+            else_=False
+        )
 
     def update_quantity(self, change: float, transaction_type: TransactionType,
                         reference_type: Optional[str] = None, reference_id: Optional[int] = None,
@@ -326,4 +450,137 @@ class Inventory(AbstractBase, ValidationMixin, AuditMixin, TrackingMixin):
         if self.last_movement_date is None:
             return None
         delta = datetime.now() - self.last_movement_date
-        return delta.days
\ No newline at end of file
+        return delta.days
+
+
+# SQLite triggers keep status and low_stock in step with quantity for writes that
+# bypass the ORM (raw SQL, Core bulk statements). Enum columns store member names.
+_REORDER_STATUS_NAMES = ", ".join(f"'{status.name}'" for status in REORDER_STATUSES)
+
+_INVENTORY_STOCK_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_inventory_stock_insert
+    AFTER INSERT ON inventory
+    BEGIN
+        UPDATE inventory SET low_stock = (status IN ({_REORDER_STATUS_NAMES}))
+        WHERE id = NEW.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_inventory_stock_quantity
+    AFTER UPDATE OF quantity, min_stock_level, reorder_point ON inventory
+    BEGIN
+        UPDATE inventory SET status = CASE
+            WHEN NEW.quantity <= 0 THEN 'OUT_OF_STOCK'
+            WHEN NEW.min_stock_level IS NOT NULL AND NEW.quantity <= NEW.min_stock_level THEN 'LOW_STOCK'
+            WHEN NEW.reorder_point IS NOT NULL AND NEW.quantity <= NEW.reorder_point THEN 'PENDING_REORDER'
+            ELSE 'IN_STOCK'
+        END
+        WHERE id = NEW.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_inventory_stock_status
+    AFTER UPDATE OF status ON inventory
+    BEGIN
+        UPDATE inventory SET low_stock = (NEW.status IN ({_REORDER_STATUS_NAMES}))
+        WHERE id = NEW.id;
+    END
+    """,
+)
+
+# Occupancy triggers: every storage location carries the item count and quantity of its
+# whole subtree, so each inventory change adjusts the location and all its ancestors.
+# A location is an ancestor-or-self of L when its path is a prefix of L's path.
+_ANCESTORS_OF = (
+    "substr((SELECT path FROM storage_locations WHERE id = {ref}.location_id), 1, length(path)) = path"
+)
+
+_INVENTORY_OCCUPANCY_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_inventory_location_insert
+    AFTER INSERT ON inventory WHEN NEW.location_id IS NOT NULL
+    BEGIN
+        UPDATE storage_locations
+        SET item_count = item_count + 1, total_quantity = total_quantity + NEW.quantity
+        WHERE {_ANCESTORS_OF.format(ref='NEW')};
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_inventory_location_update
+    AFTER UPDATE OF location_id, quantity ON inventory
+    BEGIN
+        UPDATE storage_locations
+        SET item_count = item_count - 1, total_quantity = total_quantity - OLD.quantity
+        WHERE {_ANCESTORS_OF.format(ref='OLD')};
+        UPDATE storage_locations
+        SET item_count = item_count + 1, total_quantity = total_quantity + NEW.quantity
+        WHERE {_ANCESTORS_OF.format(ref='NEW')};
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_inventory_location_delete
+    AFTER DELETE ON inventory WHEN OLD.location_id IS NOT NULL
+    BEGIN
+        UPDATE storage_locations
+        SET item_count = item_count - 1, total_quantity = total_quantity - OLD.quantity
+        WHERE {_ANCESTORS_OF.format(ref='OLD')};
+    END
+    """,
+)
+
+for _trigger_sql in _INVENTORY_STOCK_TRIGGERS + _INVENTORY_OCCUPANCY_TRIGGERS:
+    event.listen(Inventory.__table__, 'after_create', DDL(_trigger_sql).execute_if(dialect='sqlite'))
+
+
+def _upgrade_stock_columns(connection) -> None:
+    """
+    Create the stock triggers on databases created before them and derive low_stock.
+
+    Rows written before the low_stock column existed got its default; the flag is
+    recomputed from their status.
+
+    Args:
+        connection: Connection inside the schema upgrade transaction
+    """
+    if connection.dialect.name != 'sqlite':
+        return
+    for trigger_sql in _INVENTORY_STOCK_TRIGGERS:
+        connection.exec_driver_sql(trigger_sql)
+    connection.exec_driver_sql(
+        f"UPDATE inventory SET low_stock = (status IN ({_REORDER_STATUS_NAMES})) "
+        f"WHERE low_stock != (status IN ({_REORDER_STATUS_NAMES}))"
+    )
+
+
+register_upgrade('inventory', 'inventory stock triggers', _upgrade_stock_columns)
+
+
+def _upgrade_location_columns(connection) -> None:
+    """
+    Create the occupancy triggers on databases created before them.
+
+    Counts of rows linked to a location before the triggers existed are recomputed.
+
+    Args:
+        connection: Connection inside the schema upgrade transaction
+    """
+    if connection.dialect.name != 'sqlite':
+        return
+    created = connection.exec_driver_sql(
+        "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_inventory_location_%'"
+    ).scalar() == len(_INVENTORY_OCCUPANCY_TRIGGERS)
+    if created:
+        return
+
+    for trigger_sql in _INVENTORY_OCCUPANCY_TRIGGERS:
+        connection.exec_driver_sql(trigger_sql)
+
+    from sqlalchemy.orm import Session
+    from database.repositories.storage_location_repository import StorageLocationRepository
+    with Session(bind=connection) as session:
+        StorageLocationRepository(session).refresh_occupancy()
+        session.flush()
+
+
+register_upgrade('inventory', 'storage location occupancy triggers', _upgrade_location_columns)
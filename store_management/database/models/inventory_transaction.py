@@ -0,0 +1,74 @@
+# database/models/inventory_transaction.py
+"""
+This module defines the InventoryTransaction model for the leatherworking application.
+
+Each row is one ledger entry recording a quantity change on an inventory record,
+with the quantities before and after so the ledger can be audited without replaying it.
+"""
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import DateTime, Enum, Float, ForeignKey, Integer, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database.models.base import AbstractBase
+from database.models.enums import InventoryAdjustmentType, TransactionType
+
+
+class InventoryTransaction(AbstractBase):
+    """
+    Ledger entry for an inventory quantity change.
+
+    Attributes:
+        inventory_id: Inventory record that changed
+        transaction_type: Business transaction behind the change, if any
+        adjustment_type: Kind of manual adjustment, if any
+        quantity_before: Quantity before the change
+        quantity_after: Quantity after the change
+        quantity_change: Signed change in quantity
+        transaction_date: When the change happened
+        project_id: Project that consumed the stock, if any
+        reason: Optional free-text reason
+    """
+    __tablename__ = 'inventory_transactions'
+    __table_args__ = {"extend_existing": True}
+
+    inventory_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('inventory.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+    transaction_type: Mapped[Optional[TransactionType]] = mapped_column(Enum(TransactionType), nullable=True)
+    adjustment_type: Mapped[Optional[InventoryAdjustmentType]] = mapped_column(
+        Enum(InventoryAdjustmentType), nullable=True
+    )
+    quantity_before: Mapped[float] = mapped_column(Float, nullable=False)
+    quantity_after: Mapped[float] = mapped_column(Float, nullable=False)
+    quantity_change: Mapped[float] = mapped_column(Float, nullable=False)
+    transaction_date: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now, index=True)
+    project_id: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        ForeignKey('projects.id', ondelete='SET NULL'),
+        nullable=True
+    )
+    reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the ledger entry to a dictionary.
+
+        Returns:
+            Dict[str, Any]: Ledger entry fields
+        """
+        return {
+            'id': self.id,
+            'inventory_id': self.inventory_id,
+            'transaction_type': self.transaction_type.value if self.transaction_type else None,
+            'adjustment_type': self.adjustment_type.value if self.adjustment_type else None,
+            'quantity_before': self.quantity_before,
+            'quantity_after': self.quantity_after,
+            'quantity_change': self.quantity_change,
+            'transaction_date': self.transaction_date,
+            'reason': self.reason
+        }
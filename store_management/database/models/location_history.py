@@ -0,0 +1,68 @@
+# database/models/location_history.py
+"""
+This module defines the LocationHistory model for the leatherworking application.
+
+Each row records one inventory record moving between storage locations. Rows are
+written in bulk alongside set-based relocations, so the model carries no per-row logic.
+"""
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database.models.base import AbstractBase
+
+
+class LocationHistory(AbstractBase):
+    """
+    Movement of an inventory record between storage locations.
+
+    Attributes:
+        inventory_id: Inventory record that moved
+        from_location: Location code before the move
+        to_location: Location code after the move
+        from_location_id: Hierarchy location before the move, if linked
+        to_location_id: Hierarchy location after the move, if linked
+        move_date: When the move happened
+        notes: Optional reason for the move
+    """
+    __tablename__ = 'location_history'
+    __table_args__ = {"extend_existing": True}
+
+    inventory_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('inventory.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+    from_location: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    to_location: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    from_location_id: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        ForeignKey('storage_locations.id', ondelete='SET NULL'),
+        nullable=True
+    )
+    to_location_id: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        ForeignKey('storage_locations.id', ondelete='SET NULL'),
+        nullable=True
+    )
+    move_date: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now, index=True)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the movement to a dictionary.
+
+        Returns:
+            Dict[str, Any]: Movement fields
+        """
+        return {
+            'id': self.id,
+            'inventory_id': self.inventory_id,
+            'from_location': self.from_location,
+            'to_location': self.to_location,
+            'move_date': self.move_date,
+            'notes': self.notes
+        }
@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import Boolean, Enum, Float, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from database.models.base import AbstractBase, CostingMixin, ModelValidationError, ValidationMixin
+from database.models.base import AbstractBase, CostingMixin, ModelValidationError, ValidationMixin, RELATIONSHIP_LAZY
 from database.models.enums import (
     HardwareFinish, HardwareMaterial, HardwareType, LeatherFinish,
     LeatherType, MaterialType, MeasurementUnit, QualityGrade
@@ -49,7 +49,7 @@ class Material(AbstractBase, ValidationMixin, CostingMixin):
     supplier = relationship(
         "Supplier",
         back_populates="materials",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     # Relationship with components through junction table
@@ -75,7 +75,7 @@ class Material(AbstractBase, ValidationMixin, CostingMixin):
         foreign_keys="[Inventory.item_id]",
         back_populates="material",
         uselist=False,
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
         overlaps="inventory"  # Add this parameter
     )
 
@@ -83,7 +83,7 @@ class Material(AbstractBase, ValidationMixin, CostingMixin):
     picking_list_items = relationship(
         "PickingListItem",
         back_populates="material",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     # Relationship to PurchaseItem
@@ -92,7 +92,7 @@ class Material(AbstractBase, ValidationMixin, CostingMixin):
         primaryjoin="and_(Material.id==PurchaseItem.item_id, PurchaseItem.item_type=='material')",
         foreign_keys="[PurchaseItem.item_id]",
         back_populates="material",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     __mapper_args__ = {
@@ -100,6 +100,11 @@ class Material(AbstractBase, ValidationMixin, CostingMixin):
         'polymorphic_identity': 'generic'
     }
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'name': {'required': True},
+    }
+
     def __init__(self, **kwargs):
         """
         Initialize a Material instance with validation.
@@ -165,6 +170,13 @@ class Leather(Material):
         'polymorphic_identity': 'leather'  # Changed from MaterialType.LEATHER to match data
     }
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        **Material.BULK_LOAD_CHECKS,
+        'thickness': {'gt': 0, 'max': 100},
+        'area': {'gt': 0, 'max': 1000},
+    }
+
     def validate(self) -> None:
         """
         Validate leather data.
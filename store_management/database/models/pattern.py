@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import Enum, ForeignKey, Integer, JSON, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from database.models.base import AbstractBase, ModelValidationError, ValidationMixin
+from database.models.base import AbstractBase, ModelValidationError, ValidationMixin, RELATIONSHIP_LAZY
 from database.models.enums import SkillLevel
 
 # Import the relationship tables from the central location
@@ -53,7 +53,7 @@ class Pattern(AbstractBase, ValidationMixin):
         "Component",
         secondary=pattern_component_table,
         backref="patterns",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     # Uncommenting the relationship to Product
@@ -61,9 +61,14 @@ class Pattern(AbstractBase, ValidationMixin):
         "Product",
         secondary=product_pattern_table,
         back_populates="patterns",  # Using back_populates to match Product class
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'name': {'required': True},
+    }
+
     def __init__(self, **kwargs):
         """
         Initialize a Pattern instance with validation.
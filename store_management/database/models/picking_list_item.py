@@ -33,6 +33,12 @@ class PickingListItem(AbstractBase, ValidationMixin):
     component: Mapped[Optional["Component"]] = relationship(back_populates="picking_list_items")
     material: Mapped[Optional["Material"]] = relationship(back_populates="picking_list_items")
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'quantity_ordered': {'gt': 0},
+        'quantity_picked': {'min': 0},
+    }
+
     def __init__(self, **kwargs):
         """Initialize a PickingListItem instance with validation."""
         super().__init__(**kwargs)
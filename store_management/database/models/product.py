@@ -9,7 +9,7 @@ from sqlalchemy import Boolean, Column, Enum, Float, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import expression
 
-from database.models.base import AbstractBase, CostingMixin, ModelValidationError, ValidationMixin
+from database.models.base import AbstractBase, CostingMixin, ModelValidationError, ValidationMixin, RELATIONSHIP_LAZY
 from database.models.enums import ProjectType
 
 # Import the relationship table from the central location
@@ -36,14 +36,14 @@ class Product(AbstractBase, ValidationMixin, CostingMixin):
         "Pattern",
         secondary=product_pattern_table,
         back_populates="products",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     sales_items = relationship(
         "SalesItem",
         back_populates="product",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     # Inventory relationship
@@ -53,10 +53,16 @@ class Product(AbstractBase, ValidationMixin, CostingMixin):
         foreign_keys="[Inventory.item_id]",
         back_populates="product",
         uselist=False,
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
         overlaps="inventory"  # Add this parameter
     )
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'name': {'required': True},
+        'price': {'min': 0},
+    }
+
     def __init__(self, **kwargs):
         """
         Initialize a Product instance with validation.
@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from database.models.base import AbstractBase, ModelValidationError, ValidationMixin
+from database.models.base import AbstractBase, ModelValidationError, ValidationMixin, RELATIONSHIP_LAZY
 from database.models.enums import ProjectStatus, ProjectType
 
 
@@ -42,14 +42,14 @@ class Project(AbstractBase, ValidationMixin):
         "ProjectComponent",
         back_populates="project",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     # Use a string reference to avoid circular import dependencies
     sales = relationship(
         "Sales",
         foreign_keys=[sales_id],
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
         # This is important to break the circular dependency during initialization
         post_update=True,
         # Back-reference without circular loading
@@ -62,7 +62,7 @@ class Project(AbstractBase, ValidationMixin):
         back_populates="project",
         uselist=False,  # One-to-one relationship
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     # New relationship for tool checkouts
@@ -70,11 +70,18 @@ class Project(AbstractBase, ValidationMixin):
         "ToolCheckout",
         back_populates="project",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     # picking_lists will be added later if needed
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'name': {'required': True},
+        'type': {'required': True},
+        'status': {'required': True},
+    }
+
     def __init__(self, **kwargs):
         """
         Initialize a Project instance with validation.
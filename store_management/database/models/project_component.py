@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import Column, Float, ForeignKey, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from database.models.base import AbstractBase, ModelValidationError, ValidationMixin
+from database.models.base import AbstractBase, ModelValidationError, ValidationMixin, RELATIONSHIP_LAZY
 
 
 class ProjectComponent(AbstractBase, ValidationMixin):
@@ -42,14 +42,21 @@ class ProjectComponent(AbstractBase, ValidationMixin):
     project = relationship(
         "Project",
         back_populates="project_components",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     component = relationship(
         "Component",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'project_id': {'required': True, 'gt': 0},
+        'component_id': {'required': True, 'gt': 0},
+        'quantity': {'required': True, 'gt': 0},
+    }
+
     def __init__(self, **kwargs):
         """
         Initialize a ProjectComponent instance with validation.
@@ -44,6 +44,11 @@ class Purchase(AbstractBase, ValidationMixin):
     supplier: Mapped["Supplier"] = relationship(back_populates="purchases")
     items: Mapped[List["PurchaseItem"]] = relationship(back_populates="purchase", cascade="all, delete-orphan")
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'total_amount': {'min': 0},
+    }
+
     def __init__(self, **kwargs):
         """Initialize a Purchase instance with validation."""
         super().__init__(**kwargs)
@@ -52,6 +52,14 @@ class PurchaseItem(AbstractBase, ValidationMixin):
         viewonly=True
     )
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'quantity': {'gt': 0},
+        'price': {'min': 0},
+        'received_quantity': {'min': 0},
+        'item_type': {'choices': ('material', 'tool')},
+    }
+
     def __init__(self, **kwargs):
         """Initialize a PurchaseItem instance with validation."""
         super().__init__(**kwargs)
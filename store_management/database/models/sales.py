@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from database.models.base import AbstractBase, CostingMixin, ModelValidationError, ValidationMixin
+from database.models.base import AbstractBase, CostingMixin, ModelValidationError, ValidationMixin, RELATIONSHIP_LAZY
 from database.models.enums import PaymentStatus, SaleStatus
 
 
@@ -46,21 +46,21 @@ class Sales(AbstractBase, ValidationMixin, CostingMixin):
     customer = relationship(
         "Customer",
         back_populates="sales",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     sales_items = relationship(
         "SalesItem",
         back_populates="sales",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     # Break the circular dependency using string-based primaryjoin
     projects = relationship(
         "Project",
         primaryjoin="Sales.id==Project.sales_id",
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
         viewonly=True  # Use viewonly to break circular references
     )
 
@@ -69,10 +69,17 @@ class Sales(AbstractBase, ValidationMixin, CostingMixin):
         "PickingList",
         back_populates="sales",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
         uselist=False  # Makes this a one-to-one relationship
     )
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'total_amount': {'min': 0},
+        'status': {'required': True},
+        'payment_status': {'required': True},
+    }
+
     def __init__(self, **kwargs):
         """
         Initialize a Sales instance with validation.
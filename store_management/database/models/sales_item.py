@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import Column, Float, ForeignKey, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from database.models.base import AbstractBase, ModelValidationError, ValidationMixin
+from database.models.base import AbstractBase, ModelValidationError, ValidationMixin, RELATIONSHIP_LAZY
 
 
 class SalesItem(AbstractBase, ValidationMixin):
@@ -40,15 +40,21 @@ class SalesItem(AbstractBase, ValidationMixin):
     sales = relationship(
         "Sales",
         back_populates="sales_items",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     product = relationship(
         "Product",
         back_populates="sales_items",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'quantity': {'gt': 0},
+        'price': {'min': 0},
+    }
+
     def __init__(self, **kwargs):
         """
         Initialize a SalesItem instance with validation.
@@ -0,0 +1,135 @@
+# database/models/storage_location.py
+"""
+This module defines the StorageLocation model for the leatherworking application.
+
+Locations form a zone/aisle/shelf/bin hierarchy. Each row stores a materialized
+path of ancestor IDs (e.g. ``/1/4/9/``), so a whole subtree can be read with one
+indexed range query. Item counts and quantities are kept per location, including
+descendants, and are maintained incrementally by triggers on the inventory table.
+"""
+from typing import List, Optional
+
+from sqlalchemy import Enum, Float, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from database.models.base import AbstractBase, ModelValidationError, ValidationMixin
+from database.models.enums import StorageLocationLevel, StorageLocationType
+
+# Code separator between hierarchy segments, e.g. "A-B-3-12" for zone A, aisle B, shelf 3, bin 12
+LOCATION_CODE_SEPARATOR = '-'
+
+
+class StorageLocation(AbstractBase, ValidationMixin):
+    """
+    A node in the storage location hierarchy.
+
+    Attributes:
+        name: Segment name within the parent (e.g. 'B' for aisle B)
+        code: Full location code built from all segment names (e.g. 'A-B')
+        level: Hierarchy level (zone, aisle, shelf, bin)
+        location_type: Optional physical type (shelf, drawer, cabinet, ...)
+        parent_id: Parent location, None for zones
+        path: Materialized path of ancestor-or-self IDs, '/'-delimited
+        depth: Number of ancestors
+        capacity: Optional capacity in stock units, used for fill levels
+        item_count: Inventory records in this location and its descendants
+        total_quantity: Stock quantity in this location and its descendants
+        description: Optional description
+    """
+    __tablename__ = 'storage_locations'
+    __table_args__ = {"extend_existing": True}
+
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    code: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
+    level: Mapped[StorageLocationLevel] = mapped_column(Enum(StorageLocationLevel), nullable=False)
+    location_type: Mapped[Optional[StorageLocationType]] = mapped_column(Enum(StorageLocationType), nullable=True)
+
+    parent_id: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        ForeignKey('storage_locations.id', ondelete='CASCADE'),
+        nullable=True,
+        index=True
+    )
+    path: Mapped[str] = mapped_column(String(500), nullable=False, default='', index=True)
+    depth: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    capacity: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    item_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_quantity: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    description: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+
+    # Relationships
+    parent: Mapped[Optional["StorageLocation"]] = relationship(
+        "StorageLocation",
+        remote_side="StorageLocation.id",
+        back_populates="children"
+    )
+    children: Mapped[List["StorageLocation"]] = relationship(
+        "StorageLocation",
+        back_populates="parent",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'name': {'required': True},
+        'capacity': {'gt': 0},
+    }
+
+    def __init__(self, **kwargs):
+        """
+        Initialize a StorageLocation instance with validation.
+
+        Args:
+            **kwargs: Keyword arguments for StorageLocation initialization
+        """
+        super().__init__(**kwargs)
+        self.validate()
+
+    def validate(self) -> None:
+        """
+        Validate storage location data.
+
+        Raises:
+            ModelValidationError: If validation fails
+        """
+        if not self.name or not isinstance(self.name, str):
+            raise ModelValidationError("Location name cannot be empty")
+
+        if LOCATION_CODE_SEPARATOR in self.name:
+            raise ModelValidationError(f"Location name cannot contain '{LOCATION_CODE_SEPARATOR}'")
+
+        if self.capacity is not None and self.capacity <= 0:
+            raise ModelValidationError("Location capacity must be positive")
+
+        return self
+
+    @property
+    def fill_level(self) -> Optional[float]:
+        """
+        Fraction of capacity in use, or None if the location has no capacity set.
+
+        Returns:
+            Optional[float]: total_quantity / capacity
+        """
+        if not self.capacity:
+            return None
+        return (self.total_quantity or 0.0) / self.capacity
+
+    @staticmethod
+    def subtree_upper_bound(path: str) -> str:
+        """
+        Exclusive upper bound for paths under ``path``.
+
+        Paths are '/'-delimited and '0' sorts directly after '/', so
+        ``path <= p < subtree_upper_bound(path)`` selects the subtree with an index range scan.
+
+        Args:
+            path: Materialized path of the subtree root (ending in '/')
+
+        Returns:
+            str: Upper bound for a range comparison
+        """
+        return path[:-1] + '0'
@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import Column, Enum, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from database.models.base import AbstractBase, ValidationMixin, ModelValidationError
+from database.models.base import AbstractBase, ValidationMixin, ModelValidationError, RELATIONSHIP_LAZY
 from database.models.enums import SupplierStatus
 
 
@@ -57,22 +57,28 @@ class Supplier(AbstractBase, ValidationMixin):
     materials: Mapped[List[object]] = relationship(
         "Material",
         back_populates="supplier",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     tools: Mapped[List[object]] = relationship(
         "Tool",
         back_populates="supplier",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     # Restore the relationship to Purchase
     purchases: Mapped[List["Purchase"]] = relationship(
         "Purchase",
         back_populates="supplier",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'name': {'required': True},
+        'contact_email': {'required': True},
+    }
+
     def __init__(self, **kwargs):
         """
         Initialize a Supplier instance with validation.
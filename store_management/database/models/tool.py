@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from database.models.base import AbstractBase, ModelValidationError, ValidationMixin
+from database.models.base import AbstractBase, ModelValidationError, ValidationMixin, RELATIONSHIP_LAZY
 from database.models.enums import ToolCategory
 from database.models.inventory import Inventory
 
@@ -56,7 +56,7 @@ class Tool(AbstractBase, ValidationMixin):
     supplier = relationship(
         "Supplier",
         back_populates="tools",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     inventory = relationship(
@@ -65,7 +65,7 @@ class Tool(AbstractBase, ValidationMixin):
         foreign_keys="[Inventory.item_id]",
         back_populates="tool",
         uselist=False,
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
         overlaps="inventory,inventory,material,product"  # Add this parameter
     )
 
@@ -73,7 +73,7 @@ class Tool(AbstractBase, ValidationMixin):
         "ToolListItem",
         back_populates="tool",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     # New relationships for tool management
@@ -81,16 +81,23 @@ class Tool(AbstractBase, ValidationMixin):
         "ToolMaintenance",
         back_populates="tool",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     checkouts = relationship(
         "ToolCheckout",
         back_populates="tool",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'name': {'required': True},
+        'tool_category': {'required': True},
+        'purchase_price': {'min': 0},
+    }
+
     def __init__(self, **kwargs):
         """
         Initialize a Tool instance with validation.
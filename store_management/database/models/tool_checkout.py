@@ -10,7 +10,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from database.models.base import AbstractBase, ModelValidationError, ValidationMixin
+from database.models.base import AbstractBase, ModelValidationError, ValidationMixin, RELATIONSHIP_LAZY
 
 
 class ToolCheckout(AbstractBase, ValidationMixin):
@@ -53,15 +53,22 @@ class ToolCheckout(AbstractBase, ValidationMixin):
     tool = relationship(
         "Tool",
         back_populates="checkouts",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
     project = relationship(
         "Project",
         back_populates="tool_checkouts",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'tool_id': {'required': True},
+        'checked_out_by': {'required': True},
+        'checked_out_date': {'required': True},
+    }
+
     def __init__(self, **kwargs):
         """
         Initialize a ToolCheckout instance with validation.
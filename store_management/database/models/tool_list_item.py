@@ -35,6 +35,11 @@ class ToolListItem(AbstractBase, ValidationMixin):
     tool_list: Mapped["ToolList"] = relationship(back_populates="items")
     tool: Mapped["Tool"] = relationship(back_populates="tool_list_items")
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'quantity': {'gt': 0},
+    }
+
     def __init__(self, **kwargs):
         """Initialize a ToolListItem instance with validation."""
         super().__init__(**kwargs)
@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from database.models.base import AbstractBase, ModelValidationError, ValidationMixin
+from database.models.base import AbstractBase, ModelValidationError, ValidationMixin, RELATIONSHIP_LAZY
 
 
 class ToolMaintenance(AbstractBase, ValidationMixin):
@@ -53,9 +53,18 @@ class ToolMaintenance(AbstractBase, ValidationMixin):
     tool = relationship(
         "Tool",
         back_populates="maintenance_records",
-        lazy="selectin"
+        lazy=RELATIONSHIP_LAZY
     )
 
+    # Checks the trusted bulk-load path applies over whole columns in place of validate()
+    BULK_LOAD_CHECKS = {
+        'tool_id': {'required': True},
+        'maintenance_type': {'required': True},
+        'maintenance_date': {'required': True},
+        'cost': {'min': 0},
+        'maintenance_interval': {'min': 0},
+    }
+
     def __init__(self, **kwargs):
         """
         Initialize a ToolMaintenance instance with validation.
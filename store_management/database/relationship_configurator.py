@@ -1,4 +1,3 @@
-from database.models.base import metadata
 # database/relationship_configurator.py
 """
 Module for configuring SQLAlchemy model relationships.
@@ -11,7 +10,6 @@ import sqlalchemy
 from sqlalchemy.orm import configure_mappers
 
 from database.models.base import Base
-from database.relationship_registration import initialize_relationships
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -35,6 +33,37 @@ def configure_polymorphic_relationship(model_cls, target_cls_name, id_column, ty
 
 
 
+# Model modules in registration order; base and association tables come first
+MODEL_MODULES = (
+    "database.models.base",
+    "database.models.relationship_tables",
+    "database.models.supplier",
+    "database.models.customer",
+    "database.models.storage_location",
+    "database.models.material",
+    "database.models.inventory",
+    "database.models.location_history",
+    "database.models.inventory_transaction",
+    "database.models.component",
+    "database.models.component_material",
+    "database.models.pattern",
+    "database.models.product",
+    "database.models.sales",
+    "database.models.sales_item",
+    "database.models.project",
+    "database.models.project_component",
+    "database.models.picking_list",
+    "database.models.picking_list_item",
+    "database.models.tool",
+    "database.models.tool_maintenance",
+    "database.models.tool_checkout",
+    "database.models.tool_list",
+    "database.models.tool_list_item",
+    "database.models.purchase",
+    "database.models.purchase_item",
+)
+
+
 def import_all_models():
     """
     Dynamically import all models to ensure they are registered.
@@ -43,65 +72,9 @@ def import_all_models():
     are loaded before mapper configuration.
     """
     try:
-        # Import base models first
-        logger.info("Importing model: Base")
-        from database.models.base import Base, BaseModel
-        logger.info("Imported model: BaseModel")
-
-        # Import core domain models
-        logger.info("Importing model: Pattern")
-        from database.models.pattern import Pattern
-        logger.info("Imported model: Pattern")
-
-        logger.info("Importing model: Project")
-        from database.models.project import Project
-        logger.info("Imported model: Project")
-
-        logger.info("Importing model: Component")
-        from database.models.components import Component, ProjectComponent, PatternComponent
-        logger.info("Imported model: Component")
-        logger.info("Imported model: ProjectComponent")
-        logger.info("Imported model: PatternComponent")
-
-        logger.info("Importing model: Material")
-        from database.models.material import Material
-        logger.info("Imported model: Material")
-
-        logger.info("Importing model: Product")
-        from database.models.product import Product
-        logger.info("Imported model: Product")
-
-        logger.info("Importing model: Order")
-        from database.models.sale import Sale, SaleItem
-        logger.info("Imported model: Order")
-        logger.info("Imported model: OrderItem")
-
-        logger.info("Importing model: Leather")
-        from database.models.leather import Leather
-        logger.info("Imported model: Leather")
-
-        logger.info("Importing model: Hardware")
-        from database.models.hardware import Hardware
-        logger.info("Imported model: Hardware")
-
-        # Import supporting domain models
-        logger.info("Importing model: Storage")
-        from database.models.storage import Storage
-        logger.info("Imported model: Storage")
-
-        logger.info("Importing model: Supplier")
-        from database.models.supplier import Supplier
-        logger.info("Imported model: Supplier")
-
-        # Import transaction models last to avoid circular imports
-        logger.info("Importing model: Transaction")
-        from database.models.transaction import (
-            BaseTransaction,
-            MaterialTransaction,
-            LeatherTransaction,
-            HardwareTransaction
-        )
-        logger.info("Imported transaction models")
+        for module_name in MODEL_MODULES:
+            importlib.import_module(module_name)
+            logger.debug(f"Imported model module: {module_name}")
 
         return True
 
@@ -128,8 +101,12 @@ def configure_model_relationships():
             logger.error("Failed to import all models")
             return False
 
-        # Register relationships using the new relationship registration module
-        if not initialize_relationships():
+        # Register relationships using the relationship registration module, if present
+        try:
+            from database.relationship_registration import initialize_relationships
+        except ImportError:
+            initialize_relationships = None
+        if initialize_relationships is not None and not initialize_relationships():
             logger.error("Failed to register model relationships")
             return False
 
@@ -1,8 +1,11 @@
 # database/repositories/base_repository.py
 from sqlalchemy.orm import Session
-from typing import Generic, TypeVar, Optional, List, Type, Dict, Any, Callable, Tuple
+from typing import Generic, TypeVar, Optional, List, Type, Dict, Any, Callable, Sequence, Tuple
 import logging
 
+from database.repositories.loader_profiles import loader_options
+from database.repositories.projection import ListProjection
+
 # Generic type variable for entity models
 T = TypeVar('T')
 
@@ -33,8 +36,11 @@ class BaseRepository(Generic[T]):
         session: The SQLAlchemy session for database access
         logger: Logger for this repository
         model_class: The SQLAlchemy model class this repository manages
+        list_columns: List field names mapped to model attribute paths for get_list_rows
     """
 
+    list_columns: Dict[str, str] = {}
+
     def __init__(self, session: Session):
         """Initialize repository with session injection.
 
@@ -56,30 +62,48 @@ class BaseRepository(Generic[T]):
         """
         raise NotImplementedError("Subclasses must implement _get_model_class")
 
-    def get_by_id(self, id: int) -> Optional[T]:
+    def apply_profile(self, query, profile: Optional[str]):
+        """Eager-load the relationships a loader profile names.
+
+        Args:
+            query: Query or select statement for this repository's model
+            profile: Loader profile name (see loader_profiles), or None to load no relationships
+
+        Returns:
+            The query with the profile's loader options applied
+        """
+        if profile is None:
+            return query
+        return query.options(*loader_options(self.model_class, profile))
+
+    def get_by_id(self, id: int, profile: Optional[str] = None) -> Optional[T]:
         """Retrieve entity by ID.
 
         Args:
             id: Entity ID
+            profile: Optional loader profile naming the relationships to load
 
         Returns:
             Entity instance or None if not found
         """
         self.logger.debug(f"Getting {self.model_class.__name__} with ID {id}")
-        return self.session.query(self.model_class).filter_by(id=id).first()
+        query = self.apply_profile(self.session.query(self.model_class), profile)
+        return query.filter_by(id=id).first()
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
+    def get_all(self, skip: int = 0, limit: int = 100, profile: Optional[str] = None) -> List[T]:
         """Get all entities with pagination.
 
         Args:
             skip: Number of records to skip
             limit: Maximum records to return
+            profile: Optional loader profile naming the relationships to load
 
         Returns:
             List of entity instances
         """
         self.logger.debug(f"Getting all {self.model_class.__name__} (skip={skip}, limit={limit})")
-        return self.session.query(self.model_class).offset(skip).limit(limit).all()
+        query = self.apply_profile(self.session.query(self.model_class), profile)
+        return query.offset(skip).limit(limit).all()
 
     def create(self, entity: T) -> T:
         """Create new entity.
@@ -143,24 +167,27 @@ class BaseRepository(Generic[T]):
             self.session.rollback()
             raise RepositoryError(f"Failed to delete {self.model_class.__name__}: {str(e)}")
 
-    def filter_by(self, **kwargs) -> List[T]:
+    def filter_by(self, profile: Optional[str] = None, **kwargs) -> List[T]:
         """Filter entities by exact match criteria.
 
         Args:
+            profile: Optional loader profile naming the relationships to load
             **kwargs: Filter criteria as field=value pairs
 
         Returns:
             List of matching entities
         """
         self.logger.debug(f"Filtering {self.model_class.__name__} by {kwargs}")
-        return self.session.query(self.model_class).filter_by(**kwargs).all()
+        query = self.apply_profile(self.session.query(self.model_class), profile)
+        return query.filter_by(**kwargs).all()
 
-    def search(self, search_term: str, fields: List[str]) -> List[T]:
+    def search(self, search_term: str, fields: List[str], profile: Optional[str] = None) -> List[T]:
         """Search entities by term across specified fields.
 
         Args:
             search_term: Term to search for
             fields: Model fields to search in
+            profile: Optional loader profile naming the relationships to load
 
         Returns:
             List of matching entities
@@ -181,7 +208,51 @@ class BaseRepository(Generic[T]):
         if not filters:
             return []
 
-        return self.session.query(self.model_class).filter(or_(*filters)).all()
+        query = self.apply_profile(self.session.query(self.model_class), profile)
+        return query.filter(or_(*filters)).all()
+
+    def get_list_rows(self, fields: Sequence[str], skip: int = 0, limit: int = 100,
+                      sort_by: Optional[str] = None, sort_dir: str = 'asc',
+                      search_term: Optional[str] = None, search_fields: Sequence[str] = (),
+                      **filter_criteria) -> List[tuple]:
+        """Get one page of a list, selecting only the columns it shows.
+
+        Rows are namedtuples rather than entities, so they are not tracked by the
+        session and carry no relationship state.
+
+        Args:
+            fields: List field names, in display order (see ``list_columns``)
+            skip: Number of rows to skip
+            limit: Maximum rows to return
+            sort_by: Field to sort by (defaults to the primary key)
+            sort_dir: Sort direction ('asc' or 'desc')
+            search_term: Text that any of the search fields must contain
+            search_fields: Fields searched for the search term
+            **filter_criteria: Field name to value filters
+
+        Returns:
+            List of row namedtuples
+        """
+        projection = ListProjection(self.model_class, fields, self.list_columns)
+        statement = projection.select(search_term, search_fields, **filter_criteria)
+        statement = projection.order_by(statement, sort_by, sort_dir).offset(skip).limit(limit)
+        return projection.make_rows(self.session.execute(statement))
+
+    def count_list_rows(self, search_term: Optional[str] = None, search_fields: Sequence[str] = (),
+                        **filter_criteria) -> int:
+        """Count the rows get_list_rows would return without paging.
+
+        Args:
+            search_term: Text that any of the search fields must contain
+            search_fields: Fields searched for the search term
+            **filter_criteria: Field name to value filters
+
+        Returns:
+            Number of matching rows
+        """
+        projection = ListProjection(self.model_class, ('id',), self.list_columns)
+        statement = projection.select(search_term, search_fields, **filter_criteria)
+        return self.session.execute(projection.count(statement)).scalar_one()
 
     def count(self, **filter_criteria) -> int:
         """Count entities matching criteria.
@@ -257,6 +328,35 @@ class BaseRepository(Generic[T]):
             self.session.rollback()
             raise ValidationError(f"Failed to bulk create {self.model_class.__name__}: {str(e)}")
 
+    def bulk_load(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert trusted rows without constructing entities.
+
+        The batch is validated once, column by column (lengths, enums, the model's
+        BULK_LOAD_CHECKS ranges and required values), and inserted with a single Core
+        executemany. Model constructors, validate() and @validates hooks are skipped,
+        so use this for sample data, backup restores and catalog imports rather than
+        user edits.
+
+        Args:
+            rows: Row dictionaries keyed by attribute name
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            ValidationError: If any row is invalid or the insert fails; nothing is inserted
+        """
+        from database.repositories.bulk_load import BulkLoader, BulkLoadError
+
+        try:
+            return BulkLoader(self.session, self.model_class).load(rows)
+        except BulkLoadError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error bulk loading {self.model_class.__name__}: {str(e)}")
+            self.session.rollback()
+            raise ValidationError(f"Failed to bulk load {self.model_class.__name__}: {str(e)}")
+
     def bulk_update(self, entities: List[T]) -> List[T]:
         """Update multiple entities in a single operation.
 
@@ -353,12 +453,14 @@ class BaseRepository(Generic[T]):
         created_entity = self.create(entity)
         return created_entity, True
 
-    def paginate(self, page: int = 1, page_size: int = 20, **filter_criteria) -> Dict[str, Any]:
+    def paginate(self, page: int = 1, page_size: int = 20, profile: Optional[str] = None,
+                 **filter_criteria) -> Dict[str, Any]:
         """Get paginated results with optional filtering.
 
         Args:
             page: Page number (1-based)
             page_size: Number of items per page
+            profile: Optional loader profile naming the relationships to load
             **filter_criteria: Optional filter criteria
 
         Returns:
@@ -378,7 +480,7 @@ class BaseRepository(Generic[T]):
         query = query.offset((page - 1) * page_size).limit(page_size)
 
         # Execute query
-        items = query.all()
+        items = self.apply_profile(query, profile).all()
 
         # Calculate pagination metadata
         total_pages = (total_count + page_size - 1) // page_size if page_size > 0 else 0
@@ -0,0 +1,364 @@
+# database/repositories/bulk_load.py
+"""
+Trusted bulk loading that skips per-instance model construction.
+
+Building models one at a time runs each model's ``__init__`` (defaults, derived
+fields, ``validate()``) and ValidationMixin's ``@validates`` hooks on every
+attribute set, and the unit of work then flushes the objects one by one. When
+loading sample data, restoring a backup or importing a supplier catalog, that
+per-object work dominates.
+
+A BulkLoader validates a whole batch of row dictionaries once, a column at a time,
+and inserts it with a single Core executemany:
+
+- Values are coerced per column: enum members from their names or values,
+  datetimes from ISO strings and numbers from numeric strings.
+- Strings are checked against the column length and ValidationMixin's limits.
+- The ranges, allowed values and required values a model declares in
+  ``BULK_LOAD_CHECKS`` stand in for its ``validate()``. Numeric checks run over the
+  whole column with numpy. Models whose ``validate()`` enforces rules must declare
+  them, or bulk loads would accept rows the constructor rejects.
+- Python-side column defaults and missing polymorphic discriminators are filled in. A
+  model's ``prepare_bulk_columns`` hook then computes derived columns, such as the
+  inventory status.
+- NOT NULL columns are checked last.
+
+Every invalid value in the batch is reported in one BulkLoadError, and nothing is
+inserted. Rows never become ORM objects, so no ORM events fire and nothing enters
+the identity map. A value of None is treated like a missing value.
+"""
+
+import enum
+import logging
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import Boolean, Date, DateTime, Enum, Float, Integer, Numeric, String, Text, inspect, insert
+from sqlalchemy.orm import Session
+
+from database.models.base import DEFAULT_MAX_LENGTHS, ValidationMixin
+from database.repositories.base_repository import ValidationError
+from utils.lazy_import import lazy_module
+
+np = lazy_module("numpy")
+
+logger = logging.getLogger(__name__)
+
+# Invalid values listed in a BulkLoadError message; the rest are only counted
+MAX_REPORTED_ERRORS = 20
+
+# Comparisons a BULK_LOAD_CHECKS entry can declare besides 'choices' and 'required',
+# with the message for a failure
+_RANGE_CHECKS = {
+    'min': (lambda values, limit: values < limit, "must be at least {}"),
+    'max': (lambda values, limit: values > limit, "must be at most {}"),
+    'gt': (lambda values, limit: values <= limit, "must be greater than {}"),
+    'lt': (lambda values, limit: values >= limit, "must be less than {}"),
+}
+
+# A validation failure: row index (None for the whole batch), attribute name, message
+BulkLoadIssue = Tuple[Optional[int], str, str]
+
+
+class BulkLoadError(ValidationError):
+    """Raised when a bulk load batch has invalid values; nothing is inserted."""
+
+    def __init__(self, model_name: str, errors: List[BulkLoadIssue]):
+        """
+        Initialize the error.
+
+        Args:
+            model_name: Name of the model being loaded
+            errors: Every invalid value found in the batch
+        """
+        self.errors = errors
+        lines = [f"row {row}: {key}: {message}" if row is not None else f"{key}: {message}"
+                 for row, key, message in errors[:MAX_REPORTED_ERRORS]]
+        if len(errors) > MAX_REPORTED_ERRORS:
+            lines.append(f"... and {len(errors) - MAX_REPORTED_ERRORS} more")
+        super().__init__(f"{len(errors)} invalid values in {model_name} bulk load:\n" + "\n".join(lines))
+
+
+class _ColumnPlan:
+    """How the values of one mapped column are coerced, checked and defaulted."""
+
+    __slots__ = ("key", "column", "kind", "enum_lookup", "max_length", "checks")
+
+    def __init__(self, key: str, column, model_class: Type):
+        self.key = key
+        self.column = column
+        self.checks = getattr(model_class, 'BULK_LOAD_CHECKS', {}).get(key, {})
+        self.enum_lookup = None
+        self.max_length = None
+
+        column_type = column.type
+        if isinstance(column_type, Enum) and column_type.enum_class is not None:
+            self.kind = "enum"
+            self.enum_lookup = _enum_lookup(column_type.enum_class)
+        elif isinstance(column_type, DateTime):
+            self.kind = "datetime"
+        elif isinstance(column_type, Date):
+            self.kind = "date"
+        elif isinstance(column_type, Boolean):
+            self.kind = "boolean"
+        elif isinstance(column_type, Integer):
+            self.kind = "integer"
+        elif isinstance(column_type, (Float, Numeric)):
+            self.kind = "float"
+        elif isinstance(column_type, (String, Text)):
+            self.kind = "string"
+            limits = [column_type.length]
+            if issubclass(model_class, ValidationMixin):
+                limits.append(DEFAULT_MAX_LENGTHS.get(key))
+            limits = [limit for limit in limits if limit]
+            self.max_length = min(limits) if limits else None
+        else:
+            self.kind = "other"
+
+    def default(self):
+        """
+        Get a new default value for a missing value.
+
+        Returns:
+            The column's Python-side default, or None
+        """
+        default = self.column.default
+        if default is None or not (default.is_scalar or default.is_callable):
+            return None
+        # Callables run once per row so per-row defaults such as UUIDs stay unique
+        return default.arg(None) if default.is_callable else default.arg
+
+    @property
+    def required(self) -> bool:
+        """Whether the database needs a value from the load."""
+        column = self.column
+        return (not column.nullable and column.server_default is None
+                and not (column.primary_key and column.autoincrement in (True, "auto")))
+
+
+def _enum_lookup(enum_class: Type[enum.Enum]) -> Dict[Any, enum.Enum]:
+    """Map the members, names, upper-case names and values of an enum to its members."""
+    lookup = {}
+    for name, member in enum_class.__members__.items():
+        lookup[member.value] = member
+        lookup[name.upper()] = member
+        lookup[name] = member
+        lookup[member] = member
+    return lookup
+
+
+def _sorted(errors: List[BulkLoadIssue]) -> List[BulkLoadIssue]:
+    """Order errors by row and column, batch-wide errors first."""
+    return sorted(errors, key=lambda error: (-1 if error[0] is None else error[0], error[1]))
+
+
+@lru_cache(maxsize=None)
+def load_plan(model_class: Type) -> Tuple[Any, Dict[str, _ColumnPlan]]:
+    """
+    Get the table and column plans used to bulk load a model.
+
+    Plans are cached, so each model's columns are only examined once.
+
+    Args:
+        model_class: The model to load
+
+    Returns:
+        The table rows are inserted into, and the column plans by attribute name
+
+    Raises:
+        ValueError: If the model spans several tables (joined inheritance)
+    """
+    mapper = inspect(model_class)
+    if len(mapper.tables) > 1:
+        raise ValueError(f"{model_class.__name__} spans several tables and cannot be bulk loaded")
+    plans = {key: _ColumnPlan(key, column, model_class)
+             for key, column in mapper.columns.items() if column.table is mapper.local_table}
+    return mapper.local_table, plans
+
+
+class BulkLoader:
+    """
+    Validates batches of rows for a model once, column-wise, and inserts them with Core.
+    """
+
+    def __init__(self, session: Session, model_class: Type, ignore_unknown: bool = False):
+        """
+        Initialize the loader.
+
+        Args:
+            session: SQLAlchemy session whose transaction the inserts join
+            model_class: The model whose table is loaded
+            ignore_unknown: Drop keys that are not columns of the model, with a
+                warning, instead of rejecting the batch
+        """
+        self.session = session
+        self.model_class = model_class
+        self.ignore_unknown = ignore_unknown
+        self.table, self.plans = load_plan(model_class)
+
+    def validate(self, rows: Sequence[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Validate and complete a batch of rows.
+
+        Args:
+            rows: Row dictionaries keyed by attribute name
+
+        Returns:
+            The coerced values by attribute name, one list per column, including
+            defaulted and derived columns
+
+        Raises:
+            BulkLoadError: If any value in the batch is invalid
+        """
+        size = len(rows)
+        errors: List[BulkLoadIssue] = []
+
+        keys = set()
+        for row in rows:
+            keys.update(row)
+        unknown = sorted(keys - self.plans.keys())
+        if unknown and self.ignore_unknown:
+            logger.warning(f"Ignoring keys that are not columns of {self.model_class.__name__}: "
+                           f"{', '.join(unknown)}")
+        else:
+            errors.extend((None, key, f"is not a column of {self.model_class.__name__}") for key in unknown)
+
+        # Transpose once; every later step works on whole columns
+        columns = {key: [row.get(key) for row in rows] for key in keys if key in self.plans}
+
+        mapper = inspect(self.model_class)
+        if mapper.polymorphic_on is not None and mapper.polymorphic_identity is not None:
+            discriminator = mapper.get_property_by_column(mapper.polymorphic_on).key
+            identity = mapper.polymorphic_identity
+            values = columns.get(discriminator) or [None] * size
+            columns[discriminator] = [identity if value is None else value for value in values]
+
+        for key, values in columns.items():
+            self._check_column(self.plans[key], values, errors)
+        if errors:
+            raise BulkLoadError(self.model_class.__name__, _sorted(errors))
+
+        for key, plan in self.plans.items():
+            values = columns.get(key)
+            if values is None:
+                if plan.column.default is not None:
+                    columns[key] = [plan.default() for _ in range(size)]
+            elif plan.column.default is not None and None in values:
+                columns[key] = [plan.default() if value is None else value for value in values]
+
+        prepare = getattr(self.model_class, 'prepare_bulk_columns', None)
+        if prepare is not None:
+            prepare(columns, size)
+
+        for key, plan in self.plans.items():
+            values = columns.get(key)
+            if plan.required or plan.checks.get('required'):
+                missing = range(size) if values is None else [i for i, value in enumerate(values) if value is None]
+                errors.extend((row, key, "is required") for row in missing)
+            elif values is not None and plan.column.primary_key and None in values and any(
+                    value is not None for value in values):
+                errors.append((None, key, "must be given for every row or for none"))
+
+        if errors:
+            raise BulkLoadError(self.model_class.__name__, _sorted(errors))
+
+        # Columns nobody filled are left to the database (autoincrement, server defaults)
+        return {key: values for key, values in columns.items()
+                if any(value is not None for value in values)}
+
+    def _check_column(self, plan: _ColumnPlan, values: List[Any], errors: List[BulkLoadIssue]) -> None:
+        """Coerce the values of one column in place and record every invalid one."""
+        key = plan.key
+        present = [i for i, value in enumerate(values) if value is not None]
+        if not present:
+            return
+
+        if plan.kind == "enum":
+            lookup = plan.enum_lookup
+            for i in present:
+                value = values[i]
+                member = lookup.get(value)
+                if member is None and isinstance(value, str):
+                    member = lookup.get(value.upper())
+                if member is None:
+                    errors.append((i, key, f"{value!r} is not a valid {plan.column.type.enum_class.__name__}"))
+                values[i] = member
+        elif plan.kind in ("datetime", "date"):
+            parse = datetime.fromisoformat if plan.kind == "datetime" else date.fromisoformat
+            for i in present:
+                value = values[i]
+                if isinstance(value, str):
+                    try:
+                        values[i] = parse(value)
+                    except ValueError:
+                        errors.append((i, key, f"{value!r} is not an ISO {plan.kind}"))
+                elif plan.kind == "date" and isinstance(value, datetime):
+                    values[i] = value.date()
+        elif plan.kind in ("integer", "float"):
+            self._check_numbers(plan, values, present, errors)
+        elif plan.kind == "string" and plan.max_length:
+            lengths = np.fromiter((len(value) if isinstance(value, str) else 0 for value in values),
+                                  dtype=np.int64, count=len(values))
+            for i in np.flatnonzero(lengths > plan.max_length):
+                errors.append((int(i), key, f"cannot exceed {plan.max_length} characters"))
+
+        if plan.checks.get('required') and plan.kind == "string":
+            errors.extend((i, key, "cannot be empty") for i in present
+                          if isinstance(values[i], str) and not values[i].strip())
+
+        choices = plan.checks.get('choices')
+        if choices is not None:
+            allowed = set(choices)
+            errors.extend((i, key, f"{values[i]!r} is not one of {', '.join(map(str, choices))}")
+                          for i in present if values[i] not in allowed)
+
+    def _check_numbers(self, plan: _ColumnPlan, values: List[Any], present: List[int],
+                       errors: List[BulkLoadIssue]) -> None:
+        """Coerce a numeric column and apply its range checks over the whole column."""
+        key = plan.key
+        convert = int if plan.kind == "integer" else float
+        for i in present:
+            value = values[i]
+            if isinstance(value, str):
+                try:
+                    values[i] = convert(value)
+                except ValueError:
+                    errors.append((i, key, f"{value!r} is not a number"))
+                    values[i] = None
+
+        ranges = [(name, limit) for name, limit in plan.checks.items() if name in _RANGE_CHECKS]
+        if not ranges:
+            return
+        # None becomes NaN, which fails no comparison
+        array = np.array([np.nan if value is None else value for value in values], dtype=float)
+        for name, limit in ranges:
+            compare, message = _RANGE_CHECKS[name]
+            for i in np.flatnonzero(compare(array, limit)):
+                errors.append((int(i), key, message.format(limit)))
+
+    def load(self, rows: Sequence[Dict[str, Any]]) -> int:
+        """
+        Validate a batch of rows and insert it with one executemany.
+
+        Runs in the session's current transaction; the caller commits.
+
+        Args:
+            rows: Row dictionaries keyed by attribute name
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            BulkLoadError: If any value in the batch is invalid
+        """
+        if not rows:
+            return 0
+
+        columns = self.validate(rows)
+        names = [self.plans[key].column.key for key in columns]
+        records = [dict(zip(names, values)) for values in zip(*columns.values())]
+
+        self.session.execute(insert(self.table), records)
+        logger.debug(f"Bulk loaded {len(records)} {self.model_class.__name__} rows")
+        return len(records)
@@ -1,7 +1,7 @@
 # database/repositories/inventory_repository.py
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Optional, Type, Union, Tuple
-from sqlalchemy import func, case, and_, or_
+from sqlalchemy import DateTime, Float, Integer, String, Text, func, case, and_, or_, bindparam, insert, literal, select, update
 from datetime import datetime, timedelta
 
 from database.models.inventory import Inventory
@@ -53,6 +53,9 @@ class InventoryRepository(BaseRepository[Inventory]):
     def get_by_storage_location(self, location: str) -> List[Inventory]:
         """Get inventory by storage location.
 
+        A code known to the location hierarchy matches the location and everything
+        below it through the materialized path; anything else falls back to a text match.
+
         Args:
             location: Storage location to search for
 
@@ -60,6 +63,17 @@ class InventoryRepository(BaseRepository[Inventory]):
             List of inventory instances in the specified location
         """
         self.logger.debug(f"Getting inventory with storage location '{location}'")
+        from database.models.storage_location import StorageLocation
+
+        root = self.session.query(StorageLocation.path).filter(StorageLocation.code == location).first()
+        if root:
+            return self.session.query(Inventory).join(
+                StorageLocation, StorageLocation.id == Inventory.location_id
+            ).filter(
+                StorageLocation.path >= root.path,
+                StorageLocation.path < StorageLocation.subtree_upper_bound(root.path)
+            ).all()
+
         return self.session.query(Inventory).filter(Inventory.storage_location.ilike(f"%{location}%")).all()
 
     def get_by_item(self, item_id: int, item_type: str) -> Optional[Inventory]:
@@ -110,6 +124,9 @@ class InventoryRepository(BaseRepository[Inventory]):
     def get_low_stock_items(self, threshold: Optional[float] = None) -> List[Dict[str, Any]]:
         """Get items with low stock.
 
+        Without a threshold this reads the rows flagged low_stock through the partial
+        index, joining item names in the same query.
+
         Args:
             threshold: Optional override threshold (if not specified, uses per-item thresholds)
 
@@ -121,105 +138,165 @@ class InventoryRepository(BaseRepository[Inventory]):
         from database.models.product import Product
         from database.models.tool import Tool
 
-        # Prepare query with conditional joins based on item_type
-        query = self.session.query(Inventory)
+        materials = Material.__table__
+        products = Product.__table__
+        tools = Tool.__table__
+
+        query = self.session.query(
+            Inventory.id,
+            Inventory.item_type,
+            Inventory.item_id,
+            Inventory.quantity,
+            Inventory.status,
+            Inventory.min_stock_level,
+            Inventory.reorder_point,
+            Inventory.reorder_quantity,
+            Inventory.storage_location,
+            func.coalesce(materials.c.name, products.c.name, tools.c.name).label('name'),
+            materials.c.material_type,
+            tools.c.tool_category
+        ).outerjoin(
+            materials, and_(Inventory.item_type == 'material', materials.c.id == Inventory.item_id)
+        ).outerjoin(
+            products, and_(Inventory.item_type == 'product', products.c.id == Inventory.item_id)
+        ).outerjoin(
+            tools, and_(Inventory.item_type == 'tool', tools.c.id == Inventory.item_id)
+        )
 
         # Apply threshold filtering
         if threshold is not None:
             query = query.filter(Inventory.quantity <= threshold)
         else:
-            # Use the low_stock flag that is updated by inventory triggers/rules
-            query = query.filter(Inventory.status == InventoryStatus.LOW_STOCK)
+            # Use the low_stock flag maintained alongside every quantity change
+            query = query.filter(Inventory.low_stock == True)
 
-        results = []
-        for inv in query.all():
-            item_data = inv.to_dict()
+        return [
+            {
+                'id': row.id,
+                'item_type': row.item_type,
+                'item_id': row.item_id,
+                'name': row.name,
+                'quantity': row.quantity,
+                'status': row.status.value,
+                'min_stock_level': row.min_stock_level,
+                'reorder_point': row.reorder_point,
+                'reorder_quantity': row.reorder_quantity,
+                'storage_location': row.storage_location,
+                'material_type': row.material_type.value if row.material_type else None,
+                'tool_category': row.tool_category.value if row.tool_category else None
+            }
+            for row in query.all()
+        ]
 
-            # Add item-specific details based on type
-            if inv.item_type == 'material':
-                material = self.session.query(Material).get(inv.item_id)
-                if material:
-                    item_data['name'] = material.name
-                    item_data['material_type'] = material.material_type.value if hasattr(material,
-                                                                                         'material_type') else None
-                    item_data['min_stock'] = material.min_stock if hasattr(material, 'min_stock') else None
+    def get_low_stock_counts(self) -> Dict[str, int]:
+        """Count rows needing replenishment, grouped by status.
 
-            elif inv.item_type == 'product':
-                product = self.session.query(Product).get(inv.item_id)
-                if product:
-                    item_data['name'] = product.name
-                    item_data['min_stock'] = product.min_stock if hasattr(product, 'min_stock') else None
+        Only rows flagged low_stock are read, so this stays cheap as the table grows.
 
-            elif inv.item_type == 'tool':
-                tool = self.session.query(Tool).get(inv.item_id)
-                if tool:
-                    item_data['name'] = tool.name
-                    item_data['tool_type'] = tool.tool_type.value if hasattr(tool, 'tool_type') else None
+        Returns:
+            Dictionary of status value to count
+        """
+        self.logger.debug("Counting low stock items by status")
+        rows = self.session.query(
+            Inventory.status,
+            func.count().label('count')
+        ).filter(Inventory.low_stock == True).group_by(Inventory.status).all()
 
-            results.append(item_data)
+        return {status.value: count for status, count in rows}
 
-        return results
+    def get_reorder_candidates(self, material_multiplier: float = 3.0,
+                               tool_multiplier: float = 2.0) -> List[Dict[str, Any]]:
+        """Get purchasable low-stock items with suggested order quantities.
 
-    def update_inventory_status(self) -> Dict[str, int]:
-        """Update inventory status based on quantity thresholds.
+        Order quantities, suppliers and unit prices for every flagged material and tool
+        are computed in one joined query. An item's reorder_quantity is used when set.
+        Otherwise stock is topped up to a multiple of its minimum stock level.
+
+        Args:
+            material_multiplier: Target stock for materials as a multiple of the minimum level
+            tool_multiplier: Target stock for tools as a multiple of the minimum level
 
         Returns:
-            Dictionary with counts of updated records by status
+            List of dicts with item, supplier, stock and order quantity information
         """
-        self.logger.debug("Updating inventory status based on thresholds")
+        self.logger.debug("Getting reorder candidates")
         from database.models.material import Material
-        from database.models.product import Product
+        from database.models.tool import Tool
 
-        updates = {
-            'out_of_stock': 0,
-            'low_stock': 0,
-            'in_stock': 0
-        }
+        materials = Material.__table__
+        tools = Tool.__table__
+
+        base_level = func.coalesce(Inventory.min_stock_level, Inventory.reorder_point, 1.0)
+        multiplier = case((Inventory.item_type == 'material', material_multiplier), else_=tool_multiplier)
+        order_quantity = func.coalesce(Inventory.reorder_quantity, base_level * multiplier - Inventory.quantity)
+
+        query = self.session.query(
+            Inventory.id,
+            Inventory.item_type,
+            Inventory.item_id,
+            Inventory.quantity,
+            Inventory.status,
+            func.coalesce(materials.c.name, tools.c.name).label('name'),
+            func.coalesce(materials.c.supplier_id, tools.c.supplier_id).label('supplier_id'),
+            func.coalesce(materials.c.cost_price, tools.c.purchase_price, 0.0).label('unit_price'),
+            order_quantity.label('order_quantity')
+        ).outerjoin(
+            materials, and_(Inventory.item_type == 'material', materials.c.id == Inventory.item_id)
+        ).outerjoin(
+            tools, and_(Inventory.item_type == 'tool', tools.c.id == Inventory.item_id)
+        ).filter(
+            Inventory.low_stock == True
+        ).filter(
+            Inventory.item_type.in_(('material', 'tool'))
+        ).filter(
+            order_quantity > 0
+        )
+
+        return [
+            {
+                'inventory_id': row.id,
+                'item_type': row.item_type,
+                'item_id': row.item_id,
+                'name': row.name,
+                'current_quantity': row.quantity,
+                'status': row.status.value,
+                'supplier_id': row.supplier_id,
+                'price': row.unit_price,
+                'quantity': row.order_quantity
+            }
+            for row in query.all()
+        ]
 
-        # Get all inventory items
-        inventory_items = self.get_all(limit=10000)
+    def update_inventory_status(self) -> Dict[str, int]:
+        """Recompute inventory status and the low-stock flag from quantity thresholds.
 
-        for inv in inventory_items:
-            old_status = inv.status
+        Status is normally kept current whenever quantity changes, so this is only a
+        repair pass. It runs as one set-based UPDATE rather than loading every row.
 
-            # Determine the appropriate status based on quantity
-            if inv.quantity <= 0:
-                inv.status = InventoryStatus.OUT_OF_STOCK
-                updates['out_of_stock'] += 1
-            else:
-                # Check threshold based on item type
-                if inv.item_type == 'material':
-                    material = self.session.query(Material).get(inv.item_id)
-                    if material and hasattr(material, 'min_stock') and material.min_stock is not None:
-                        if inv.quantity <= material.min_stock:
-                            inv.status = InventoryStatus.LOW_STOCK
-                            updates['low_stock'] += 1
-                        else:
-                            inv.status = InventoryStatus.IN_STOCK
-                            updates['in_stock'] += 1
-                elif inv.item_type == 'product':
-                    product = self.session.query(Product).get(inv.item_id)
-                    if product and hasattr(product, 'min_stock') and product.min_stock is not None:
-                        if inv.quantity <= product.min_stock:
-                            inv.status = InventoryStatus.LOW_STOCK
-                            updates['low_stock'] += 1
-                        else:
-                            inv.status = InventoryStatus.IN_STOCK
-                            updates['in_stock'] += 1
-                else:
-                    # Default logic for other types
-                    if inv.quantity <= 2:  # Default threshold
-                        inv.status = InventoryStatus.LOW_STOCK
-                        updates['low_stock'] += 1
-                    else:
-                        inv.status = InventoryStatus.IN_STOCK
-                        updates['in_stock'] += 1
+        Returns:
+            Dictionary with counts of records by resulting status
+        """
+        self.logger.debug("Updating inventory status based on thresholds")
 
-            # Only update if status changed
-            if old_status != inv.status:
-                self.update(inv)
+        self.session.execute(
+            update(Inventory).values(
+                status=Inventory.status_expression(),
+                low_stock=Inventory.low_stock_expression()
+            ).execution_options(synchronize_session=False)
+        )
+        self.session.flush()
+        self.session.expire_all()
 
-        return updates
+        counts = dict(
+            self.session.query(Inventory.status, func.count()).group_by(Inventory.status).all()
+        )
+        pending = counts.get(InventoryStatus.PENDING_REORDER, 0)
+
+        return {
+            'out_of_stock': counts.get(InventoryStatus.OUT_OF_STOCK, 0),
+            'low_stock': counts.get(InventoryStatus.LOW_STOCK, 0) + pending,
+            'in_stock': counts.get(InventoryStatus.IN_STOCK, 0)
+        }
 
     # Inventory manipulation methods
 
@@ -296,44 +373,33 @@ class InventoryRepository(BaseRepository[Inventory]):
         Args:
             inventory: Inventory record to update
         """
-        from database.models.material import Material
-        from database.models.product import Product
+        inventory._update_status()
 
-        # Update status based on thresholds
-        if inventory.quantity <= 0:
-            inventory.status = InventoryStatus.OUT_OF_STOCK
-        elif inventory.item_type == 'material':
-            material = self.session.query(Material).get(inventory.item_id)
-            if material and hasattr(material, 'min_stock') and material.min_stock is not None:
-                if inventory.quantity <= material.min_stock:
-                    inventory.status = InventoryStatus.LOW_STOCK
-                else:
-                    inventory.status = InventoryStatus.IN_STOCK
-            else:
-                # Default threshold
-                if inventory.quantity <= 5:
-                    inventory.status = InventoryStatus.LOW_STOCK
-                else:
-                    inventory.status = InventoryStatus.IN_STOCK
-        elif inventory.item_type == 'product':
-            product = self.session.query(Product).get(inventory.item_id)
-            if product and hasattr(product, 'min_stock') and product.min_stock is not None:
-                if inventory.quantity <= product.min_stock:
-                    inventory.status = InventoryStatus.LOW_STOCK
-                else:
-                    inventory.status = InventoryStatus.IN_STOCK
-            else:
-                # Default threshold
-                if inventory.quantity <= 2:
-                    inventory.status = InventoryStatus.LOW_STOCK
-                else:
-                    inventory.status = InventoryStatus.IN_STOCK
-        else:
-            # Default logic for other types
-            if inventory.quantity <= 2:  # Default threshold
-                inventory.status = InventoryStatus.LOW_STOCK
-            else:
-                inventory.status = InventoryStatus.IN_STOCK
+    def apply_quantity_change(self, inventory_id: int, quantity_change: float) -> int:
+        """Change quantity and recompute status in a single UPDATE statement.
+
+        Args:
+            inventory_id: ID of the inventory record
+            quantity_change: Amount to add (positive) or subtract (negative)
+
+        Returns:
+            Number of rows updated (0 if not found or the change would go negative)
+        """
+        self.logger.debug(f"Applying quantity change {quantity_change} to inventory {inventory_id}")
+
+        new_quantity = Inventory.quantity + quantity_change
+        result = self.session.execute(
+            update(Inventory).
+            where(Inventory.id == inventory_id).
+            where(new_quantity >= 0).
+            values(
+                quantity=new_quantity,
+                status=Inventory.status_expression(new_quantity),
+                low_stock=Inventory.low_stock_expression(new_quantity),
+                last_movement_date=datetime.now()
+            ).execution_options(synchronize_session='fetch')
+        )
+        return result.rowcount
 
     def track_inventory_movement(self, inventory_id: int,
                                  from_location: str, to_location: str) -> Dict[str, Any]:
@@ -564,6 +630,7 @@ class InventoryRepository(BaseRepository[Inventory]):
 
         # Get low stock items
         low_stock = self.get_low_stock_items()
+        low_stock_counts = self.get_low_stock_counts()
 
         # Get recent movements (last 7 days)
         from database.models.location_history import LocationHistory
@@ -599,7 +666,7 @@ class InventoryRepository(BaseRepository[Inventory]):
             'item_type_counts': item_type_data,
             'location_counts': location_data,
             'valuation': inventory_value,
-            'low_stock_count': len(low_stock),
+            'low_stock_count': sum(low_stock_counts.values()),
             'low_stock_items': low_stock[:10],  # Top 10 for preview
             'recent_movements': movement_data[:10],  # Top 10 recent movements
             'total_items': sum(status_data.values()),
@@ -852,6 +919,9 @@ class InventoryRepository(BaseRepository[Inventory]):
     def bulk_update_locations(self, items_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Update storage locations for multiple inventory items.
 
+        Items are grouped by destination and each group is moved with one UPDATE
+        and one history INSERT ... SELECT, all in the caller's transaction.
+
         Args:
             items_data: List of items with inventory_id and new_location
 
@@ -862,55 +932,284 @@ class InventoryRepository(BaseRepository[Inventory]):
             ValidationError: If validation fails
         """
         self.logger.debug(f"Bulk updating storage locations for {len(items_data)} items")
+        by_destination: Dict[str, List[int]] = {}
+        for item in items_data:
+            inventory_id = item.get('inventory_id')
+            new_location = item.get('new_location')
+
+            if not inventory_id or not new_location:
+                raise ValidationError(f"Missing inventory_id or new_location in item data")
+
+            by_destination.setdefault(new_location, []).append(inventory_id)
+
+        updated_count = sum(
+            self.relocate_items(inventory_ids, new_location)
+            for new_location, inventory_ids in by_destination.items()
+        )
+
+        return {
+            'success': True,
+            'updated_count': updated_count
+        }
+
+    def relocate_items(self, inventory_ids: List[int], to_location: str,
+                       notes: Optional[str] = None) -> int:
+        """Move inventory records to a location in one statement.
+
+        Args:
+            inventory_ids: IDs of the inventory records to move
+            to_location: Destination location code
+            notes: Optional reason recorded in the movement history
+
+        Returns:
+            Number of records moved
+
+        Raises:
+            ValidationError: If the move fails
+        """
+        self.logger.debug(f"Relocating {len(inventory_ids)} inventory records to '{to_location}'")
+        if not inventory_ids:
+            return 0
+        return self._relocate(Inventory.id.in_(inventory_ids), to_location, notes)
+
+    def relocate_location_contents(self, from_location: str, to_location: str,
+                                   include_sublocations: bool = False,
+                                   similar_only: bool = False,
+                                   notes: Optional[str] = None) -> int:
+        """Move everything stored in one location to another in one statement.
+
+        Args:
+            from_location: Source location code
+            to_location: Destination location code
+            include_sublocations: Also move items stored below the source location
+            similar_only: Only move items whose type is already stored at the destination
+            notes: Optional reason recorded in the movement history
+
+        Returns:
+            Number of records moved
+
+        Raises:
+            EntityNotFoundError: If the source location does not exist
+            ValidationError: If the move fails
+        """
+        self.logger.debug(f"Relocating contents of '{from_location}' to '{to_location}'")
+        from database.models.storage_location import StorageLocation
+
+        source = self.session.query(StorageLocation).filter(StorageLocation.code == from_location).first()
+        if not source:
+            raise EntityNotFoundError(f"Storage location '{from_location}' not found")
+
+        if include_sublocations:
+            source_ids = select(StorageLocation.id).where(
+                StorageLocation.path >= source.path,
+                StorageLocation.path < StorageLocation.subtree_upper_bound(source.path)
+            )
+            condition = Inventory.location_id.in_(source_ids)
+        else:
+            condition = Inventory.location_id == source.id
+
+        if similar_only:
+            destination_types = select(Inventory.item_type).join(
+                StorageLocation, StorageLocation.id == Inventory.location_id
+            ).where(StorageLocation.code == to_location).distinct()
+            condition = and_(condition, Inventory.item_type.in_(destination_types))
+
+        return self._relocate(condition, to_location, notes)
+
+    def _relocate(self, condition, to_location: str, notes: Optional[str]) -> int:
+        """Move matching inventory to a location and record the history in bulk.
+
+        History rows are copied from the current inventory rows with INSERT ... SELECT
+        before the UPDATE, so both are set-based and nothing is loaded into the session.
+        Occupancy counts follow through the inventory triggers.
+
+        Args:
+            condition: Filter selecting the inventory rows to move
+            to_location: Destination location code, created if it does not exist
+            notes: Optional reason recorded in the movement history
+
+        Returns:
+            Number of records moved
+
+        Raises:
+            ValidationError: If the move fails
+        """
         from database.models.location_history import LocationHistory
+        from database.models.storage_location import StorageLocation
+        from database.repositories.storage_location_repository import StorageLocationRepository
 
-        updates = []
-        history_records = []
+        destination = StorageLocationRepository(self.session).get_or_create_by_code(to_location)
+        moving = and_(
+            condition,
+            or_(Inventory.location_id.is_(None), Inventory.location_id != destination.id)
+        )
+        now = datetime.now()
 
         try:
-            for item in items_data:
-                inventory_id = item.get('inventory_id')
-                new_location = item.get('new_location')
-
-                if not inventory_id or not new_location:
-                    raise ValidationError(f"Missing inventory_id or new_location in item data")
-
-                inventory = self.get_by_id(inventory_id)
-                if not inventory:
-                    raise ValidationError(f"Inventory with ID {inventory_id} not found")
-
-                old_location = inventory.storage_location
-                inventory.storage_location = new_location
-
-                # Create history record
-                history = LocationHistory(
-                    inventory_id=inventory_id,
-                    from_location=old_location or '',
-                    to_location=new_location,
-                    move_date=datetime.now()
+            self.session.execute(
+                insert(LocationHistory).from_select(
+                    ['inventory_id', 'from_location', 'from_location_id', 'to_location',
+                     'to_location_id', 'move_date', 'notes', 'created_at'],
+                    select(
+                        Inventory.id,
+                        Inventory.storage_location,
+                        Inventory.location_id,
+                        literal(destination.code, String),
+                        literal(destination.id, Integer),
+                        literal(now, DateTime),
+                        literal(notes, Text),
+                        literal(now, DateTime)
+                    ).where(moving)
                 )
-                history_records.append(history)
-
-                # Update inventory
-                self.update(inventory)
-
-                updates.append({
-                    'inventory_id': inventory_id,
-                    'item_id': inventory.item_id,
-                    'item_type': inventory.item_type,
-                    'old_location': old_location,
-                    'new_location': new_location
-                })
-
-            # Add history records
-            self.session.add_all(history_records)
-
-            return {
-                'success': True,
-                'updated_count': len(updates),
-                'updates': updates
-            }
+            )
+            result = self.session.execute(
+                update(Inventory).where(moving).values(
+                    location_id=destination.id,
+                    storage_location=destination.code,
+                    last_movement_date=now
+                ).execution_options(synchronize_session='fetch')
+            )
+
+            # Occupancy columns were changed by triggers behind the session's back
+            for instance in list(self.session.identity_map.values()):
+                if isinstance(instance, StorageLocation):
+                    self.session.expire(instance, ['item_count', 'total_quantity'])
+
+            return result.rowcount
+        except Exception as e:
+            self.logger.error(f"Error relocating inventory to '{to_location}': {str(e)}")
+            self.session.rollback()
+            raise ValidationError(f"Failed to update locations: {str(e)}")
+
+    # Physical count methods
+
+    def get_count_index(self, item_type: Optional[str] = None) -> List[Tuple[int, str, int, float, float]]:
+        """Get the columns needed to reconcile a physical count, without loading ORM objects.
+
+        Args:
+            item_type: Optional item type to restrict the count to
+
+        Returns:
+            List of (inventory_id, item_type, item_id, quantity, unit_price) tuples
+        """
+        self.logger.debug(f"Getting physical count index (item type: {item_type})")
+        from database.models.material import Material
+        from database.models.product import Product
+        from database.models.tool import Tool
+
+        materials = Material.__table__
+        products = Product.__table__
+        tools = Tool.__table__
+
+        query = select(
+            Inventory.id,
+            Inventory.item_type,
+            Inventory.item_id,
+            Inventory.quantity,
+            func.coalesce(materials.c.cost_price, products.c.price, tools.c.purchase_price, 0.0)
+        ).outerjoin(
+            materials, and_(Inventory.item_type == 'material', materials.c.id == Inventory.item_id)
+        ).outerjoin(
+            products, and_(Inventory.item_type == 'product', products.c.id == Inventory.item_id)
+        ).outerjoin(
+            tools, and_(Inventory.item_type == 'tool', tools.c.id == Inventory.item_id)
+        )
+        if item_type:
+            query = query.where(Inventory.item_type == item_type)
+
+        return [tuple(row) for row in self.session.execute(query)]
+
+    def apply_count_adjustments(self, adjustments: List[Dict[str, Any]],
+                                adjustment_type: InventoryAdjustmentType = InventoryAdjustmentType.PHYSICAL_COUNT,
+                                reason: Optional[str] = None) -> List[int]:
+        """Set counted quantities and write their ledger entries in bulk.
+
+        Quantities are written with one executemany UPDATE, which also recomputes status
+        and the low-stock flag, and ledger entries with one executemany INSERT. A record
+        is only updated while its quantity still equals quantity_before, so stock moved
+        since the count was compared is never overwritten; such records are skipped and
+        get no ledger entry.
+
+        Args:
+            adjustments: Dicts with inventory_id, quantity_before and quantity_after
+            adjustment_type: Adjustment type recorded in the ledger
+            reason: Optional reason recorded in the ledger
+
+        Returns:
+            IDs of the inventory records adjusted
+
+        Raises:
+            ValidationError: If the adjustment fails
+        """
+        self.logger.debug(f"Applying {len(adjustments)} physical count adjustments")
+        from database.models.inventory_transaction import InventoryTransaction
+
+        if not adjustments:
+            return []
+
+        now = datetime.now()
+        counted = bindparam('counted_quantity', type_=Float)
+        inventory = Inventory.__table__
+
+        try:
+            self.session.execute(
+                update(inventory).where(
+                    inventory.c.id == bindparam('inventory_id'),
+                    inventory.c.quantity == bindparam('system_quantity', type_=Float)
+                ).values(
+                    quantity=counted,
+                    status=Inventory.status_expression(counted),
+                    low_stock=Inventory.low_stock_expression(counted),
+                    last_movement_date=now
+                ),
+                [
+                    {
+                        'inventory_id': adjustment['inventory_id'],
+                        'system_quantity': adjustment['quantity_before'],
+                        'counted_quantity': adjustment['quantity_after']
+                    }
+                    for adjustment in adjustments
+                ]
+            )
+
+            # Only the rows the guarded update wrote carry this transaction's timestamp
+            adjusted_ids = set(self.session.scalars(
+                select(inventory.c.id).where(
+                    inventory.c.id.in_([adjustment['inventory_id'] for adjustment in adjustments]),
+                    inventory.c.last_movement_date == now
+                )
+            ))
+            applied = [adjustment for adjustment in adjustments if adjustment['inventory_id'] in adjusted_ids]
+            if len(applied) < len(adjustments):
+                self.logger.warning(f"Skipped {len(adjustments) - len(applied)} count adjustments for "
+                                    f"inventory whose quantity changed since it was counted")
+
+            if applied:
+                self.session.execute(
+                    insert(InventoryTransaction.__table__),
+                    [
+                        {
+                            'inventory_id': adjustment['inventory_id'],
+                            'transaction_type': TransactionType.INVENTORY_CORRECTION,
+                            'adjustment_type': adjustment_type,
+                            'quantity_before': adjustment['quantity_before'],
+                            'quantity_after': adjustment['quantity_after'],
+                            'quantity_change': adjustment['quantity_after'] - adjustment['quantity_before'],
+                            'transaction_date': now,
+                            'reason': reason,
+                            'created_at': now
+                        }
+                        for adjustment in applied
+                    ]
+                )
+
+            # Quantities were changed behind the session's back
+            for instance in list(self.session.identity_map.values()):
+                if isinstance(instance, Inventory):
+                    self.session.expire(instance)
+
+            return [adjustment['inventory_id'] for adjustment in applied]
         except Exception as e:
-            self.logger.error(f"Error updating locations: {str(e)}")
+            self.logger.error(f"Error applying physical count adjustments: {str(e)}")
             self.session.rollback()
-            raise ValidationError(f"Failed to update locations: {str(e)}")
\ No newline at end of file
+            raise ValidationError(f"Failed to apply physical count adjustments: {str(e)}")
\ No newline at end of file
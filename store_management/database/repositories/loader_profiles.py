@@ -0,0 +1,186 @@
+# database/repositories/loader_profiles.py
+"""
+Named loader profiles for repository queries.
+
+Model relationships are not eager-loaded by default (see ``RELATIONSHIP_LAZY`` in
+database.models.base). Instead every use case names the relationships it reads,
+and repositories turn that profile into query options:
+
+    list_row   - what a row in a list view shows
+    detail     - what a detail view or single-entity DTO shows
+    export     - what an export writes for each entity
+    analytics  - what dashboards and reports aggregate in Python
+
+Relationship paths may be dotted (``"sales_items.product"``). Each step is loaded with
+a JOIN when it points to a single object and with one extra ``IN`` query when it is a
+collection, so a profile costs at most one query per collection in it, however many
+rows are loaded.
+"""
+
+import logging
+from typing import Dict, List, Tuple, Type
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, selectinload
+
+logger = logging.getLogger(__name__)
+
+LIST_ROW = "list_row"
+DETAIL = "detail"
+EXPORT = "export"
+ANALYTICS = "analytics"
+
+PROFILE_NAMES = (LIST_ROW, DETAIL, EXPORT, ANALYTICS)
+
+# Model class name -> profile name -> relationship paths to load.
+# Subclasses (Leather, Hardware, Supplies) use their base model's entry.
+LOADER_PROFILES: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "Component": {
+        DETAIL: ("component_materials.material", "patterns"),
+        EXPORT: ("component_materials.material",),
+    },
+    "Customer": {
+        LIST_ROW: ("sales",),
+        DETAIL: ("sales",),
+        ANALYTICS: ("sales.sales_items",),
+    },
+    "Inventory": {
+        LIST_ROW: ("material", "product", "tool"),
+        DETAIL: ("material", "product", "tool", "location"),
+        EXPORT: ("material", "product", "tool", "location"),
+        ANALYTICS: ("material", "product", "tool"),
+    },
+    "Material": {
+        LIST_ROW: ("supplier", "inventory"),
+        DETAIL: ("supplier", "inventory", "purchase_items"),
+        EXPORT: ("supplier", "inventory"),
+        ANALYTICS: ("inventory", "component_materials"),
+    },
+    "Pattern": {
+        LIST_ROW: ("components",),
+        DETAIL: ("components", "products"),
+        EXPORT: ("components", "products"),
+    },
+    "Product": {
+        LIST_ROW: ("inventory",),
+        DETAIL: ("patterns", "inventory", "sales_items"),
+        EXPORT: ("inventory",),
+        ANALYTICS: ("sales_items",),
+    },
+    "Project": {
+        DETAIL: ("project_components.component", "sales.customer", "tool_list", "tool_checkouts.tool"),
+        EXPORT: ("project_components.component", "sales.customer"),
+        ANALYTICS: ("project_components.component", "tool_checkouts"),
+    },
+    "ProjectComponent": {
+        LIST_ROW: ("component",),
+        DETAIL: ("project", "component"),
+    },
+    "Purchase": {
+        LIST_ROW: ("supplier",),
+        DETAIL: ("supplier", "items"),
+        EXPORT: ("supplier", "items"),
+        ANALYTICS: ("supplier", "items"),
+    },
+    "PurchaseItem": {
+        DETAIL: ("purchase", "material", "tool"),
+    },
+    "Sales": {
+        LIST_ROW: ("customer", "sales_items"),
+        DETAIL: ("customer", "sales_items.product", "projects", "picking_list"),
+        EXPORT: ("customer", "sales_items"),
+        ANALYTICS: ("customer", "sales_items.product"),
+    },
+    "SalesItem": {
+        LIST_ROW: ("product",),
+        DETAIL: ("sales", "product"),
+        ANALYTICS: ("product",),
+    },
+    "Supplier": {
+        DETAIL: ("materials", "tools", "purchases"),
+        ANALYTICS: ("purchases",),
+    },
+    "Tool": {
+        LIST_ROW: ("supplier", "inventory"),
+        DETAIL: ("supplier", "inventory", "maintenance_records", "checkouts"),
+        EXPORT: ("supplier", "inventory"),
+        ANALYTICS: ("maintenance_records", "checkouts"),
+    },
+    "ToolCheckout": {
+        LIST_ROW: ("tool", "project"),
+        DETAIL: ("tool", "project"),
+    },
+    "ToolMaintenance": {
+        LIST_ROW: ("tool",),
+        DETAIL: ("tool",),
+    },
+}
+
+
+def register_profile(model_name: str, profile: str, paths: Tuple[str, ...]) -> None:
+    """
+    Add or replace the relationships a profile loads for a model.
+
+    Args:
+        model_name: Model class name
+        profile: Profile name
+        paths: Relationship paths to load
+    """
+    LOADER_PROFILES.setdefault(model_name, {})[profile] = tuple(paths)
+
+
+def profile_paths(model_class: Type, profile: str) -> Tuple[str, ...]:
+    """
+    Get the relationship paths a profile loads for a model.
+
+    Args:
+        model_class: The model class
+        profile: Profile name
+
+    Returns:
+        Relationship paths, empty if the profile loads no relationships for the model
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    if profile not in PROFILE_NAMES and not any(profile in entry for entry in LOADER_PROFILES.values()):
+        raise ValueError(f"Unknown loader profile '{profile}'")
+
+    for cls in model_class.__mro__:
+        entry = LOADER_PROFILES.get(cls.__name__)
+        if entry is not None:
+            return entry.get(profile, ())
+    return ()
+
+
+def loader_options(model_class: Type, profile: str) -> List:
+    """
+    Build the query options for a profile.
+
+    Args:
+        model_class: The model class being queried
+        profile: Profile name
+
+    Returns:
+        Loader options to pass to ``Query.options`` or ``Select.options``
+
+    Raises:
+        ValueError: If the profile is unknown or names a relationship the model does not have
+    """
+    options = []
+    for path in profile_paths(model_class, profile):
+        option = None
+        current = model_class
+        for name in path.split("."):
+            relationship = inspect(current).relationships.get(name)
+            if relationship is None:
+                raise ValueError(f"{current.__name__} has no relationship '{name}' (loader profile '{profile}')")
+
+            attribute = getattr(current, name)
+            if relationship.uselist:
+                option = selectinload(attribute) if option is None else option.selectinload(attribute)
+            else:
+                option = joinedload(attribute) if option is None else option.joinedload(attribute)
+            current = relationship.mapper.class_
+        options.append(option)
+    return options
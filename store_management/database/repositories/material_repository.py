@@ -17,6 +17,13 @@ class MaterialRepository(BaseRepository[Material]):
     material data, along with business logic operations and GUI-specific functionality.
     """
 
+    list_columns = {
+        'supplier_name': 'supplier.name',
+        'inventory_status': 'inventory.status',
+        'quantity': 'inventory.quantity',
+        'cost': 'inventory.unit_cost',
+    }
+
     def _get_model_class(self) -> Type[Material]:
         """Return the model class this repository manages.
 
@@ -139,8 +146,8 @@ class MaterialRepository(BaseRepository[Material]):
         if threshold is not None:
             query = query.filter(Inventory.quantity <= threshold)
         else:
-            # Use material-specific thresholds stored in material.min_stock
-            query = query.filter(Inventory.quantity <= Material.min_stock)
+            # Use the indexed low_stock flag kept current with every quantity change
+            query = query.filter(Inventory.low_stock == True)
 
         result = []
         for material, inventory in query.all():
@@ -165,10 +172,8 @@ class MaterialRepository(BaseRepository[Material]):
             join(Inventory,
                  (Inventory.item_id == Material.id) &
                  (Inventory.item_type == 'material')). \
-            filter(or_(
-            Inventory.quantity <= 0,
-            Inventory.status == InventoryStatus.OUT_OF_STOCK
-        ))
+            filter(Inventory.low_stock == True). \
+            filter(Inventory.status == InventoryStatus.OUT_OF_STOCK)
 
         result = []
         for material, inventory in query.all():
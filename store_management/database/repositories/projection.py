@@ -0,0 +1,215 @@
+# database/repositories/projection.py
+"""
+Column projections for list queries.
+
+List views show a handful of columns per row, so loading full entities (identity map
+bookkeeping, relationship state, DTO conversion) for every row is wasted work. A
+ListProjection selects exactly the requested columns, following single-valued
+relationships with outer joins (``"supplier.name"``), and returns each row as an
+immutable namedtuple, which has no per-instance ``__dict__``.
+"""
+
+import enum
+import logging
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import Enum, String, func, literal, or_, select
+from sqlalchemy.orm import aliased
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def row_type(name: str, fields: Tuple[str, ...]) -> Type[tuple]:
+    """
+    Get the namedtuple type for a list row.
+
+    Types are cached, so every page of a list shares one row class.
+
+    Args:
+        name: Class name for the row type
+        fields: Field names in display order
+
+    Returns:
+        The namedtuple class
+    """
+    return namedtuple(name, fields)
+
+
+class ListProjection:
+    """
+    Select statement builder for the columns of a list.
+
+    Field names map to model attribute paths through ``column_map``; names without
+    an entry are looked up on the model directly, and names the model cannot resolve
+    come back as None so a list never fails over a column it cannot fill.
+    """
+
+    def __init__(self, model_class: Type, fields: Sequence[str], column_map: Optional[Dict[str, str]] = None):
+        """
+        Initialize the projection.
+
+        Args:
+            model_class: The model listed
+            fields: Field names of the row, in display order
+            column_map: Field name to attribute path (e.g. ``{"supplier_name": "supplier.name"}``)
+        """
+        self.model_class = model_class
+        self.fields = tuple(fields)
+        self.column_map = column_map or {}
+        self.row_class = row_type(f"{model_class.__name__}Row", self.fields)
+        self._aliases: Dict[str, Any] = {}
+        self._joins: List[Tuple[Any, Any]] = []
+        self._columns = [self.column(field) for field in self.fields]
+
+        # Only enum columns need converting; everything else is passed through as is
+        self._enum_positions = [
+            position for position, column in enumerate(self._columns)
+            if isinstance(getattr(column, "type", None), Enum)
+        ]
+
+    def column(self, field: str):
+        """
+        Resolve a field to a column expression, joining relationships as needed.
+
+        Args:
+            field: Field name
+
+        Returns:
+            Column expression, or None if the model has no such column
+        """
+        path = self.column_map.get(field, field).split(".")
+        entity = self.model_class
+        for depth, name in enumerate(path[:-1]):
+            key = ".".join(path[:depth + 1])
+            if key not in self._aliases:
+                attribute = getattr(entity, name, None)
+                prop = getattr(attribute, "property", None)
+                if prop is None or not hasattr(prop, "mapper"):
+                    return None
+                if prop.uselist:
+                    raise ValueError(f"List column '{field}' follows collection '{name}'")
+                target = aliased(prop.mapper.class_)
+                self._aliases[key] = target
+                self._joins.append((attribute, target))
+            entity = self._aliases[key]
+
+        column = getattr(entity, path[-1], None)
+        if column is None or not hasattr(column, "property") or hasattr(column.property, "mapper"):
+            return None
+        return column
+
+    def select(self, search_term: Optional[str] = None, search_fields: Sequence[str] = (),
+               **filter_criteria):
+        """
+        Build the filtered select of the row columns.
+
+        String columns match filter values as case-insensitive substrings, enum columns
+        accept enum values or names, and other columns match exactly. Empty values and
+        fields the model cannot resolve are ignored.
+
+        Args:
+            search_term: Text that any of the search fields must contain
+            search_fields: Fields searched for the search term
+            **filter_criteria: Field name to value filters
+
+        Returns:
+            The select statement
+        """
+        conditions = []
+        for field, value in filter_criteria.items():
+            if value is None or value == "":
+                continue
+            column = self.column(field)
+            if column is None:
+                logger.debug(f"Ignoring filter on unknown list field '{field}'")
+                continue
+            conditions.append(self._match(column, value))
+
+        if search_term:
+            matches = [column.ilike(f"%{search_term}%")
+                       for column in map(self.column, search_fields) if column is not None]
+            if matches:
+                conditions.append(or_(*matches))
+
+        columns = [literal(None).label(field) if column is None else column.label(field)
+                   for field, column in zip(self.fields, self._columns)]
+        statement = select(*columns).select_from(self.model_class)
+        for attribute, target in self._joins:
+            statement = statement.outerjoin(attribute.of_type(target))
+        return statement.where(*conditions)
+
+    def order_by(self, statement, sort_by: Optional[str], sort_dir: str = "asc"):
+        """
+        Sort a projection statement.
+
+        Args:
+            statement: Statement built by ``select``
+            sort_by: Field to sort by, or None for the primary key
+            sort_dir: Sort direction ('asc' or 'desc')
+
+        Returns:
+            The sorted statement
+        """
+        column = self.column(sort_by) if sort_by else None
+        if column is None:
+            column = self.model_class.id
+        return statement.order_by(column.desc() if sort_dir.lower() == "desc" else column.asc())
+
+    def count(self, statement):
+        """
+        Wrap a projection statement in a row count.
+
+        Args:
+            statement: Statement built by ``select``
+
+        Returns:
+            Select statement returning the number of rows
+        """
+        return select(func.count()).select_from(statement.subquery())
+
+    def make_rows(self, result) -> List[tuple]:
+        """
+        Turn result rows into row tuples, with enums replaced by their values.
+
+        Args:
+            result: Iterable of result rows
+
+        Returns:
+            List of row tuples
+        """
+        make = self.row_class._make
+        if not self._enum_positions:
+            return [make(row) for row in result]
+
+        rows = []
+        for row in result:
+            values = list(row)
+            for position in self._enum_positions:
+                if isinstance(values[position], enum.Enum):
+                    values[position] = values[position].value
+            rows.append(make(values))
+        return rows
+
+    @staticmethod
+    def _match(column, value):
+        """
+        Build the condition for a filter value.
+
+        Args:
+            column: The column filtered on
+            value: The filter value
+
+        Returns:
+            SQL condition
+        """
+        column_type = getattr(column, "type", None)
+        if isinstance(column_type, Enum) and column_type.enum_class and isinstance(value, str):
+            enum_class = column_type.enum_class
+            member = next((m for m in enum_class if value in (m.value, m.name)), None)
+            return column == member if member is not None else literal(False)
+        if isinstance(column_type, String) and isinstance(value, str):
+            return column.ilike(f"%{value}%")
+        return column == value
@@ -24,6 +24,81 @@ class PurchaseRepository(BaseRepository[Purchase]):
         """
         return Purchase
 
+    # Bulk operations
+
+    def bulk_create_with_items(self, orders: List[Dict[str, Any]]) -> List[int]:
+        """Create purchases and their items with bulk inserts.
+
+        Purchases are inserted with one executemany and items with another. Totals are
+        then set by a single UPDATE that sums the item lines in SQL. Model constructors
+        are bypassed, so callers must pass validated data.
+
+        Args:
+            orders: List of dicts with supplier_id, optional status and notes, and an
+                'items' list of dicts with item_type, item_id, quantity and price
+
+        Returns:
+            IDs of the created purchases, in the order of ``orders``
+
+        Raises:
+            ValidationError: If the inserts fail
+        """
+        if not orders:
+            return []
+
+        from sqlalchemy import insert, select, update
+        from database.models.purchase_item import PurchaseItem
+
+        self.logger.debug(f"Bulk creating {len(orders)} purchases")
+        now = datetime.now()
+        try:
+            purchase_ids = self.session.scalars(
+                insert(Purchase).returning(Purchase.id, sort_by_parameter_order=True),
+                [
+                    {
+                        'supplier_id': order['supplier_id'],
+                        'status': order.get('status', PurchaseStatus.DRAFT),
+                        'notes': order.get('notes'),
+                        'total_amount': 0.0,
+                        'created_at': now
+                    }
+                    for order in orders
+                ]
+            ).all()
+
+            item_rows = [
+                {
+                    'purchase_id': purchase_id,
+                    'item_type': item['item_type'],
+                    'item_id': item['item_id'],
+                    'quantity': item['quantity'],
+                    'price': item.get('price') or 0.0,
+                    'received_quantity': 0.0,
+                    'created_at': now
+                }
+                for purchase_id, order in zip(purchase_ids, orders)
+                for item in order['items']
+            ]
+            if item_rows:
+                self.session.execute(insert(PurchaseItem.__table__), item_rows)
+
+            items_total = select(
+                func.coalesce(func.sum(PurchaseItem.price * PurchaseItem.quantity), 0.0)
+            ).where(PurchaseItem.purchase_id == Purchase.id).scalar_subquery()
+
+            self.session.execute(
+                update(Purchase).
+                where(Purchase.id.in_(purchase_ids)).
+                values(total_amount=items_total).
+                execution_options(synchronize_session=False)
+            )
+            self.session.flush()
+            return list(purchase_ids)
+        except Exception as e:
+            self.logger.error(f"Error bulk creating purchases: {str(e)}")
+            self.session.rollback()
+            raise ValidationError(f"Failed to bulk create purchases: {str(e)}")
+
     # Purchase-specific query methods
 
     def get_by_status(self, status: PurchaseStatus) -> List[Purchase]:
@@ -6,6 +6,7 @@ from sqlalchemy import func, or_, and_, desc, extract, case
 
 from database.models.sales import Sales
 from database.repositories.base_repository import BaseRepository, EntityNotFoundError, ValidationError, RepositoryError
+from database.repositories.loader_profiles import EXPORT
 from database.models.enums import SaleStatus, PaymentStatus
 
 
@@ -89,6 +90,28 @@ class SalesRepository(BaseRepository[Sales]):
         self.logger.debug(f"Getting {limit} most recent sales")
         return self.session.query(Sales).order_by(Sales.created_at.desc()).limit(limit).all()
 
+    def get_monthly_sales_totals(self, start_date: datetime, end_date: datetime) -> Dict[str, float]:
+        """Get total sales per calendar month in a single grouped query.
+
+        Args:
+            start_date: Start of the range
+            end_date: End of the range
+
+        Returns:
+            Mapping of 'YYYY-MM' to total sales; months without sales are omitted
+        """
+        self.logger.debug(f"Getting monthly sales totals from {start_date} to {end_date}")
+        month = func.strftime('%Y-%m', Sales.created_at)
+        rows = self.session.query(
+            month.label('month'),
+            func.sum(Sales.total_amount).label('total_sales')
+        ).filter(
+            Sales.created_at >= start_date,
+            Sales.created_at <= end_date
+        ).group_by(month).all()
+
+        return {row.month: float(row.total_sales or 0) for row in rows}
+
     # Sales item methods
 
     def get_sales_with_items(self, sales_id: int) -> Dict[str, Any]:
@@ -723,7 +746,7 @@ class SalesRepository(BaseRepository[Sales]):
         self.logger.debug(f"Exporting sales data in {format} format from {start_date} to {end_date}")
 
         # Build query
-        query = self.session.query(Sales)
+        query = self.apply_profile(self.session.query(Sales), EXPORT)
 
         # Apply date filters if provided
         if start_date:
@@ -0,0 +1,341 @@
+# database/repositories/storage_location_repository.py
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import and_, case, func, select, update
+
+from database.models.enums import StorageLocationLevel, StorageLocationType
+from database.models.inventory import Inventory
+from database.models.storage_location import LOCATION_CODE_SEPARATOR, StorageLocation
+from database.repositories.base_repository import BaseRepository, EntityNotFoundError, ValidationError
+
+# Hierarchy levels in order, indexed by depth
+LOCATION_LEVELS = (
+    StorageLocationLevel.ZONE,
+    StorageLocationLevel.AISLE,
+    StorageLocationLevel.SHELF,
+    StorageLocationLevel.BIN,
+)
+
+
+class StorageLocationRepository(BaseRepository[StorageLocation]):
+    """Repository for the storage location hierarchy.
+
+    Locations are addressed by code ('A-B-3-12' is bin 12 on shelf 3 of aisle B in zone A).
+    Subtree reads use the materialized path column, and occupancy counts are kept current
+    by triggers on the inventory table, so none of the queries here walk the tree in Python.
+    """
+
+    def _get_model_class(self) -> Type[StorageLocation]:
+        """Return the model class this repository manages.
+
+        Returns:
+            The StorageLocation model class
+        """
+        return StorageLocation
+
+    # Basic query methods
+
+    def get_by_code(self, code: str) -> Optional[StorageLocation]:
+        """Get a location by its full code.
+
+        Args:
+            code: Location code (e.g. 'A-B-3')
+
+        Returns:
+            The location if found, None otherwise
+        """
+        self.logger.debug(f"Getting storage location with code '{code}'")
+        return self.session.query(StorageLocation).filter(StorageLocation.code == code).first()
+
+    def get_tree(self) -> List[StorageLocation]:
+        """Get all locations in depth-first order.
+
+        Ordering by materialized path lists every parent directly before its descendants.
+
+        Returns:
+            List of all storage locations
+        """
+        self.logger.debug("Getting storage location tree")
+        return self.session.query(StorageLocation).order_by(StorageLocation.path).all()
+
+    def get_subtree(self, location_id: int) -> List[StorageLocation]:
+        """Get a location and all of its descendants.
+
+        Args:
+            location_id: ID of the subtree root
+
+        Returns:
+            List of locations in depth-first order, starting with the root
+
+        Raises:
+            EntityNotFoundError: If the location does not exist
+        """
+        self.logger.debug(f"Getting storage location subtree for ID {location_id}")
+        root = self.get_by_id(location_id)
+        if not root:
+            raise EntityNotFoundError(f"Storage location with ID {location_id} not found")
+
+        return self.session.query(StorageLocation).filter(
+            self._subtree_filter(root.path)
+        ).order_by(StorageLocation.path).all()
+
+    def get_or_create_by_code(self, code: str,
+                              location_type: Optional[StorageLocationType] = None) -> StorageLocation:
+        """Get a location by code, creating it and any missing ancestors.
+
+        Free text that is not a hierarchy code (more than four segments, or empty
+        segments as in 'A--3') is kept as a single top-level location whose code is
+        the whole text, so locations entered before the hierarchy existed still work.
+
+        Args:
+            code: Location code with up to four segments (zone-aisle-shelf-bin)
+            location_type: Physical type for newly created leaf locations
+
+        Returns:
+            The existing or newly created location
+
+        Raises:
+            ValidationError: If the code is empty or has no usable name
+        """
+        self.logger.debug(f"Getting or creating storage location '{code}'")
+        segments, prefixes = self._parse_code(code)
+
+        # Fetch every existing prefix of the code in one query
+        existing = {
+            location.code: location
+            for location in self.session.query(StorageLocation).filter(StorageLocation.code.in_(prefixes))
+        }
+
+        try:
+            parent = None
+            for depth, prefix in enumerate(prefixes):
+                location = existing.get(prefix)
+                if location is None:
+                    is_leaf = depth == len(prefixes) - 1
+                    location = StorageLocation(
+                        name=segments[depth],
+                        code=prefix,
+                        level=LOCATION_LEVELS[depth],
+                        location_type=location_type if is_leaf else None,
+                        parent_id=parent.id if parent else None,
+                        depth=depth
+                    )
+                    self.session.add(location)
+                    self.session.flush()
+                    # The path embeds the new ID, so it can only be set after the insert
+                    location.path = f"{parent.path if parent else '/'}{location.id}/"
+                    self.session.flush()
+                parent = location
+            return parent
+        except Exception as e:
+            self.logger.error(f"Error creating storage location '{code}': {str(e)}")
+            self.session.rollback()
+            raise ValidationError(f"Failed to create storage location: {str(e)}")
+
+    # Occupancy methods
+
+    def get_items_in_subtree(self, location_id: int) -> List[Dict[str, Any]]:
+        """Get inventory stored in a location or any of its descendants.
+
+        Args:
+            location_id: ID of the subtree root
+
+        Returns:
+            List of inventory dictionaries with item names and values
+
+        Raises:
+            EntityNotFoundError: If the location does not exist
+        """
+        self.logger.debug(f"Getting inventory in storage location subtree {location_id}")
+        from database.models.material import Material
+        from database.models.product import Product
+        from database.models.tool import Tool
+
+        root = self.get_by_id(location_id)
+        if not root:
+            raise EntityNotFoundError(f"Storage location with ID {location_id} not found")
+
+        materials = Material.__table__
+        products = Product.__table__
+        tools = Tool.__table__
+        unit_price = func.coalesce(materials.c.cost_price, products.c.price, tools.c.purchase_price, 0.0)
+
+        rows = self.session.query(
+            Inventory.id,
+            Inventory.item_type,
+            Inventory.item_id,
+            Inventory.quantity,
+            Inventory.status,
+            StorageLocation.code,
+            func.coalesce(materials.c.name, products.c.name, tools.c.name).label('name'),
+            (Inventory.quantity * unit_price).label('value')
+        ).join(
+            StorageLocation, StorageLocation.id == Inventory.location_id
+        ).outerjoin(
+            materials, and_(Inventory.item_type == 'material', materials.c.id == Inventory.item_id)
+        ).outerjoin(
+            products, and_(Inventory.item_type == 'product', products.c.id == Inventory.item_id)
+        ).outerjoin(
+            tools, and_(Inventory.item_type == 'tool', tools.c.id == Inventory.item_id)
+        ).filter(
+            self._subtree_filter(root.path)
+        ).order_by(StorageLocation.path, Inventory.id).all()
+
+        return [
+            {
+                'id': row.id,
+                'item_type': row.item_type,
+                'item_id': row.item_id,
+                'name': row.name,
+                'quantity': row.quantity,
+                'value': row.value or 0.0,
+                'status': row.status.value,
+                'storage_location': row.code
+            }
+            for row in rows
+        ]
+
+    def get_inventory_ids_in_subtree(self, location_id: int) -> List[int]:
+        """Get IDs of inventory stored in a location or any of its descendants.
+
+        Args:
+            location_id: ID of the subtree root
+
+        Returns:
+            List of inventory IDs
+
+        Raises:
+            EntityNotFoundError: If the location does not exist
+        """
+        self.logger.debug(f"Getting inventory IDs in storage location subtree {location_id}")
+        root = self.get_by_id(location_id)
+        if not root:
+            raise EntityNotFoundError(f"Storage location with ID {location_id} not found")
+
+        rows = self.session.query(Inventory.id).join(
+            StorageLocation, StorageLocation.id == Inventory.location_id
+        ).filter(self._subtree_filter(root.path)).all()
+        return [row.id for row in rows]
+
+    def link_inventory_by_code(self) -> int:
+        """Attach inventory rows to locations using their storage_location code.
+
+        Creates any locations referenced by code but not yet in the hierarchy. Used to
+        migrate records created before the hierarchy existed.
+
+        Returns:
+            Number of inventory rows linked
+        """
+        self.logger.debug("Linking inventory to storage locations by code")
+        codes = [
+            row.storage_location for row in self.session.query(Inventory.storage_location).filter(
+                Inventory.location_id.is_(None),
+                Inventory.storage_location.isnot(None),
+                Inventory.storage_location != ''
+            ).distinct()
+        ]
+
+        locations = {}
+        for code in codes:
+            try:
+                self._parse_code(code)
+            except ValidationError as e:
+                self.logger.warning(f"Skipping inventory stored at '{code}': {str(e)}")
+                continue
+            locations[code] = self.get_or_create_by_code(code)
+        if not locations:
+            return 0
+
+        try:
+            # Stored text may differ from the canonical code ('A - B' is 'A-B'), so rows
+            # are matched on the text they were stored with
+            result = self.session.execute(
+                update(Inventory).where(
+                    Inventory.location_id.is_(None),
+                    Inventory.storage_location.in_(list(locations))
+                ).values(
+                    location_id=case({code: location.id for code, location in locations.items()},
+                                     value=Inventory.storage_location),
+                    storage_location=case({code: location.code for code, location in locations.items()},
+                                          value=Inventory.storage_location)
+                ).execution_options(synchronize_session=False)
+            )
+            self.session.flush()
+            return result.rowcount
+        except ValidationError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error linking inventory to storage locations: {str(e)}")
+            self.session.rollback()
+            raise ValidationError(f"Failed to link inventory to storage locations: {str(e)}")
+
+    def refresh_occupancy(self) -> None:
+        """Recompute item counts and quantities for every location from scratch.
+
+        The inventory triggers keep these columns current; this is a repair path for
+        databases edited outside the application.
+        """
+        self.logger.debug("Refreshing storage location occupancy")
+        descendant = StorageLocation.__table__.alias('descendant')
+        in_subtree = and_(
+            descendant.c.id == Inventory.location_id,
+            func.substr(descendant.c.path, 1, func.length(StorageLocation.path)) == StorageLocation.path
+        )
+
+        item_count = select(func.count(Inventory.id)).where(in_subtree).scalar_subquery()
+        total_quantity = select(func.coalesce(func.sum(Inventory.quantity), 0.0)).where(in_subtree).scalar_subquery()
+
+        try:
+            self.session.execute(
+                update(StorageLocation).values(
+                    item_count=item_count,
+                    total_quantity=total_quantity
+                ).execution_options(synchronize_session=False)
+            )
+            self.session.expire_all()
+        except Exception as e:
+            self.logger.error(f"Error refreshing storage location occupancy: {str(e)}")
+            self.session.rollback()
+            raise ValidationError(f"Failed to refresh storage location occupancy: {str(e)}")
+
+    # Helper methods
+
+    @staticmethod
+    def _parse_code(code: str) -> Tuple[List[str], List[str]]:
+        """Split a location code into segment names and the codes of each level.
+
+        Text that is not a hierarchy code yields one segment holding the whole text.
+
+        Args:
+            code: Location code or free text
+
+        Returns:
+            Tuple of (segment names, code of each level from the root down)
+
+        Raises:
+            ValidationError: If the code is empty or has no usable name
+        """
+        code = code.strip() if code else ''
+        segments = [segment.strip() for segment in code.split(LOCATION_CODE_SEPARATOR)]
+        if all(segments) and len(segments) <= len(LOCATION_LEVELS):
+            return segments, [LOCATION_CODE_SEPARATOR.join(segments[:depth + 1]) for depth in range(len(segments))]
+
+        name = ' '.join(segment for segment in segments if segment)[:100]
+        if not name:
+            raise ValidationError(f"Invalid storage location code '{code}'")
+        return [name], [code]
+
+    @staticmethod
+    def _subtree_filter(path: str):
+        """Build a range filter matching a path and all paths below it.
+
+        Args:
+            path: Materialized path of the subtree root
+
+        Returns:
+            SQLAlchemy filter expression usable with the path index
+        """
+        return and_(
+            StorageLocation.path >= path,
+            StorageLocation.path < StorageLocation.subtree_upper_bound(path)
+        )
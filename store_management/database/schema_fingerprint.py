@@ -0,0 +1,156 @@
+# database/schema_fingerprint.py
+"""
+Schema fingerprint cache for skipping redundant schema work at startup.
+
+Running ``create_all`` and the mapper diagnostics on every start means reflecting
+every table of a database whose schema almost never changes. The fingerprint is a
+hash of the tables, columns, keys and indexes declared by the models; it is cached
+next to the database together with SQLite's ``schema_version``, which changes
+whenever the database schema does. While both still match, the checks are skipped.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import MetaData, text
+from sqlalchemy.engine import Engine
+
+from database.schema_upgrade import upgrade_schema
+
+logger = logging.getLogger(__name__)
+
+
+def compute_schema_fingerprint(metadata: MetaData) -> str:
+    """
+    Compute a fingerprint of the schema declared by the models.
+
+    Args:
+        metadata: Metadata holding the model tables
+
+    Returns:
+        Hex digest that changes whenever a table, column, key or index changes
+    """
+    digest = hashlib.sha256()
+    for table in sorted(metadata.tables.values(), key=lambda t: t.fullname):
+        digest.update(f"table {table.fullname}\n".encode())
+        for column in table.columns:
+            digest.update(
+                f"column {column.name} {column.type!r} nullable={column.nullable} "
+                f"pk={column.primary_key} unique={column.unique}\n".encode()
+            )
+        for fk in sorted(table.foreign_keys, key=lambda fk: (fk.parent.name, fk.target_fullname)):
+            digest.update(f"fk {fk.parent.name} {fk.target_fullname}\n".encode())
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            columns = ",".join(column.name for column in index.columns)
+            digest.update(f"index {index.name} {columns} unique={index.unique}\n".encode())
+    return digest.hexdigest()
+
+
+def get_schema_version(engine: Engine) -> Optional[int]:
+    """
+    Get the schema version counter of a SQLite database.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        The ``schema_version`` pragma, or None for other databases
+    """
+    if engine.dialect.name != "sqlite":
+        return None
+    with engine.connect() as connection:
+        return connection.execute(text("PRAGMA schema_version")).scalar()
+
+
+class SchemaFingerprintCache:
+    """Fingerprint of the last verified schema, stored in a JSON file."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Cache file path
+        """
+        self.path = path
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Load the cached entry.
+
+        Returns:
+            The cached fingerprint and schema version, or an empty dict
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def is_current(self, fingerprint: str, schema_version: Optional[int]) -> bool:
+        """
+        Check whether the cached entry matches the current schema.
+
+        Args:
+            fingerprint: Fingerprint of the model schema
+            schema_version: Current database schema version
+
+        Returns:
+            True if the schema was verified and has not changed since
+        """
+        return self.load() == {"fingerprint": fingerprint, "schema_version": schema_version}
+
+    def record(self, fingerprint: str, schema_version: Optional[int]) -> None:
+        """
+        Store the verified schema.
+
+        Args:
+            fingerprint: Fingerprint of the model schema
+            schema_version: Database schema version after verification
+        """
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint, "schema_version": schema_version}, f)
+        except OSError as e:
+            logger.warning(f"Could not write schema fingerprint cache: {str(e)}")
+
+    def clear(self) -> None:
+        """Remove the cached entry, forcing the next check to run."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def ensure_schema(engine: Engine, metadata: MetaData, cache_path: Optional[str] = None,
+                  diagnostics: Optional[Callable[[], None]] = None) -> bool:
+    """
+    Create missing tables, upgrade existing ones and run diagnostics, unless the schema is unchanged.
+
+    Args:
+        engine: Database engine
+        metadata: Metadata holding the model tables
+        cache_path: Fingerprint cache file; None always runs the checks
+        diagnostics: Schema or mapper checks to run along with ``create_all``
+
+    Returns:
+        True if the checks ran, False if they were skipped
+    """
+    fingerprint = compute_schema_fingerprint(metadata)
+    cache = SchemaFingerprintCache(cache_path) if cache_path else None
+
+    if cache is not None and cache.is_current(fingerprint, get_schema_version(engine)):
+        logger.info("Schema unchanged since last verified, skipping create_all and diagnostics")
+        return False
+
+    metadata.create_all(engine)
+    # create_all leaves existing tables alone; bring them up to the models
+    upgrade_schema(engine, metadata)
+    if diagnostics is not None:
+        diagnostics()
+
+    if cache is not None:
+        cache.record(fingerprint, get_schema_version(engine))
+    logger.info("Schema verified")
+    return True
@@ -0,0 +1,133 @@
+# database/schema_upgrade.py
+"""
+In-place upgrades of existing databases to the schema declared by the models.
+
+``create_all`` only creates missing tables, so columns, indexes and triggers added to
+a table that already exists never reach databases created before them. ``upgrade_schema``
+adds the missing columns and indexes and then runs the upgrade steps models register for
+their tables, such as creating triggers or deriving the values of a new column. Every
+step is idempotent, so the upgrade can run on each schema check.
+"""
+
+import logging
+from typing import Any, Callable, List, Optional, Tuple
+
+from sqlalchemy import Column, MetaData, Table, inspect, literal
+from sqlalchemy.engine import Connection, Dialect, Engine
+
+logger = logging.getLogger(__name__)
+
+# Registered upgrade steps: (table name, step name, step)
+_upgrade_steps: List[Tuple[str, str, Callable[[Connection], None]]] = []
+
+
+def register_upgrade(table_name: str, name: str, step: Callable[[Connection], None]) -> None:
+    """
+    Register an idempotent upgrade step for a table.
+
+    Steps run in registration order, after missing columns and indexes were added.
+
+    Args:
+        table_name: Table the step upgrades; the step is skipped for metadata without it
+        name: Step name used in logs
+        step: Called with a connection inside the upgrade transaction
+    """
+    _upgrade_steps.append((table_name, name, step))
+
+
+def upgrade_schema(engine: Engine, metadata: MetaData) -> List[str]:
+    """
+    Add missing columns and indexes to existing tables and run the registered steps.
+
+    Tables that do not exist are left to ``create_all``.
+
+    Args:
+        engine: Database engine
+        metadata: Metadata holding the model tables
+
+    Returns:
+        Descriptions of the columns and indexes that were added
+    """
+    added = []
+    with engine.begin() as connection:
+        inspector = inspect(connection)
+        for table in metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing_columns:
+                    connection.exec_driver_sql(_add_column_sql(table, column, connection.dialect))
+                    added.append(f"column {table.name}.{column.name}")
+
+            existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(connection)
+                    added.append(f"index {index.name}")
+
+        for table_name, name, step in _upgrade_steps:
+            if table_name in metadata.tables:
+                logger.debug(f"Running schema upgrade step '{name}'")
+                step(connection)
+
+    for change in added:
+        logger.info(f"Schema upgrade added {change}")
+    return added
+
+
+def _add_column_sql(table: Table, column: Column, dialect: Dialect) -> str:
+    """
+    Build the ALTER TABLE statement adding a column to an existing table.
+
+    A NOT NULL column is only declared NOT NULL when it has a default for the existing
+    rows; foreign keys are declared inline, which SQLite accepts for added columns.
+
+    Args:
+        table: The table
+        column: The missing column
+        dialect: Dialect to render the statement for
+
+    Returns:
+        The statement
+    """
+    preparer = dialect.identifier_preparer
+    sql = (f"ALTER TABLE {preparer.format_table(table)} "
+           f"ADD COLUMN {preparer.format_column(column)} {column.type.compile(dialect=dialect)}")
+
+    default = _default_sql(column, dialect)
+    if default is not None:
+        sql += f" DEFAULT {default}"
+        if not column.nullable:
+            sql += " NOT NULL"
+
+    for foreign_key in column.foreign_keys:
+        target = foreign_key.column
+        sql += f" REFERENCES {preparer.format_table(target.table)} ({preparer.format_column(target)})"
+        if foreign_key.ondelete:
+            sql += f" ON DELETE {foreign_key.ondelete}"
+    return sql
+
+
+def _default_sql(column: Column, dialect: Dialect) -> Optional[str]:
+    """
+    Render the default an added column gives existing rows.
+
+    Args:
+        column: The column
+        dialect: Dialect to render the default for
+
+    Returns:
+        SQL literal, or None if the column has no constant default
+    """
+    if column.server_default is not None and hasattr(column.server_default, 'arg'):
+        arg: Any = column.server_default.arg
+        if isinstance(arg, str):
+            return "'" + arg.replace("'", "''") + "'"
+        return str(arg.compile(dialect=dialect))
+
+    default = column.default
+    if default is None or not default.is_scalar:
+        return None
+    return str(literal(default.arg, column.type).compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
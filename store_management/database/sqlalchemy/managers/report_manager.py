@@ -5,15 +5,18 @@ import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
-import pandas as pd
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pdfkit
 
 from di.core import inject
 from services.interfaces import MaterialService, ProjectService, InventoryService, OrderService
 from models import Storage, Product, Project
 from sqlalchemy import func
+from utils.lazy_import import lazy_module
+
+# pandas and pdfkit are only needed once a report is generated
+pd = lazy_module("pandas")
+pdfkit = lazy_module("pdfkit")
 
 
 class ReportManager:
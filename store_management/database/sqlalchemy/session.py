@@ -59,19 +59,45 @@ def create_session_factory(database_url: Optional[str] = None) -> Callable[[], S
         expire_on_commit=False
     )
 
+    # Keep the identity maps of long-running sessions bounded
+    from database.sqlalchemy.session_hygiene import get_session_hygiene
+    get_session_hygiene().install(factory)
+
     _SESSION_FACTORY = factory
     return factory
 
 
+def get_engine():
+    """
+    Get the engine of the global session factory, creating the factory if needed.
+
+    Returns:
+        Engine: SQLAlchemy engine
+    """
+    if _SESSION_FACTORY is None:
+        create_session_factory()
+
+    return _SESSION_FACTORY.kw["bind"]
+
+
 def get_db_session() -> Session:
     """
     Get a new database session.
 
+    Waits for the startup warm-up, if one is running, so no session is opened
+    before the mappers are configured and the schema is verified.
+
     Returns:
         Session: A new SQLAlchemy session
+
+    Raises:
+        DataLayerNotReadyError: If the warm-up does not finish in time
     """
     global _SESSION_FACTORY
 
+    from utils.warmup import require_ready
+    require_ready()
+
     if _SESSION_FACTORY is None:
         create_session_factory()
 
@@ -0,0 +1,402 @@
+# database/sqlalchemy/session_hygiene.py
+"""
+Identity map hygiene for long-running sessions.
+
+The session factory uses ``expire_on_commit=False`` so views can keep reading the
+objects they loaded after a commit. SQLAlchemy's identity map only holds clean
+objects weakly, but loaded relationships make objects reference each other. In
+those reference cycles, rows no view holds any longer stay in the identity map
+until the cyclic garbage collector happens to run. A session shared by the whole
+application, kept open all day, therefore grows with every screen visited.
+
+After each committed unit of work, SessionHygiene expunges every object that
+nothing outside the session's object graph references:
+
+- Objects with references from outside the session (views, caches, services) are
+  roots, and everything reachable from a root through loaded attributes is kept.
+- The remaining objects are expunged.
+- A session whose identity map is still larger than the report threshold after
+  the sweep is only reported. Every object left in it is referenced from outside,
+  so detaching them would break the views still reading them; the unit of work
+  holding the session open is what needs fixing.
+
+Roots are found by comparing ``sys.getrefcount`` with the references the sweep
+itself creates, which is only exact on the CPython versions checked below. On other
+interpreters nothing is expunged and sweeps just report sizes.
+
+Identity map sizes, sweeps and oversized sessions are tracked per session and shown,
+with object counts by model and tracemalloc figures, in the memory diagnostics dialog.
+"""
+
+import logging
+import sys
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Sessions smaller than this are not swept; sweeping costs time linear in their size
+DEFAULT_SWEEP_THRESHOLD = 200
+
+# Sessions still holding more objects than this after a sweep are reported
+DEFAULT_REPORT_THRESHOLD = 5000
+
+# References every object gets while being inspected: the objects list, the local
+# variable and the argument of sys.getrefcount
+_INSPECTION_REFERENCES = 3
+
+# The count above relies on CPython's reference counting; 3.14 stops counting some
+# references the interpreter borrows, so later versions are not trusted either
+REFCOUNTS_RELIABLE = sys.implementation.name == "cpython" and sys.version_info < (3, 14)
+
+_COLLECTION_TYPES = (list, set, tuple, frozenset)
+
+
+class SessionStats:
+    """Identity map figures for one session."""
+
+    __slots__ = ("name", "size", "peak_size", "units_of_work", "sweeps", "expunged",
+                 "oversized", "last_sweep_time")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.size = 0
+        self.peak_size = 0
+        self.units_of_work = 0
+        self.sweeps = 0
+        self.expunged = 0
+        self.oversized = 0
+        self.last_sweep_time = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the figures as a dictionary, with times in milliseconds."""
+        return {
+            "session": self.name,
+            "size": self.size,
+            "peak_size": self.peak_size,
+            "units_of_work": self.units_of_work,
+            "sweeps": self.sweeps,
+            "expunged": self.expunged,
+            "oversized": self.oversized,
+            "last_sweep_ms": self.last_sweep_time * 1000,
+        }
+
+
+def _referenced_objects(value: Any):
+    """Yield the objects an attribute value refers to."""
+    if isinstance(value, _COLLECTION_TYPES):
+        yield from value
+    elif isinstance(value, dict):
+        yield from value.values()
+    else:
+        yield value
+
+
+def _partition(session: Session) -> Tuple[List[Any], Set[int]]:
+    """
+    Split the objects of a session into kept and unreferenced ones.
+
+    Returns:
+        The unreferenced objects, and the ids of those among them from which a
+        loaded attribute path leads to a kept object; every object is kept when
+        reference counts cannot be trusted
+    """
+    if not REFCOUNTS_RELIABLE:
+        return [], set()
+
+    states = [state for state in session.identity_map.all_states() if state.obj() is not None]
+    objects = [state.obj() for state in states]
+    index = {id(obj): position for position, obj in enumerate(objects)}
+
+    # Count references between the session's objects through loaded attributes
+    edges: List[List[int]] = [[] for _ in objects]
+    internal = [0] * len(objects)
+    for position in range(len(objects)):
+        for key, value in vars(objects[position]).items():
+            if key.startswith("_sa_"):
+                continue
+            for target in _referenced_objects(value):
+                target_position = index.get(id(target))
+                if target_position is not None:
+                    edges[position].append(target_position)
+                    internal[target_position] += 1
+    # Leftover loop variables would count as outside references
+    key = value = target = None
+
+    # Objects with any other reference, or with changes, are roots. Indexing instead
+    # of enumerate() keeps iterator tuples from holding extra references.
+    roots = []
+    for position in range(len(objects)):
+        obj = objects[position]
+        external = sys.getrefcount(obj) - _INSPECTION_REFERENCES - internal[position]
+        if external > 0 or states[position].modified:
+            roots.append(position)
+    obj = None
+
+    kept = set(roots)
+    while roots:
+        for target_position in edges[roots.pop()]:
+            if target_position not in kept:
+                kept.add(target_position)
+                roots.append(target_position)
+
+    # Walk the edges backwards from kept objects to find the unreferenced objects an
+    # expunge cascade could reach them from
+    referrers: List[List[int]] = [[] for _ in objects]
+    for position, targets in enumerate(edges):
+        for target_position in targets:
+            referrers[target_position].append(position)
+    guarded = set()
+    pending = list(kept)
+    while pending:
+        for referrer in referrers[pending.pop()]:
+            if referrer not in kept and referrer not in guarded:
+                guarded.add(referrer)
+                pending.append(referrer)
+
+    unreferenced = [objects[position] for position in range(len(objects)) if position not in kept]
+    return unreferenced, {id(objects[position]) for position in guarded}
+
+
+def find_unreferenced(session: Session) -> List[Any]:
+    """
+    Find the objects of a session that nothing outside the session references.
+
+    Args:
+        session: The session to inspect
+
+    Returns:
+        Objects that are neither referenced from outside the session nor reachable
+        from an object that is
+    """
+    return _partition(session)[0]
+
+
+class SessionHygiene:
+    """Keeps the identity maps of long-running sessions bounded."""
+
+    def __init__(self, sweep_threshold: int = DEFAULT_SWEEP_THRESHOLD,
+                 report_threshold: Optional[int] = DEFAULT_REPORT_THRESHOLD):
+        """
+        Initialize session hygiene.
+
+        Args:
+            sweep_threshold: Sessions smaller than this are not swept
+            report_threshold: Sessions larger than this after a sweep are reported;
+                None never reports
+        """
+        self.sweep_threshold = sweep_threshold
+        self.report_threshold = report_threshold
+        self._stats: "weakref.WeakKeyDictionary[Session, SessionStats]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._count = 0
+
+    def install(self, target) -> None:
+        """
+        Maintain the sessions of a session factory, or a single session.
+
+        Args:
+            target: A sessionmaker or Session
+        """
+        event.listen(target, "after_commit", self._after_commit)
+
+    def track(self, session: Session) -> SessionStats:
+        """
+        Get the figures of a session, starting to track it if needed.
+
+        Args:
+            session: The session
+
+        Returns:
+            The session's figures
+        """
+        with self._lock:
+            stats = self._stats.get(session)
+            if stats is None:
+                self._count += 1
+                stats = self._stats[session] = SessionStats(f"session {self._count}")
+            return stats
+
+    def _after_commit(self, session: Session) -> None:
+        stats = self.track(session)
+        stats.units_of_work += 1
+        try:
+            self.sweep(session)
+        except Exception as e:
+            # Hygiene must never break a commit
+            logger.warning(f"Session sweep failed: {str(e)}")
+
+    def sweep(self, session: Session, force: bool = False) -> int:
+        """
+        Expunge unreferenced objects, reporting the session if it is still too large.
+
+        Args:
+            session: The session to sweep
+            force: Sweep even if the session is below the sweep threshold
+
+        Returns:
+            Number of objects expunged
+        """
+        stats = self.track(session)
+        size = len(session.identity_map)
+        stats.peak_size = max(stats.peak_size, size)
+        stats.size = size
+
+        if session.new or session.dirty or session.deleted:
+            return 0
+        if size < self.sweep_threshold and not force:
+            return 0
+
+        started = time.perf_counter()
+        size_before = len(session.identity_map)
+        unreferenced, guarded = _partition(session)
+        unreferenced_ids = {id(obj) for obj in unreferenced}
+        for obj in unreferenced:
+            state = inspect(obj)
+            if state.session is not session:
+                # Already expunged through a cascade
+                continue
+            # Expunging cascades; never let it detach an object that is kept
+            if id(obj) in guarded and any(
+                    id(child) not in unreferenced_ids
+                    for child, _, _, _ in state.mapper.cascade_iterator("expunge", state)):
+                continue
+            session.expunge(obj)
+        unreferenced = obj = None
+        expunged = size_before - len(session.identity_map)
+
+        if self.report_threshold is not None and len(session.identity_map) > self.report_threshold:
+            # Everything left is referenced from outside; detaching it would break its readers
+            stats.oversized += 1
+            logger.warning(f"{stats.name} still holds {len(session.identity_map)} referenced objects "
+                           f"after sweeping (more than {self.report_threshold}); the work keeping it "
+                           f"open should use a shorter unit of work")
+
+        stats.sweeps += 1
+        stats.expunged += expunged
+        stats.size = len(session.identity_map)
+        stats.last_sweep_time = time.perf_counter() - started
+        if expunged:
+            logger.debug(f"Expunged {expunged} objects from {stats.name} "
+                         f"in {stats.last_sweep_time * 1000:.1f} ms")
+        return expunged
+
+    def sweep_all(self) -> int:
+        """
+        Sweep every tracked session that is not in the middle of a transaction.
+
+        Returns:
+            Number of objects expunged
+        """
+        total = 0
+        for session in self.sessions():
+            if not session.in_transaction():
+                total += self.sweep(session, force=True)
+        return total
+
+    def sessions(self) -> List[Session]:
+        """
+        Get the tracked sessions that are still alive.
+
+        Returns:
+            The sessions
+        """
+        with self._lock:
+            return list(self._stats.keys())
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get the identity map figures of every live session.
+
+        Returns:
+            One dictionary per session, largest first
+        """
+        results = []
+        for session in self.sessions():
+            stats = self.track(session)
+            stats.size = len(session.identity_map)
+            stats.peak_size = max(stats.peak_size, stats.size)
+            results.append(stats.as_dict())
+        return sorted(results, key=lambda s: s["size"], reverse=True)
+
+    def count_objects_by_model(self) -> Dict[str, int]:
+        """
+        Count the objects in the identity maps of all live sessions by model.
+
+        Returns:
+            Dictionary of model name to object count, most numerous first
+        """
+        counts = Counter()
+        for session in self.sessions():
+            for state in session.identity_map.all_states():
+                counts[state.class_.__name__] += 1
+        return dict(counts.most_common())
+
+
+def start_memory_tracing(frames: int = 1) -> None:
+    """
+    Start tracing memory allocations with tracemalloc.
+
+    Tracing slows the application down, so it is only on while diagnosing.
+
+    Args:
+        frames: Stack frames recorded per allocation
+    """
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+        logger.info("Memory tracing started")
+
+
+def stop_memory_tracing() -> None:
+    """Stop tracing memory allocations."""
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+        logger.info("Memory tracing stopped")
+
+
+def get_memory_stats(limit: int = 10) -> Dict[str, Any]:
+    """
+    Get traced memory figures.
+
+    Args:
+        limit: Number of top allocation sites to include
+
+    Returns:
+        Whether tracing is on, current and peak traced memory in bytes, and the
+        source lines that allocated the most memory
+    """
+    if not tracemalloc.is_tracing():
+        return {"tracing": False, "current": 0, "peak": 0, "top": []}
+
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ))
+    top = [
+        {"location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+         "size": stat.size, "count": stat.count}
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+    return {"tracing": True, "current": current, "peak": peak, "top": top}
+
+
+# Hygiene for the sessions of the application's session factory
+_hygiene = SessionHygiene()
+
+
+def get_session_hygiene() -> SessionHygiene:
+    """
+    Get the session hygiene of the application's session factory.
+
+    Returns:
+        The session hygiene
+    """
+    return _hygiene
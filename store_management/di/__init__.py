@@ -7,10 +7,12 @@ Provides tools for managing dependencies and service registrations.
 from di.container import (
     Container,
     Lifetime,
+    ServiceScope,
     get_container,
     set_container,
     create_container,
-    clear_container
+    clear_container,
+    unit_of_work
 )
 from di.inject import inject, resolve
 
@@ -28,10 +30,12 @@ def verify_container():
 __all__ = [
     'Container',
     'Lifetime',
+    'ServiceScope',
     'get_container',
     'set_container',
     'create_container',
     'clear_container',
+    'unit_of_work',
     'inject',
     'resolve',
     'initialize',
@@ -11,7 +11,7 @@ import importlib
 import logging
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, Dict, Generic, Optional, Type, TypeVar, Union, get_type_hints
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union, get_type_hints
 
 T = TypeVar('T')
 
@@ -37,6 +37,10 @@ class Lifetime(str, Enum):
     SCOPED = "scoped"        # Single instance within a scope
 
 
+# Service key of the database session a ServiceScope commits and closes
+SESSION_KEY = "Session"
+
+
 class ServiceRegistration:
     """Registration information for a service."""
 
@@ -60,6 +64,87 @@ class ServiceRegistration:
         self.lifetime = lifetime
         self.factory = factory
         self.import_path = import_path
+        self.plan: Optional['ConstructionPlan'] = None
+
+
+class ConstructionPlan:
+    """
+    Precomputed constructor injection for an implementation class.
+
+    Inspecting a constructor signature and its type hints is far slower than calling
+    the constructor, so it is done once per class. Creating an instance from a plan
+    is one container lookup per dependency plus the constructor call.
+    """
+
+    __slots__ = ("implementation", "dependencies")
+
+    def __init__(self, implementation: Type[Any]):
+        """
+        Build the plan for a class.
+
+        Args:
+            implementation: Class to instantiate
+        """
+        self.implementation = implementation
+        # (parameter name, service key, whether the parameter has no default)
+        self.dependencies: List[Tuple[str, Optional[str], bool]] = []
+
+        signature = inspect.signature(implementation.__init__)
+        type_hints = get_type_hints(implementation.__init__)
+        for name, param in signature.parameters.items():
+            # Skip self and parameters without a type hint
+            if name == 'self' or name not in type_hints:
+                continue
+            param_type = type_hints[name]
+            key = param_type if isinstance(param_type, str) else getattr(param_type, '__name__', None)
+            self.dependencies.append((name, key, param.default is param.empty))
+
+    def create(self, container: 'Container') -> Any:
+        """
+        Create an instance, resolving its dependencies from a container.
+
+        Args:
+            container: Container to resolve dependencies from
+
+        Returns:
+            New instance
+        """
+        parameters = {}
+        for name, key, required in self.dependencies:
+            try:
+                if key is None:
+                    raise ResolutionError(f"No service key for parameter '{name}'")
+                parameters[name] = container.resolve(key)
+            except ResolutionError:
+                # Skip parameters that can't be resolved - they might have defaults
+                if required:
+                    container._logger.warning(
+                        f"Could not resolve parameter '{name}' with type "
+                        f"'{key}' for {self.implementation.__name__}"
+                    )
+
+        # Create instance
+        return self.implementation(**parameters)
+
+
+# Construction plans are independent of any container, so they are shared
+_plans: Dict[Type[Any], ConstructionPlan] = {}
+
+
+def get_plan(implementation: Type[Any]) -> ConstructionPlan:
+    """
+    Get the construction plan for a class, building it on first use.
+
+    Args:
+        implementation: Class to instantiate
+
+    Returns:
+        The construction plan
+    """
+    plan = _plans.get(implementation)
+    if plan is None:
+        plan = _plans[implementation] = ConstructionPlan(implementation)
+    return plan
 
 
 class Container:
@@ -79,6 +164,8 @@ class Container:
         """
         self._registrations: Dict[str, ServiceRegistration] = {}
         self._instances: Dict[str, Any] = {}
+        # Keys of the instances this container created itself, in creation order
+        self._created: List[str] = []
         self._parent = parent
         self._logger = logging.getLogger(__name__)
 
@@ -116,7 +203,6 @@ class Container:
             elif isinstance(implementation, str):
                 # String is treated as an import path for lazy loading
                 import_path = implementation
-                factory = lambda c, path=implementation: c._create_with_injection(c._import_implementation(path))
                 implementation = None
             elif callable(implementation) and not isinstance(implementation, type):
                 # Factory function
@@ -194,6 +280,19 @@ class Container:
         key = self._get_key(service_type)
         return key in self._registrations or key in self._instances
 
+    def get_lifetime(self, service_type: Union[str, Type[T]]) -> Optional[Lifetime]:
+        """
+        Get the lifetime a service is registered with here or in a parent container.
+
+        Args:
+            service_type: Interface or service name
+
+        Returns:
+            The lifetime, or None for registered instances and unknown services
+        """
+        registration = self._find_registration(self._get_key(service_type))
+        return registration.lifetime if registration is not None else None
+
     def resolve(self, service_type: Union[str, Type[T]]) -> Any:
         """
         Resolve a service instance.
@@ -221,6 +320,10 @@ class Container:
 
             # Try parent container if it exists
             if self._parent:
+                registration = self._parent._find_registration(key)
+                if registration is not None and registration.lifetime != Lifetime.SINGLETON:
+                    # Scoped and transient services are built here, from this scope's services
+                    return self._create_instance(key, registration)
                 return self._parent.resolve(service_type)
 
             # Not found
@@ -233,14 +336,17 @@ class Container:
             self._logger.error(error_msg)
             raise ResolutionError(error_msg) from e
 
-    def create_scope(self) -> 'Container':
+    def create_scope(self) -> 'ServiceScope':
         """
         Create a new scoped container that shares singleton registrations with this container.
 
+        Scoped services resolved through the scope are created once per scope; the root
+        container itself acts as the application-wide scope.
+
         Returns:
             A new scoped container
         """
-        return Container(parent=self)
+        return ServiceScope(parent=self)
 
     def reset(self, include_singletons: bool = False) -> None:
         """
@@ -259,6 +365,26 @@ class Container:
         # Remove identified keys
         for key in keys_to_remove:
             del self._instances[key]
+            if key in self._created:
+                self._created.remove(key)
+
+    def _find_registration(self, key: str) -> Optional[ServiceRegistration]:
+        """
+        Find the registration of a service in this container or its parents.
+
+        Args:
+            key: Service key
+
+        Returns:
+            The registration, or None if the service is not registered
+        """
+        container = self
+        while container is not None:
+            registration = container._registrations.get(key)
+            if registration is not None:
+                return registration
+            container = container._parent
+        return None
 
     def _get_key(self, service_type: Union[str, Type[T]]) -> str:
         """
@@ -272,69 +398,80 @@ class Container:
         """
         return service_type if isinstance(service_type, str) else service_type.__name__
 
-    def _create_instance(self, key: str) -> Any:
+    def _create_instance(self, key: str, registration: Optional[ServiceRegistration] = None) -> Any:
         """
         Create an instance of a registered service.
 
         Args:
             key: Service key
+            registration: Registration to create from, if it belongs to a parent container
 
         Returns:
             Service instance
         """
-        registration = self._registrations[key]
+        if registration is None:
+            registration = self._registrations[key]
 
         # Use factory if available
         if registration.factory:
             instance = registration.factory(self)
-        elif registration.import_path:
-            implementation = self._import_implementation(registration.import_path)
-            instance = self._create_with_injection(implementation)
         else:
             # Create instance with constructor injection
-            instance = self._create_with_injection(registration.implementation)
+            instance = self._registration_plan(registration).create(self)
 
         # Cache instance based on lifetime
-        if registration.lifetime == Lifetime.SINGLETON:
+        if registration.lifetime != Lifetime.TRANSIENT:
             self._instances[key] = instance
+            self._created.append(key)
 
         return instance
 
-    def _create_with_injection(self, implementation: Type[Any]) -> Any:
+    def _registration_plan(self, registration: ServiceRegistration) -> ConstructionPlan:
         """
-        Create an instance with constructor injection.
+        Get the construction plan of a registration, importing its class on first use.
 
         Args:
-            implementation: Class to instantiate
+            registration: Registration without a factory
 
         Returns:
-            New instance
+            The construction plan
         """
-        # Get constructor parameters
-        signature = inspect.signature(implementation.__init__)
-        parameters = {}
+        if registration.plan is None:
+            implementation = registration.implementation
+            if implementation is None:
+                implementation = self._import_implementation(registration.import_path)
+            registration.plan = get_plan(implementation)
+        return registration.plan
 
-        for name, param in signature.parameters.items():
-            # Skip self
-            if name == 'self':
+    def prepare(self) -> int:
+        """
+        Build the construction plans of all class registrations ahead of the first resolution.
+
+        Returns:
+            Number of registrations prepared; registrations that fail to import are skipped
+        """
+        prepared = 0
+        for key, registration in self._registrations.items():
+            if registration.factory:
                 continue
+            try:
+                self._registration_plan(registration)
+                prepared += 1
+            except Exception as e:
+                self._logger.warning(f"Could not prepare service {key}: {str(e)}")
+        return prepared
+
+    def _create_with_injection(self, implementation: Type[Any]) -> Any:
+        """
+        Create an instance with constructor injection.
 
-            # Get parameter type hint
-            type_hints = get_type_hints(implementation.__init__)
-            if name in type_hints:
-                param_type = type_hints[name]
-                try:
-                    parameters[name] = self.resolve(param_type)
-                except ResolutionError:
-                    # Skip parameters that can't be resolved - they might have defaults
-                    if param.default is param.empty:
-                        self._logger.warning(
-                            f"Could not resolve parameter '{name}' with type "
-                            f"'{param_type}' for {implementation.__name__}"
-                        )
+        Args:
+            implementation: Class to instantiate
 
-        # Create instance
-        return implementation(**parameters)
+        Returns:
+            New instance
+        """
+        return get_plan(implementation).create(self)
 
     def _import_implementation(self, import_path: str) -> Any:
         """
@@ -357,6 +494,87 @@ class Container:
             raise ResolutionError(f"Failed to import {import_path}: {str(e)}") from e
 
 
+class ServiceScope(Container):
+    """
+    Container for one unit of work, such as a GUI operation or a background job.
+
+    Scoped services - the database session, repositories and services - are created
+    once per scope, so each unit of work gets its own short-lived session. When the
+    scope ends, the session it created is committed, or rolled back if the work
+    failed, and closed:
+
+        with unit_of_work() as scope:
+            scope.resolve("IMaterialService").update(material_id, data)
+    """
+
+    def __init__(self, parent: Container):
+        """
+        Initialize the scope.
+
+        Args:
+            parent: Container the scope resolves singletons and registrations from
+        """
+        super().__init__(parent=parent)
+        self._disposed = False
+
+    def __enter__(self) -> 'ServiceScope':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.dispose(commit=exc_type is None)
+        return False
+
+    def resolve(self, service_type: Union[str, Type[T]]) -> Any:
+        """
+        Resolve a service instance within the scope.
+
+        Args:
+            service_type: Interface or service name
+
+        Returns:
+            An instance of the requested service
+
+        Raises:
+            ResolutionError: If resolution fails or the scope has ended
+        """
+        if self._disposed:
+            raise ResolutionError(f"Cannot resolve {self._get_key(service_type)} from a disposed scope")
+        return super().resolve(service_type)
+
+    def dispose(self, commit: bool = True) -> None:
+        """
+        End the scope, finishing and closing the session it created.
+
+        Sessions registered with ``register_instance`` belong to the caller and are left open.
+
+        Args:
+            commit: Commit the session; False rolls it back
+
+        Raises:
+            Exception: If committing fails; the session is rolled back and closed first
+        """
+        if self._disposed:
+            return
+        self._disposed = True
+
+        session = self._instances.get(SESSION_KEY) if SESSION_KEY in self._created else None
+        try:
+            if session is not None:
+                if commit:
+                    session.commit()
+                else:
+                    session.rollback()
+        except Exception as e:
+            self._logger.error(f"Unit of work failed to commit: {str(e)}")
+            session.rollback()
+            raise
+        finally:
+            if session is not None:
+                session.close()
+            self._instances.clear()
+            self._created.clear()
+
+
 # Global container instance
 _global_container: Optional[Container] = None
 
@@ -373,6 +591,11 @@ def get_container() -> Container:
     """
     global _global_container
 
+    if _global_container is None:
+        # The container may still be being built by the startup warm-up
+        from utils.warmup import require_ready
+        require_ready()
+
     if _global_container is None:
         raise RuntimeError("DI container is not initialized. Call create_container() first.")
 
@@ -407,4 +630,14 @@ def clear_container() -> None:
     """Clear the global container."""
     global _global_container
     _global_container = None
-    logger.info("Global DI container has been cleared")
\ No newline at end of file
+    logger.info("Global DI container has been cleared")
+
+
+def unit_of_work() -> ServiceScope:
+    """
+    Start a unit of work on the global container.
+
+    Returns:
+        A new scope, to be used as a context manager
+    """
+    return get_container().create_scope()
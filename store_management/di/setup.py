@@ -20,7 +20,7 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from di.container import Container, Lifetime, create_container, get_container
+from di.container import Container, Lifetime, get_container, set_container
 from di.config import SERVICE_MAPPINGS, REPOSITORY_MAPPINGS, DATABASE_SESSION_CONFIG
 
 
@@ -76,9 +76,10 @@ def register_database_session(container: Container) -> Container:
             container.register_factory("Session", lambda c: None)
             return container
 
-        # Register a dummy session factory for now
-        logger.info("Registering a dummy session factory for testing")
-        container.register_factory("Session", lambda c: None)
+        # Each scope (unit of work) gets its own session, finished when the scope ends
+        session_factory = getattr(module, 'get_db_session')
+        container.register_factory("Session", lambda c: session_factory(), Lifetime.SCOPED)
+        logger.info("Registered scoped database session factory")
         return container
 
     except Exception as e:
@@ -142,7 +143,7 @@ def register_services(container: Container) -> Container:
 
             # Register any real services that exist
             if implementation_path and implementation_path != 'mock_implementations':
-                container.register(interface_name, implementation_path)
+                container.register(interface_name, implementation_path, Lifetime.SCOPED)
                 registered_count += 1
                 logger.info(f"Registered service: {interface_name} -> {implementation_path}")
 
@@ -154,6 +155,23 @@ def register_services(container: Container) -> Container:
     return container
 
 
+def build_container() -> Container:
+    """
+    Create a container with every registration of the application.
+
+    The container is not made global, so it can be built on a background thread
+    and published with ``set_container`` once complete.
+
+    Returns:
+        The populated container
+    """
+    container = Container()
+    register_database_session(container)
+    register_repositories(container)
+    register_services(container)
+    return container
+
+
 def initialize() -> Container:
     """
     Initialize the DI system for the application.
@@ -174,13 +192,9 @@ def initialize() -> Container:
 
         logger.info("Initializing DI container")
 
-        # Create container
-        container = create_container()
-
-        # Register components
-        register_database_session(container)
-        register_repositories(container)
-        register_services(container)
+        # Build the container and publish it once it is complete
+        container = build_container()
+        set_container(container)
 
         logger.info("DI container initialized successfully")
         return container
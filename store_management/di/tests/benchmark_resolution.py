@@ -0,0 +1,119 @@
+# di/tests/benchmark_resolution.py
+"""
+Benchmark service resolution for the full service graph registered by di.setup.
+
+Compares the per-resolution cost of the previous constructor injection, which
+inspected the constructor signature and type hints on every resolution, with
+resolution from cached construction plans.
+
+Run from the store_management directory:
+
+    python -m di.tests.benchmark_resolution [rounds]
+"""
+
+import inspect
+import logging
+import sys
+import time
+from typing import Any, Dict, List, get_type_hints
+
+from di.container import Container, ResolutionError
+from di.setup import register_database_session, register_repositories, register_services
+
+
+def build_container() -> Container:
+    """Create a container with the registrations of the application."""
+    container = Container()
+    register_database_session(container)
+    register_repositories(container)
+    register_services(container)
+    return container
+
+
+def legacy_resolve(container: Container, key: str) -> Any:
+    """Resolve a service the way the container did before construction plans."""
+    if key in container._instances:
+        return container._instances[key]
+    if key not in container._registrations:
+        raise ResolutionError(f"No registration found for {key}")
+    return legacy_create(container, key)
+
+
+def legacy_create(container: Container, key: str) -> Any:
+    """Create a service, inspecting its constructor on every call."""
+    registration = container._registrations[key]
+    if registration.factory:
+        return registration.factory(container)
+
+    implementation = registration.implementation
+    if implementation is None:
+        implementation = container._import_implementation(registration.import_path)
+
+    signature = inspect.signature(implementation.__init__)
+    parameters = {}
+    for name, param in signature.parameters.items():
+        if name == 'self':
+            continue
+        type_hints = get_type_hints(implementation.__init__)
+        if name in type_hints:
+            param_type = type_hints[name]
+            try:
+                parameters[name] = legacy_resolve(container, container._get_key(param_type))
+            except Exception:
+                pass
+    return implementation(**parameters)
+
+
+def time_per_call(create, rounds: int) -> float:
+    """Get the mean time of a call in microseconds."""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        create()
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def run(rounds: int = 200) -> List[Dict[str, Any]]:
+    """
+    Time the creation of every resolvable service with both strategies.
+
+    Args:
+        rounds: Creations per service and strategy
+
+    Returns:
+        One result per service with legacy and planned times in microseconds
+    """
+    container = build_container()
+    container.prepare()
+
+    results = []
+    for key in sorted(container._registrations):
+        try:
+            container._create_instance(key)
+        except Exception:
+            # Registrations that cannot be created in this environment are not timed
+            continue
+
+        legacy = time_per_call(lambda: legacy_create(container, key), rounds)
+        planned = time_per_call(lambda: container._create_instance(key), rounds)
+        results.append({"service": key, "legacy_us": legacy, "planned_us": planned})
+    return results
+
+
+def main() -> None:
+    logging.disable(logging.WARNING)
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    results = run(rounds)
+
+    print(f"{'Service':<32}{'legacy (us)':>14}{'planned (us)':>14}{'speedup':>10}")
+    for result in results:
+        print(f"{result['service']:<32}{result['legacy_us']:>14.1f}{result['planned_us']:>14.1f}"
+              f"{result['legacy_us'] / result['planned_us']:>9.1f}x")
+
+    legacy_total = sum(r["legacy_us"] for r in results)
+    planned_total = sum(r["planned_us"] for r in results)
+    print(f"{'Full graph':<32}{legacy_total:>14.1f}{planned_total:>14.1f}"
+          f"{legacy_total / planned_total:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# test_construction_plan.py
+from typing import Optional
+
+from di.container import Container, Lifetime, get_plan
+
+
+class Repository:
+    def __init__(self):
+        pass
+
+
+class Service:
+    def __init__(self, repository: Repository, missing: Optional[int] = None, label: str = "default"):
+        self.repository = repository
+        self.label = label
+
+
+def test_plan_lists_dependencies_once():
+    plan = get_plan(Service)
+
+    assert plan is get_plan(Service)
+    assert plan.dependencies == [("repository", "Repository", True),
+                                 ("missing", "Optional", False),
+                                 ("label", "str", False)]
+
+
+def test_transient_resolution_uses_registration_plan():
+    container = Container()
+    container.register(Repository, lifetime=Lifetime.TRANSIENT)
+    container.register("IService", "di.tests.test_construction_plan.Service", Lifetime.TRANSIENT)
+    assert container.prepare() == 2
+
+    first, second = container.resolve("IService"), container.resolve("IService")
+    assert first is not second
+    assert isinstance(first.repository, Repository) and first.label == "default"
+    assert container._registrations["IService"].plan is not None
@@ -0,0 +1,83 @@
+# test_service_scope.py
+import pytest
+
+from di.container import Container, Lifetime, ResolutionError
+
+
+class FakeSession:
+    def __init__(self):
+        self.events = []
+
+    def commit(self):
+        self.events.append("commit")
+
+    def rollback(self):
+        self.events.append("rollback")
+
+    def close(self):
+        self.events.append("close")
+
+
+class Repository:
+    def __init__(self, session: FakeSession):
+        self.session = session
+
+
+class Service:
+    def __init__(self, session: FakeSession, repository: Repository):
+        self.session = session
+        self.repository = repository
+
+
+@pytest.fixture
+def container():
+    container = Container()
+    container.register_factory("FakeSession", lambda c: FakeSession(), Lifetime.SCOPED)
+    container.register(Repository, lifetime=Lifetime.SCOPED)
+    container.register("Service", Service, Lifetime.SCOPED)
+    container.register("Session", lambda c: c.resolve("FakeSession"), Lifetime.SCOPED)
+    return container
+
+
+def test_scoped_services_are_shared_within_a_scope(container):
+    with container.create_scope() as first, container.create_scope() as second:
+        service = first.resolve("Service")
+        assert service is first.resolve("Service")
+        assert service.repository.session is service.session
+        assert second.resolve("Service").session is not service.session
+
+    # The root container is the application-wide scope
+    assert container.resolve("Service") is container.resolve("Service")
+
+
+def test_scope_commits_and_closes_its_session(container):
+    with container.create_scope() as scope:
+        session = scope.resolve("Session")
+
+    assert session.events == ["commit", "close"]
+    with pytest.raises(ResolutionError):
+        scope.resolve("Service")
+
+
+def test_scope_rolls_back_on_error(container):
+    with pytest.raises(ValueError):
+        with container.create_scope() as scope:
+            session = scope.resolve("Session")
+            raise ValueError("failed")
+
+    assert session.events == ["rollback", "close"]
+
+
+def test_scope_leaves_registered_sessions_open(container):
+    session = FakeSession()
+    with container.create_scope() as scope:
+        scope.register_instance("Session", session)
+        scope.resolve("Session")
+
+    assert session.events == []
+
+
+def test_singletons_come_from_the_root(container):
+    container.register("Shared", lambda c: object(), Lifetime.SINGLETON)
+    with container.create_scope() as scope:
+        assert scope.resolve("Shared") is container.resolve("Shared")
@@ -124,7 +124,7 @@ class DatabaseDiagnostics:
             # Supplier and Purchase Related
             "suppliers", "purchases", "purchase_items",
             # Inventory Related
-            "inventory",
+            "inventory", "inventory_transactions", "storage_locations", "location_history",
             # Project and Component Related
             "projects", "components", "component_materials", "project_components",
             # Picking and Tool Management
@@ -12,6 +12,7 @@ from di import initialize, Container, verify_container, resolve
 from gui.main_window import MainWindow
 from gui.theme import apply_theme
 from gui import config
+from gui.utils import event_bus
 from gui.utils.gui_logger import setup_gui_logger
 from gui.utils.error_manager import ErrorManager
 
@@ -62,6 +63,9 @@ class LeatherworkingApp:
         self.root.geometry(f"{config.DEFAULT_WINDOW_WIDTH}x{config.DEFAULT_WINDOW_HEIGHT}")
         self.root.minsize(config.MIN_WINDOW_WIDTH, config.MIN_WINDOW_HEIGHT)
 
+        # Dispatch GUI events from the event loop, once per frame
+        event_bus.attach(self.root, deferred=config.EVENT_BUS_DEFERRED)
+
         # Set window icon if available
         try:
             icon_path = f"{config.ICON_PATH}/app_icon.ico"
@@ -9,6 +9,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Any, Dict, List, Optional, Type, Union
 
+from di import unit_of_work
 from gui.base.base_view import BaseView
 from gui.widgets.enum_combobox import EnumCombobox
 from gui import theme, config
@@ -491,23 +492,21 @@ class BaseFormView(BaseView):
             return
 
         try:
-            service = self.get_service(self.service_name)
-            if not service:
-                return
-
             # Collect form data
             data = self.collect_form_data()
 
             # Process data before save
             processed_data = self.process_data_before_save(data)
 
-            # Save or update
-            if self.is_edit_mode:
-                result = service.update(self.item_id, processed_data)
-                message = "Item updated successfully"
-            else:
-                result = service.create(processed_data)
-                message = "Item created successfully"
+            # Save or update in its own unit of work, committed before success is reported
+            with unit_of_work() as scope:
+                service = scope.resolve(self.service_name)
+                if self.is_edit_mode:
+                    result = service.update(self.item_id, processed_data)
+                    message = "Item updated successfully"
+                else:
+                    result = service.create(processed_data)
+                    message = "Item created successfully"
 
             # Show success message
             self.show_info("Success", message)
@@ -7,9 +7,14 @@ Provides common functionality for list views with filtering and pagination.
 import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from typing import Any, Callable, Dict, List, Optional, Type
 
+from di import unit_of_work
 from gui.base.base_view import BaseView
+from gui.utils.background_loader import BackgroundLoader, get_worker_service
+from gui.utils.event_bus import PRIORITY_HIGH, subscribe, unsubscribe
+from gui.utils.page_cache import PageCache, page_key
+from gui.utils.search_cache import SearchCache, search_key
 from gui.widgets.enhanced_treeview import EnhancedTreeview
 from gui.widgets.search_frame import SearchFrame
 from gui import theme, config
@@ -19,8 +24,22 @@ class BaseListView(BaseView):
     """
     Base class for all list views in the application.
     Includes common functionality for displaying, filtering, and paginating lists of entities.
+
+    Pages are loaded in the background (see load_data), so the window stays responsive
+    while queries run. Text search runs as the user types; small result sets are loaded
+    whole and cached, so typing further filters the cached rows instead of querying again.
+
+    Loaded pages are cached and the pages next to the visible one are prefetched, so
+    paging rarely waits for the database. Subclasses list the event bus topics that
+    change their data in ``invalidation_topics``; any of them drops the cached pages.
+
+    Subclasses that show long lists set ``virtual_rows = True``; their treeview then only
+    materializes the visible rows and offers larger page sizes.
     """
 
+    virtual_rows = False
+    invalidation_topics = ()
+
     def __init__(self, parent):
         """
         Initialize the base list view.
@@ -32,7 +51,7 @@ class BaseListView(BaseView):
         self.title = "List View"
         self.service_name = None  # Service name to resolve via DI
         self.current_page = 1
-        self.page_size = config.DEFAULT_PAGE_SIZE
+        self.page_size = config.VIRTUAL_DEFAULT_PAGE_SIZE if self.virtual_rows else config.DEFAULT_PAGE_SIZE
         self.total_items = 0
         self.filter_criteria = {}
         self.sort_column = "id"
@@ -42,6 +61,13 @@ class BaseListView(BaseView):
         self.selected_item = None
         self.treeview = None
         self.search_frame = None
+        self.search_cache = SearchCache()
+        self.page_cache = PageCache()
+        self._prefetcher = None
+
+        # Drop stale pages before other handlers of the same event refresh the view
+        for topic in self.invalidation_topics:
+            subscribe(topic, self.on_data_changed, priority=PRIORITY_HIGH)
 
     def build(self):
         """Build the list view layout."""
@@ -55,7 +81,8 @@ class BaseListView(BaseView):
         self.search_frame = SearchFrame(
             content,
             search_fields=self.search_fields,
-            on_search=self.on_search)
+            on_search=self.on_search,
+            incremental=True)
         self.search_frame.pack(fill=tk.X, pady=(0, 10))
 
         # Add list frame with treeview
@@ -121,7 +148,8 @@ class BaseListView(BaseView):
             columns=[col[0] for col in self.columns],
             on_sort=self.on_sort,
             on_select=self.on_select,
-            on_double_click=self.on_edit)
+            on_double_click=self.on_edit,
+            virtual=self.virtual_rows)
 
         # Configure columns
         for col_id, col_label, col_width in self.columns:
@@ -239,7 +267,7 @@ class BaseListView(BaseView):
         page_size_combo = ttk.Combobox(
             pagination_frame,
             textvariable=page_size_var,
-            values=config.PAGE_SIZE_OPTIONS,
+            values=config.VIRTUAL_PAGE_SIZE_OPTIONS if self.virtual_rows else config.PAGE_SIZE_OPTIONS,
             width=5,
             state="readonly")
         page_size_combo.pack(side=tk.LEFT, padx=5)
@@ -285,65 +313,259 @@ class BaseListView(BaseView):
         pagination_frame.pack(fill=tk.X, pady=5)
 
     def load_data(self):
-        """Load data into the treeview based on current filters and pagination."""
+        """
+        Load the current page in the background.
+
+        The count, page query and value extraction run on a worker thread with its own
+        database session, so overrides of get_total_count, get_items and extract_item_values
+        must not touch widgets, and they are given a snapshot of the filter criteria and
+        sort taken here rather than reading the view's live state. A newer load supersedes
+        one still in flight.
+        """
         if not self.service_name:
             self.logger.error("No service name defined for list view")
             return
 
-        try:
-            service = self.get_service(self.service_name)
-            if not service:
+        criteria = self.get_filter_criteria()
+        context = (self.sort_column, self.sort_direction)
+        text_fields = self.get_text_search_fields()
+        is_text_search = any(name in criteria for name in text_fields)
+
+        # Prefetches queued for the previous page are no longer the right neighbours
+        self.cancel_prefetch()
+
+        if is_text_search:
+            rows = self.search_cache.narrow(criteria, context, text_fields)
+            if rows is not None:
+                # Drop any query still running for an earlier keystroke
+                self.cancel_background_tasks("load")
+                self.display_search_results(rows)
                 return
 
-            # Calculate pagination
-            offset = (self.current_page - 1) * self.page_size
+        service_name = self.service_name
+        page, page_size = self.current_page, self.page_size
 
-            # Get total count first to update pagination
-            self.total_items = self.get_total_count(service)
-            total_pages = max(1, (self.total_items + self.page_size - 1) // self.page_size)
+        page_data = self.page_cache.get(page_key(criteria, *context, page_size, page))
+        if page_data is not None:
+            self.cancel_background_tasks("load")
+            self.display_page(page_data)
+            self.prefetch_pages()
+            return
 
-            # Adjust current page if needed
-            if self.current_page > total_pages:
-                self.current_page = total_pages
-                offset = (self.current_page - 1) * self.page_size
+        def load():
+            service = get_worker_service(service_name)
+            total_items = self.get_total_count(service, criteria=criteria)
+            if is_text_search and total_items <= config.SEARCH_CACHE_MAX_ROWS:
+                return self.fetch_search_results(service, total_items, text_fields,
+                                                 criteria=criteria, sort=context), None
+            return None, self.fetch_page(service, page, page_size, total_items, criteria=criteria, sort=context)
+
+        def loaded(result):
+            rows, page_data = result
+            if rows is None:
+                self.page_cache.put(page_key(criteria, *context, page_size, page_data[1]), page_data)
+                self.display_page(page_data)
+                self.prefetch_pages()
+            else:
+                self.search_cache.store(criteria, context, rows)
+                self.display_search_results(rows)
+
+        self.run_in_background(load, loaded, on_error=self.on_load_error)
+
+    def prefetch_pages(self):
+        """
+        Load the pages around the current one in the background.
 
-            # Update pagination display
-            self.update_pagination_display(total_pages)
+        Prefetches run on their own loader so they never show the loading indicator,
+        and each direction holds a single slot, so paging quickly supersedes prefetches
+        for pages the user has already moved past.
+        """
+        if not self.service_name:
+            return
 
-            # Get data for current page
-            items = self.get_items(service, offset, self.page_size)
+        total_pages = max(1, (self.total_items + self.page_size - 1) // self.page_size)
+        criteria = self.get_filter_criteria()
+        context = (self.sort_column, self.sort_direction)
+        service_name, page_size = self.service_name, self.page_size
+
+        if self._prefetcher is None:
+            self._prefetcher = BackgroundLoader(self.parent)
+
+        for distance in range(1, config.PAGE_PREFETCH_DISTANCE + 1):
+            for page in (self.current_page + distance, self.current_page - distance):
+                if not 1 <= page <= total_pages:
+                    continue
+                key = page_key(criteria, *context, page_size, page)
+                if key in self.page_cache:
+                    continue
+
+                slot = f"prefetch{page - self.current_page:+d}"
+                self._prefetcher.submit(
+                    slot,
+                    lambda page=page: self.fetch_page(get_worker_service(service_name), page, page_size,
+                                                      criteria=criteria, sort=context),
+                    lambda page_data: self.page_cache.put(
+                        page_key(criteria, *context, page_size, page_data[1]), page_data),
+                    on_error=lambda error: self.logger.debug(f"Page prefetch failed: {str(error)}"))
+
+    def cancel_prefetch(self):
+        """Cancel outstanding page prefetches."""
+        if self._prefetcher is not None:
+            self._prefetcher.cancel()
+
+    def on_data_changed(self, data=None):
+        """
+        Drop cached pages and search results after the listed entities changed.
 
-            # Clear existing items
-            self.treeview.clear()
+        Args:
+            data: Event data
+        """
+        self.cancel_prefetch()
+        self.page_cache.clear()
+        self.search_cache.clear()
 
-            # Add items to treeview
-            for item in items:
-                values = self.extract_item_values(item)
-                item_id = values[0]  # Assuming first column is ID
-                self.treeview.insert_item(item_id, values)
+    def get_filter_criteria(self):
+        """
+        Get a copy of the criteria the list is filtered by.
 
-        except Exception as e:
-            self.logger.error(f"Error loading data: {str(e)}")
-            self.show_error("Data Load Error", f"Failed to load data: {str(e)}")
+        Loads take this snapshot on the main thread and hand it to the worker; it also
+        keys the page and search caches.
+
+        Returns:
+            Dictionary of filter criteria
+        """
+        return dict(self.filter_criteria)
+
+    def get_text_search_fields(self):
+        """
+        Get the names of the search fields matched by substring.
+
+        Returns:
+            List of field names
+        """
+        return self.search_frame.text_field_names() if self.search_frame else []
+
+    def fetch_search_results(self, service, total_items, text_fields, criteria=None, sort=None):
+        """
+        Fetch every item matching the current search.
+        Runs on a background worker thread.
+
+        Args:
+            service: The service to use
+            total_items: Number of matching items
+            text_fields: Names of the text search fields to keep for client-side narrowing
+            criteria: Filter criteria snapshot; defaults to the current criteria
+            sort: (sort column, sort direction) snapshot; defaults to the current sort
+
+        Returns:
+            List of (item ID, values, search field text) for all matching items
+        """
+        items = self.get_items(service, 0, total_items, criteria=criteria, sort=sort) if total_items else []
+
+        rows = []
+        for item in items:
+            values = self.extract_item_values(item)
+            keys = {name: search_key(item, name) for name in text_fields}
+            rows.append((values[0], values, keys))  # Assuming first column is ID
+        return rows
+
+    def display_search_results(self, rows):
+        """
+        Show the current page of a complete search result.
 
-    def get_total_count(self, service):
+        Args:
+            rows: All matching rows, as returned by fetch_search_results
+        """
+        total_items = len(rows)
+        total_pages = max(1, (total_items + self.page_size - 1) // self.page_size)
+        page = min(self.current_page, total_pages)
+        start = (page - 1) * self.page_size
+        page_rows = [(item_id, values) for item_id, values, _ in rows[start:start + self.page_size]]
+        self.display_page((total_items, page, page_rows))
+
+    def fetch_page(self, service, page, page_size, total_items=None, criteria=None, sort=None):
+        """
+        Fetch one page of items and their display values.
+        Runs on a background worker thread.
+
+        Args:
+            service: The service to use
+            page: Requested page number
+            page_size: Items per page
+            total_items: Item count if already known
+            criteria: Filter criteria snapshot; defaults to the current criteria
+            sort: (sort column, sort direction) snapshot; defaults to the current sort
+
+        Returns:
+            Tuple of (total item count, page number actually loaded, list of (item ID, values))
+        """
+        # Get total count first so an out-of-range page can be clamped
+        if total_items is None:
+            total_items = self.get_total_count(service, criteria=criteria)
+        total_pages = max(1, (total_items + page_size - 1) // page_size)
+        page = min(page, total_pages)
+
+        items = self.get_items(service, (page - 1) * page_size, page_size, criteria=criteria, sort=sort)
+
+        rows = []
+        for item in items:
+            values = self.extract_item_values(item)
+            rows.append((values[0], values))  # Assuming first column is ID
+        return total_items, page, rows
+
+    def display_page(self, page_data):
+        """
+        Show a fetched page in the treeview.
+
+        Args:
+            page_data: Result of fetch_page
+        """
+        self.total_items, self.current_page, rows = page_data
+        total_pages = max(1, (self.total_items + self.page_size - 1) // self.page_size)
+
+        # Update pagination display
+        self.update_pagination_display(total_pages)
+
+        # Replace the treeview contents
+        self.treeview.clear()
+        for item_id, values in rows:
+            self.treeview.insert_item(item_id, values)
+        self.treeview.set_total_rows(self.total_items)
+
+    def on_load_error(self, error):
+        """
+        Handle a failed background load.
+
+        Args:
+            error: The exception raised while loading
+        """
+        self.logger.error(f"Error loading data: {str(error)}")
+        self.show_error("Data Load Error", f"Failed to load data: {str(error)}")
+
+    def get_total_count(self, service, criteria=None):
         """
         Get the total count of items.
 
         Args:
             service: The service to use
+            criteria: Filter criteria snapshot; defaults to the current criteria
 
         Returns:
             The total count of items
         """
+        if criteria is None:
+            criteria = self.filter_criteria
+
         # Default implementation - override in subclasses
         try:
-            return service.get_count(self.filter_criteria)
+            if hasattr(service, "count_list_rows"):
+                return service.count_list_rows(**criteria)
+            return service.get_count(criteria)
         except Exception as e:
             self.logger.error(f"Error getting count: {str(e)}")
             return 0
 
-    def get_items(self, service, offset, limit):
+    def get_items(self, service, offset, limit, criteria=None, sort=None):
         """
         Get items for the current page.
 
@@ -351,18 +573,34 @@ class BaseListView(BaseView):
             service: The service to use
             offset: Pagination offset
             limit: Page size
+            criteria: Filter criteria snapshot; defaults to the current criteria
+            sort: (sort column, sort direction) snapshot; defaults to the current sort
 
         Returns:
             List of items
         """
+        if criteria is None:
+            criteria = self.filter_criteria
+        sort_column, sort_direction = sort if sort is not None else (self.sort_column, self.sort_direction)
+
         # Default implementation - override in subclasses
         try:
+            if hasattr(service, "get_list_rows"):
+                # Select only the displayed columns instead of loading full entities
+                return service.get_list_rows(
+                    [col[0] for col in self.columns],
+                    offset=offset,
+                    limit=limit,
+                    sort_column=sort_column,
+                    sort_direction=sort_direction,
+                    **criteria
+                )
             return service.get_all(
                 offset=offset,
                 limit=limit,
-                sort_column=self.sort_column,
-                sort_direction=self.sort_direction,
-                **self.filter_criteria
+                sort_column=sort_column,
+                sort_direction=sort_direction,
+                **criteria
             )
         except Exception as e:
             self.logger.error(f"Error getting items: {str(e)}")
@@ -379,12 +617,15 @@ class BaseListView(BaseView):
             List of values corresponding to treeview columns
         """
         # Default implementation - override in subclasses
-        if hasattr(item, '__dict__'):
-            # For model objects
-            return [getattr(item, col[0], "") for col in self.columns]
-        elif isinstance(item, dict):
+        if isinstance(item, dict):
             # For dictionary data
             return [item.get(col[0], "") for col in self.columns]
+        elif hasattr(item, '_fields'):
+            # For projected list rows
+            return ["" if value is None else value for value in item]
+        elif hasattr(item, '__dict__'):
+            # For model objects
+            return [getattr(item, col[0], "") for col in self.columns]
         else:
             # For other data types
             return [str(item)] + [""] * (len(self.columns) - 1)
@@ -447,6 +688,7 @@ class BaseListView(BaseView):
         """
         self.sort_column = column
         self.sort_direction = direction
+        self.current_page = 1  # Reset to first page
         self.load_data()
 
     def on_search(self, criteria):
@@ -462,9 +704,9 @@ class BaseListView(BaseView):
 
     def on_select(self):
         """Handle item selection."""
-        selection = self.treeview.selection()
+        selection = self.treeview.get_selected_id()
         if selection:
-            self.selected_item = selection[0]
+            self.selected_item = selection
             # Enable action buttons
             self.btn_view.config(state=tk.NORMAL)
             self.btn_edit.config(state=tk.NORMAL)
@@ -476,6 +718,15 @@ class BaseListView(BaseView):
             self.btn_edit.config(state=tk.DISABLED)
             self.btn_delete.config(state=tk.DISABLED)
 
+    def get_selected_id(self):
+        """
+        Get the ID of the selected item.
+
+        Returns:
+            The selected item ID, or None if nothing is selected
+        """
+        return self.treeview.get_selected_id() if self.treeview else None
+
     def on_add(self):
         """Handle add new item action."""
         self.logger.info("Add action not implemented")
@@ -506,12 +757,9 @@ class BaseListView(BaseView):
             return
 
         try:
-            service = self.get_service(self.service_name)
-            if not service:
-                return
-
-            # Perform delete operation
-            service.delete(self.selected_item)
+            # Perform delete operation in its own unit of work
+            with unit_of_work() as scope:
+                scope.resolve(self.service_name).delete(self.selected_item)
 
             # Refresh data
             self.refresh()
@@ -523,4 +771,12 @@ class BaseListView(BaseView):
 
     def refresh(self):
         """Refresh the view."""
-        self.load_data()
\ No newline at end of file
+        self.on_data_changed()
+        self.load_data()
+
+    def destroy(self):
+        """Stop listening for data changes and destroy the view."""
+        for topic in self.invalidation_topics:
+            unsubscribe(topic, self.on_data_changed)
+        self.cancel_prefetch()
+        super().destroy()
\ No newline at end of file
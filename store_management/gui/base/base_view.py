@@ -7,10 +7,11 @@ Provides common functionality for views, including service access.
 import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
 
 from di import resolve
 from gui import theme, config
+from gui.utils.background_loader import BackgroundLoader
 
 # Type variable for service type hints
 T = TypeVar('T')
@@ -30,6 +31,8 @@ class BaseView:
         self.frame = None
         self.title = "Base View"
         self.services = {}  # Cache for resolved services
+        self.loading_indicator = None
+        self._loader = None
     
     def build(self):
         """
@@ -57,6 +60,9 @@ class BaseView:
             text=self.title,
             font=theme.create_custom_font(theme.FONTS["header"]))
         title_label.pack(side=tk.LEFT, padx=10, pady=10)
+
+        # Loading indicator, shown while background loads are running
+        self.loading_indicator = ttk.Progressbar(header_frame, mode="indeterminate", length=80)
         
         # Action buttons frame on the right
         self.action_buttons = ttk.Frame(header_frame)
@@ -79,10 +85,57 @@ class BaseView:
         """Refresh the view content."""
         self.logger.info(f"Refreshing view: {self.title}")
         # Clear and rebuild the view
+        self.cancel_background_tasks()
         if self.frame:
             self.frame.destroy()
         self.build()
     
+    def run_in_background(self, task: Callable[[], Any], on_success: Callable[[Any], None],
+                          on_error: Optional[Callable[[Exception], None]] = None,
+                          key: str = "load") -> None:
+        """
+        Run a task on the background worker pool and handle its result on the main thread.
+
+        A newer task with the same key supersedes an older one; the older result is discarded.
+        The task runs on a worker thread, so it must not touch widgets; use
+        ``get_worker_service`` from ``gui.utils.background_loader`` for service access.
+
+        Args:
+            task: Function to run on the worker thread
+            on_success: Called with the task result
+            on_error: Called with the exception if the task fails
+            key: Slot for the task
+        """
+        if self._loader is None:
+            self._loader = BackgroundLoader(self.parent, on_busy=self.set_loading)
+        self._loader.submit(key, task, on_success, on_error)
+
+    def cancel_background_tasks(self, key: Optional[str] = None):
+        """
+        Cancel outstanding background tasks for this view.
+
+        Args:
+            key: Task slot to cancel, or None to cancel all of them
+        """
+        if self._loader is not None:
+            self._loader.cancel(key)
+
+    def set_loading(self, loading: bool):
+        """
+        Show or hide the loading indicator.
+
+        Args:
+            loading: Whether a background load is in progress
+        """
+        if not self.loading_indicator:
+            return
+        if loading:
+            self.loading_indicator.pack(side=tk.LEFT, padx=10)
+            self.loading_indicator.start(15)
+        else:
+            self.loading_indicator.stop()
+            self.loading_indicator.pack_forget()
+
     def get_service(self, service_type: str) -> T:
         """
         Get a service instance using DI.
@@ -153,5 +206,6 @@ class BaseView:
     
     def destroy(self):
         """Destroy the view."""
+        self.cancel_background_tasks()
         if self.frame:
             self.frame.destroy()
\ No newline at end of file
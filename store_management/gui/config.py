@@ -4,6 +4,8 @@ Configuration settings for the GUI application.
 Centralizes constants and settings used throughout the GUI.
 """
 
+import os
+
 # Window dimensions
 DEFAULT_WINDOW_WIDTH = 1280
 DEFAULT_WINDOW_HEIGHT = 800
@@ -13,6 +15,47 @@ MIN_WINDOW_HEIGHT = 600
 # Table display settings
 PAGE_SIZE_OPTIONS = [10, 25, 50, 100]
 DEFAULT_PAGE_SIZE = 25
+# Virtual-mode lists only materialize visible rows, so they can show much larger pages
+VIRTUAL_PAGE_SIZE_OPTIONS = [100, 1000, 10000, 100000]
+VIRTUAL_DEFAULT_PAGE_SIZE = 1000
+
+# Background loading
+LOADER_MAX_WORKERS = 2
+LOADER_POLL_INTERVAL = 30  # milliseconds between checks for finished loads
+
+# Incremental search
+SEARCH_DEBOUNCE_MS = 250
+# Result sets up to this size are fetched whole so narrower queries can be filtered locally
+SEARCH_CACHE_MAX_ROWS = 2000
+SEARCH_CACHE_MAX_ENTRIES = 20
+
+# List page cache; the pages either side of the visible one are prefetched
+PAGE_CACHE_MAX_PAGES = 12
+PAGE_PREFETCH_DISTANCE = 1
+
+# Seconds from application start to the first paint of the main window before startup
+# is reported as too slow; also enforced by the startup regression test
+STARTUP_FIRST_PAINT_BUDGET = 3.0
+
+# Configure the mappers, check the schema and build the services after the main window
+# has painted, on a background thread; False does it all before the window is shown
+STARTUP_DEFERRED_WARMUP = True
+
+# Event bus: events are queued and dispatched once per frame, coalescing repeats
+EVENT_BUS_DEFERRED = True
+
+# Memory diagnostics dialog refresh interval
+DIAGNOSTICS_REFRESH_INTERVAL = 2000  # milliseconds
+
+# Heatmaps with at least this many cells are drawn as a single image
+HEATMAP_RASTER_MIN_CELLS = 500
+
+# Pattern file viewer tiles: rendered once per zoom level, kept in memory and on disk
+PATTERN_TILE_SIZE = 256  # pixels
+PATTERN_TILE_CACHE_MAX_TILES = 256
+PATTERN_TILE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".store_management", "tile_cache")
+PATTERN_TILE_DISK_MAX_MB = 500
+PATTERN_OVERVIEW_SIZE = 1024  # longest side of the low-resolution placeholder image
 
 # File paths
 ICON_PATH = "assets/icons"
@@ -27,4 +70,35 @@ LOG_LEVEL = "INFO"
 
 # Cache settings
 CACHE_ENABLED = True
-CACHE_TIMEOUT = 300  # seconds
\ No newline at end of file
+CACHE_TIMEOUT = 300  # seconds
+
+# View cache: built views are kept alive between navigations
+VIEW_CACHE_MAX_VIEWS = 8
+VIEW_CACHE_MEMORY_BUDGET_KB = 32 * 1024
+# Rough per-widget and per-treeview-row costs used to estimate a view's footprint
+VIEW_CACHE_WIDGET_COST_KB = 4
+VIEW_CACHE_ROW_COST_KB = 1
+
+# Views that are always rebuilt because they show point-in-time reports
+VIEW_CACHE_EXCLUDED_VIEWS = ["reports", "inventory_reports", "sales_reports", "project_reports"]
+
+# Event bus topics that make a cached view stale
+VIEW_CACHE_INVALIDATION_TOPICS = {
+    "inventory": ["inventory_updated", "purchase_updated", "inventory.item.added",
+                  "inventory.item.updated", "inventory.item.removed"],
+    "storage": ["inventory_updated", "inventory.item.added", "inventory.item.updated", "inventory.item.removed"],
+    "materials": ["material_updated", "inventory_updated"],
+    "leather": ["material_updated", "inventory_updated"],
+    "hardware": ["material_updated", "inventory_updated"],
+    "supplies": ["material_updated", "inventory_updated"],
+    "sales": ["sale_updated", "sale.created", "sale.updated", "customer_updated"],
+    "customers": ["customer_created", "customer_updated", "customer_deleted", "customer_status_changed"],
+    "purchases": ["purchase_created", "purchase_updated", "purchase.created", "purchase.updated",
+                  "purchase.received", "supplier_updated"],
+    "suppliers": ["supplier_created", "supplier_updated"],
+    "projects": ["project.created", "project.updated", "project.status_changed", "project.completed"],
+    "picking_lists": ["picking_list_completed", "picking_list_cancelled"],
+    "tool_lists": ["tool_list_cancelled"],
+    "patterns": ["pattern_updated", "component_updated", "component_created"],
+    "components": ["component_created", "component_updated"],
+}
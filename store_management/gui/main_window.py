@@ -16,6 +16,7 @@ from gui import theme
 from gui.widgets.breadcrumb_navigation import BreadcrumbNavigation
 from gui.utils.view_history_manager import ViewHistoryManager
 from gui.utils.navigation_service import NavigationService
+from gui.utils.view_cache import ViewCache
 
 # Try to import the utils service provider bridge, with better error handling
 try:
@@ -66,6 +67,9 @@ class MainWindow:
         self.view_history = ViewHistoryManager()
         self.view_history.set_navigation_callback(self._navigate_to_view)
 
+        # Built views kept alive between navigations
+        self.view_cache = ViewCache()
+
         # Initialize and set up navigation service
         nav_service = NavigationService.get_instance()
         nav_service.initialize(self, self.view_history)
@@ -350,6 +354,13 @@ class MainWindow:
             # If we don't have a specific mapping, add to the current path
             self.breadcrumb_nav.add_breadcrumb(title, view_name, view_data)
 
+    def _clear_content(self):
+        """Hide cached views and destroy any other content, keeping the breadcrumbs."""
+        self.view_cache.hide_all()
+        for widget in self.frame_content.winfo_children():
+            if widget != self.breadcrumb_container and not self.view_cache.owns(widget):
+                widget.destroy()
+
     def _setup_keyboard_shortcuts(self):
         """Set up keyboard shortcuts for the application."""
         # Navigation shortcuts
@@ -367,6 +378,9 @@ class MainWindow:
         # Help shortcut
         self.root.bind("<F1>", lambda e: self.show_help())
 
+        # Diagnostics shortcut
+        self.root.bind("<Control-M>", lambda e: self.show_memory_diagnostics())
+
         # Standard shortcuts
         self.root.bind("<Control-n>", lambda e: self.create_new_item())
         self.root.bind("<Control-f>", lambda e: self.show_search())
@@ -392,11 +406,17 @@ class MainWindow:
             self.view_history.add_view(view_name, view_data)
             self._update_navigation_buttons()
 
-        # Clear the current view (keep breadcrumbs)
-        if self.current_view:
-            for widget in self.frame_content.winfo_children():
-                if widget != self.breadcrumb_container:
-                    widget.destroy()
+        # Hide the current view (keep breadcrumbs and cached views)
+        self._clear_content()
+
+        # Reuse a cached view when there is one
+        cacheable = self.view_cache.is_cacheable(view_name, view_data)
+        cached_view = self.view_cache.show(view_name) if cacheable else None
+        if cached_view is not None:
+            self.current_view = cached_view
+            self._update_breadcrumbs(view_name, view_data)
+            self.update_status(f"Viewing: {view_name}")
+            return self.current_view
 
         # Show the requested view
         try:
@@ -490,6 +510,9 @@ class MainWindow:
             # Build and pack the view
             self.current_view.build()
 
+            if cacheable:
+                self.view_cache.put(view_name, self.current_view, content_container)
+
             # Update status bar
             self.update_status(f"Viewing: {view_name}")
 
@@ -522,11 +545,18 @@ class MainWindow:
             self.view_history.add_view("dashboard")
             self._update_navigation_buttons()
 
-        # Clear the current view (keep breadcrumbs)
-        if self.current_view:
-            for widget in self.frame_content.winfo_children():
-                if widget != self.breadcrumb_container:
-                    widget.destroy()
+        # Hide the current view (keep breadcrumbs and cached views)
+        self._clear_content()
+
+        # Reuse the dashboard's widgets but reload its figures, which may have changed
+        # while another view was shown
+        cached_view = self.view_cache.show("dashboard")
+        if cached_view is not None:
+            self.current_view = cached_view
+            self.current_view.refresh()
+            self.breadcrumb_nav.set_home_breadcrumb("Dashboard", "dashboard")
+            self.update_status("Dashboard")
+            return self.current_view
 
         try:
             # Create a container for the dashboard
@@ -537,6 +567,7 @@ class MainWindow:
             from gui.views.dashboard.main_dashboard import DashboardView
             self.current_view = DashboardView(dashboard_container)
             self.current_view.build()
+            self.view_cache.put("dashboard", self.current_view, dashboard_container)
 
             # Update breadcrumbs
             self.breadcrumb_nav.set_home_breadcrumb("Dashboard", "dashboard")
@@ -633,7 +664,8 @@ class MainWindow:
             ("Ctrl+N", "Create new item"),
             ("Ctrl+F", "Search"),
             ("Ctrl+R", "Reports"),
-            ("F1", "Show this help")
+            ("F1", "Show this help"),
+            ("Ctrl+Shift+M", "Memory diagnostics")
         ]
 
         for key, desc in shortcuts:
@@ -665,6 +697,17 @@ class MainWindow:
         if hasattr(self.current_view, 'on_add'):
             self.current_view.on_add()
 
+    def show_memory_diagnostics(self, event=None):
+        """Show the memory diagnostics dialog, or raise it if it is already open."""
+        dialog = getattr(self, '_memory_diagnostics', None)
+        if dialog is not None and dialog.dialog and dialog.dialog.winfo_exists():
+            dialog.dialog.lift()
+            return
+
+        from gui.views.diagnostics.memory_diagnostics_dialog import MemoryDiagnosticsDialog
+        self._memory_diagnostics = MemoryDiagnosticsDialog(self.root)
+        self._memory_diagnostics.show()
+
     def show_search(self, event=None):
         """
         Show the search interface for the current view.
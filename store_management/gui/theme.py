@@ -37,6 +37,16 @@ COLORS = {
     "text_primary": "#2c3e50",
     "info": "#3498db",
     "error": "#c0392b", #Added this
+    "secondary_light": "#a6acaf",
+    "secondary_text": "#777777",
+    "light_success": "#d5f5e3",
+    # Chart colors
+    "background": "#ffffff",
+    "light_blue": "#d6eaf8",
+    "dark_blue": "#1b4f72",
+    "tooltip_bg": "#2c3e50",
+    "tooltip_fg": "#ffffff",
+    "tooltip_text": "#ffffff",
 }
 
 # Define fonts
@@ -0,0 +1,432 @@
+# gui/utils/background_loader.py
+"""
+Background loading for GUI views.
+Runs service calls on a shared worker pool and hands the results back to the Tk main loop.
+
+Tk widgets may only be touched from the main thread, and SQLAlchemy sessions may only be
+used from one thread at a time. Each task therefore runs in its own DI unit-of-work scope,
+with its own database session and service instances, and finished loads are queued and
+picked up by a main-loop ``after()`` poll rather than calling back into Tk directly.
+
+Cancelling a running load interrupts its query on the pooled connection. The task is bound
+to a connection only while its session holds it: the binding is made when the session
+begins a transaction and dropped, under the same lock ``cancel`` holds, before the
+connection is checked back into the pool, so an interrupt never reaches another load.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import event
+
+from gui import config
+
+logger = logging.getLogger(__name__)
+
+# Shared worker pool, created on first use
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Per-worker unit-of-work scope and currently running task
+_worker_state = threading.local()
+
+# Tasks bound to the pooled DBAPI connection their query runs on; the lock guards
+# binding, unbinding and interrupting
+_bound_tasks: Dict[Any, "LoadTask"] = {}
+_interrupt_lock = threading.Lock()
+_watched_engines = set()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared worker pool, creating it on first use.
+
+    Returns:
+        The thread pool used for background loads
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=config.LOADER_MAX_WORKERS,
+                thread_name_prefix="gui-loader")
+        return _executor
+
+
+def shutdown(wait: bool = False) -> None:
+    """
+    Shut down the shared worker pool.
+
+    Args:
+        wait: Whether to wait for running loads to finish
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait, cancel_futures=True)
+            _executor = None
+
+
+def _worker_scope():
+    """
+    Get the unit-of-work scope of the task running on the current worker thread.
+
+    The scope is created on first use and ended after the task, so each load gets its
+    own session, repositories and services, and no ORM objects outlive the task.
+
+    Returns:
+        The task's service scope
+    """
+    scope = getattr(_worker_state, 'scope', None)
+    if scope is None:
+        from di import Container, Lifetime, get_container
+
+        try:
+            scope = get_container().create_scope()
+        except RuntimeError:
+            # No application container (e.g. in tests); sessions still need a scope
+            scope = Container().create_scope()
+
+        def create_session(container):
+            from database.sqlalchemy.session import get_db_session
+            return get_db_session()
+
+        scope.register_factory("Session", create_session, Lifetime.SCOPED)
+        _worker_state.scope = scope
+    return scope
+
+
+def get_worker_session():
+    """
+    Get the database session of the task running on the current worker thread.
+
+    The session belongs to the task's unit-of-work scope: it is committed when the task
+    succeeds, rolled back when it fails, and closed either way, so each load sees
+    committed data.
+
+    Returns:
+        SQLAlchemy session for this task
+    """
+    session = _worker_scope().resolve("Session")
+
+    task = getattr(_worker_state, 'task', None)
+    if task is not None and task.session is not session:
+        task.watch_session(session)
+    return session
+
+
+def _release_connection(dbapi_connection, connection_record) -> None:
+    """
+    Unbind the task using a connection before the connection goes back to the pool.
+
+    Args:
+        dbapi_connection: The DBAPI connection being checked in
+        connection_record: The pool's record of the connection
+    """
+    with _interrupt_lock:
+        task = _bound_tasks.get(dbapi_connection)
+        if task is not None:
+            task._unbind()
+
+
+def _watch_engine(engine) -> None:
+    """
+    Listen for connections of an engine being checked back into its pool.
+
+    Args:
+        engine: The engine worker sessions are bound to
+    """
+    with _interrupt_lock:
+        if engine in _watched_engines:
+            return
+        _watched_engines.add(engine)
+    event.listen(engine, "checkin", _release_connection)
+
+
+def get_worker_service(service_name: str) -> Any:
+    """
+    Resolve a service bound to the session of the current worker task.
+
+    Services listed in the DI service mappings are created in the task's scope, on the
+    task's session; anything else falls back to the shared instance.
+
+    Args:
+        service_name: The service interface name (e.g. 'IInventoryService')
+
+    Returns:
+        The service instance
+    """
+    scope = _worker_scope()
+    get_worker_session()
+
+    from di import Lifetime
+    from di.config import SERVICE_MAPPINGS
+
+    implementation = SERVICE_MAPPINGS.get(service_name)
+    if implementation:
+        if not scope.is_registered(service_name):
+            scope.register(service_name, implementation, Lifetime.SCOPED)
+        return scope.resolve(service_name)
+
+    from gui.utils.service_provider import ServiceProvider
+    logger.debug(f"No mapping for {service_name}, using shared service instance")
+    return ServiceProvider.get_service(service_name)
+
+
+class LoadTask:
+    """A single background load and the callbacks waiting on it."""
+
+    def __init__(self, key: str, task: Callable[[], Any],
+                 on_success: Callable[[Any], None],
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        Initialize the load task.
+
+        Args:
+            key: Slot the task occupies; a newer task with the same key supersedes it
+            task: Function run on the worker thread
+            on_success: Called on the main thread with the task result
+            on_error: Called on the main thread with the exception if the task fails
+        """
+        self.key = key
+        self.task = task
+        self.on_success = on_success
+        self.on_error = on_error
+        self.future = None
+        self.cancelled = False
+        self.finished = False
+        self.session = None
+        self.interrupt = None
+        self._connection = None
+
+    def watch_session(self, session) -> None:
+        """
+        Bind the task to each connection the session checks out for it.
+
+        Args:
+            session: The worker session the task is using
+        """
+        self.session = session
+        try:
+            engine = session.get_bind()
+        except Exception as e:
+            # Without the engine the binding could outlive the checkout; don't bind at all
+            logger.debug(f"Load '{self.key}' cannot be interrupted: {str(e)}")
+            return
+        _watch_engine(getattr(engine, 'engine', engine))
+        event.listen(session, "after_begin",
+                     lambda session, transaction, connection: self.bind_connection(connection))
+        if session.in_transaction():
+            self.bind_connection(session.connection())
+
+    def bind_connection(self, connection) -> None:
+        """
+        Remember how to interrupt the query this task is running.
+
+        Args:
+            connection: The SQLAlchemy connection the task's session is using
+        """
+        dbapi_connection = connection.connection.dbapi_connection
+        with _interrupt_lock:
+            if self.finished:
+                return
+            self._unbind()
+            self._connection = dbapi_connection
+            self.interrupt = getattr(dbapi_connection, 'interrupt', None)
+            _bound_tasks[dbapi_connection] = self
+
+    def finish(self) -> None:
+        """Unbind the task for good; called before its session is closed."""
+        with _interrupt_lock:
+            self.finished = True
+            self._unbind()
+
+    def cancel(self) -> None:
+        """Cancel the task, aborting its query if it is already running."""
+        self.cancelled = True
+        if self.future is not None and self.future.cancel():
+            return
+        with _interrupt_lock:
+            if self.interrupt is not None:
+                try:
+                    # sqlite3 allows interrupting a connection from another thread
+                    self.interrupt()
+                except Exception as e:
+                    logger.debug(f"Could not interrupt load '{self.key}': {str(e)}")
+
+    def _unbind(self) -> None:
+        """Forget the bound connection; the caller holds the interrupt lock."""
+        if self._connection is not None and _bound_tasks.get(self._connection) is self:
+            del _bound_tasks[self._connection]
+        self._connection = None
+        self.interrupt = None
+
+
+class BackgroundLoader:
+    """
+    Runs loads for one view on the shared worker pool.
+
+    Each load occupies a key; submitting a new load for a key cancels the previous one,
+    and results of cancelled loads are discarded, so the view only ever sees the newest
+    answer for each key.
+    """
+
+    def __init__(self, widget, on_busy: Optional[Callable[[bool], None]] = None):
+        """
+        Initialize the loader.
+
+        Args:
+            widget: Tk widget whose ``after()`` schedules result delivery
+            on_busy: Called on the main thread with True when loading starts and False when idle
+        """
+        self.widget = widget
+        self.on_busy = on_busy
+        self._tasks: Dict[str, LoadTask] = {}
+        self._results: "queue.Queue" = queue.Queue()
+        self._poll_id = None
+
+    @property
+    def busy(self) -> bool:
+        """Whether any load is still outstanding."""
+        return bool(self._tasks)
+
+    def submit(self, key: str, task: Callable[[], Any], on_success: Callable[[Any], None],
+               on_error: Optional[Callable[[Exception], None]] = None) -> LoadTask:
+        """
+        Run a task on the worker pool, superseding any earlier task with the same key.
+
+        Args:
+            key: Slot for the task
+            task: Function run on the worker thread; must not touch Tk widgets
+            on_success: Called on the main thread with the task result
+            on_error: Called on the main thread with the exception if the task fails
+
+        Returns:
+            The submitted task
+        """
+        was_busy = self.busy
+        previous = self._tasks.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+
+        load_task = LoadTask(key, task, on_success, on_error)
+        self._tasks[key] = load_task
+        load_task.future = get_executor().submit(self._run, load_task)
+
+        if not was_busy:
+            self._notify_busy(True)
+        self._schedule_poll()
+        return load_task
+
+    def cancel(self, key: Optional[str] = None) -> None:
+        """
+        Cancel outstanding loads.
+
+        Args:
+            key: Load to cancel, or None to cancel all of them
+        """
+        keys = list(self._tasks) if key is None else [key]
+        for task_key in keys:
+            load_task = self._tasks.pop(task_key, None)
+            if load_task is not None:
+                load_task.cancel()
+
+        if not self._tasks:
+            if self._poll_id is not None:
+                try:
+                    self.widget.after_cancel(self._poll_id)
+                except Exception:
+                    pass
+                self._poll_id = None
+            if keys:
+                self._notify_busy(False)
+
+    def _run(self, load_task: LoadTask) -> None:
+        """
+        Execute a task on a worker thread and queue its outcome.
+
+        Args:
+            load_task: The task to run
+        """
+        if load_task.cancelled:
+            return
+
+        _worker_state.task = load_task
+        result, error = None, None
+        try:
+            result = load_task.task()
+        except Exception as e:
+            error = e
+        finally:
+            _worker_state.task = None
+            load_task.finish()
+            scope = getattr(_worker_state, 'scope', None)
+            _worker_state.scope = None
+            if scope is not None:
+                try:
+                    scope.dispose(commit=error is None and not load_task.cancelled)
+                except Exception as e:
+                    logger.debug(f"Error finishing worker session: {str(e)}")
+                    if error is None:
+                        error = e
+
+        if not load_task.cancelled:
+            self._results.put((load_task, result, error))
+
+    def _schedule_poll(self) -> None:
+        """Schedule a main-loop check for finished loads."""
+        if self._poll_id is None:
+            try:
+                self._poll_id = self.widget.after(config.LOADER_POLL_INTERVAL, self._poll)
+            except Exception as e:
+                # The widget is gone, so nobody is waiting for the results
+                logger.debug(f"Stopping background loads: {str(e)}")
+                self._poll_id = None
+                for load_task in self._tasks.values():
+                    load_task.cancel()
+                self._tasks.clear()
+
+    def _poll(self) -> None:
+        """Deliver finished loads on the main thread."""
+        self._poll_id = None
+        while True:
+            try:
+                load_task, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            # Superseded or cancelled after finishing
+            if load_task.cancelled or self._tasks.get(load_task.key) is not load_task:
+                continue
+            del self._tasks[load_task.key]
+
+            try:
+                if error is None:
+                    load_task.on_success(result)
+                elif load_task.on_error is not None:
+                    load_task.on_error(error)
+                else:
+                    logger.error(f"Background load '{load_task.key}' failed: {str(error)}")
+            except Exception as e:
+                logger.error(f"Error handling background load '{load_task.key}': {str(e)}")
+
+        if self._tasks:
+            self._schedule_poll()
+        else:
+            self._notify_busy(False)
+
+    def _notify_busy(self, busy: bool) -> None:
+        """
+        Report a change between loading and idle.
+
+        Args:
+            busy: Whether loads are outstanding
+        """
+        if self.on_busy is not None:
+            try:
+                self.on_busy(busy)
+            except Exception as e:
+                logger.debug(f"Error updating loading indicator: {str(e)}")
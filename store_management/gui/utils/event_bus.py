@@ -2,13 +2,104 @@
 """
 Event bus for communication between GUI components.
 Provides a simple publish-subscribe mechanism.
+
+Once attached to the Tk root (see ``attach``), publishing only queues an event and
+the queue is dispatched from ``after_idle``, once per frame. Events published again
+for the same topic and key before the queue is dispatched are coalesced into one,
+carrying the latest data, so a bulk operation publishing hundreds of updates makes
+each subscriber refresh once. The key defaults to the payload itself, so only repeats
+of the same event are coalesced and events about different records all arrive;
+publishers whose subscribers just reload pass a shared key to merge them.
+Without a root, events are dispatched immediately.
+
+Bound methods are held through weak references and subscribers belonging to a
+destroyed widget are dropped, so views that are never unsubscribed do not leak.
 """
 
+import inspect
 import logging
-from typing import Any, Callable, Dict, List, Set
+import time
+import weakref
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Subscriber priorities; higher priorities are called first
+PRIORITY_HIGH = 10
+PRIORITY_NORMAL = 0
+PRIORITY_LOW = -10
+
+
+class _Subscription:
+    """A subscriber callback with its priority."""
+
+    __slots__ = ("priority", "order", "_callback", "_ref")
+
+    def __init__(self, callback: Callable[[Any], None], priority: int, order: int, weak: bool):
+        self.priority = priority
+        self.order = order
+        if weak and inspect.ismethod(callback):
+            self._callback = None
+            self._ref = weakref.WeakMethod(callback)
+        else:
+            self._callback = callback
+            self._ref = None
+
+    @property
+    def sort_key(self) -> Tuple[int, int]:
+        return -self.priority, self.order
+
+    def target(self) -> Optional[Callable[[Any], None]]:
+        """Get the callback, or None if it was garbage collected."""
+        return self._callback if self._ref is None else self._ref()
+
+    def resolve(self) -> Optional[Callable[[Any], None]]:
+        """
+        Get the callback, or None once its owner is gone.
+
+        Returns:
+            The callback, or None if it was collected or belongs to a destroyed widget
+        """
+        callback = self.target()
+        if callback is None:
+            return None
+
+        owner = getattr(callback, "__self__", None)
+        if hasattr(owner, "winfo_exists"):
+            try:
+                if not owner.winfo_exists():
+                    return None
+            except Exception:
+                return None
+        return callback
+
+
+class TopicStats:
+    """Publishing and handler timing figures for one topic."""
+
+    __slots__ = ("published", "coalesced", "dispatched", "handler_calls", "handler_time", "max_handler_time")
+
+    def __init__(self):
+        self.published = 0
+        self.coalesced = 0
+        self.dispatched = 0
+        self.handler_calls = 0
+        self.handler_time = 0.0
+        self.max_handler_time = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the figures as a dictionary, with times in milliseconds."""
+        return {
+            "published": self.published,
+            "coalesced": self.coalesced,
+            "dispatched": self.dispatched,
+            "handler_calls": self.handler_calls,
+            "handler_time_ms": self.handler_time * 1000,
+            "max_handler_time_ms": self.max_handler_time * 1000,
+        }
+
 
 class EventBus:
     """
@@ -18,20 +109,29 @@ class EventBus:
 
     def __init__(self):
         """Initialize the event bus."""
-        self._subscribers: Dict[str, List[Callable[[Any], None]]] = {}
+        self._subscribers: Dict[str, List[_Subscription]] = {}
         self._topic_registry: Set[str] = set()
-
-    def subscribe(self, topic: str, callback: Callable[[Any], None]) -> None:
+        self._order = count()
+        self._widget = None
+        self._pending: "OrderedDict[Tuple[str, Hashable], Any]" = OrderedDict()
+        self._flush_scheduled = False
+        self._stats: Dict[str, TopicStats] = {}
+
+    def subscribe(self, topic: str, callback: Callable[[Any], None],
+                  priority: int = PRIORITY_NORMAL, weak: bool = True) -> None:
         """
         Subscribe to a topic.
 
         Args:
             topic: The topic to subscribe to
             callback: The callback function to call when the topic is published
+            priority: Subscribers with higher priorities are called first
+            weak: Hold bound methods through a weak reference
         """
-        if topic not in self._subscribers:
-            self._subscribers[topic] = []
-        self._subscribers[topic].append(callback)
+        subscription = _Subscription(callback, priority, next(self._order), weak)
+        subscribers = self._subscribers.setdefault(topic, [])
+        subscribers.append(subscription)
+        subscribers.sort(key=lambda s: s.sort_key)
         self._topic_registry.add(topic)
         logger.debug(f"Subscribed to topic: {topic}")
 
@@ -43,28 +143,161 @@ class EventBus:
             topic: The topic to unsubscribe from
             callback: The callback function to remove
         """
-        if topic in self._subscribers and callback in self._subscribers[topic]:
-            self._subscribers[topic].remove(callback)
-            logger.debug(f"Unsubscribed from topic: {topic}")
-            # Remove topic if no subscribers left
-            if not self._subscribers[topic]:
-                del self._subscribers[topic]
+        subscribers = self._subscribers.get(topic)
+        if not subscribers:
+            return
+
+        for subscription in subscribers:
+            if subscription.target() == callback:
+                subscribers.remove(subscription)
+                logger.debug(f"Unsubscribed from topic: {topic}")
+                break
+
+        # Remove topic if no subscribers left
+        if not subscribers:
+            del self._subscribers[topic]
+
+    def attach(self, widget, deferred: bool = True) -> None:
+        """
+        Dispatch events from the Tk event loop of a widget.
+
+        Args:
+            widget: Widget whose ``after_idle`` schedules dispatching, normally the root
+            deferred: Queue and coalesce events; False dispatches them immediately
+        """
+        self.flush()
+        self._widget = widget if deferred else None
 
-    def publish(self, topic: str, data: Any = None) -> None:
+    def detach(self) -> None:
+        """Dispatch queued events and go back to dispatching immediately."""
+        self._widget = None
+        self.flush()
+
+    @property
+    def deferred(self) -> bool:
+        """Whether published events are queued until the event loop is idle."""
+        return self._widget is not None
+
+    def publish(self, topic: str, data: Any = None, key: Hashable = None, immediate: bool = False) -> None:
         """
         Publish data to a topic.
 
         Args:
             topic: The topic to publish to
             data: The data to publish
+            key: Events with the same topic and key queued in one frame are coalesced into
+                the latest; defaults to the payload, so only identical events are merged
+            immediate: Dispatch now even when events are deferred
+        """
+        self._topic_stats(topic).published += 1
+
+        if immediate or self._widget is None:
+            self._dispatch(topic, data)
+            return
+
+        pending_key = (topic, key if key is not None else _payload_key(data))
+        if pending_key in self._pending:
+            self._stats[topic].coalesced += 1
+        self._pending[pending_key] = data
+
+        if not self._flush_scheduled:
+            try:
+                self._widget.after_idle(self.flush)
+                self._flush_scheduled = True
+            except Exception as e:
+                # The widget is gone; fall back to dispatching immediately
+                logger.debug(f"Could not schedule event dispatch: {str(e)}")
+                self._widget = None
+                self.flush()
+
+    def flush(self) -> None:
+        """Dispatch all queued events."""
+        self._flush_scheduled = False
+        # Events published by handlers are queued for the next frame
+        pending, self._pending = self._pending, OrderedDict()
+        for (topic, _), data in pending.items():
+            self._dispatch(topic, data)
+
+    def pending_count(self) -> int:
+        """
+        Get the number of queued events.
+
+        Returns:
+            Number of events waiting to be dispatched
+        """
+        return len(self._pending)
+
+    def _dispatch(self, topic: str, data: Any) -> None:
+        """
+        Call the subscribers of a topic, timing each handler.
+
+        Args:
+            topic: The topic published
+            data: The data published
+        """
+        subscribers = self._subscribers.get(topic)
+        if not subscribers:
+            return
+
+        logger.debug(f"Publishing to topic: {topic}")
+        stats = self._topic_stats(topic)
+        stats.dispatched += 1
+        dead = []
+        for subscription in list(subscribers):
+            callback = subscription.resolve()
+            if callback is None:
+                dead.append(subscription)
+                continue
+
+            started = time.perf_counter()
+            try:
+                callback(data)
+            except Exception as e:
+                logger.error(f"Error in event handler for topic {topic}: {str(e)}")
+            elapsed = time.perf_counter() - started
+            stats.handler_calls += 1
+            stats.handler_time += elapsed
+            stats.max_handler_time = max(stats.max_handler_time, elapsed)
+
+        if dead:
+            for subscription in dead:
+                if subscription in subscribers:
+                    subscribers.remove(subscription)
+            logger.debug(f"Dropped {len(dead)} stale subscribers from topic: {topic}")
+            if not subscribers:
+                self._subscribers.pop(topic, None)
+
+    def _topic_stats(self, topic: str) -> TopicStats:
+        stats = self._stats.get(topic)
+        if stats is None:
+            stats = self._stats[topic] = TopicStats()
+        return stats
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get publishing and handler timing figures per topic.
+
+        Returns:
+            Dictionary of topic to figures, slowest topics first
+        """
+        ordered = sorted(self._stats.items(), key=lambda item: item[1].handler_time, reverse=True)
+        return {topic: stats.as_dict() for topic, stats in ordered}
+
+    def reset_stats(self) -> None:
+        """Reset the per-topic figures."""
+        self._stats.clear()
+
+    def subscriber_count(self, topic: str) -> int:
         """
-        if topic in self._subscribers:
-            logger.debug(f"Publishing to topic: {topic}")
-            for callback in self._subscribers[topic]:
-                try:
-                    callback(data)
-                except Exception as e:
-                    logger.error(f"Error in event handler for topic {topic}: {str(e)}")
+        Get the number of live subscribers of a topic.
+
+        Args:
+            topic: The topic
+
+        Returns:
+            Number of subscribers whose callbacks are still alive
+        """
+        return sum(1 for s in self._subscribers.get(topic, ()) if s.resolve() is not None)
 
     def register_topic(self, topic: str) -> None:
         """
@@ -85,25 +318,57 @@ class EventBus:
         return list(self._topic_registry)
 
     def clear(self) -> None:
-        """Clear all subscriptions."""
+        """Clear all subscriptions and queued events."""
         self._subscribers.clear()
+        self._pending.clear()
         logger.debug("Event bus cleared")
 
 
+def _payload_key(data: Any) -> Hashable:
+    """
+    Derive the coalescing key of an event from its payload.
+
+    Args:
+        data: The published data
+
+    Returns:
+        A hashable copy of the payload, or a unique key if it cannot be hashed
+    """
+    def freeze(value):
+        if isinstance(value, dict):
+            return frozenset((k, freeze(v)) for k, v in value.items())
+        if isinstance(value, (list, tuple)):
+            return tuple(freeze(v) for v in value)
+        if isinstance(value, set):
+            return frozenset(freeze(v) for v in value)
+        return value
+
+    try:
+        key = freeze(data)
+        hash(key)
+        return key
+    except TypeError:
+        # Never coalesce what cannot be compared
+        return object()
+
+
 # Global event bus instance
 _event_bus = EventBus()
 
 
 # Public functions to interact with the global event bus
-def subscribe(topic: str, callback: Callable[[Any], None]) -> None:
+def subscribe(topic: str, callback: Callable[[Any], None],
+              priority: int = PRIORITY_NORMAL, weak: bool = True) -> None:
     """
     Subscribe to a topic on the global event bus.
 
     Args:
         topic: The topic to subscribe to
         callback: The callback function to call when the topic is published
+        priority: Subscribers with higher priorities are called first
+        weak: Hold bound methods through a weak reference
     """
-    _event_bus.subscribe(topic, callback)
+    _event_bus.subscribe(topic, callback, priority=priority, weak=weak)
 
 
 def unsubscribe(topic: str, callback: Callable[[Any], None]) -> None:
@@ -117,15 +382,44 @@ def unsubscribe(topic: str, callback: Callable[[Any], None]) -> None:
     _event_bus.unsubscribe(topic, callback)
 
 
-def publish(topic: str, data: Any = None) -> None:
+def publish(topic: str, data: Any = None, key: Hashable = None, immediate: bool = False) -> None:
     """
     Publish data to a topic on the global event bus.
 
     Args:
         topic: The topic to publish to
         data: The data to publish
+        key: Events with the same topic and key queued in one frame are coalesced;
+            defaults to the payload
+        immediate: Dispatch now even when events are deferred
+    """
+    _event_bus.publish(topic, data, key=key, immediate=immediate)
+
+
+def attach(widget, deferred: bool = True) -> None:
+    """
+    Dispatch events of the global event bus from the Tk event loop.
+
+    Args:
+        widget: Widget whose ``after_idle`` schedules dispatching, normally the root
+        deferred: Queue and coalesce events; False dispatches them immediately
+    """
+    _event_bus.attach(widget, deferred=deferred)
+
+
+def flush() -> None:
+    """Dispatch all events queued on the global event bus."""
+    _event_bus.flush()
+
+
+def get_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get per-topic publishing and handler timing figures of the global event bus.
+
+    Returns:
+        Dictionary of topic to figures, slowest topics first
     """
-    _event_bus.publish(topic, data)
+    return _event_bus.get_stats()
 
 
 def register_topic(topic: str) -> None:
@@ -150,4 +444,4 @@ def get_topics() -> List[str]:
 
 def clear() -> None:
     """Clear all subscriptions from the global event bus."""
-    _event_bus.clear()
\ No newline at end of file
+    _event_bus.clear()
@@ -0,0 +1,110 @@
+# gui/utils/page_cache.py
+"""
+Page cache for list views.
+
+Holds recently loaded pages keyed by the filters, sort order, page size and page
+number they were loaded with, so paging back and forth, and into pages that were
+prefetched, needs no database round trip.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from gui import config
+
+logger = logging.getLogger(__name__)
+
+
+def page_key(criteria: Dict[str, Any], sort_column: Any, sort_direction: Any,
+             page_size: int, page: int) -> Tuple:
+    """
+    Build the cache key for a page.
+
+    Criteria values are compared by their representation, so filters holding
+    unhashable values such as date ranges in lists still produce a usable key.
+
+    Args:
+        criteria: Filter criteria the page was loaded with
+        sort_column: Column the list is sorted by
+        sort_direction: Sort direction
+        page_size: Items per page
+        page: Page number
+
+    Returns:
+        Hashable cache key
+    """
+    filters = repr(sorted(criteria.items(), key=lambda pair: str(pair[0])))
+    return filters, sort_column, sort_direction, page_size, page
+
+
+class PageCache:
+    """
+    LRU cache of loaded list pages.
+
+    Each page is stored together with the total item count it was loaded with. Entries
+    expire after the GUI cache timeout; views clear the cache when their data changes.
+    """
+
+    def __init__(self,
+                 max_pages: int = config.PAGE_CACHE_MAX_PAGES,
+                 timeout: float = config.CACHE_TIMEOUT):
+        """
+        Initialize the page cache.
+
+        Args:
+            max_pages: Maximum number of pages to keep
+            timeout: Seconds before a page is considered out of date
+        """
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self._pages: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, touch=False) is not None
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def get(self, key: Hashable, touch: bool = True) -> Optional[Any]:
+        """
+        Get a cached page.
+
+        Args:
+            key: Key built by page_key
+            touch: Whether to mark the page as recently used
+
+        Returns:
+            The cached page data, or None if it is missing or out of date
+        """
+        entry = self._pages.get(key)
+        if entry is None:
+            return None
+
+        created, page_data = entry
+        if time.monotonic() - created > self.timeout:
+            del self._pages[key]
+            return None
+        if touch:
+            self._pages.move_to_end(key)
+        return page_data
+
+    def put(self, key: Hashable, page_data: Any) -> None:
+        """
+        Store a page, dropping the least recently used pages beyond the limit.
+
+        Args:
+            key: Key built by page_key
+            page_data: The page to store
+        """
+        self._pages.pop(key, None)
+        self._pages[key] = (time.monotonic(), page_data)
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached pages."""
+        if self._pages:
+            logger.debug(f"Dropping {len(self._pages)} cached pages")
+        self._pages.clear()
@@ -0,0 +1,182 @@
+# gui/utils/search_cache.py
+"""
+Search result cache for list views.
+
+Text search fields match on a case-insensitive substring, so every row that matches
+"brid" also matches "bri". Once the complete result set for a query has been loaded,
+any query that only lengthens its text terms can be answered by filtering those rows
+locally instead of querying the database again.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from gui import config
+
+logger = logging.getLogger(__name__)
+
+# A cached row: (item ID, display values, lower-cased text of each text search field)
+CachedRow = Tuple[Any, List[Any], Dict[str, Optional[str]]]
+
+
+def search_key(item: Any, field_name: str) -> Optional[str]:
+    """
+    Get the lower-cased text an item exposes for a search field.
+
+    Args:
+        item: Model object or dictionary returned by a service
+        field_name: The search field name
+
+    Returns:
+        The field text, or None if the item has no such field
+    """
+    if isinstance(item, dict):
+        if field_name not in item:
+            return None
+        value = item[field_name]
+    elif hasattr(item, field_name):
+        value = getattr(item, field_name)
+    else:
+        return None
+    return "" if value is None else str(value).lower()
+
+
+class SearchEntry:
+    """The complete result set of one search."""
+
+    def __init__(self, criteria: Dict[str, Any], context: Hashable, rows: List[CachedRow]):
+        """
+        Initialize the cache entry.
+
+        Args:
+            criteria: Search criteria the rows were loaded with
+            context: Anything else the result depends on, such as the sort order
+            rows: Every row matching the criteria, in display order
+        """
+        self.criteria = dict(criteria)
+        self.context = context
+        self.rows = rows
+        self.created = time.monotonic()
+
+
+class SearchCache:
+    """
+    LRU cache of complete search results.
+
+    Only result sets that were loaded in full are stored; a page of a larger result set
+    cannot answer a narrower query. Entries expire after the GUI cache timeout and the
+    whole cache should be cleared whenever the underlying data changes.
+    """
+
+    def __init__(self,
+                 max_entries: int = config.SEARCH_CACHE_MAX_ENTRIES,
+                 timeout: float = config.CACHE_TIMEOUT):
+        """
+        Initialize the search cache.
+
+        Args:
+            max_entries: Maximum number of result sets to keep
+            timeout: Seconds before a result set is considered out of date
+        """
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._entries: "OrderedDict[Tuple, SearchEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def store(self, criteria: Dict[str, Any], context: Hashable, rows: List[CachedRow]) -> None:
+        """
+        Store the complete result set of a search.
+
+        Args:
+            criteria: Search criteria the rows were loaded with
+            context: Anything else the result depends on, such as the sort order
+            rows: Every row matching the criteria
+        """
+        key = (tuple(sorted(criteria.items())), context)
+        self._entries.pop(key, None)
+        self._entries[key] = SearchEntry(criteria, context, rows)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def narrow(self, criteria: Dict[str, Any], context: Hashable,
+               text_fields: Iterable[str]) -> Optional[List[CachedRow]]:
+        """
+        Answer a search from a cached result set if possible.
+
+        A cached set can answer the search when it was loaded with the same context and
+        the same non-text criteria, and each of its text terms occurs within the new term
+        for that field. Fields it was not filtered on can only be narrowed if every row
+        carries text for them.
+
+        Args:
+            criteria: The new search criteria
+            context: The new search context
+            text_fields: Names of the fields matched by substring
+
+        Returns:
+            The matching rows, or None if the database has to be queried
+        """
+        text_fields = set(text_fields)
+        now = time.monotonic()
+
+        # Most recently used first, since it is usually the closest superset
+        for key in reversed(list(self._entries)):
+            entry = self._entries[key]
+            if now - entry.created > self.timeout:
+                del self._entries[key]
+                continue
+            if entry.context != context:
+                continue
+
+            terms = self._narrowing_terms(entry.criteria, criteria, text_fields)
+            if terms is None:
+                continue
+
+            rows = entry.rows
+            if terms:
+                if any(row_keys.get(name) is None for _, _, row_keys in rows for name in terms):
+                    continue
+                rows = [row for row in rows
+                        if all(term in row[2][name] for name, term in terms.items())]
+
+            self._entries.move_to_end(key)
+            logger.debug(f"Answered search {criteria} from cached results for {entry.criteria}")
+            return rows
+
+        return None
+
+    def clear(self) -> None:
+        """Drop all cached result sets."""
+        self._entries.clear()
+
+    @staticmethod
+    def _narrowing_terms(cached: Dict[str, Any], criteria: Dict[str, Any],
+                         text_fields: set) -> Optional[Dict[str, str]]:
+        """
+        Work out which text terms have to be applied to a cached result set.
+
+        Args:
+            cached: Criteria of the cached result set
+            criteria: The new search criteria
+            text_fields: Names of the fields matched by substring
+
+        Returns:
+            Mapping of field name to lower-cased term, or None if the cached set is not
+            a superset of the new result
+        """
+        terms = {}
+        for name in set(cached) | set(criteria):
+            old, new = cached.get(name), criteria.get(name)
+            if old == new:
+                continue
+            if name not in text_fields or new is None:
+                return None
+            new_term = str(new).lower()
+            if old is not None and str(old).lower() not in new_term:
+                return None
+            terms[name] = new_term
+        return terms
@@ -2,13 +2,14 @@
 """
 Service Provider for the Leatherworking ERP application.
 Provides standardized access to services with caching and error handling.
+Operations run in their own unit of work, so each gets a short-lived database session.
 """
 
 import logging
 from typing import Any, Dict, Type, TypeVar, Callable, Optional, Union
 import functools
 
-from di import resolve
+from di import Lifetime, get_container, resolve, unit_of_work
 
 # Configure module-level logger
 logger = logging.getLogger(__name__)
@@ -70,7 +71,7 @@ class ServiceProvider:
     Acts as a façade to the DI system, adding caching and consistent error handling.
     """
 
-    # Cache for resolved services
+    # Cache for resolved singleton services; scoped services hold a session and are not cached
     _service_cache: Dict[str, Any] = {}
 
     @staticmethod
@@ -93,35 +94,22 @@ class ServiceProvider:
         # Ensure service keys are interface names (IServiceName)
         if not service_key.startswith("I") and not isinstance(service_type, str):
             service_key = f"I{service_key}"
-            logger.debug(f"Converted service key to interface name: {service_key}")
 
         # Check cache first
         if service_key in ServiceProvider._service_cache:
-            logger.debug(f"Service {service_key} found in cache")
             return ServiceProvider._service_cache[service_key]
 
         try:
-            # If we have a string that's not an interface name, try adding the 'I' prefix
-            if isinstance(service_type, str) and not service_type.startswith("I"):
-                try_interface_name = f"I{service_type}"
-                logger.debug(f"Trying to resolve with interface name: {try_interface_name}")
-                try:
-                    service = resolve(try_interface_name)
-                    logger.debug(f"Successfully resolved with interface name: {try_interface_name}")
-                    # Cache the resolved service
-                    ServiceProvider._service_cache[service_key] = service
-                    return service
-                except Exception as e:
-                    # If that fails, continue with the original name
-                    logger.debug(f"Failed to resolve with interface name, trying original name: {e}")
-
             # Resolve from DI container
-            logger.debug(f"Service {service_key} not in cache, resolving from DI container")
-            service = resolve(service_type)
+            container_key = ServiceProvider._container_key(service_type)
+            service = resolve(container_key)
 
-            # Cache the resolved service
-            ServiceProvider._service_cache[service_key] = service
-            logger.debug(f"Service {service_key} successfully resolved and cached")
+            # Cache the resolved service unless it belongs to a unit of work
+            if get_container().get_lifetime(container_key) in (Lifetime.SCOPED, Lifetime.TRANSIENT):
+                logger.debug(f"Service {service_key} successfully resolved")
+            else:
+                ServiceProvider._service_cache[service_key] = service
+                logger.debug(f"Service {service_key} successfully resolved and cached")
 
             return service
         except Exception as e:
@@ -133,11 +121,39 @@ class ServiceProvider:
             # Re-raise with detailed information
             raise ServiceProviderError(error_msg) from e
 
+    @staticmethod
+    def _container_key(service_type: Union[str, Type]) -> str:
+        """
+        Get the container key to resolve a service with.
+
+        Services are registered under their interface names, so a name without the
+        "I" prefix resolves to the interface when one is registered.
+
+        Args:
+            service_type: The interface class or name of the service
+
+        Returns:
+            The key to resolve
+        """
+        name = service_type if isinstance(service_type, str) else service_type.__name__
+        if not name.startswith("I"):
+            try:
+                if get_container().is_registered(f"I{name}"):
+                    return f"I{name}"
+            except RuntimeError:
+                # No container yet; resolving reports the error
+                pass
+        return name
+
     @staticmethod
     def execute_service_operation(service_type: Union[str, Type], operation: str, *args, **kwargs) -> Any:
         """
         Execute a service operation with standard error handling.
 
+        The operation runs in its own unit of work: the service is resolved in a new
+        scope whose session is committed when the operation succeeds, rolled back when
+        it fails, and closed either way.
+
         Args:
             service_type: The service interface or name to use
             operation: The name of the operation/method to call
@@ -158,39 +174,14 @@ class ServiceProvider:
         logger.debug(f"Executing operation: {service_name}.{operation}")
 
         try:
-            # Get the service
-            service = ServiceProvider.get_service(service_type)
-
-            # Get the operation method
-            if not hasattr(service, operation):
-                error = f"Operation '{operation}' not found on service {service_name}"
-                logger.error(error)
-                raise ServiceProviderError(error)
-
-            service_method = getattr(service, operation)
-
-            # Parameter adaptation for known mismatches
-            adapted_kwargs = kwargs.copy()
-
-            # Special case for InventoryService.get_all
-            if service_name in ('IInventoryService', 'InventoryService') and operation == 'get_all':
-                # Convert sort_column to sort_by if present
-                if 'sort_column' in adapted_kwargs and 'sort_by' not in adapted_kwargs:
-                    logger.debug(f"Adapting parameter: sort_column -> sort_by")
-                    sort_column = adapted_kwargs.pop('sort_column')
-                    sort_direction = adapted_kwargs.pop('sort_direction', 'asc')
-                    adapted_kwargs['sort_by'] = (sort_column, sort_direction)
-
-                # Handle other parameter mismatches as needed
-                for old_param, new_param in [('search_term', 'search_criteria')]:
-                    if old_param in adapted_kwargs and new_param not in adapted_kwargs:
-                        logger.debug(f"Adapting parameter: {old_param} -> {new_param}")
-                        adapted_kwargs[new_param] = adapted_kwargs.pop(old_param)
-
-            # Execute the operation with adapted parameters
-            result = service_method(*args, **adapted_kwargs)
-            logger.debug(f"Operation {service_name}.{operation} executed successfully")
-            return result
+            with unit_of_work() as scope:
+                # Get the service
+                try:
+                    service = scope.resolve(ServiceProvider._container_key(service_type))
+                except Exception as e:
+                    raise ServiceProviderError(f"Failed to resolve service {service_name}: {str(e)}") from e
+
+                return ServiceProvider._call_operation(service, service_name, operation, args, kwargs)
 
         except ValidationError as e:
             # Let validation errors pass through
@@ -224,6 +215,55 @@ class ServiceProvider:
             logger.debug("Detailed stack trace:", exc_info=True)
             raise ServiceProviderError(error_msg) from e
 
+    @staticmethod
+    def _call_operation(service: Any, service_name: str, operation: str, args: tuple, kwargs: dict) -> Any:
+        """
+        Call an operation on a resolved service, adapting known parameter mismatches.
+
+        Args:
+            service: The resolved service
+            service_name: Name of the service, for messages and adaptation
+            operation: The name of the operation/method to call
+            args: Positional arguments for the operation
+            kwargs: Keyword arguments for the operation
+
+        Returns:
+            The result of the operation
+
+        Raises:
+            ServiceProviderError: If the service has no such operation
+        """
+        # Get the operation method
+        if not hasattr(service, operation):
+            error = f"Operation '{operation}' not found on service {service_name}"
+            logger.error(error)
+            raise ServiceProviderError(error)
+
+        service_method = getattr(service, operation)
+
+        # Parameter adaptation for known mismatches
+        adapted_kwargs = kwargs.copy()
+
+        # Special case for InventoryService.get_all
+        if service_name in ('IInventoryService', 'InventoryService') and operation == 'get_all':
+            # Convert sort_column to sort_by if present
+            if 'sort_column' in adapted_kwargs and 'sort_by' not in adapted_kwargs:
+                logger.debug(f"Adapting parameter: sort_column -> sort_by")
+                sort_column = adapted_kwargs.pop('sort_column')
+                sort_direction = adapted_kwargs.pop('sort_direction', 'asc')
+                adapted_kwargs['sort_by'] = (sort_column, sort_direction)
+
+            # Handle other parameter mismatches as needed
+            for old_param, new_param in [('search_term', 'search_criteria')]:
+                if old_param in adapted_kwargs and new_param not in adapted_kwargs:
+                    logger.debug(f"Adapting parameter: {old_param} -> {new_param}")
+                    adapted_kwargs[new_param] = adapted_kwargs.pop(old_param)
+
+        # Execute the operation with adapted parameters
+        result = service_method(*args, **adapted_kwargs)
+        logger.debug(f"Operation {service_name}.{operation} executed successfully")
+        return result
+
     @staticmethod
     def clear_cache() -> None:
         """Clear the service cache."""
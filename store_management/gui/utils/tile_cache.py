@@ -0,0 +1,364 @@
+# gui/utils/tile_cache.py
+"""
+Tile cache for zoomable image views.
+
+A document is rasterized once per zoom level and cut into square tiles, so a view
+only has to draw the tiles that are on screen. Tiles are kept in a shared in-memory
+LRU cache and written to an on-disk cache keyed by a hash of the file content,
+so zoom levels rendered once, even in an earlier session, are never rendered again.
+
+Tiles are PIL images. The cache is used from worker threads and the main loop at
+the same time; creating Tk PhotoImages from the tiles is left to the view.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from gui import config
+
+logger = logging.getLogger(__name__)
+
+# Tile key: (file hash, zoom level, column, row)
+TileKey = Tuple[str, int, int, int]
+
+_shared_cache: Optional["TileCache"] = None
+_shared_cache_lock = threading.Lock()
+
+
+def file_digest(content: bytes) -> str:
+    """
+    Hash file content for use as a cache key.
+
+    Args:
+        content: The file content
+
+    Returns:
+        Hex digest of the content
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+def tile_grid(width: int, height: int, tile_size: int) -> Tuple[int, int]:
+    """
+    Get the number of tile columns and rows covering an image.
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        tile_size: Tile edge length in pixels
+
+    Returns:
+        Tuple of (columns, rows)
+    """
+    return math.ceil(width / tile_size), math.ceil(height / tile_size)
+
+
+def get_tile_cache() -> "TileCache":
+    """
+    Get the tile cache shared by all views, creating it on first use.
+
+    Returns:
+        The shared tile cache
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = TileCache()
+        return _shared_cache
+
+
+class TileCache:
+    """
+    Two-level tile cache: an LRU of tile images in memory backed by PNG files on disk.
+
+    Disk entries live under ``<cache_dir>/<file hash>/<tile size>/``. Each file gets a
+    low-resolution overview image, used as a placeholder while sharp tiles load, and
+    one subdirectory per rendered zoom level holding its tiles and its rendered size.
+    """
+
+    def __init__(self,
+                 cache_dir: Optional[str] = config.PATTERN_TILE_CACHE_DIR,
+                 max_tiles: int = config.PATTERN_TILE_CACHE_MAX_TILES,
+                 tile_size: int = config.PATTERN_TILE_SIZE,
+                 disk_max_mb: float = config.PATTERN_TILE_DISK_MAX_MB):
+        """
+        Initialize the tile cache.
+
+        Args:
+            cache_dir: Directory for the disk cache (None to keep tiles in memory only)
+            max_tiles: Maximum number of tiles kept in memory
+            tile_size: Tile edge length in pixels
+            disk_max_mb: Disk cache size above which the least recently used files are removed
+        """
+        self.cache_dir = cache_dir
+        self.max_tiles = max_tiles
+        self.tile_size = tile_size
+        self.disk_max_bytes = int(disk_max_mb * 1024 * 1024)
+        self._tiles: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._level_locks: Dict[Tuple[str, int], threading.Lock] = {}
+        self._level_sizes: Dict[Tuple[str, int], Tuple[int, int]] = {}
+
+    def __contains__(self, key: TileKey) -> bool:
+        with self._lock:
+            return key in self._tiles
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tiles)
+
+    def get(self, key: TileKey):
+        """
+        Get a tile from memory.
+
+        Args:
+            key: The tile key
+
+        Returns:
+            The tile image, or None if it is not in memory
+        """
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+            return tile
+
+    def put(self, key: TileKey, tile) -> None:
+        """
+        Keep a tile in memory, dropping the least recently used tiles beyond the limit.
+
+        Args:
+            key: The tile key
+            tile: The tile image
+        """
+        with self._lock:
+            self._tiles.pop(key, None)
+            self._tiles[key] = tile
+            while len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+
+    def load(self, key: TileKey):
+        """
+        Get a tile from memory, falling back to the disk cache.
+
+        Args:
+            key: The tile key
+
+        Returns:
+            The tile image, or None if it has not been rendered
+        """
+        tile = self.get(key)
+        if tile is not None or self.cache_dir is None:
+            return tile
+
+        path = self._tile_path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            from PIL import Image
+            with Image.open(path) as image:
+                tile = image.copy()
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cached tile {path}: {str(e)}")
+            return None
+
+        self.put(key, tile)
+        return tile
+
+    def level_lock(self, file_hash: str, level: int) -> threading.Lock:
+        """
+        Get the lock serializing renders of one zoom level.
+
+        Workers rendering a level hold the lock, so a second request for the same level
+        waits for the first render and then finds the tiles cached.
+
+        Args:
+            file_hash: Hash of the file
+            level: The zoom level
+
+        Returns:
+            The lock for the level
+        """
+        with self._lock:
+            return self._level_locks.setdefault((file_hash, level), threading.Lock())
+
+    def level_size(self, file_hash: str, level: int) -> Optional[Tuple[int, int]]:
+        """
+        Get the size a zoom level was rendered at.
+
+        Renderers round the scaled page size in their own way, so the tile grid of a
+        level must come from the rendered size rather than from the zoom factor.
+
+        Args:
+            file_hash: Hash of the file
+            level: The zoom level
+
+        Returns:
+            Tuple of (width, height) in pixels, or None if the level has not been rendered
+        """
+        with self._lock:
+            size = self._level_sizes.get((file_hash, level))
+        if size is not None or self.cache_dir is None:
+            return size
+
+        try:
+            with open(os.path.join(self._level_dir(file_hash, level), "level.json"), "r") as f:
+                size = tuple(json.load(f)["size"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+        with self._lock:
+            self._level_sizes[(file_hash, level)] = size
+        return size
+
+    def store_level(self, file_hash: str, level: int, image) -> Dict[TileKey, object]:
+        """
+        Cut a rendered zoom level into tiles and write them to the disk cache.
+
+        The tiles are not kept in memory; callers ``put`` the ones they are about to show.
+        The rendered size is recorded for ``level_size``.
+
+        Args:
+            file_hash: Hash of the file the image was rendered from
+            level: The zoom level
+            image: The rendered level as a PIL image
+
+        Returns:
+            Dictionary of tile key to tile image
+        """
+        columns, rows = tile_grid(image.width, image.height, self.tile_size)
+        tiles = {}
+        for row in range(rows):
+            for column in range(columns):
+                left, top = column * self.tile_size, row * self.tile_size
+                tile = image.crop((left, top,
+                                   min(left + self.tile_size, image.width),
+                                   min(top + self.tile_size, image.height)))
+                tiles[(file_hash, level, column, row)] = tile
+
+        with self._lock:
+            self._level_sizes[(file_hash, level)] = image.size
+
+        if self.cache_dir is not None:
+            try:
+                os.makedirs(self._level_dir(file_hash, level), exist_ok=True)
+                for key, tile in tiles.items():
+                    tile.save(self._tile_path(key), "PNG", compress_level=1)
+                with open(os.path.join(self._level_dir(file_hash, level), "level.json"), "w") as f:
+                    json.dump({"size": list(image.size)}, f)
+            except OSError as e:
+                logger.warning(f"Could not write tile cache for level {level}: {str(e)}")
+
+        return tiles
+
+    def load_overview(self, file_hash: str):
+        """
+        Get the cached overview of a file.
+
+        Args:
+            file_hash: Hash of the file
+
+        Returns:
+            Tuple of (overview image, (full width, full height)), or None if not cached
+        """
+        if self.cache_dir is None:
+            return None
+
+        file_dir = self._file_dir(file_hash)
+        try:
+            from PIL import Image
+            with open(os.path.join(file_dir, "overview.json"), "r") as f:
+                full_size = tuple(json.load(f)["size"])
+            with Image.open(os.path.join(file_dir, "overview.png")) as image:
+                overview = image.copy()
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # Mark the file as recently used so pruning keeps it
+        os.utime(file_dir)
+        return overview, full_size
+
+    def store_overview(self, file_hash: str, overview, full_size: Tuple[int, int]) -> None:
+        """
+        Write the overview of a file to the disk cache.
+
+        Args:
+            file_hash: Hash of the file
+            overview: Low-resolution image of the whole file
+            full_size: Size of the file rendered at zoom level 0
+        """
+        if self.cache_dir is None:
+            return
+
+        file_dir = self._file_dir(file_hash)
+        try:
+            os.makedirs(file_dir, exist_ok=True)
+            overview.save(os.path.join(file_dir, "overview.png"), "PNG")
+            with open(os.path.join(file_dir, "overview.json"), "w") as f:
+                json.dump({"size": list(full_size)}, f)
+        except OSError as e:
+            logger.warning(f"Could not write tile cache overview: {str(e)}")
+            return
+
+        self.prune_disk(keep=file_hash)
+
+    def prune_disk(self, keep: Optional[str] = None) -> List[str]:
+        """
+        Remove the least recently used files from the disk cache until it fits its limit.
+
+        Args:
+            keep: Hash of a file that must not be removed
+
+        Returns:
+            Hashes of the removed files
+        """
+        if self.cache_dir is None or not os.path.isdir(self.cache_dir):
+            return []
+
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if not os.path.isdir(path):
+                continue
+            size = sum(os.path.getsize(os.path.join(root, file))
+                       for root, _, files in os.walk(path) for file in files)
+            entries.append((os.path.getmtime(path), name, size))
+            total += size
+
+        removed = []
+        for _, name, size in sorted(entries):
+            if total <= self.disk_max_bytes:
+                break
+            if name == keep:
+                continue
+            shutil.rmtree(os.path.join(self.cache_dir, name), ignore_errors=True)
+            total -= size
+            removed.append(name)
+
+        if removed:
+            logger.debug(f"Removed {len(removed)} files from the tile cache")
+        return removed
+
+    def clear(self) -> None:
+        """Drop all tiles held in memory."""
+        with self._lock:
+            self._tiles.clear()
+
+    def _file_dir(self, file_hash: str) -> str:
+        return os.path.join(self.cache_dir, file_hash)
+
+    def _level_dir(self, file_hash: str, level: int) -> str:
+        return os.path.join(self._file_dir(file_hash), str(self.tile_size), str(level))
+
+    def _tile_path(self, key: TileKey) -> str:
+        file_hash, level, column, row = key
+        return os.path.join(self._level_dir(file_hash, level), f"{column}_{row}.png")
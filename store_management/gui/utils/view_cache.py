@@ -0,0 +1,287 @@
+# gui/utils/view_cache.py
+"""
+View cache for the leatherworking application.
+
+Keeps built views alive between navigations so returning to a view only has to
+show its frame again instead of rebuilding it and reloading its data.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from gui import config
+from gui.utils.event_bus import PRIORITY_HIGH, subscribe, unsubscribe
+
+logger = logging.getLogger(__name__)
+
+
+class CachedView:
+    """A built view, the container frame it lives in, and its cache state."""
+
+    def __init__(self, name: str, view: Any, container: Any):
+        """
+        Initialize the cache entry.
+
+        Args:
+            name: The view name used for navigation
+            view: The view instance
+            container: The frame holding the view
+        """
+        self.name = name
+        self.view = view
+        self.container = container
+        self.stale = False
+        self.needs_refresh = False
+
+    def handles(self, topic: str) -> bool:
+        """
+        Check whether the view drops its own cached data when a topic is published.
+
+        Args:
+            topic: The event bus topic
+
+        Returns:
+            True if the view lists the topic in its invalidation_topics
+        """
+        return topic in getattr(self.view, 'invalidation_topics', ())
+
+    def estimate_size_kb(self) -> float:
+        """
+        Estimate the memory held by the view.
+
+        Counts widgets and treeview rows; the per-item costs in the GUI config are
+        rough averages, good enough to keep a budget but not an exact measurement.
+
+        Returns:
+            Estimated size in kilobytes
+        """
+        widgets, rows = 0, 0
+        pending = [self.container]
+        while pending:
+            widget = pending.pop()
+            widgets += 1
+            try:
+                if hasattr(widget, 'row_count'):
+                    rows += widget.row_count()
+                elif widget.winfo_class() == 'Treeview':
+                    rows += len(widget.get_children())
+                pending.extend(widget.winfo_children())
+            except Exception:
+                # Widget destroyed while being measured
+                continue
+
+        return widgets * config.VIEW_CACHE_WIDGET_COST_KB + rows * config.VIEW_CACHE_ROW_COST_KB
+
+
+class ViewCache:
+    """
+    LRU cache of built views.
+
+    Views are hidden rather than destroyed when navigating away. The least recently
+    shown views are destroyed once the cache holds more than the configured number
+    of views or its estimated footprint exceeds the memory budget. Event bus topics
+    listed in the GUI config mark the views that depend on them as stale; stale views
+    are rebuilt the next time they are shown. Views that handle a topic themselves
+    (it is in their ``invalidation_topics``) drop their own cached pages instead, so
+    they are kept and only reloaded the next time they are shown.
+    """
+
+    def __init__(self,
+                 max_views: int = config.VIEW_CACHE_MAX_VIEWS,
+                 memory_budget_kb: float = config.VIEW_CACHE_MEMORY_BUDGET_KB,
+                 invalidation_topics: Optional[Dict[str, List[str]]] = None,
+                 excluded_views: Optional[Iterable[str]] = None):
+        """
+        Initialize the view cache.
+
+        Args:
+            max_views: Maximum number of views to keep, including the visible one
+            memory_budget_kb: Estimated memory budget for all cached views
+            invalidation_topics: Mapping of view name to event bus topics that make it stale
+            excluded_views: View names that are never cached
+        """
+        self.max_views = max_views
+        self.memory_budget_kb = memory_budget_kb
+        self.excluded_views = set(config.VIEW_CACHE_EXCLUDED_VIEWS if excluded_views is None else excluded_views)
+        self._entries: "OrderedDict[str, CachedView]" = OrderedDict()
+        self._active: Optional[str] = None
+
+        # Invert the view -> topics mapping so each topic has one subscription
+        if invalidation_topics is None:
+            invalidation_topics = config.VIEW_CACHE_INVALIDATION_TOPICS
+        self._topic_views: Dict[str, List[str]] = {}
+        for view_name, topics in invalidation_topics.items():
+            for topic in topics:
+                self._topic_views.setdefault(topic, []).append(view_name)
+
+        self._handlers = {}
+        for topic, view_names in self._topic_views.items():
+            handler = lambda data, names=tuple(view_names), topic=topic: self.invalidate(*names, topic=topic)
+            self._handlers[topic] = handler
+            subscribe(topic, handler, priority=PRIORITY_HIGH)
+
+    def __contains__(self, view_name: str) -> bool:
+        return view_name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_cacheable(self, view_name: str, view_data: Any = None) -> bool:
+        """
+        Check whether a view may be cached.
+
+        Views opened with data (detail views for a specific record) are always rebuilt.
+
+        Args:
+            view_name: The view name
+            view_data: Data the view is being opened with
+
+        Returns:
+            True if the view can be cached
+        """
+        return not view_data and view_name not in self.excluded_views
+
+    def owns(self, widget: Any) -> bool:
+        """
+        Check whether a widget is the container of a cached view.
+
+        Args:
+            widget: The widget to check
+
+        Returns:
+            True if the widget belongs to the cache
+        """
+        return any(entry.container is widget for entry in self._entries.values())
+
+    def show(self, view_name: str) -> Optional[Any]:
+        """
+        Show a cached view if there is a usable one.
+
+        Args:
+            view_name: The view to show
+
+        Returns:
+            The view instance, or None if it has to be built
+        """
+        entry = self._entries.get(view_name)
+        if entry is None:
+            return None
+        if entry.stale:
+            self.evict(view_name)
+            return None
+
+        self._entries.move_to_end(view_name)
+        self._active = view_name
+        entry.container.pack(fill="both", expand=True)
+        if entry.needs_refresh:
+            entry.needs_refresh = False
+            entry.view.refresh()
+        logger.debug(f"Showing cached view: {view_name}")
+        return entry.view
+
+    def put(self, view_name: str, view: Any, container: Any) -> None:
+        """
+        Add a freshly built view to the cache as the visible view.
+
+        Args:
+            view_name: The view name
+            view: The view instance
+            container: The frame holding the view
+        """
+        if view_name in self._entries:
+            self.evict(view_name)
+        self._entries[view_name] = CachedView(view_name, view, container)
+        self._active = view_name
+        self._enforce_limits()
+
+    def hide_all(self) -> None:
+        """Hide every cached view, destroying any that went stale while visible."""
+        for view_name, entry in list(self._entries.items()):
+            if entry.stale:
+                self.evict(view_name)
+            else:
+                entry.container.pack_forget()
+        self._active = None
+
+    def invalidate(self, *view_names: str, topic: Optional[str] = None) -> None:
+        """
+        Mark views as stale.
+
+        Hidden views are destroyed at once; the visible view stays on screen and is
+        rebuilt the next time it is navigated to. Views that handle the topic
+        themselves have already dropped their cached pages: the visible one is left
+        alone and hidden ones are reloaded the next time they are shown.
+
+        Args:
+            *view_names: The views to invalidate
+            topic: The event bus topic that caused the invalidation, if any
+        """
+        for view_name in view_names:
+            entry = self._entries.get(view_name)
+            if entry is None:
+                continue
+            if topic is not None and entry.handles(topic):
+                if view_name != self._active:
+                    entry.needs_refresh = True
+                continue
+            if view_name == self._active:
+                entry.stale = True
+            else:
+                self.evict(view_name)
+            logger.debug(f"Invalidated cached view: {view_name}")
+
+    def evict(self, view_name: str) -> None:
+        """
+        Remove a view from the cache and destroy it.
+
+        Args:
+            view_name: The view to remove
+        """
+        entry = self._entries.pop(view_name, None)
+        if entry is None:
+            return
+        if self._active == view_name:
+            self._active = None
+
+        try:
+            if hasattr(entry.view, 'destroy'):
+                entry.view.destroy()
+            entry.container.destroy()
+        except Exception as e:
+            logger.debug(f"Error destroying cached view {view_name}: {str(e)}")
+
+    def clear(self) -> None:
+        """Destroy all cached views."""
+        for view_name in list(self._entries):
+            self.evict(view_name)
+
+    def close(self) -> None:
+        """Destroy all cached views and stop listening for invalidation topics."""
+        self.clear()
+        for topic, handler in self._handlers.items():
+            unsubscribe(topic, handler)
+        self._handlers.clear()
+
+    def total_size_kb(self) -> float:
+        """
+        Estimate the memory held by all cached views.
+
+        Returns:
+            Estimated size in kilobytes
+        """
+        return sum(entry.estimate_size_kb() for entry in self._entries.values())
+
+    def _enforce_limits(self) -> None:
+        """Destroy least recently shown views until the cache is within its limits."""
+        sizes = {name: entry.estimate_size_kb() for name, entry in self._entries.items()}
+        total = sum(sizes.values())
+
+        for view_name in list(self._entries):
+            if len(self._entries) <= self.max_views and total <= self.memory_budget_kb:
+                break
+            if view_name == self._active:
+                continue
+            total -= sizes[view_name]
+            logger.debug(f"Evicting cached view {view_name} to stay within cache limits")
+            self.evict(view_name)
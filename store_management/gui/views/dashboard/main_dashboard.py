@@ -18,8 +18,8 @@ from gui.config import DATE_FORMAT
 from gui.theme import COLORS, get_status_style
 from gui.widgets.charts import create_bar_chart, create_pie_chart, create_line_chart
 from gui.widgets.charts.heatmap import HeatmapChart  # Import the heatmap chart
+from gui.utils.background_loader import BackgroundLoader, get_worker_service
 from gui.utils.event_bus import subscribe, unsubscribe, publish
-from gui.utils.service_access import with_service
 from gui.utils.view_history_manager import ViewHistoryManager
 from gui.widgets.breadcrumb_navigation import BreadcrumbNavigation
 from gui.widgets.status_badge import StatusBadge
@@ -27,6 +27,21 @@ from gui.widgets.status_badge import StatusBadge
 logger = logging.getLogger(__name__)
 
 
+# Dashboard sections, each loaded and rendered independently:
+# section -> (service name, fetch method, statistics attribute)
+DASHBOARD_SECTIONS = {
+    "inventory": ("IInventoryService", "fetch_inventory_stats", "inventory_stats"),
+    "projects": ("IProjectService", "fetch_project_stats", "project_stats"),
+    "sales": ("ISalesService", "fetch_sales_stats", "sales_stats"),
+    "purchases": ("IPurchaseService", "fetch_purchase_stats", "purchase_stats"),
+    "analytics": ("IAnalyticsDashboardService", "fetch_analytics_summary", "analytics_summary"),
+}
+
+# Skeleton placeholder shapes
+SKELETON_TEXT = "\u2588\u2588\u2588\u2588\u2588"
+SKELETON_BAR_HEIGHTS = [60, 110, 80, 140, 95, 120]
+
+
 class DashboardView:
     """
     Main dashboard view showing key metrics and providing quick access to common actions.
@@ -55,6 +70,10 @@ class DashboardView:
         self.kpi_widgets = {}
         self.chart_widgets = {}
 
+        # Background loading; sections still waiting for data
+        self._loader = BackgroundLoader(parent)
+        self._pending_sections = set()
+
         # Container frames for sections
         self.content_frame = None
         self.left_column = None
@@ -758,13 +777,21 @@ class DashboardView:
         main_window = self.parent.winfo_toplevel()
         main_window.show_view(view_name, view_data)
 
-    @with_service("IInventoryService")
-    def load_inventory_stats(self, service=None):
-        """Load inventory statistics from inventory service."""
+    def fetch_inventory_stats(self, service=None):
+        """
+        Fetch inventory statistics from the inventory service.
+        Runs on a background worker thread.
+
+        Args:
+            service: The service to use, or None to fall back to placeholder data
+
+        Returns:
+            Dictionary of statistics
+        """
         try:
             # If service is not available, use placeholder data
             if not service:
-                self.inventory_stats = {
+                return {
                     "total_value": 12500.00,
                     "total_items": 356,
                     "low_stock_count": 12,
@@ -777,10 +804,9 @@ class DashboardView:
                     },
                     "value_trend": 3.2  # Percentage change from previous period
                 }
-                return
 
             # If service is available, get actual data
-            self.inventory_stats = {
+            return {
                 "total_value": service.get_total_inventory_value(),
                 "total_items": service.get_total_inventory_count(),
                 "low_stock_count": service.get_low_stock_count(),
@@ -792,7 +818,7 @@ class DashboardView:
         except Exception as e:
             self.logger.error(f"Error loading inventory statistics: {str(e)}")
             # Use placeholder data on error
-            self.inventory_stats = {
+            return {
                 "total_value": 12500.00,
                 "total_items": 356,
                 "low_stock_count": 12,
@@ -806,13 +832,21 @@ class DashboardView:
                 "value_trend": 3.2  # Percentage change from previous period
             }
 
-    @with_service("IProjectService")
-    def load_project_stats(self, service=None):
-        """Load project statistics from project service."""
+    def fetch_project_stats(self, service=None):
+        """
+        Fetch project statistics from the project service.
+        Runs on a background worker thread.
+
+        Args:
+            service: The service to use, or None to fall back to placeholder data
+
+        Returns:
+            Dictionary of statistics
+        """
         try:
             # If service is not available, use placeholder data
             if not service:
-                self.project_stats = {
+                return {
                     "active_count": 8,
                     "completed_this_month": 3,
                     "completion_trend": 20.0,  # Percentage change from previous period
@@ -831,7 +865,6 @@ class DashboardView:
                         {"title": "Client Meeting", "date": "Mar 18, 2025", "type": "Meeting"}
                     ]
                 }
-                return
 
             # If service is available, get actual data
             today = datetime.now()
@@ -854,7 +887,7 @@ class DashboardView:
             else:
                 completion_trend = 0 if completed_this_month == 0 else 100
 
-            self.project_stats = {
+            return {
                 "active_count": service.get_active_project_count(),
                 "completed_this_month": completed_this_month,
                 "completion_trend": completion_trend,
@@ -864,7 +897,7 @@ class DashboardView:
         except Exception as e:
             self.logger.error(f"Error loading project statistics: {str(e)}")
             # Use placeholder data on error
-            self.project_stats = {
+            return {
                 "active_count": 8,
                 "completed_this_month": 3,
                 "completion_trend": 20.0,  # Percentage change from previous period
@@ -884,13 +917,21 @@ class DashboardView:
                 ]
             }
 
-    @with_service("ISalesService")
-    def load_sales_stats(self, service=None):
-        """Load sales statistics from sales service."""
+    def fetch_sales_stats(self, service=None):
+        """
+        Fetch sales statistics from the sales service.
+        Runs on a background worker thread.
+
+        Args:
+            service: The service to use, or None to fall back to placeholder data
+
+        Returns:
+            Dictionary of statistics
+        """
         try:
             # If service is not available, use placeholder data
             if not service:
-                self.sales_stats = {
+                return {
                     "current_month": 4250.00,
                     "prev_month": 3980.00,
                     "percentage_change": 6.8,
@@ -908,24 +949,12 @@ class DashboardView:
                         {"month": "Mar", "value": 4250}
                     ]
                 }
-                return
 
-            # Calculate date ranges
-            today = datetime.now()
-            start_of_month = today.replace(day=1)
-            start_of_prev_month = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
-            end_of_prev_month = today.replace(day=1) - timedelta(days=1)
-
-            # Get sales statistics
-            current_month_sales = service.get_total_sales_for_period(
-                start_of_month,
-                today
-            )
-
-            prev_month_sales = service.get_total_sales_for_period(
-                start_of_prev_month,
-                end_of_prev_month
-            )
+            # Last six months of totals in one grouped query; the final two entries
+            # are the current and previous month
+            monthly_totals = service.get_monthly_sales_totals(months=6)
+            current_month_sales = monthly_totals[-1]["value"]
+            prev_month_sales = monthly_totals[-2]["value"]
 
             # Calculate change percentage
             if prev_month_sales and prev_month_sales > 0:
@@ -933,34 +962,20 @@ class DashboardView:
             else:
                 percentage_change = 0 if current_month_sales == 0 else 100
 
-            # Get monthly trend for the last 6 months
-            monthly_trend = []
-            for i in range(5, -1, -1):
-                month_date = today.replace(day=15) - timedelta(days=30 * i)
-                month_start = month_date.replace(day=1)
-                if month_date.month == today.month:
-                    month_end = today
-                else:
-                    next_month = month_date.replace(day=28) + timedelta(days=4)
-                    month_end = next_month.replace(day=1) - timedelta(days=1)
-
-                month_sales = service.get_total_sales_for_period(month_start, month_end)
-                monthly_trend.append({
-                    "month": month_date.strftime("%b"),
-                    "value": month_sales
-                })
-
-            self.sales_stats = {
+            return {
                 "current_month": current_month_sales,
                 "prev_month": prev_month_sales,
                 "percentage_change": percentage_change,
                 "recent_sales": service.get_recent_sales(limit=5),
-                "monthly_trend": monthly_trend
+                "monthly_trend": [
+                    {"month": entry["month"], "value": entry["value"]}
+                    for entry in monthly_totals
+                ]
             }
         except Exception as e:
             self.logger.error(f"Error loading sales statistics: {str(e)}")
             # Use placeholder data on error
-            self.sales_stats = {
+            return {
                 "current_month": 4250.00,
                 "prev_month": 3980.00,
                 "percentage_change": 6.8,
@@ -979,13 +994,21 @@ class DashboardView:
                 ]
             }
 
-    @with_service("IPurchaseService")
-    def load_purchase_stats(self, service=None):
-        """Load purchase statistics from purchase service."""
+    def fetch_purchase_stats(self, service=None):
+        """
+        Fetch purchase statistics from the purchase service.
+        Runs on a background worker thread.
+
+        Args:
+            service: The service to use, or None to fall back to placeholder data
+
+        Returns:
+            Dictionary of statistics
+        """
         try:
             # If service is not available, use placeholder data
             if not service:
-                self.purchase_stats = {
+                return {
                     "pending_count": 3,
                     "pending_amount": 1250.00,
                     "pending_trend": -15.0,  # Percentage change from previous period
@@ -998,7 +1021,6 @@ class DashboardView:
                          "date": datetime.now() - timedelta(days=7)}
                     ]
                 }
-                return
 
             # Get current pending purchase amount
             pending_amount = service.get_pending_purchase_amount()
@@ -1015,7 +1037,7 @@ class DashboardView:
                 pending_trend = 0 if pending_amount == 0 else 100
 
             # Get purchase statistics
-            self.purchase_stats = {
+            return {
                 "pending_count": service.get_pending_purchase_count(),
                 "pending_amount": pending_amount,
                 "pending_trend": pending_trend,
@@ -1024,7 +1046,7 @@ class DashboardView:
         except Exception as e:
             self.logger.error(f"Error loading purchase statistics: {str(e)}")
             # Use placeholder data on error
-            self.purchase_stats = {
+            return {
                 "pending_count": 3,
                 "pending_amount": 1250.00,
                 "pending_trend": -15.0,  # Percentage change from previous period
@@ -1037,13 +1059,21 @@ class DashboardView:
                 ]
             }
 
-    @with_service("IAnalyticsDashboardService")
-    def load_analytics_summary(self, service=None):
-        """Load analytics summary from analytics service."""
+    def fetch_analytics_summary(self, service=None):
+        """
+        Fetch the analytics summary from the analytics service.
+        Runs on a background worker thread.
+
+        Args:
+            service: The service to use, or None to fall back to placeholder data
+
+        Returns:
+            Dictionary of statistics
+        """
         try:
             # If service is not available, use placeholder data
             if not service:
-                self.analytics_summary = {
+                return {
                     "total_revenue": 12500.00,
                     "profit_margin": 32.5,
                     "customer_retention": 78.4,
@@ -1053,19 +1083,18 @@ class DashboardView:
                     "average_project_time": 8.5,  # days
                     "bottleneck_area": "Edge Finishing"
                 }
-                return
 
             # Get analytics summary
             today = datetime.now()
             start_date = today - timedelta(days=90)  # Last 90 days
-            self.analytics_summary = service.get_analytics_summary(
+            return service.get_analytics_summary(
                 start_date=start_date,
                 end_date=today
             )
         except Exception as e:
             self.logger.error(f"Error loading analytics summary: {str(e)}")
             # Use placeholder data on error
-            self.analytics_summary = {
+            return {
                 "total_revenue": 12500.00,
                 "profit_margin": 32.5,
                 "customer_retention": 78.4,
@@ -1147,33 +1176,159 @@ class DashboardView:
             self.logger.error(f"Error loading recent activities: {str(e)}")
 
     def load_data(self):
-        """Load dashboard data from services."""
-        try:
-            # Load inventory statistics
-            self.load_inventory_stats()
+        """
+        Load every dashboard section in the background.
 
-            # Load project statistics
-            self.load_project_stats()
+        Each section shows a skeleton until its own data arrives and then renders
+        immediately, so a slow query only holds up the section that needs it.
+        """
+        self.load_recent_activities()
+        for section in DASHBOARD_SECTIONS:
+            self._load_section(section)
 
-            # Load sales statistics
-            self.load_sales_stats()
+    def load_inventory_stats(self):
+        """Reload inventory statistics in the background."""
+        self._load_section("inventory")
 
-            # Load purchase statistics
-            self.load_purchase_stats()
+    def load_project_stats(self):
+        """Reload project statistics in the background."""
+        self._load_section("projects")
 
-            # Load analytics summary
-            self.load_analytics_summary()
+    def load_sales_stats(self):
+        """Reload sales statistics in the background."""
+        self._load_section("sales")
 
-            # Load recent activities
-            self.load_recent_activities()
+    def load_purchase_stats(self):
+        """Reload purchase statistics in the background."""
+        self._load_section("purchases")
 
-            # Update the dashboard with loaded data
-            self.update_dashboard()
+    def load_analytics_summary(self):
+        """Reload the analytics summary in the background."""
+        self._load_section("analytics")
 
-            self.logger.info("Dashboard data loaded successfully")
+    def _load_section(self, section):
+        """
+        Fetch one section's data on a worker thread.
+
+        Args:
+            section: Key in DASHBOARD_SECTIONS
+        """
+        service_name, fetch_name, attribute = DASHBOARD_SECTIONS[section]
+        fetch = getattr(self, fetch_name)
+
+        # Only show a skeleton the first time; reloads keep the current figures visible
+        if not getattr(self, attribute):
+            self._show_section_skeleton(section)
+        self._pending_sections.add(section)
+
+        def task():
+            try:
+                service = get_worker_service(service_name)
+            except Exception as e:
+                self.logger.warning(f"{service_name} unavailable, using placeholder data: {str(e)}")
+                service = None
+            return fetch(service)
+
+        self._loader.submit(
+            section,
+            task,
+            lambda stats: self._render_section(section, stats),
+            on_error=lambda e: self.logger.error(f"Error loading dashboard section {section}: {str(e)}"))
+
+    def _render_section(self, section, stats):
+        """
+        Store a section's data and redraw the widgets that show it.
+
+        Args:
+            section: Key in DASHBOARD_SECTIONS
+            stats: Data returned by the section's fetch method
+        """
+        setattr(self, DASHBOARD_SECTIONS[section][2], stats)
+        self._pending_sections.discard(section)
+
+        renderers = {
+            "inventory": [self._update_inventory_kpi, self._update_inventory_status, self._draw_inventory_chart],
+            "projects": [self._update_projects_kpi, self._update_project_status, self._draw_project_chart,
+                         self._update_upcoming_deadlines],
+            "sales": [self._update_sales_kpi],
+            "purchases": [self._update_purchases_kpi],
+            "analytics": [self._update_analytics_section],
+        }[section]
+
+        # The project chart shows the sales trend once sales data is available
+        if section == "sales" and "projects" not in self._pending_sections:
+            renderers.append(self._draw_project_chart)
+
+        try:
+            for render in renderers:
+                render()
         except Exception as e:
-            self.logger.error(f"Error loading dashboard data: {str(e)}")
-            # We don't have access to a show_error method, so we'll just log it
+            self.logger.error(f"Error rendering dashboard section {section}: {str(e)}")
+
+        if not self._pending_sections:
+            self.logger.info("Dashboard data loaded successfully")
+
+    def _show_section_skeleton(self, section):
+        """
+        Show grey placeholders for a section whose data has not arrived yet.
+
+        Args:
+            section: Key in DASHBOARD_SECTIONS
+        """
+        if section in self.kpi_widgets:
+            kpi = self.kpi_widgets[section]
+            kpi["value"].config(text=SKELETON_TEXT, foreground=COLORS["light_grey"])
+            kpi["subtitle"].config(text="Loading...")
+            if kpi["trend"]:
+                kpi["trend"].config(text="")
+
+        if section == "inventory":
+            self._show_status_skeleton(self.inventory_status)
+            self._show_chart_skeleton(self.chart_widgets["inventory"])
+        elif section == "projects":
+            self._show_status_skeleton(self.project_status)
+            self._show_chart_skeleton(self.chart_widgets["projects"])
+            for widget in self.deadline_cards_frame.winfo_children():
+                widget.destroy()
+            for column in range(4):
+                tk.Frame(self.deadline_cards_frame, height=90, background=COLORS["light_grey"]).grid(
+                    row=0, column=column, sticky="nsew", padx=5, pady=5)
+        elif section == "analytics":
+            for widget in self.analytics_metrics_frame.winfo_children():
+                widget.destroy()
+            for i in range(4):
+                self.analytics_metrics_frame.columnconfigure(i % 2, weight=1)
+                tk.Frame(self.analytics_metrics_frame, height=50, background=COLORS["light_grey"]).grid(
+                    row=i // 2, column=i % 2, sticky="nsew", padx=5, pady=5)
+
+    def _show_status_skeleton(self, indicators):
+        """
+        Blank out status indicator values while loading.
+
+        Args:
+            indicators: Dictionary of status indicators
+        """
+        for indicator in indicators.values():
+            indicator["value"].config(text="\u2013")
+
+    def _show_chart_skeleton(self, chart_frame):
+        """
+        Draw grey placeholder bars in a chart frame.
+
+        Args:
+            chart_frame: The chart container
+        """
+        for widget in chart_frame.winfo_children():
+            widget.destroy()
+
+        canvas = tk.Canvas(chart_frame, background=COLORS["bg"], highlightthickness=0)
+        canvas.pack(fill=tk.BOTH, expand=True)
+
+        baseline = max(SKELETON_BAR_HEIGHTS) + 20
+        for i, height in enumerate(SKELETON_BAR_HEIGHTS):
+            x = 30 + i * 45
+            canvas.create_rectangle(x, baseline - height, x + 28, baseline,
+                                    fill=COLORS["light_grey"], outline="")
 
     def update_dashboard(self):
         """Update dashboard widgets with loaded data."""
@@ -1197,9 +1352,15 @@ class DashboardView:
 
     def _update_kpi_widgets(self):
         """Update KPI widgets with current statistics."""
-        # Update Sales KPI
+        self._update_sales_kpi()
+        self._update_projects_kpi()
+        self._update_inventory_kpi()
+        self._update_purchases_kpi()
+
+    def _update_sales_kpi(self):
+        """Update the sales KPI widget."""
         sales_kpi = self.kpi_widgets["sales"]
-        sales_kpi["value"].config(text=f"${self.sales_stats['current_month']:.2f}")
+        sales_kpi["value"].config(text=f"${self.sales_stats['current_month']:.2f}", foreground=COLORS["text"])
 
         # Update sales trend indicator
         percent_change = self.sales_stats['percentage_change']
@@ -1212,9 +1373,10 @@ class DashboardView:
             trend_color = COLORS["success"] if percent_change > 0 else COLORS["danger"]
             sales_kpi["trend"].config(text=f" {trend_symbol}", foreground=trend_color)
 
-        # Update Projects KPI
+    def _update_projects_kpi(self):
+        """Update the projects KPI widget."""
         projects_kpi = self.kpi_widgets["projects"]
-        projects_kpi["value"].config(text=str(self.project_stats["active_count"]))
+        projects_kpi["value"].config(text=str(self.project_stats["active_count"]), foreground=COLORS["text"])
 
         completed_text = f"{self.project_stats['completed_this_month']} completed this month"
         projects_kpi["subtitle"].config(text=completed_text)
@@ -1226,9 +1388,10 @@ class DashboardView:
             trend_color = COLORS["success"] if trend_value > 0 else COLORS["danger"]
             projects_kpi["trend"].config(text=f" {trend_symbol}", foreground=trend_color)
 
-        # Update Inventory KPI
+    def _update_inventory_kpi(self):
+        """Update the inventory KPI widget."""
         inventory_kpi = self.kpi_widgets["inventory"]
-        inventory_kpi["value"].config(text=f"${self.inventory_stats['total_value']:.2f}")
+        inventory_kpi["value"].config(text=f"${self.inventory_stats['total_value']:.2f}", foreground=COLORS["text"])
 
         low_stock_text = f"{self.inventory_stats['low_stock_count']} items low stock"
         inventory_kpi["subtitle"].config(text=low_stock_text)
@@ -1240,9 +1403,10 @@ class DashboardView:
             trend_color = COLORS["success"] if trend_value > 0 else COLORS["danger"]
             inventory_kpi["trend"].config(text=f" {trend_symbol}", foreground=trend_color)
 
-        # Update Purchases KPI
+    def _update_purchases_kpi(self):
+        """Update the purchases KPI widget."""
         purchases_kpi = self.kpi_widgets["purchases"]
-        purchases_kpi["value"].config(text=str(self.purchase_stats["pending_count"]))
+        purchases_kpi["value"].config(text=str(self.purchase_stats["pending_count"]), foreground=COLORS["text"])
 
         pending_text = f"${self.purchase_stats['pending_amount']:.2f} pending receipt"
         purchases_kpi["subtitle"].config(text=pending_text)
@@ -1623,7 +1787,9 @@ class DashboardView:
         Call this method when the dashboard is closed.
         """
         self._unsubscribe_from_events()
-        # Clean up any other resources
+
+        # Drop any loads still in flight
+        self._loader.cancel()
 
         self.logger.info("Dashboard destroyed and unsubscribed from events")
 
@@ -1665,13 +1831,8 @@ class DashboardView:
         """
         self.logger.info(f"Handling inventory event: {data}")
 
-        # Only reload inventory stats, not the entire dashboard
+        # Only reload inventory stats; the section redraws when they arrive
         self.load_inventory_stats()
-        self._update_inventory_status()
-        self._draw_inventory_chart()
-
-        # Update KPI widget
-        self._update_kpi_widgets()
 
         # Add to recent activities
         self._add_activity_entry("Inventory", data.get("description", "Inventory updated"))
@@ -1687,7 +1848,6 @@ class DashboardView:
 
         # Update inventory status
         self.load_inventory_stats()
-        self._update_inventory_status()
 
         # Add to recent activities with alert tag
         self._add_activity_entry("Inventory",
@@ -1703,14 +1863,8 @@ class DashboardView:
         """
         self.logger.info(f"Handling project event: {data}")
 
-        # Only reload project stats, not the entire dashboard
+        # Only reload project stats; the section redraws when they arrive
         self.load_project_stats()
-        self._update_project_status()
-        self._draw_project_chart()
-        self._update_upcoming_deadlines()
-
-        # Update KPI widget
-        self._update_kpi_widgets()
 
         # Add to recent activities
         self._add_activity_entry("Project", data.get("description", "Project updated"))
@@ -1724,10 +1878,8 @@ class DashboardView:
         """
         self.logger.info(f"Handling project status change: {data}")
 
-        # Only reload project stats, not the entire dashboard
+        # Only reload project stats; the section redraws when they arrive
         self.load_project_stats()
-        self._update_project_status()
-        self._update_kpi_widgets()
 
         # Add to recent activities
         status_desc = f"Project '{data.get('project_name', '')}' moved to {data.get('new_status', '')}"
@@ -1744,8 +1896,6 @@ class DashboardView:
 
         # Reload project stats
         self.load_project_stats()
-        self._update_project_status()
-        self._update_kpi_widgets()
 
         # Add to recent activities
         completion_desc = f"Project '{data.get('project_name', '')}' completed"
@@ -1760,10 +1910,8 @@ class DashboardView:
         """
         self.logger.info(f"Handling sale event: {data}")
 
-        # Only reload sales stats, not the entire dashboard
+        # Only reload sales stats; the section redraws when they arrive
         self.load_sales_stats()
-        self._update_kpi_widgets()
-        self._draw_project_chart()  # This also shows sales trend if available
 
         # Add to recent activities
         sale_desc = f"New sale: ${data.get('amount', '0.00')} - {data.get('description', 'Sale')}"
@@ -1778,9 +1926,8 @@ class DashboardView:
         """
         self.logger.info(f"Handling purchase event: {data}")
 
-        # Only reload purchase stats, not the entire dashboard
+        # Only reload purchase stats; the section redraws when they arrive
         self.load_purchase_stats()
-        self._update_kpi_widgets()
 
         # Add to recent activities
         purchase_desc = f"New purchase: ${data.get('amount', '0.00')} - {data.get('supplier', 'Purchase')}"
@@ -1798,8 +1945,6 @@ class DashboardView:
         # Update both purchase and inventory stats
         self.load_purchase_stats()
         self.load_inventory_stats()
-        self._update_kpi_widgets()
-        self._update_inventory_status()
 
         # Add to recent activities
         received_desc = f"Received order: {data.get('description', 'Purchase received')}"
@@ -1816,7 +1961,6 @@ class DashboardView:
 
         # Reload analytics summary
         self.load_analytics_summary()
-        self._update_analytics_section()
 
     def _add_activity_entry(self, activity_type, description, alert=False):
         """
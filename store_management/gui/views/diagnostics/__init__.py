@@ -0,0 +1,6 @@
+# gui/views/diagnostics/__init__.py
+"""
+Diagnostics views package initialization.
+"""
+
+from gui.views.diagnostics.memory_diagnostics_dialog import MemoryDiagnosticsDialog
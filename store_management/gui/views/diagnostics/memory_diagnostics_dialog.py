@@ -0,0 +1,189 @@
+# gui/views/diagnostics/memory_diagnostics_dialog.py
+"""
+Memory diagnostics dialog.
+
+Shows the identity map size of each database session, the objects they hold by
+model and, while tracing is on, tracemalloc figures with the source lines that
+allocated the most memory.
+"""
+
+import tkinter as tk
+import tracemalloc
+from tkinter import ttk
+from typing import Any, Dict, List
+
+from gui import config
+from gui.base.base_dialog import BaseDialog
+from database.sqlalchemy.session_hygiene import (
+    get_memory_stats,
+    get_session_hygiene,
+    start_memory_tracing,
+    stop_memory_tracing,
+)
+
+SESSION_COLUMNS = (
+    ("session", "Session", 110),
+    ("size", "Objects", 70),
+    ("peak_size", "Peak", 70),
+    ("units_of_work", "Commits", 70),
+    ("sweeps", "Sweeps", 60),
+    ("expunged", "Expunged", 70),
+    ("oversized", "Oversized", 70),
+    ("last_sweep_ms", "Last sweep (ms)", 100),
+)
+
+
+def format_bytes(size: float) -> str:
+    """
+    Format a byte count for display.
+
+    Args:
+        size: Number of bytes
+
+    Returns:
+        The size in B, KB or MB
+    """
+    if size < 1024:
+        return f"{size:.0f} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def session_rows(stats: List[Dict[str, Any]]) -> List[tuple]:
+    """
+    Convert session figures to table rows.
+
+    Args:
+        stats: Figures from SessionHygiene.get_stats
+
+    Returns:
+        One tuple of display values per session
+    """
+    rows = []
+    for entry in stats:
+        values = [entry[key] for key, _, _ in SESSION_COLUMNS]
+        values[-1] = f"{entry['last_sweep_ms']:.1f}"
+        rows.append(tuple(values))
+    return rows
+
+
+class MemoryDiagnosticsDialog(BaseDialog):
+    """Non-modal dialog showing session and memory figures, refreshed periodically."""
+
+    def __init__(self, parent):
+        """
+        Initialize the memory diagnostics dialog.
+
+        Args:
+            parent: The parent window
+        """
+        self.hygiene = get_session_hygiene()
+        self.sessions_tree = None
+        self.models_tree = None
+        self.allocations_tree = None
+        self.memory_label = None
+        self.tracing_button = None
+        self._refresh_id = None
+        super().__init__(parent, title="Memory Diagnostics", width=760, height=620, modal=False)
+
+    def create_layout(self):
+        """Create the dialog layout."""
+        content = ttk.Frame(self.dialog, padding=10)
+        content.pack(fill=tk.BOTH, expand=True)
+
+        sessions_frame = ttk.LabelFrame(content, text="Database sessions", padding=5)
+        sessions_frame.pack(fill=tk.X)
+        self.sessions_tree = ttk.Treeview(
+            sessions_frame, columns=[key for key, _, _ in SESSION_COLUMNS], show="headings", height=4)
+        for key, heading, width in SESSION_COLUMNS:
+            self.sessions_tree.heading(key, text=heading)
+            self.sessions_tree.column(key, width=width, anchor=tk.W if key == "session" else tk.E)
+        self.sessions_tree.pack(fill=tk.X)
+
+        tables = ttk.Frame(content)
+        tables.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+
+        models_frame = ttk.LabelFrame(tables, text="Objects by model", padding=5)
+        models_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
+        self.models_tree = ttk.Treeview(models_frame, columns=("model", "count"), show="headings")
+        self.models_tree.heading("model", text="Model")
+        self.models_tree.heading("count", text="Objects")
+        self.models_tree.column("model", width=160)
+        self.models_tree.column("count", width=70, anchor=tk.E)
+        self.models_tree.pack(fill=tk.BOTH, expand=True)
+
+        memory_frame = ttk.LabelFrame(tables, text="Traced memory", padding=5)
+        memory_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
+        self.memory_label = ttk.Label(memory_frame, text="")
+        self.memory_label.pack(anchor=tk.W, pady=(0, 5))
+        self.allocations_tree = ttk.Treeview(
+            memory_frame, columns=("location", "size", "count"), show="headings")
+        self.allocations_tree.heading("location", text="Allocated at")
+        self.allocations_tree.heading("size", text="Size")
+        self.allocations_tree.heading("count", text="Blocks")
+        self.allocations_tree.column("location", width=240)
+        self.allocations_tree.column("size", width=70, anchor=tk.E)
+        self.allocations_tree.column("count", width=60, anchor=tk.E)
+        self.allocations_tree.pack(fill=tk.BOTH, expand=True)
+
+        button_frame = ttk.Frame(self.dialog, padding="10 0 10 10")
+        button_frame.pack(fill=tk.X)
+        self.tracing_button = ttk.Button(button_frame, text="Start tracing", command=self.toggle_tracing)
+        self.tracing_button.pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Sweep sessions", command=self.sweep).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Close", command=self.on_cancel).pack(side=tk.RIGHT)
+        ttk.Button(button_frame, text="Refresh", command=self.refresh).pack(side=tk.RIGHT, padx=5)
+
+        self.refresh()
+
+    def refresh(self):
+        """Reload every figure and schedule the next refresh."""
+        if not self.dialog or not self.dialog.winfo_exists():
+            return
+        if self._refresh_id is not None:
+            self.dialog.after_cancel(self._refresh_id)
+
+        self._fill(self.sessions_tree, session_rows(self.hygiene.get_stats()))
+        self._fill(self.models_tree, list(self.hygiene.count_objects_by_model().items()))
+
+        memory = get_memory_stats()
+        if memory["tracing"]:
+            self.memory_label.configure(
+                text=f"Current: {format_bytes(memory['current'])}    Peak: {format_bytes(memory['peak'])}")
+            self.tracing_button.configure(text="Stop tracing")
+        else:
+            self.memory_label.configure(text="Tracing is off; start it to see allocations.")
+            self.tracing_button.configure(text="Start tracing")
+        self._fill(self.allocations_tree, [
+            (entry["location"], format_bytes(entry["size"]), entry["count"]) for entry in memory["top"]
+        ])
+
+        self._refresh_id = self.dialog.after(config.DIAGNOSTICS_REFRESH_INTERVAL, self.refresh)
+
+    def _fill(self, tree: ttk.Treeview, rows: List[tuple]):
+        """Replace the rows of a table."""
+        tree.delete(*tree.get_children())
+        for row in rows:
+            tree.insert("", tk.END, values=row)
+
+    def toggle_tracing(self):
+        """Start or stop tracing memory allocations."""
+        if tracemalloc.is_tracing():
+            stop_memory_tracing()
+        else:
+            start_memory_tracing()
+        self.refresh()
+
+    def sweep(self):
+        """Expunge unreferenced objects from every idle session."""
+        expunged = self.hygiene.sweep_all()
+        self.logger.info(f"Expunged {expunged} objects from idle sessions")
+        self.refresh()
+
+    def close(self):
+        """Stop refreshing and close the dialog."""
+        if self.dialog and self._refresh_id is not None:
+            self.dialog.after_cancel(self._refresh_id)
+            self._refresh_id = None
+        super().close()
@@ -17,6 +17,9 @@ from gui.utils.service_access import with_service
 class InventoryTransactionView(BaseListView):
     """View for displaying inventory transaction history."""
 
+    virtual_rows = True
+    invalidation_topics = ("inventory_updated", "inventory.item.updated")
+
     def __init__(
             self,
             parent,
@@ -641,7 +644,7 @@ class InventoryTransactionView(BaseListView):
             "Please enter date in format: YYYY-MM-DD"
         )
 
-    def get_items(self, service, offset, limit):
+    def get_items(self, service, offset, limit, criteria=None, sort=None):
         """
         Get transaction items with filtering.
 
@@ -649,19 +652,25 @@ class InventoryTransactionView(BaseListView):
             service: The service to use
             offset: Pagination offset
             limit: Page size
+            criteria: Filter criteria snapshot; defaults to the current criteria
+            sort: (sort column, sort direction) snapshot; defaults to the current sort
 
         Returns:
             List of transaction items
         """
+        if criteria is None:
+            criteria = self.filter_criteria
+        sort_column, sort_direction = sort if sort is not None else (self.sort_column, self.sort_direction)
+
         # Apply special filtering for inventory_id or item_id+item_type
         if self.inventory_id:
             return service.get_transactions_by_inventory(
                 inventory_id=self.inventory_id,
                 offset=offset,
                 limit=limit,
-                sort_column=self.sort_column,
-                sort_direction=self.sort_direction,
-                **{k: v for k, v in self.filter_criteria.items() if k != "inventory_id"}
+                sort_column=sort_column,
+                sort_direction=sort_direction,
+                **{k: v for k, v in criteria.items() if k != "inventory_id"}
             )
         elif self.item_id and self.item_type:
             return service.get_transactions_by_item(
@@ -669,42 +678,46 @@ class InventoryTransactionView(BaseListView):
                 item_type=self.item_type,
                 offset=offset,
                 limit=limit,
-                sort_column=self.sort_column,
-                sort_direction=self.sort_direction,
-                **{k: v for k, v in self.filter_criteria.items() if k not in ["item_id", "item_type"]}
+                sort_column=sort_column,
+                sort_direction=sort_direction,
+                **{k: v for k, v in criteria.items() if k not in ["item_id", "item_type"]}
             )
         else:
             # Regular filtering
             return service.get_transactions(
                 offset=offset,
                 limit=limit,
-                sort_column=self.sort_column,
-                sort_direction=self.sort_direction,
-                **self.filter_criteria
+                sort_column=sort_column,
+                sort_direction=sort_direction,
+                **criteria
             )
 
-    def get_total_count(self, service):
+    def get_total_count(self, service, criteria=None):
         """
         Get the total count of transaction items.
 
         Args:
             service: The service to use
+            criteria: Filter criteria snapshot; defaults to the current criteria
 
         Returns:
             The total count of items
         """
+        if criteria is None:
+            criteria = self.filter_criteria
+
         # Apply special filtering for inventory_id or item_id+item_type
         if self.inventory_id:
             return service.get_transaction_count_by_inventory(
                 inventory_id=self.inventory_id,
-                **{k: v for k, v in self.filter_criteria.items() if k != "inventory_id"}
+                **{k: v for k, v in criteria.items() if k != "inventory_id"}
             )
         elif self.item_id and self.item_type:
             return service.get_transaction_count_by_item(
                 item_id=self.item_id,
                 item_type=self.item_type,
-                **{k: v for k, v in self.filter_criteria.items() if k not in ["item_id", "item_type"]}
+                **{k: v for k, v in criteria.items() if k not in ["item_id", "item_type"]}
             )
         else:
             # Regular filtering
-            return service.get_transaction_count(**self.filter_criteria)
\ No newline at end of file
+            return service.get_transaction_count(**criteria)
\ No newline at end of file
@@ -5,7 +5,7 @@ Displays a comprehensive view of inventory across all item types.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from database.models.enums import InventoryStatus, StorageLocationType, TransactionType
@@ -21,6 +21,9 @@ from gui.utils.error_manager import ErrorManager
 class InventoryView(BaseListView):
     """View for displaying and managing inventory items."""
 
+    invalidation_topics = ("inventory_updated", "purchase_updated", "inventory.item.added",
+                           "inventory.item.updated", "inventory.item.removed")
+
     def __init__(self, parent):
         """
         Initialize the inventory view.
@@ -106,7 +109,7 @@ class InventoryView(BaseListView):
             )
             return {}
 
-    def get_items(self, service, offset, limit):
+    def get_items(self, service, offset, limit, criteria=None, sort=None):
         """
         Get inventory items with filtering.
 
@@ -114,19 +117,22 @@ class InventoryView(BaseListView):
             service: The service to use
             offset: Pagination offset
             limit: Page size
+            criteria: Filter criteria snapshot; defaults to the search form's criteria
+            sort: (sort column, sort direction) snapshot; defaults to the current sort
 
         Returns:
             List of inventory items
         """
         try:
             # Get search criteria
-            search_criteria = self.get_search_params()
+            search_criteria = criteria if criteria is not None else self.get_search_params()
 
             # Get sort parameters
+            sort_column, sort_direction = sort if sort is not None else (
+                getattr(self, 'sort_column', None), getattr(self, 'sort_direction', None))
             sort_by = None
-            if hasattr(self, 'sort_column') and hasattr(self, 'sort_direction'):
-                if self.sort_column and self.sort_direction:
-                    sort_by = (self.sort_column, self.sort_direction)
+            if sort_column and sort_direction:
+                sort_by = (sort_column, sort_direction)
 
             try:
                 # First try with sort_by parameter
@@ -139,9 +145,6 @@ class InventoryView(BaseListView):
             except TypeError as e:
                 if "got an unexpected keyword argument 'sort_by'" in str(e):
                     self.logger.info("Using alternative parameter format for service.get_all")
-                    sort_column = self.sort_column if hasattr(self, 'sort_column') else None
-                    sort_direction = self.sort_direction if hasattr(self, 'sort_direction') else None
-
                     return service.get_all(
                         offset=offset,
                         limit=limit,
@@ -171,19 +174,20 @@ class InventoryView(BaseListView):
                  "storage_location": "Display Area", "quantity": 5, "status": "IN_STOCK"}
             ]
 
-    def get_total_count(self, service):
+    def get_total_count(self, service, criteria=None):
         """
         Get the total count of inventory items.
 
         Args:
             service: The service to use
+            criteria: Filter criteria snapshot; defaults to the search form's criteria
 
         Returns:
             The total count of items
         """
         try:
             # Get search criteria
-            search_criteria = self.get_search_params()
+            search_criteria = criteria if criteria is not None else self.get_search_params()
 
             # Check if the service supports get_count method
             if hasattr(service, 'get_count'):
@@ -356,6 +360,13 @@ class InventoryView(BaseListView):
             command=self.run_inventory_check)
         btn_check.pack(side=tk.LEFT, padx=5)
 
+        # Add button to reconcile a physical count file
+        btn_count = ttk.Button(
+            parent,
+            text="Import Count",
+            command=self.import_physical_count)
+        btn_count.pack(side=tk.LEFT, padx=5)
+
         # Add button to generate report
         btn_report = ttk.Button(
             parent,
@@ -890,6 +901,72 @@ class InventoryView(BaseListView):
             )
             return None
 
+    @with_service('IInventoryService')
+    def import_physical_count(self, service):
+        """
+        Reconcile a physical count CSV against inventory.
+
+        The file is first checked without changes; the variance summary is shown and the
+        adjustments are only applied after confirmation.
+
+        Args:
+            service: The inventory service
+        """
+        try:
+            path = filedialog.askopenfilename(
+                title="Select Physical Count File",
+                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            )
+            if not path:
+                return
+
+            report = service.reconcile_physical_count(path, dry_run=True)
+            summary = (
+                f"Rows read: {report['rows_read']}\n"
+                f"Matched items: {report['matched']}\n"
+                f"Unmatched rows: {len(report['unmatched'])}\n"
+                f"Invalid rows: {len(report['invalid'])}\n"
+                f"Items with variance: {len(report['variances'])}\n"
+                f"Total variance value: {report['total_variance_value']:.2f}"
+            )
+
+            if report['variances'] and messagebox.askyesno(
+                    "Save Variance Report",
+                    f"{summary}\n\nSave the variance report before applying?"
+            ):
+                report_path = filedialog.asksaveasfilename(
+                    title="Save Variance Report",
+                    defaultextension=".csv",
+                    filetypes=[("CSV files", "*.csv")]
+                )
+                if report_path:
+                    service.export_variance_report(report, report_path)
+
+            if not report['variances']:
+                ErrorManager.show_info("Physical Count", f"{summary}\n\nNo adjustments needed.")
+                return
+
+            if not messagebox.askyesno("Apply Physical Count", f"{summary}\n\nApply these adjustments?"):
+                return
+
+            result = service.reconcile_physical_count(path)
+            self.refresh()
+            message = f"Adjusted {result['adjusted']} inventory records."
+            if result['skipped']:
+                message += (f"\n\n{len(result['skipped'])} records changed since they were counted "
+                            f"and were left unchanged; count them again.")
+            ErrorManager.show_info("Physical Count", message)
+            skipped_ids = {entry['inventory_id'] for entry in result['skipped']}
+            publish("inventory_updated", {"inventory_ids": [entry['inventory_id'] for entry in result['variances']
+                                                            if entry['inventory_id'] not in skipped_ids]})
+
+        except Exception as e:
+            ErrorManager.handle_exception(
+                self,
+                e,
+                context="Importing Physical Count"
+            )
+
     @with_service('IInventoryService')
     def perform_location_move(self, service, dialog, inventory_id, old_location, location_type, location_id, notes):
         """
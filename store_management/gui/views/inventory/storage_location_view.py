@@ -771,7 +771,7 @@ class StorageLocationView(BaseListView):
             command=lambda: self.move_selected_items(
                 source_var.get(),
                 dest_var.get(),
-                tree.selection()
+                [tree.item(iid, "values")[0] for iid in tree.selection()]
             )
         )
         move_selected_btn.pack(pady=10)
@@ -969,18 +969,16 @@ class StorageLocationView(BaseListView):
 
         try:
             service = self.get_service(self.service_name)
-            result = service.move_all_items(source_location, dest_location)
+            moved = service.move_all_items(source_location, dest_location)
 
-            if result:
-                messagebox.showinfo(
-                    "Success",
-                    f"Successfully moved all items from {source_location} to {dest_location}"
-                )
+            # Failures raise; the service returns the number of records moved
+            messagebox.showinfo(
+                "Success",
+                f"Moved {moved} item(s) from {source_location} to {dest_location}"
+            )
 
-                # Refresh the view
-                self.refresh()
-            else:
-                messagebox.showerror("Error", "Failed to move items")
+            # Refresh the view
+            self.refresh()
 
         except Exception as e:
             self.logger.error(f"Error moving items: {str(e)}")
@@ -993,7 +991,7 @@ class StorageLocationView(BaseListView):
         Args:
             source_location: Source location
             dest_location: Destination location
-            item_selections: Selected items
+            item_selections: Inventory IDs of the selected items
         """
         if not source_location or not dest_location:
             messagebox.showerror("Error", "Please select both source and destination locations")
@@ -1015,24 +1013,19 @@ class StorageLocationView(BaseListView):
             return
 
         try:
-            # Get item IDs from selection
-            # In a real app, we'd extract the item IDs from the tree item values
-            # For this demo, we'll just use the selection index
-            item_ids = list(range(len(item_selections)))
+            item_ids = [int(item_id) for item_id in item_selections]
 
             service = self.get_service(self.service_name)
-            result = service.move_items(source_location, dest_location, item_ids)
+            moved = service.move_items(source_location, dest_location, item_ids)
 
-            if result:
-                messagebox.showinfo(
-                    "Success",
-                    f"Successfully moved selected items from {source_location} to {dest_location}"
-                )
+            # Failures raise; the service returns the number of records moved
+            messagebox.showinfo(
+                "Success",
+                f"Moved {moved} of {len(item_ids)} selected item(s) from {source_location} to {dest_location}"
+            )
 
-                # Refresh the view
-                self.refresh()
-            else:
-                messagebox.showerror("Error", "Failed to move items")
+            # Refresh the view
+            self.refresh()
 
         except Exception as e:
             self.logger.error(f"Error moving items: {str(e)}")
@@ -1063,18 +1056,16 @@ class StorageLocationView(BaseListView):
 
         try:
             service = self.get_service(self.service_name)
-            result = service.consolidate_items(source_location, dest_location)
+            moved = service.consolidate_items(source_location, dest_location)
 
-            if result:
-                messagebox.showinfo(
-                    "Success",
-                    f"Successfully consolidated items between {source_location} and {dest_location}"
-                )
+            # Failures raise; the service returns the number of records moved
+            messagebox.showinfo(
+                "Success",
+                f"Consolidated {moved} item(s) from {source_location} into {dest_location}"
+            )
 
-                # Refresh the view
-                self.refresh()
-            else:
-                messagebox.showerror("Error", "Failed to consolidate items")
+            # Refresh the view
+            self.refresh()
 
         except Exception as e:
             self.logger.error(f"Error consolidating items: {str(e)}")
@@ -64,6 +64,10 @@ class LeatherView(MaterialListView):
         Returns:
             List of values corresponding to treeview columns
         """
+        # Projected list rows already hold the display values
+        if hasattr(item, "_fields"):
+            return super().extract_item_values(item)
+
         # For DTO objects
         if hasattr(item, "id"):
             # Get inventory status from inventory data if available
@@ -19,6 +19,8 @@ from gui.utils.event_bus import subscribe, unsubscribe, publish
 class MaterialListView(BaseListView):
     """View for displaying and managing a list of materials."""
 
+    invalidation_topics = ("material_updated", "inventory_updated")
+
     def __init__(self, parent):
         """
         Initialize the material list view.
@@ -80,6 +82,10 @@ class MaterialListView(BaseListView):
         Returns:
             List of values corresponding to treeview columns
         """
+        # Projected list rows already hold the display values
+        if hasattr(item, "_fields"):
+            return super().extract_item_values(item)
+
         # For DTO objects
         if hasattr(item, "id"):
             # Get inventory status from inventory data if available
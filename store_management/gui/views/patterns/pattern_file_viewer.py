@@ -6,6 +6,8 @@ Provides a specialized view for displaying pattern files (SVG, PDF, images)
 with zoom, pan, and measurement functionality.
 """
 
+import importlib.util
+import io
 import logging
 import os
 import tempfile
@@ -13,12 +15,69 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Dict, List, Any, Optional, Tuple
 
+from gui import config
 from gui.base.base_dialog import BaseDialog
 from gui.theme import COLORS
+from gui.utils.background_loader import BackgroundLoader
 from gui.utils.service_access import get_service
+from gui.utils.tile_cache import TileKey, file_digest, get_tile_cache, tile_grid
 
 logger = logging.getLogger(__name__)
 
+# Each zoom step scales the view by this factor; zoom levels are whole steps from 100%
+ZOOM_FACTOR = 1.2
+
+# File types rendered through the tile cache
+TILED_FILE_TYPES = ("svg", "pdf", "png", "jpg", "jpeg")
+
+MISSING_PACKAGE_MESSAGES = {
+    "svg": "SVG Viewer requires the PIL, cairosvg packages.\nPlease install these packages to view SVG files.",
+    "pdf": "PDF Viewer requires the pdf2image and poppler packages.\nPlease install these packages to view PDF files.",
+    "image": "Image viewer requires the PIL package.\nPlease install this package to view JPG files.",
+}
+
+
+def render_pattern_page(content: bytes, file_type: str, scale: float):
+    """
+    Rasterize a pattern file at a zoom level.
+
+    Runs on a worker thread; for PDFs only the first page is rendered.
+
+    Args:
+        content: The file content
+        file_type: The file type ('svg', 'pdf', 'png', 'jpg', 'jpeg')
+        scale: Zoom factor, 1.0 for 100%
+
+    Returns:
+        The rendered page as a PIL image
+
+    Raises:
+        ImportError: If the packages needed for the file type are missing
+        ValueError: If the file has nothing to render
+    """
+    from PIL import Image
+
+    if file_type == "svg":
+        import cairosvg
+        image = Image.open(io.BytesIO(cairosvg.svg2png(bytestring=content, scale=scale)))
+    elif file_type == "pdf":
+        from pdf2image import convert_from_bytes
+        pages = convert_from_bytes(content, dpi=100 * scale, first_page=1, last_page=1)
+        if not pages:
+            raise ValueError("No pages found in PDF file.")
+        image = pages[0]
+    else:
+        image = Image.open(io.BytesIO(content))
+        if scale != 1.0:
+            width = max(1, round(image.width * scale))
+            height = max(1, round(image.height * scale))
+            image = image.resize((width, height), Image.LANCZOS)
+
+    image.load()
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA")
+    return image
+
 
 class PatternFileViewer(BaseDialog):
     """
@@ -46,6 +105,7 @@ class PatternFileViewer(BaseDialog):
 
         # Viewer state
         self.zoom_level = 1.0
+        self.zoom_step = 0
         self.pan_x = 0
         self.pan_y = 0
         self.is_panning = False
@@ -57,6 +117,18 @@ class PatternFileViewer(BaseDialog):
         self.measure_line = None
         self.measure_text = None
 
+        # Tiled rendering state: the overview is a low-resolution image of the whole
+        # page, full_size the page size at 100%, level_sizes the sizes zoom levels were
+        # actually rendered at, tile_items the tiles on the canvas
+        self.tile_cache = get_tile_cache()
+        self.tile_loader = None
+        self.file_hash = None
+        self.overview = None
+        self.full_size = None
+        self.level_sizes: Dict[int, Tuple[int, int]] = {}
+        self.tile_items: Dict[Tuple[int, int], Tuple[int, bool, Any]] = {}
+        self._tile_update_id = None
+
         # Determine title based on available info
         title = "Pattern File Viewer"
         if file_id:
@@ -149,10 +221,11 @@ class PatternFileViewer(BaseDialog):
 
         self.canvas = tk.Canvas(
             view_frame,
-            xscrollcommand=self.h_scrollbar.set,
-            yscrollcommand=self.v_scrollbar.set,
+            xscrollcommand=self._on_xscroll,
+            yscrollcommand=self._on_yscroll,
             bg="white"
         )
+        self.tile_loader = BackgroundLoader(self.canvas)
 
         self.h_scrollbar.config(command=self.canvas.xview)
         self.v_scrollbar.config(command=self.canvas.yview)
@@ -181,6 +254,7 @@ class PatternFileViewer(BaseDialog):
         self.canvas.bind("<MouseWheel>", self.on_mouse_wheel)  # Windows/MacOS
         self.canvas.bind("<Button-4>", lambda e: self.on_mouse_wheel(e, 1))  # Linux scroll up
         self.canvas.bind("<Button-5>", lambda e: self.on_mouse_wheel(e, -1))  # Linux scroll down
+        self.canvas.bind("<Configure>", lambda e: self._schedule_tile_update())
 
         # Load file
         self.load_file()
@@ -307,230 +381,339 @@ class PatternFileViewer(BaseDialog):
             self.temp_file = None
 
         # Handle different file types
-        if self.file_type == "svg":
-            self._display_svg()
-        elif self.file_type in ["png", "jpg", "jpeg"]:
-            self._display_image()
-        elif self.file_type == "pdf":
-            self._display_pdf()
+        if self.file_type in TILED_FILE_TYPES:
+            self._display_tiled()
         else:
             self._display_unsupported()
 
-    def _display_svg(self):
-        """Display SVG file on canvas."""
-        try:
-            # SVG display requires creating a temporary file and loading it with tkinter
-            fd, self.temp_file = tempfile.mkstemp(suffix=".svg")
-            os.close(fd)
+    def _display_tiled(self):
+        """
+        Display the file through the tile cache.
 
-            with open(self.temp_file, "wb") as f:
-                f.write(self.file_content)
+        Shows the cached overview straight away if the file was rendered before;
+        otherwise renders the page at 100% in the background, which also produces
+        the overview and the first zoom level's tiles.
+        """
+        if importlib.util.find_spec("PIL") is None:
+            if self.file_type == "png":
+                self._display_image_without_pil()
+            else:
+                self._show_missing_packages()
+            return
 
-            # Check if PIL and svglib are available
-            try:
-                from PIL import Image, ImageTk
-                import io
-                import cairosvg
-
-                # Convert SVG to PNG using cairosvg
-                png_data = cairosvg.svg2png(
-                    bytestring=self.file_content,
-                    scale=self.zoom_level
-                )
+        self.file_hash = file_digest(self.file_content)
+        cached = self.tile_cache.load_overview(self.file_hash)
+        if cached is not None:
+            self._on_overview_loaded(cached)
+            return
 
-                # Load the PNG data with PIL
-                image = Image.open(io.BytesIO(png_data))
+        self._show_message("Rendering file...", fill=COLORS["text_secondary"])
+        self.status_var.set("Rendering file...")
 
-                # Create a PhotoImage for the canvas
-                self.photo_image = ImageTk.PhotoImage(image)
+        content, file_type, file_hash = self.file_content, self.file_type, self.file_hash
+        cache = self.tile_cache
 
-                # Display image
-                self.canvas.delete("all")
-                self.image_id = self.canvas.create_image(0, 0, image=self.photo_image, anchor="nw")
+        def render_overview():
+            image = render_pattern_page(content, file_type, 1.0)
+            with cache.level_lock(file_hash, 0):
+                cache.store_level(file_hash, 0, image)
+            overview = image.copy()
+            overview.thumbnail((config.PATTERN_OVERVIEW_SIZE, config.PATTERN_OVERVIEW_SIZE))
+            cache.store_overview(file_hash, overview, image.size)
+            return overview, image.size
 
-                # Update canvas scrollregion
-                self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.tile_loader.submit("overview", render_overview, self._on_overview_loaded, self._on_render_error)
 
-                # Update status
-                self.status_var.set(f"SVG Image: {image.width} × {image.height}px")
+    def _on_overview_loaded(self, result):
+        """
+        Show the file once its overview is available.
 
-            except ImportError:
-                # Fallback - display error message
-                self.canvas.delete("all")
-                self.canvas.create_text(
-                    400, 300,
-                    text="SVG Viewer requires the PIL, cairosvg packages.\nPlease install these packages to view SVG files.",
-                    font=("TkDefaultFont", 12),
-                    fill="red",
-                    justify="center"
-                )
+        Args:
+            result: Tuple of (overview image, size at 100%)
+        """
+        self.overview, self.full_size = result
+        self.level_sizes = {0: tuple(self.full_size)}
+        self.canvas.delete("all")
+        self.tile_items = {}
+        self.measure_line = None
+        self.measure_text = None
+        self._apply_zoom()
 
-                # Update status
-                self.status_var.set("Error: Missing required packages for SVG display.")
+        width, height = self.full_size
+        label = {"svg": "SVG Image", "pdf": "PDF Page 1"}.get(self.file_type, "Image")
+        self.status_var.set(f"{label}: {width} × {height}px")
 
-        except Exception as e:
-            logger.error(f"Error displaying SVG: {str(e)}")
-            self.canvas.delete("all")
-            self.canvas.create_text(
-                400, 300,
-                text=f"Error displaying SVG file:\n{str(e)}",
-                font=("TkDefaultFont", 12),
-                fill="red",
-                justify="center"
-            )
-            self.status_var.set("Error displaying SVG file.")
+    def _on_render_error(self, error: Exception):
+        """
+        Show why the file could not be rendered.
 
-    def _display_image(self):
-        """Display image file (PNG, JPG) on canvas."""
-        try:
-            # Check if PIL is available
-            try:
-                from PIL import Image, ImageTk
-                import io
+        Args:
+            error: The exception raised while rendering
+        """
+        if isinstance(error, ImportError):
+            self._show_missing_packages()
+            return
 
-                # Load the image from binary data
-                image = Image.open(io.BytesIO(self.file_content))
+        logger.error(f"Error displaying {self.file_type} file: {str(error)}")
+        self._show_message(f"Error displaying {self.file_type.upper()} file:\n{str(error)}")
+        self.status_var.set(f"Error displaying {self.file_type.upper()} file.")
 
-                # Apply zoom
-                if self.zoom_level != 1.0:
-                    width = int(image.width * self.zoom_level)
-                    height = int(image.height * self.zoom_level)
-                    image = image.resize((width, height), Image.LANCZOS)
+    def _show_missing_packages(self):
+        """Show which packages are needed to view the current file type."""
+        kind = self.file_type if self.file_type in ("svg", "pdf") else "image"
+        label = kind.upper() if kind != "image" else kind
+        self._show_message(MISSING_PACKAGE_MESSAGES[kind])
+        self.status_var.set(f"Error: Missing required packages for {label} display.")
 
-                # Create a PhotoImage for the canvas
-                self.photo_image = ImageTk.PhotoImage(image)
+    def _show_message(self, text: str, fill: str = "red"):
+        """
+        Replace the canvas contents with a message.
 
-                # Display image
-                self.canvas.delete("all")
-                self.image_id = self.canvas.create_image(0, 0, image=self.photo_image, anchor="nw")
+        Args:
+            text: The message
+            fill: Text color
+        """
+        self.canvas.delete("all")
+        self.tile_items = {}
+        self.canvas.create_text(
+            400, 300,
+            text=text,
+            font=("TkDefaultFont", 12),
+            fill=fill,
+            justify="center"
+        )
 
-                # Update canvas scrollregion
-                self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    def _level_size(self, step: int) -> Tuple[int, int]:
+        """
+        Get the page size at a zoom level.
 
-                # Update status
-                self.status_var.set(f"Image: {image.width} × {image.height}px")
+        Uses the size the level was rendered at once it is known; until then the size
+        is estimated from the zoom factor.
 
-            except ImportError:
-                # Fallback - try with tkinter's PhotoImage for PNG
-                if self.file_type == "png":
-                    # Create a temporary file for the image
-                    fd, self.temp_file = tempfile.mkstemp(suffix=".png")
-                    os.close(fd)
+        Args:
+            step: The zoom level
 
-                    with open(self.temp_file, "wb") as f:
-                        f.write(self.file_content)
+        Returns:
+            Tuple of (width, height) in pixels
+        """
+        if step in self.level_sizes:
+            return self.level_sizes[step]
+        scale = ZOOM_FACTOR ** step
+        width, height = self.full_size
+        return max(1, round(width * scale)), max(1, round(height * scale))
 
-                    # Load with tkinter
-                    self.photo_image = tk.PhotoImage(file=self.temp_file)
+    def _apply_zoom(self, center: Optional[Tuple[float, float]] = None):
+        """
+        Lay out the canvas for the current zoom level and show its tiles.
 
-                    # Display image
-                    self.canvas.delete("all")
-                    self.image_id = self.canvas.create_image(0, 0, image=self.photo_image, anchor="nw")
+        Args:
+            center: Point of the page, as fractions of its size, to keep in the middle of the view
+        """
+        width, height = self._level_size(self.zoom_step)
+        self.canvas.delete("tiles")
+        self.tile_items = {}
+        self.canvas.configure(scrollregion=(0, 0, width, height))
+
+        if center is not None:
+            view_width = self.canvas.winfo_width() / width
+            view_height = self.canvas.winfo_height() / height
+            self.canvas.xview_moveto(max(0.0, center[0] - view_width / 2))
+            self.canvas.yview_moveto(max(0.0, center[1] - view_height / 2))
+
+        self._update_visible_tiles()
+
+    def _on_xscroll(self, first, last):
+        """Update the horizontal scrollbar and the tiles in view."""
+        self.h_scrollbar.set(first, last)
+        self._schedule_tile_update()
+
+    def _on_yscroll(self, first, last):
+        """Update the vertical scrollbar and the tiles in view."""
+        self.v_scrollbar.set(first, last)
+        self._schedule_tile_update()
+
+    def _schedule_tile_update(self):
+        """Update the tiles in view once pending scroll and resize events are handled."""
+        if self._tile_update_id is None and self.overview is not None:
+            self._tile_update_id = self.canvas.after_idle(self._update_visible_tiles)
+
+    def _update_visible_tiles(self):
+        """
+        Draw the tiles in view and drop the ones scrolled out of it.
 
-                    # Update canvas scrollregion
-                    self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        Tiles in the memory cache are drawn straight away. The others get a placeholder
+        cut from the overview and are loaded, or rendered, in the background.
+        """
+        self._tile_update_id = None
+        if self.overview is None:
+            return
 
-                    # Update status
-                    self.status_var.set(f"Image: {self.photo_image.width()} × {self.photo_image.height()}px")
+        tile_size = self.tile_cache.tile_size
+        width, height = self._level_size(self.zoom_step)
+        columns, rows = tile_grid(width, height, tile_size)
+
+        left, top = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        right = left + self.canvas.winfo_width()
+        bottom = top + self.canvas.winfo_height()
+        visible = {
+            (column, row)
+            for column in range(max(0, int(left // tile_size)), min(columns, int(right // tile_size) + 1))
+            for row in range(max(0, int(top // tile_size)), min(rows, int(bottom // tile_size) + 1))
+        }
+
+        for cell in set(self.tile_items) - visible:
+            self.canvas.delete(self.tile_items.pop(cell)[0])
+
+        missing: List[TileKey] = []
+        for column, row in sorted(visible):
+            shown = self.tile_items.get((column, row))
+            if shown is not None and shown[1]:
+                continue
+
+            key = (self.file_hash, self.zoom_step, column, row)
+            tile = self.tile_cache.get(key)
+            if tile is not None:
+                self._show_tile(column, row, tile, sharp=True)
+            else:
+                missing.append(key)
+                if shown is None:
+                    self._show_tile(column, row, self._placeholder_tile(column, row), sharp=False)
 
-                else:
-                    # JPG not supported with standard tkinter
-                    self.canvas.delete("all")
-                    self.canvas.create_text(
-                        400, 300,
-                        text="Image viewer requires the PIL package.\nPlease install this package to view JPG files.",
-                        font=("TkDefaultFont", 12),
-                        fill="red",
-                        justify="center"
-                    )
+        # Keep measurements above the page
+        self.canvas.tag_lower("tiles")
 
-                    # Update status
-                    self.status_var.set("Error: Missing required packages for image display.")
+        if missing:
+            self._request_tiles(missing)
 
-        except Exception as e:
-            logger.error(f"Error displaying image: {str(e)}")
-            self.canvas.delete("all")
-            self.canvas.create_text(
-                400, 300,
-                text=f"Error displaying image file:\n{str(e)}",
-                font=("TkDefaultFont", 12),
-                fill="red",
-                justify="center"
-            )
-            self.status_var.set("Error displaying image file.")
+    def _show_tile(self, column: int, row: int, image, sharp: bool):
+        """
+        Draw a tile, reusing its canvas item if it is already shown.
 
-    def _display_pdf(self):
-        """Display PDF file on canvas."""
-        try:
-            # PDF display requires creating a temporary file and using a PDF library
-            fd, self.temp_file = tempfile.mkstemp(suffix=".pdf")
-            os.close(fd)
+        Args:
+            column: Tile column
+            row: Tile row
+            image: The tile as a PIL image
+            sharp: Whether this is the final tile rather than a placeholder
+        """
+        from PIL import ImageTk
 
-            with open(self.temp_file, "wb") as f:
-                f.write(self.file_content)
+        photo = ImageTk.PhotoImage(image, master=self.canvas)
+        shown = self.tile_items.get((column, row))
+        if shown is not None:
+            item_id = shown[0]
+            self.canvas.itemconfig(item_id, image=photo)
+        else:
+            tile_size = self.tile_cache.tile_size
+            item_id = self.canvas.create_image(
+                column * tile_size, row * tile_size, image=photo, anchor="nw", tags="tiles")
 
-            # Check if pdf2image is available
-            try:
-                from pdf2image import convert_from_path
-                from PIL import Image, ImageTk
+        # Keep a reference to the photo or Tk discards the image
+        self.tile_items[(column, row)] = (item_id, sharp, photo)
 
-                # Convert first page of PDF to image
-                pages = convert_from_path(self.temp_file, dpi=100 * self.zoom_level, first_page=1, last_page=1)
+    def _placeholder_tile(self, column: int, row: int):
+        """
+        Cut a low-resolution stand-in for a tile from the overview.
 
-                if pages:
-                    # Get first page
-                    image = pages[0]
+        Args:
+            column: Tile column
+            row: Tile row
 
-                    # Create a PhotoImage for the canvas
-                    self.photo_image = ImageTk.PhotoImage(image)
+        Returns:
+            PIL image the size of the tile
+        """
+        from PIL import Image
 
-                    # Display image
-                    self.canvas.delete("all")
-                    self.image_id = self.canvas.create_image(0, 0, image=self.photo_image, anchor="nw")
+        tile_size = self.tile_cache.tile_size
+        width, height = self._level_size(self.zoom_step)
+        left, top = column * tile_size, row * tile_size
+        right, bottom = min(left + tile_size, width), min(top + tile_size, height)
 
-                    # Update canvas scrollregion
-                    self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        scale_x = self.overview.width / width
+        scale_y = self.overview.height / height
+        box = (left * scale_x, top * scale_y, right * scale_x, bottom * scale_y)
+        return self.overview.resize((right - left, bottom - top), Image.BILINEAR, box=box)
 
-                    # Update status
-                    self.status_var.set(f"PDF Page 1: {image.width} × {image.height}px")
+    def _request_tiles(self, keys: List[TileKey]):
+        """
+        Load tiles of the current zoom level in the background.
 
-                    # TODO: Add PDF page navigation
-                else:
-                    self.canvas.delete("all")
-                    self.canvas.create_text(
-                        400, 300,
-                        text="No pages found in PDF file.",
-                        font=("TkDefaultFont", 12),
-                        fill="red",
-                        justify="center"
-                    )
-                    self.status_var.set("Error: No pages found in PDF file.")
-
-            except ImportError:
-                # Fallback - display error message
-                self.canvas.delete("all")
-                self.canvas.create_text(
-                    400, 300,
-                    text="PDF Viewer requires the pdf2image and poppler packages.\nPlease install these packages to view PDF files.",
-                    font=("TkDefaultFont", 12),
-                    fill="red",
-                    justify="center"
-                )
+        Tiles come from the disk cache if they are there; otherwise the whole level is
+        rendered once and cut into tiles, so later panning finds every tile cached.
+        A newer request replaces one still waiting. The size the level was rendered at
+        replaces the estimated one, so tiles outside it are not requested again.
 
-                # Update status
-                self.status_var.set("Error: Missing required packages for PDF display.")
+        Args:
+            keys: The tiles to load
+        """
+        content, file_type = self.file_content, self.file_type
+        file_hash, level = self.file_hash, self.zoom_step
+        cache = self.tile_cache
+
+        def load_tiles():
+            tiles = {key: cache.load(key) for key in keys}
+            if any(tile is None for tile in tiles.values()):
+                with cache.level_lock(file_hash, level):
+                    # Another worker may have rendered the level while this one waited
+                    tiles = {key: cache.load(key) for key in keys}
+                    if any(tile is None for tile in tiles.values()):
+                        image = render_pattern_page(content, file_type, ZOOM_FACTOR ** level)
+                        rendered = cache.store_level(file_hash, level, image)
+                        tiles = {key: rendered.get(key) for key in keys}
+
+            for key, tile in tiles.items():
+                if tile is not None:
+                    cache.put(key, tile)
+            return cache.level_size(file_hash, level)
+
+        self.tile_loader.submit("tiles", load_tiles, lambda size: self._on_tiles_loaded(file_hash, level, size),
+                                self._on_render_error)
+
+    def _on_tiles_loaded(self, file_hash: str, level: int, size: Optional[Tuple[int, int]]):
+        """
+        Show loaded tiles, first adopting the size their level was rendered at.
 
-        except Exception as e:
-            logger.error(f"Error displaying PDF: {str(e)}")
+        Args:
+            file_hash: Hash of the file the tiles belong to
+            level: The zoom level of the tiles
+            size: The rendered size of the level, or None if it is not known
+        """
+        if file_hash != self.file_hash:
+            return
+        if size is not None and self.level_sizes.get(level) != tuple(size):
+            self.level_sizes[level] = tuple(size)
+            if level == self.zoom_step:
+                # Relay the canvas out; tiles outside the rendered page are dropped
+                self._apply_zoom()
+                return
+        self._update_visible_tiles()
+
+    def _display_image_without_pil(self):
+        """Display a PNG file with tkinter's own PhotoImage when PIL is not installed."""
+        try:
+            # Create a temporary file for the image
+            fd, self.temp_file = tempfile.mkstemp(suffix=".png")
+            os.close(fd)
+
+            with open(self.temp_file, "wb") as f:
+                f.write(self.file_content)
+
+            # Load with tkinter
+            self.photo_image = tk.PhotoImage(file=self.temp_file)
+
+            # Display image
             self.canvas.delete("all")
-            self.canvas.create_text(
-                400, 300,
-                text=f"Error displaying PDF file:\n{str(e)}",
-                font=("TkDefaultFont", 12),
-                fill="red",
-                justify="center"
-            )
-            self.status_var.set("Error displaying PDF file.")
+            self.image_id = self.canvas.create_image(0, 0, image=self.photo_image, anchor="nw")
+
+            # Update canvas scrollregion
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+            # Update status
+            self.status_var.set(f"Image: {self.photo_image.width()} × {self.photo_image.height()}px")
+
+        except Exception as e:
+            logger.error(f"Error displaying image: {str(e)}")
+            self._show_message(f"Error displaying image file:\n{str(e)}")
+            self.status_var.set("Error displaying image file.")
 
     def _display_unsupported(self):
         """Display message for unsupported file types."""
@@ -563,15 +746,46 @@ class PatternFileViewer(BaseDialog):
 
     def zoom_in(self):
         """Increase zoom level and redisplay."""
-        self.zoom_level *= 1.2
-        self.update_zoom_display()
-        self.display_file()
+        self.set_zoom_step(self.zoom_step + 1)
 
     def zoom_out(self):
         """Decrease zoom level and redisplay."""
-        self.zoom_level /= 1.2
+        self.set_zoom_step(self.zoom_step - 1)
+
+    def set_zoom_step(self, step: int):
+        """
+        Zoom to a level, keeping the middle of the view in place.
+
+        Args:
+            step: Number of zoom steps from 100%
+        """
+        center = None
+        if self.full_size is not None:
+            width, height = self._level_size(self.zoom_step)
+            center = (
+                (self.canvas.canvasx(0) + self.canvas.winfo_width() / 2) / width,
+                (self.canvas.canvasy(0) + self.canvas.winfo_height() / 2) / height,
+            )
+
+        self.zoom_step = step
+        self.zoom_level = ZOOM_FACTOR ** step
         self.update_zoom_display()
-        self.display_file()
+
+        if self.full_size is not None:
+            self._clear_measurement()
+            self._apply_zoom(center)
+        elif self.file_type not in TILED_FILE_TYPES:
+            self.display_file()
+
+    def _clear_measurement(self):
+        """Remove the measurement drawn at the previous zoom level."""
+        for item in (self.measure_line, self.measure_text, getattr(self, "measure_point", None)):
+            if item:
+                self.canvas.delete(item)
+        self.measure_line = None
+        self.measure_text = None
+        self.measure_point = None
+        self.measure_start = None
 
     def update_zoom_display(self):
         """Update zoom level display."""
@@ -970,6 +1184,13 @@ class PatternFileViewer(BaseDialog):
 
     def close(self):
         """Override close to clean up temporary files."""
+        # Stop rendering tiles nobody will see
+        if self.tile_loader is not None:
+            self.tile_loader.cancel()
+        if self._tile_update_id is not None:
+            self.canvas.after_cancel(self._tile_update_id)
+            self._tile_update_id = None
+
         # Clean up temporary file
         if self.temp_file:
             try:
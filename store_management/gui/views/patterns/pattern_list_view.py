@@ -542,11 +542,9 @@ class PatternListView(BaseListView):
             name: The name of the pattern to select
         """
         # Find the pattern by name
-        for item_id in self.treeview.get_children():
-            values = self.treeview.item(item_id, "values")
+        for item_id, values in self.treeview.iter_rows():
             if values[0] == name:
                 # Select the item
-                self.treeview.selection_set(item_id)
-                self.treeview.see(item_id)
+                self.treeview.select_item_id(item_id)
                 self.on_select()
                 break
\ No newline at end of file
@@ -575,4 +575,4 @@ class ProjectListView(BaseListView):
 
     def refresh(self):
         """Refresh the view."""
-        self.load_data()
\ No newline at end of file
+        super().refresh()
\ No newline at end of file
@@ -2348,7 +2348,7 @@ class PurchaseView(BaseListView):
 
     def refresh(self):
         """Refresh the view."""
-        self.load_data()
+        super().refresh()
 
     def destroy(self):
         """Clean up resources and listeners before destroying the view."""
@@ -986,7 +986,7 @@ class SupplierView(BaseListView):
 
     def refresh(self):
         """Refresh the view."""
-        self.load_data()
+        super().refresh()
 
     def destroy(self):
         """Clean up resources and listeners before destroying the view."""
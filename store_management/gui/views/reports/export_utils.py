@@ -6,6 +6,7 @@ This module provides functions for exporting reports to PDF, Excel,
 and other formats, as well as printing functionality.
 """
 
+import importlib.util
 import logging
 import os
 import tempfile
@@ -15,15 +16,10 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime
 import csv
 
-# Try to import openpyxl for Excel export, but provide fallback to CSV
-try:
-    import openpyxl
-    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-    from openpyxl.utils import get_column_letter
-
-    HAS_OPENPYXL = True
-except ImportError:
-    HAS_OPENPYXL = False
+# Use openpyxl for Excel export if it is installed, otherwise fall back to CSV. It is
+# only imported when a report is exported, not when the reports views load.
+HAS_OPENPYXL = importlib.util.find_spec("openpyxl") is not None
+if not HAS_OPENPYXL:
     logging.warning("openpyxl not available, Excel export will use CSV format")
 
 logger = logging.getLogger(__name__)
@@ -185,6 +181,10 @@ class ReportExporter:
         Returns:
             True if export was successful, False otherwise
         """
+        import openpyxl
+        from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+        from openpyxl.utils import get_column_letter
+
         # Create a new workbook and select the active sheet
         wb = openpyxl.Workbook()
         ws = wb.active
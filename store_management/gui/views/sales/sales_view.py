@@ -34,6 +34,9 @@ class SalesView(BaseListView):
     and various sales-related actions.
     """
 
+    virtual_rows = True
+    invalidation_topics = ("sale_updated", "sale_status_changed", "sale.created", "sale.updated")
+
     def __init__(self, parent, **kwargs):
         """
         Initialize the sales view.
@@ -71,6 +74,7 @@ class SalesView(BaseListView):
 
         # Set view title
         self.title = "Sales Management"
+        self.service_name = "ISalesService"
 
     def build(self):
         """Build the sales view layout."""
@@ -99,6 +103,7 @@ class SalesView(BaseListView):
         self.create_pagination(content_frame)
 
         # Load initial data
+        self.update_dashboard_metrics()
         self.load_data()
 
     def _add_default_action_buttons(self):
@@ -272,34 +277,21 @@ class SalesView(BaseListView):
         Args:
             parent: The parent widget
         """
+        # Configure columns
+        self.columns = [
+            ("id", "Sale ID", 80),
+            ("date", "Date", 120),
+            ("customer", "Customer", 200),
+            ("amount", "Amount", 100),
+            ("status", "Status", 150),
+            ("payment_status", "Payment", 100),
+            ("items", "Items", 80),
+            ("notes", "Notes", 200)
+        ]
+
         # Call the base class method to create the treeview
         super().create_treeview(parent)
 
-        # Configure columns
-        self.treeview.configure(columns=(
-            "id", "date", "customer", "amount", "status", "payment_status", "items", "notes"
-        ))
-
-        # Set column headings
-        self.treeview.heading("id", text="Sale ID")
-        self.treeview.heading("date", text="Date")
-        self.treeview.heading("customer", text="Customer")
-        self.treeview.heading("amount", text="Amount")
-        self.treeview.heading("status", text="Status")
-        self.treeview.heading("payment_status", text="Payment")
-        self.treeview.heading("items", text="Items")
-        self.treeview.heading("notes", text="Notes")
-
-        # Set column widths
-        self.treeview.column("id", width=80)
-        self.treeview.column("date", width=120)
-        self.treeview.column("customer", width=200)
-        self.treeview.column("amount", width=100)
-        self.treeview.column("status", width=150)
-        self.treeview.column("payment_status", width=100)
-        self.treeview.column("items", width=80)
-        self.treeview.column("notes", width=200)
-
     def add_advanced_filters(self):
         """Add advanced search filters to the search frame."""
         if not hasattr(self, 'search_frame'):
@@ -571,14 +563,13 @@ class SalesView(BaseListView):
         ]
 
     def load_data(self):
-        """Load sales data into the treeview based on current filters and pagination."""
-        try:
-            # Clear existing items
-            self.treeview.delete(*self.treeview.get_children())
-
-            # Get current page and search criteria
-            offset = (self.current_page - 1) * self.page_size
+        """
+        Load sales data into the treeview based on current filters and pagination.
 
+        The filters are read from the form here; the count and page queries run in the
+        background through BaseListView, which also caches and prefetches pages.
+        """
+        try:
             # Build filter criteria
             filters = {}
 
@@ -637,38 +628,67 @@ class SalesView(BaseListView):
             if amount_min is not None or amount_max is not None:
                 filters['amount_range'] = (amount_min, amount_max)
 
-            # Get total count for pagination
-            total_count = self.sales_service.count_sales(
-                search_text=search_text,
-                filters=filters
-            )
+            self.filter_criteria = {"search_text": search_text, "filters": filters}
 
-            # Update pagination display
-            total_pages = (total_count + self.page_size - 1) // self.page_size
-            self.update_pagination_display(total_pages)
+        except Exception as e:
+            self.logger.error(f"Error loading sales data: {e}", exc_info=True)
+            messagebox.showerror("Error", f"Failed to load sales data: {str(e)}")
+            return
 
-            # Get sales for current page
-            sales = self.sales_service.search_sales(
-                search_text=search_text,
-                filters=filters,
-                offset=offset,
-                limit=self.page_size,
-                include_customer=True,
-                include_items=True
-            )
+        super().load_data()
 
-            # Insert sales into treeview
-            for sale in sales:
-                values = self.extract_item_values(sale)
-                item_id = str(getattr(sale, "id", 0))
-                self.treeview.insert('', 'end', iid=item_id, values=values)
+    def get_total_count(self, service, criteria=None):
+        """
+        Get the number of sales matching the current filters.
 
-            # Update dashboard metrics
-            self.update_dashboard_metrics()
+        Args:
+            service: The sales service to use
+            criteria: Filter criteria snapshot; defaults to the current criteria
 
-        except Exception as e:
-            self.logger.error(f"Error loading sales data: {e}", exc_info=True)
-            messagebox.showerror("Error", f"Failed to load sales data: {str(e)}")
+        Returns:
+            The total count of sales
+        """
+        if criteria is None:
+            criteria = self.filter_criteria
+        return service.count_sales(
+            search_text=criteria.get("search_text", ""),
+            filters=criteria.get("filters", {})
+        )
+
+    def get_items(self, service, offset, limit, criteria=None, sort=None):
+        """
+        Get the sales for one page.
+
+        Args:
+            service: The sales service to use
+            offset: Pagination offset
+            limit: Page size
+            criteria: Filter criteria snapshot; defaults to the current criteria
+            sort: (sort column, sort direction) snapshot; defaults to the current sort
+
+        Returns:
+            List of sales
+        """
+        if criteria is None:
+            criteria = self.filter_criteria
+        return service.search_sales(
+            search_text=criteria.get("search_text", ""),
+            filters=criteria.get("filters", {}),
+            offset=offset,
+            limit=limit,
+            include_customer=True,
+            include_items=True
+        )
+
+    def on_load_error(self, error):
+        """
+        Handle a failed background load.
+
+        Args:
+            error: The exception raised while loading
+        """
+        self.logger.error(f"Error loading sales data: {error}")
+        messagebox.showerror("Error", f"Failed to load sales data: {str(error)}")
 
     def update_dashboard_metrics(self):
         """Update sales dashboard metrics."""
@@ -1839,8 +1859,8 @@ class SalesView(BaseListView):
         # Update dashboard metrics
         self.update_dashboard_metrics()
 
-        # Reload data
-        self.load_data()
+        # Drop cached pages and reload data
+        super().refresh()
 
     def destroy(self):
         """Clean up resources and listeners before destroying the view."""
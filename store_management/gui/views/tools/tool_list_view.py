@@ -189,34 +189,48 @@ class ToolListView(BaseListView):
             command=self.on_checkout
         ).pack(side=tk.LEFT, padx=5, pady=5)
 
+    def get_filter_criteria(self) -> Dict[str, Any]:
+        """Get a copy of the search criteria the tools are filtered by.
+
+        Returns:
+            Dictionary of search criteria
+        """
+        return dict(getattr(self, 'search_criteria', None) or {})
+
     @with_service("tool_service")
-    def get_total_count(self, service) -> int:
+    def get_total_count(self, service, criteria: Optional[Dict[str, Any]] = None) -> int:
         """Get the total count of tools.
 
         Args:
             service: The tool service injected by the decorator
+            criteria: Filter criteria snapshot; defaults to the current criteria
 
         Returns:
             The total count of tools
         """
-        criteria = self.search_criteria if hasattr(self, 'search_criteria') else {}
+        if criteria is None:
+            criteria = self.get_filter_criteria()
         return service.count_tools(criteria)
 
     @with_service("tool_service")
-    def get_items(self, service, offset: int, limit: int) -> List[Any]:
+    def get_items(self, service, offset: int, limit: int, criteria: Optional[Dict[str, Any]] = None,
+                  sort: Optional[Tuple[str, str]] = None) -> List[Any]:
         """Get tools for the current page.
 
         Args:
             service: The tool service injected by the decorator
             offset: Pagination offset
             limit: Page size
+            criteria: Filter criteria snapshot; defaults to the current criteria
+            sort: (sort column, sort direction) snapshot; defaults to the current sort
 
         Returns:
             List of tools
         """
-        criteria = self.search_criteria if hasattr(self, 'search_criteria') else {}
-        sort_field = self.sort_column if hasattr(self, 'sort_column') else "name"
-        sort_dir = self.sort_direction if hasattr(self, 'sort_direction') else "asc"
+        if criteria is None:
+            criteria = self.get_filter_criteria()
+        sort_field, sort_dir = sort if sort is not None else (
+            getattr(self, 'sort_column', "name"), getattr(self, 'sort_direction', "asc"))
 
         return service.get_tools(
             criteria=criteria,
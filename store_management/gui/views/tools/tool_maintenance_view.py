@@ -257,21 +257,32 @@ class ToolMaintenanceView(BaseListView):
             self.logger.error(f"Error getting tool name: {e}")
             return ""
 
+    def get_filter_criteria(self):
+        """Get a copy of the search criteria the maintenance records are filtered by.
+
+        Returns:
+            Dictionary of search criteria, limited to the view's tool if it has one
+        """
+        criteria = dict(getattr(self, 'search_criteria', None) or {})
+
+        # If tool_id is provided, filter by tool
+        if self.tool_id and "tool_id" not in criteria:
+            criteria["tool_id"] = self.tool_id
+        return criteria
+
     @with_service("tool_maintenance_service")
-    def get_total_count(self, service=None):
+    def get_total_count(self, service=None, criteria=None):
         """Get the total count of maintenance records.
 
         Args:
             service: The tool maintenance service injected by the decorator
+            criteria: Filter criteria snapshot; defaults to the current criteria
 
         Returns:
             The total count of maintenance records
         """
-        criteria = self.search_criteria if hasattr(self, 'search_criteria') else {}
-
-        # If tool_id is provided, filter by tool
-        if self.tool_id and "tool_id" not in criteria:
-            criteria["tool_id"] = self.tool_id
+        if criteria is None:
+            criteria = self.get_filter_criteria()
 
         try:
             return service.count_maintenance_records(criteria)
@@ -280,24 +291,23 @@ class ToolMaintenanceView(BaseListView):
             return 0
 
     @with_service("tool_maintenance_service")
-    def get_items(self, service, offset, limit):
+    def get_items(self, service, offset, limit, criteria=None, sort=None):
         """Get maintenance records for the current page.
 
         Args:
             service: The tool maintenance service injected by the decorator
             offset: Pagination offset
             limit: Page size
+            criteria: Filter criteria snapshot; defaults to the current criteria
+            sort: (sort column, sort direction) snapshot; defaults to the current sort
 
         Returns:
             List of maintenance records
         """
-        criteria = self.search_criteria if hasattr(self, 'search_criteria') else {}
-        sort_field = self.sort_column if hasattr(self, 'sort_column') else "maintenance_date"
-        sort_dir = self.sort_direction if hasattr(self, 'sort_direction') else "desc"
-
-        # If tool_id is provided, filter by tool
-        if self.tool_id and "tool_id" not in criteria:
-            criteria["tool_id"] = self.tool_id
+        if criteria is None:
+            criteria = self.get_filter_criteria()
+        sort_field, sort_dir = sort if sort is not None else (
+            getattr(self, 'sort_column', "maintenance_date"), getattr(self, 'sort_direction', "desc"))
 
         try:
             return service.get_maintenance_records(
@@ -10,6 +10,7 @@ from tkinter import ttk
 from typing import Any, Dict, List, Optional, Tuple
 
 from gui.theme import COLORS
+from gui.widgets.charts.canvas_items import CanvasItemPool, unique_keys
 
 
 class BarChart(ttk.Frame):
@@ -75,11 +76,15 @@ class BarChart(ttk.Frame):
         self.chart_area = None
         self.x_axis = None
         self.y_axis = None
+        self.items = None
         self.bars = []
+        self.bar_data = {}
         self.value_labels = []
         self.grid_lines = []
         self.tooltip = None
         self.tooltip_visible = False
+        self._render_pending = None
+        self._animation_pending = None
 
         # Layout
         self.padding = 50  # Padding around the chart
@@ -107,6 +112,7 @@ class BarChart(ttk.Frame):
             bg=COLORS["background"]
         )
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.items = CanvasItemPool(self.canvas)
 
         # Create chart elements
         self._create_title()
@@ -186,12 +192,20 @@ class BarChart(ttk.Frame):
             )
 
     def render(self):
-        """Render the chart with the current data."""
+        """
+        Render the chart with the current data.
+
+        Canvas items are kept per data label and tick and only updated where their
+        coordinates or text changed; items for labels that disappeared are deleted.
+        """
         if not self.data:
             return
 
-        # Clear previous elements
-        self._clear_chart_elements()
+        self.items.begin()
+        self.bars = []
+        self.value_labels = []
+        self.grid_lines = []
+        self.bar_data = {}
 
         # Calculate value range for y-axis
         max_value = max(item.get(self.y_key, 0) for item in self.data)
@@ -223,8 +237,9 @@ class BarChart(ttk.Frame):
 
             # Draw grid line
             if self.show_grid and i > 0:
-                grid_line = self.canvas.create_line(
-                    left, y_pos, right, y_pos,
+                grid_line = self.items.line(
+                    ("grid_line", i),
+                    (left, y_pos, right, y_pos),
                     fill=COLORS["border"],
                     dash=(2, 4),
                     tags=("grid_line",)
@@ -232,15 +247,17 @@ class BarChart(ttk.Frame):
                 self.grid_lines.append(grid_line)
 
             # Draw y-axis tick
-            tick = self.canvas.create_line(
-                left - 5, y_pos, left, y_pos,
+            self.items.line(
+                ("y_tick", i),
+                (left - 5, y_pos, left, y_pos),
                 fill=COLORS["text"],
                 tags=("y_tick",)
             )
 
             # Draw y-axis label
             format_str = "{:.0f}" if value == int(value) else "{:.1f}"
-            label = self.canvas.create_text(
+            self.items.text(
+                ("y_label", i),
                 left - 10,
                 y_pos,
                 text=format_str.format(value),
@@ -264,9 +281,10 @@ class BarChart(ttk.Frame):
         start_x = left + (chart_width - total_width) // 2 + self.spacing
 
         # Draw bars and x-axis labels
-        for i, item in enumerate(self.data):
+        keys = unique_keys(item.get(self.x_key, f"Item {i}") for i, item in enumerate(self.data))
+        for i, (item, key) in enumerate(zip(self.data, keys)):
             # Get values and ensure they're numbers
-            x_value = item.get(self.x_key, f"Item {i}")
+            x_value = key[0]
             y_value = item.get(self.y_key, 0)
             try:
                 y_value = float(y_value)
@@ -286,20 +304,21 @@ class BarChart(ttk.Frame):
 
             # Create bar
             if current_height > 0:
-                bar = self.canvas.create_rectangle(
-                    bar_x, bottom - current_height,
-                           bar_x + self.bar_width, bottom,
+                bar = self.items.rectangle(
+                    ("bar", key),
+                    (bar_x, bottom - current_height, bar_x + self.bar_width, bottom),
                     fill=self.color,
                     outline=COLORS["border"],
                     tags=("bar", f"bar_{i}")
                 )
                 self.bars.append(bar)
 
-                # Store data with the bar for tooltips
-                self.canvas.itemconfig(bar, data=(x_value, y_value))
+                # Keep data with the bar for tooltips
+                self.bar_data[bar] = (x_value, y_value)
 
             # Create x-axis label
-            label = self.canvas.create_text(
+            self.items.text(
+                ("x_label", key),
                 bar_x + self.bar_width // 2,
                 bottom + 15,
                 text=str(x_value),
@@ -313,7 +332,8 @@ class BarChart(ttk.Frame):
             # Create value label if needed
             if self.show_values and current_height > 0:
                 value_text = str(int(y_value)) if y_value == int(y_value) else f"{y_value:.1f}"
-                value_label = self.canvas.create_text(
+                value_label = self.items.text(
+                    ("value_label", key),
                     bar_x + self.bar_width // 2,
                     bottom - current_height - 5,
                     text=value_text,
@@ -324,45 +344,57 @@ class BarChart(ttk.Frame):
                 )
                 self.value_labels.append(value_label)
 
-        # Start animation if needed
-        if self.animate and self.animation_step < self.animation_steps:
-            self.animation_step += 1
-            self.after(self.animation_duration // self.animation_steps, self.render)
+        self.items.end()
+
+        # Continue animation if needed
+        if self.animate and self.animation_step < self.animation_steps and self._animation_pending is None:
+            self._animation_pending = self.after(
+                self.animation_duration // self.animation_steps, self._next_animation_step)
+
+    def _next_animation_step(self):
+        """Advance the initial animation by one frame."""
+        self._animation_pending = None
+        self.animation_step += 1
+        self.render()
 
     def _clear_chart_elements(self):
         """Clear the chart elements."""
-        # Clear bars
-        for bar in self.bars:
-            self.canvas.delete(bar)
+        self.items.clear()
         self.bars = []
-
-        # Clear value labels
-        for label in self.value_labels:
-            self.canvas.delete(label)
         self.value_labels = []
-
-        # Clear grid lines
-        for line in self.grid_lines:
-            self.canvas.delete(line)
         self.grid_lines = []
-
-        # Clear existing x-axis labels
-        self.canvas.delete("x_label")
-
-        # Clear existing y-axis labels and ticks
-        self.canvas.delete("y_label")
-        self.canvas.delete("y_tick")
+        self.bar_data = {}
 
     def update_data(self, data: List[Dict[str, Any]]):
         """
         Update the chart with new data.
 
+        The redraw happens once the event loop is idle, so several updates in a row
+        cost a single render, and the existing bars move to their new values rather
+        than being rebuilt.
+
         Args:
             data: List of dictionaries with chart data
         """
         self.data = data
-        self.animation_step = 0  # Reset animation
-        self.render()
+        if self._render_pending is None:
+            self._render_pending = self.after_idle(self._render_when_idle)
+
+    def _render_when_idle(self):
+        """Run a redraw scheduled by update_data."""
+        self._render_pending = None
+        if self.data:
+            self.render()
+        else:
+            self._clear_chart_elements()
+
+    def destroy(self):
+        """Cancel pending redraws and destroy the chart."""
+        for pending in (self._render_pending, self._animation_pending):
+            if pending is not None:
+                self.after_cancel(pending)
+        self._render_pending = self._animation_pending = None
+        super().destroy()
 
     def _create_tooltip(self, x: int, y: int, text: str):
         """
@@ -412,9 +444,9 @@ class BarChart(ttk.Frame):
             bbox = self.canvas.bbox(bar)
             if bbox and bbox[0] <= event.x <= bbox[2] and bbox[1] <= event.y <= bbox[3]:
                 # Get data from bar
-                data = self.canvas.itemcget(bar, "data")
+                data = self.bar_data.get(bar)
                 if data:
-                    x_value, y_value = eval(data)
+                    x_value, y_value = data
                     tooltip_text = f"{x_value}: {y_value}"
                     self._create_tooltip(event.x + 10, event.y - 10, tooltip_text)
                 return
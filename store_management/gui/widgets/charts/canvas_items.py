@@ -0,0 +1,145 @@
+# gui/widgets/charts/canvas_items.py
+"""
+Canvas item reuse for the chart widgets.
+
+Charts draw through a CanvasItemPool instead of deleting and recreating every
+canvas item on each render. Items are addressed by a stable key (a data label,
+a tick index), so a redraw only moves, recolors or retexts the items whose
+coordinates or options actually changed, and deletes the ones no longer drawn.
+"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Sequence, Tuple
+
+
+def unique_keys(labels: Iterable[Any]) -> List[Tuple[Any, int]]:
+    """
+    Build stable item keys for a series of data labels.
+
+    Repeated labels are told apart by how many times they occurred before, so
+    two points labelled "Jan" still get their own items.
+
+    Args:
+        labels: Data labels in display order
+
+    Returns:
+        List of (label, occurrence) keys
+    """
+    seen: Dict[Any, int] = {}
+    keys = []
+    for label in labels:
+        occurrence = seen.get(label, 0)
+        seen[label] = occurrence + 1
+        keys.append((label, occurrence))
+    return keys
+
+
+class CanvasItemPool:
+    """
+    Canvas items kept by key and reused across renders.
+
+    Call ``begin`` before drawing, draw every item through the pool, then call
+    ``end`` to delete the items that were not drawn this time.
+    """
+
+    def __init__(self, canvas):
+        """
+        Initialize the pool.
+
+        Args:
+            canvas: The canvas the items live on
+        """
+        self.canvas = canvas
+        self._items: Dict[Hashable, Tuple[str, int, Tuple[float, ...], Dict[str, Any]]] = {}
+        self._drawn = set()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def item_id(self, key: Hashable):
+        """
+        Get the canvas item ID for a key.
+
+        Args:
+            key: The item key
+
+        Returns:
+            The canvas item ID, or None if there is no such item
+        """
+        entry = self._items.get(key)
+        return entry[1] if entry else None
+
+    def begin(self) -> None:
+        """Start a render pass."""
+        self._drawn = set()
+
+    def end(self) -> None:
+        """Finish a render pass, deleting the items it did not draw."""
+        for key in [key for key in self._items if key not in self._drawn]:
+            self.canvas.delete(self._items.pop(key)[1])
+
+    def clear(self) -> None:
+        """Delete every item in the pool."""
+        for _, item_id, _, _ in self._items.values():
+            self.canvas.delete(item_id)
+        self._items.clear()
+        self._drawn = set()
+
+    def line(self, key: Hashable, coords: Sequence[float], **options) -> int:
+        """Draw a line item. See ``draw``."""
+        return self.draw("line", key, coords, **options)
+
+    def rectangle(self, key: Hashable, coords: Sequence[float], **options) -> int:
+        """Draw a rectangle item. See ``draw``."""
+        return self.draw("rectangle", key, coords, **options)
+
+    def oval(self, key: Hashable, coords: Sequence[float], **options) -> int:
+        """Draw an oval item. See ``draw``."""
+        return self.draw("oval", key, coords, **options)
+
+    def polygon(self, key: Hashable, coords: Sequence[float], **options) -> int:
+        """Draw a polygon item. See ``draw``."""
+        return self.draw("polygon", key, coords, **options)
+
+    def text(self, key: Hashable, x: float, y: float, **options) -> int:
+        """Draw a text item. See ``draw``."""
+        return self.draw("text", key, (x, y), **options)
+
+    def draw(self, kind: str, key: Hashable, coords: Sequence[float], **options) -> int:
+        """
+        Create an item, or update the existing item with the same key.
+
+        Only coordinates and options that differ from the previous render are sent
+        to Tk.
+
+        Args:
+            kind: Canvas item type ('line', 'rectangle', 'oval', 'polygon', 'text')
+            key: Stable key of the item
+            coords: Item coordinates
+            **options: Canvas item options
+
+        Returns:
+            The canvas item ID
+        """
+        self._drawn.add(key)
+        coords = tuple(coords)
+        entry = self._items.get(key)
+
+        if entry is None or entry[0] != kind:
+            if entry is not None:
+                self.canvas.delete(entry[1])
+            item_id = getattr(self.canvas, f"create_{kind}")(*coords, **options)
+            self._items[key] = (kind, item_id, coords, dict(options))
+            return item_id
+
+        _, item_id, old_coords, old_options = entry
+        if coords != old_coords:
+            self.canvas.coords(item_id, *coords)
+        changed = {name: value for name, value in options.items() if old_options.get(name) != value}
+        if changed:
+            self.canvas.itemconfig(item_id, **changed)
+        if coords != old_coords or changed:
+            self._items[key] = (kind, item_id, coords, {**old_options, **options})
+        return item_id
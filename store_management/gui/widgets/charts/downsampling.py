@@ -0,0 +1,68 @@
+# gui/widgets/charts/downsampling.py
+"""
+Series downsampling for the chart widgets.
+
+Implements Largest-Triangle-Three-Buckets (LTTB), which reduces a long series to a
+fixed number of points while keeping its visual shape: peaks, troughs and trend
+changes survive, flat stretches are thinned out.
+"""
+
+from typing import Optional
+
+from utils.lazy_import import lazy_module
+
+# numpy is imported when a chart first needs it, not at application startup
+np = lazy_module("numpy")
+
+
+def lttb_indices(y, threshold: int, x: Optional["np.ndarray"] = None) -> "np.ndarray":
+    """
+    Choose the points of a series to keep with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The interior is split into
+    ``threshold - 2`` buckets and from each bucket the point forming the largest
+    triangle with the previously kept point and the average of the next bucket is
+    kept. Bucket averages and triangle areas are computed with NumPy; only the walk
+    over the buckets is a Python loop, so the cost is linear in the series length.
+
+    Args:
+        y: Series values
+        threshold: Number of points to keep
+        x: Series positions, or None for evenly spaced points
+
+    Returns:
+        Sorted array of indices into the series
+    """
+    y = np.asarray(y, dtype=np.float64)
+    size = len(y)
+    if threshold >= size:
+        return np.arange(size)
+    if threshold < 3:
+        return np.array([0, size - 1][:max(threshold, 0)], dtype=np.int64)
+
+    x = np.arange(size, dtype=np.float64) if x is None else np.asarray(x, dtype=np.float64)
+
+    # Interior points 1 .. size-2 split into threshold-2 buckets of at least one point
+    edges = np.linspace(1, size - 1, threshold - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+    counts = ends - starts
+
+    # Average of every bucket from prefix sums; the last bucket looks ahead to the final point
+    sum_x = np.concatenate(([0.0], np.cumsum(x)))
+    sum_y = np.concatenate(([0.0], np.cumsum(y)))
+    next_x = np.append(((sum_x[ends] - sum_x[starts]) / counts)[1:], x[-1])
+    next_y = np.append(((sum_y[ends] - sum_y[starts]) / counts)[1:], y[-1])
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, size - 1
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = starts[bucket], ends[bucket]
+        ax, ay = x[previous], y[previous]
+        areas = np.abs((ax - next_x[bucket]) * (y[start:end] - ay)
+                       - (ax - x[start:end]) * (next_y[bucket] - ay))
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+
+    return selected
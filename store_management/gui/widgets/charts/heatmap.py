@@ -6,15 +6,34 @@ This module defines a customizable heatmap chart for visualizing tabular data
 where color intensity corresponds to value magnitude.
 """
 
+import math
 import tkinter as tk
 from tkinter import ttk
 from typing import Any, Dict, List, Optional, Tuple
 
+from gui import config
 from gui.theme import COLORS
+from utils.lazy_import import lazy_module
+
+# numpy is imported when a chart first needs it, not at application startup
+np = lazy_module("numpy")
+
+# Minimum space per axis label before labels are thinned out
+MIN_X_LABEL_SPACING = 40
+MIN_Y_LABEL_SPACING = 14
+# Number of entries in the raster colormap lookup table
+COLORMAP_SIZE = 256
 
 
 class HeatmapChart(ttk.Frame):
-    """Heatmap chart widget for displaying tabular data with color intensity."""
+    """
+    Heatmap chart widget for displaying tabular data with color intensity.
+
+    Large heatmaps are drawn in raster mode: the cell colors are looked up for the
+    whole value grid at once and blitted as a single image, with cells shrunk to fit
+    the canvas. Small heatmaps keep one canvas rectangle and value label per cell.
+    Either way, tooltips map the cursor position straight to a grid cell.
+    """
 
     def __init__(
             self,
@@ -32,6 +51,7 @@ class HeatmapChart(ttk.Frame):
             cell_height: int = 30,
             color_min: str = COLORS["light_blue"],
             color_max: str = COLORS["dark_blue"],
+            raster: Optional[bool] = None,
             **kwargs
     ):
         """
@@ -52,6 +72,7 @@ class HeatmapChart(ttk.Frame):
             cell_height: Height of heatmap cells
             color_min: Color for minimum values
             color_max: Color for maximum values
+            raster: Whether to draw the cells as one image (or None to decide by cell count)
             **kwargs: Additional arguments
         """
         super().__init__(parent, **kwargs)
@@ -69,6 +90,7 @@ class HeatmapChart(ttk.Frame):
         self.cell_height = cell_height
         self.color_min = color_min
         self.color_max = color_max
+        self.raster = raster
 
         self.padding = 10
         self.title_height = 30
@@ -82,6 +104,13 @@ class HeatmapChart(ttk.Frame):
         self.min_value = 0
         self.max_value = 0
 
+        # Value grid (rows are y labels, NaN where there is no data) and its layout
+        self.grid_values = None
+        self.grid_origin = (0, 0)
+        self.grid_cell_size = (cell_width, cell_height)
+        self._tooltip_cell = None
+        self._photo = None
+
         self._build_chart()
 
         if self.data:
@@ -169,43 +198,100 @@ class HeatmapChart(ttk.Frame):
         # Draw the heatmap grid
         x_offset = self.axis_label_space + self.padding
         y_offset = self.padding
+        self.grid_origin = (x_offset, y_offset)
+
+        if self.use_raster():
+            self._render_raster(x_offset, y_offset)
+        else:
+            self.grid_cell_size = (self.cell_width, self.cell_height)
+            self._render_cells(x_offset, y_offset)
+
+        self._render_axis_labels(x_offset, y_offset)
+
+    def use_raster(self) -> bool:
+        """
+        Decide whether to draw the cells as a single image.
+
+        Returns:
+            True for raster mode
+        """
+        if self.raster is not None:
+            return self.raster and self._image_support() is not None
+        cells = len(self.x_labels) * len(self.y_labels)
+        return cells >= config.HEATMAP_RASTER_MIN_CELLS and self._image_support() is not None
+
+    @staticmethod
+    def _image_support():
+        """
+        Get the PIL modules used for raster mode.
+
+        Returns:
+            Tuple of (Image, ImageTk), or None if PIL is not installed
+        """
+        try:
+            from PIL import Image, ImageTk
+        except ImportError:
+            return None
+        return Image, ImageTk
+
+    def _render_axis_labels(self, x_offset: int, y_offset: int):
+        """
+        Draw the axis labels, thinned out where cells are too small to label each one.
+
+        Args:
+            x_offset: Left edge of the grid
+            y_offset: Top edge of the grid
+        """
+        cell_width, cell_height = self.grid_cell_size
 
         # Draw Y-axis labels
-        for i, label in enumerate(self.y_labels):
-            y = y_offset + i * self.cell_height + self.cell_height // 2
+        y_step = max(1, math.ceil(MIN_Y_LABEL_SPACING / cell_height))
+        for i in range(0, len(self.y_labels), y_step):
+            y = y_offset + i * cell_height + cell_height // 2
             self.canvas.create_text(
                 x_offset - self.label_padding,
                 y,
-                text=str(label),
+                text=str(self.y_labels[i]),
                 anchor="e",
                 tags="y_labels"
             )
 
         # Draw X-axis labels
-        for i, label in enumerate(self.x_labels):
-            x = x_offset + i * self.cell_width + self.cell_width // 2
+        x_step = max(1, math.ceil(MIN_X_LABEL_SPACING / cell_width))
+        for i in range(0, len(self.x_labels), x_step):
+            x = x_offset + i * cell_width + cell_width // 2
             self.canvas.create_text(
                 x,
-                y_offset + len(self.y_labels) * self.cell_height + self.label_padding,
-                text=str(label),
+                y_offset + len(self.y_labels) * cell_height + self.label_padding,
+                text=str(self.x_labels[i]),
                 anchor="n",
                 tags="x_labels"
             )
 
-        # Draw the cells
+    def _render_cells(self, x_offset: int, y_offset: int):
+        """
+        Draw one rectangle and value label per cell.
+
+        Args:
+            x_offset: Left edge of the grid
+            y_offset: Top edge of the grid
+        """
+        x_index = {label: i for i, label in enumerate(self.x_labels)}
+        y_index = {label: i for i, label in enumerate(self.y_labels)}
+
         self.cells = []
         for point in self.data:
             try:
-                x_index = self.x_labels.index(point[self.x_key])
-                y_index = self.y_labels.index(point[self.y_key])
+                x_pos = x_index[point[self.x_key]]
+                y_pos = y_index[point[self.y_key]]
                 value = point[self.value_key]
 
                 # Calculate color based on value
                 color = self._get_color_for_value(value)
 
                 # Draw the cell
-                x1 = x_offset + x_index * self.cell_width
-                y1 = y_offset + y_index * self.cell_height
+                x1 = x_offset + x_pos * self.cell_width
+                y1 = y_offset + y_pos * self.cell_height
                 x2 = x1 + self.cell_width
                 y2 = y1 + self.cell_height
 
@@ -216,7 +302,7 @@ class HeatmapChart(ttk.Frame):
                     tags="cells"
                 )
 
-                # Store the cell info for tooltips
+                # Store the cell info
                 self.cells.append({
                     "id": cell_id,
                     "x1": x1,
@@ -224,8 +310,8 @@ class HeatmapChart(ttk.Frame):
                     "x2": x2,
                     "y2": y2,
                     "value": value,
-                    "x_label": self.x_labels[x_index],
-                    "y_label": self.y_labels[y_index]
+                    "x_label": self.x_labels[x_pos],
+                    "y_label": self.y_labels[y_pos]
                 })
 
                 # Add text for values that are significant
@@ -246,6 +332,80 @@ class HeatmapChart(ttk.Frame):
                 # Skip data points that don't match the axes
                 continue
 
+    def _render_raster(self, x_offset: int, y_offset: int):
+        """
+        Draw all cells as one image.
+
+        Cells shrink to fit the canvas, down to one pixel each; values are shown
+        through tooltips instead of per-cell labels.
+
+        Args:
+            x_offset: Left edge of the grid
+            y_offset: Top edge of the grid
+        """
+        Image, ImageTk = self._image_support()
+        rows, columns = self.grid_values.shape
+
+        available_width = self.chart_width - x_offset - self.padding
+        available_height = self.chart_height - y_offset - self.axis_label_space
+        cell_width = max(1, min(self.cell_width, available_width // columns))
+        cell_height = max(1, min(self.cell_height, available_height // rows))
+        self.grid_cell_size = (cell_width, cell_height)
+
+        # Scale the cells up with integer repeats; NumPy does the whole image at once
+        pixels = self._color_grid().repeat(cell_height, axis=0).repeat(cell_width, axis=1)
+        self._photo = ImageTk.PhotoImage(Image.fromarray(pixels, "RGB"), master=self.canvas)
+        self.canvas.create_image(x_offset, y_offset, image=self._photo, anchor="nw", tags="cells")
+
+    def _color_grid(self) -> "np.ndarray":
+        """
+        Map the value grid to colors through a lookup table.
+
+        Returns:
+            Array of shape (rows, columns, 3) with RGB colors; cells without data are white
+        """
+        start = np.array(self._hex_to_rgb(self.color_min), dtype=np.float64)
+        stop = np.array(self._hex_to_rgb(self.color_max), dtype=np.float64)
+        steps = np.linspace(0.0, 1.0, COLORMAP_SIZE)[:, None]
+        colormap = (start + (stop - start) * steps).astype(np.uint8)
+
+        values = self.grid_values
+        missing = np.isnan(values)
+        value_range = self.max_value - self.min_value
+        if value_range:
+            intensity = (np.where(missing, self.min_value, values) - self.min_value) / value_range
+        else:
+            intensity = np.zeros_like(values)
+        indices = np.clip((intensity * (COLORMAP_SIZE - 1)).astype(np.int64), 0, COLORMAP_SIZE - 1)
+
+        colors = colormap[indices]
+        colors[missing] = 255
+        return colors
+
+    def _cell_at(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """
+        Find the grid cell under a canvas position.
+
+        Args:
+            x: Canvas x coordinate
+            y: Canvas y coordinate
+
+        Returns:
+            Tuple of (row, column), or None if the position is outside the grid or the cell is empty
+        """
+        if self.grid_values is None:
+            return None
+        left, top = self.grid_origin
+        cell_width, cell_height = self.grid_cell_size
+        if x < left or y < top:
+            return None
+
+        row, column = int((y - top) // cell_height), int((x - left) // cell_width)
+        rows, columns = self.grid_values.shape
+        if row >= rows or column >= columns or np.isnan(self.grid_values[row, column]):
+            return None
+        return row, column
+
     def _clear_chart_elements(self):
         """Clear the chart elements."""
         self.canvas.delete("cells")
@@ -253,6 +413,8 @@ class HeatmapChart(ttk.Frame):
         self.canvas.delete("y_labels")
         self.canvas.delete("cell_values")
         self.canvas.delete("y_label")
+        self.cells = []
+        self._photo = None
         self._hide_tooltip()
 
     def update_data(self, data: List[Dict[str, Any]]):
@@ -268,10 +430,20 @@ class HeatmapChart(ttk.Frame):
         self.x_labels = sorted(list(set(point[self.x_key] for point in data)))
         self.y_labels = sorted(list(set(point[self.y_key] for point in data)))
 
+        # Build the value grid used for raster colors and tooltip lookups
+        x_index = {label: i for i, label in enumerate(self.x_labels)}
+        y_index = {label: i for i, label in enumerate(self.y_labels)}
+        count = len(data)
+        columns = np.fromiter((x_index[point[self.x_key]] for point in data), dtype=np.int64, count=count)
+        rows = np.fromiter((y_index[point[self.y_key]] for point in data), dtype=np.int64, count=count)
+        values = np.fromiter((point[self.value_key] for point in data), dtype=np.float64, count=count)
+
+        self.grid_values = np.full((len(self.y_labels), len(self.x_labels)), np.nan)
+        self.grid_values[rows, columns] = values
+
         # Find min/max values for color scaling
-        values = [point[self.value_key] for point in data]
-        self.min_value = min(values) if values else 0
-        self.max_value = max(values) if values else 0
+        self.min_value = min(point[self.value_key] for point in data) if data else 0
+        self.max_value = max(point[self.value_key] for point in data) if data else 0
 
         # Render the chart
         self.render()
@@ -351,20 +523,24 @@ class HeatmapChart(ttk.Frame):
         """
         x, y = event.x, event.y
 
-        # Check if the mouse is over a cell
-        for cell in self.cells:
-            if cell["x1"] <= x <= cell["x2"] and cell["y1"] <= y <= cell["y2"]:
-                # Show tooltip
-                tooltip_text = f"{cell['y_label']}, {cell['x_label']}: {cell['value']}"
-                self._create_tooltip(
-                    self.winfo_rootx() + x + 15,
-                    self.winfo_rooty() + y + 10,
-                    tooltip_text
-                )
-                return
+        # Work out the cell from the grid layout rather than searching the cells
+        cell = self._cell_at(x, y)
+        if cell is None:
+            self._hide_tooltip()
+            return
+        if cell == self._tooltip_cell:
+            return
 
-        # If not over a cell, hide the tooltip
-        self._hide_tooltip()
+        row, column = cell
+        value = self.grid_values[row, column]
+        value_text = str(int(value)) if value == int(value) else f"{value:.1f}"
+        tooltip_text = f"{self.y_labels[row]}, {self.x_labels[column]}: {value_text}"
+        self._create_tooltip(
+            self.winfo_rootx() + x + 15,
+            self.winfo_rooty() + y + 10,
+            tooltip_text
+        )
+        self._tooltip_cell = cell
 
     def _on_mouse_leave(self, event):
         """
@@ -377,6 +553,7 @@ class HeatmapChart(ttk.Frame):
 
     def _hide_tooltip(self):
         """Hide the tooltip."""
+        self._tooltip_cell = None
         if self.tooltip:
             self.tooltip.destroy()
             self.tooltip = None
\ No newline at end of file
@@ -5,15 +5,36 @@ Line chart widget for displaying trend data.
 This module provides a line chart component for visualizing trend data over time.
 """
 
+import math
 import tkinter as tk
 from tkinter import ttk
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 from gui.theme import COLORS
+from gui.widgets.charts.canvas_items import CanvasItemPool, unique_keys
+from gui.widgets.charts.downsampling import lttb_indices
+from utils.lazy_import import lazy_module
+
+# numpy is imported when a chart first needs it, not at application startup
+np = lazy_module("numpy")
+
+# Minimum horizontal space per x-axis label before labels are thinned out
+MIN_LABEL_SPACING = 30
+# Smallest number of points a zoomed view may show
+MIN_ZOOM_POINTS = 10
+# Share of the visible range kept by one mouse wheel step
+ZOOM_STEP = 0.8
 
 
 class LineChart(ttk.Frame):
-    """A line chart widget that displays trend data as a line."""
+    """
+    A line chart widget that displays trend data as a line.
+
+    Long series are downsampled with LTTB to about one point per pixel of the chart
+    area before drawing. The mouse wheel zooms into the series around the cursor and
+    a double click resets the zoom; both, like resizing the chart, resample the
+    visible range.
+    """
 
     def __init__(
             self,
@@ -35,6 +56,7 @@ class LineChart(ttk.Frame):
             show_values: bool = False,
             show_grid: bool = True,
             animate: bool = True,
+            max_points: Optional[int] = None,
             **kwargs
     ):
         """
@@ -59,6 +81,7 @@ class LineChart(ttk.Frame):
             show_values: Whether to show values at data points
             show_grid: Whether to show grid lines
             animate: Whether to animate the chart on initial display
+            max_points: Most points to draw (or None to use the chart area width in pixels)
         """
         super().__init__(parent, **kwargs)
         self.data = data
@@ -78,19 +101,26 @@ class LineChart(ttk.Frame):
         self.show_values = show_values
         self.show_grid = show_grid
         self.animate = animate
+        self.max_points = max_points
+        self.view_range = None  # (start, end) data indices while zoomed in
 
         # Internal variables
         self.canvas = None
         self.chart_area = None
         self.x_axis = None
         self.y_axis = None
+        self.items = None
         self.line_segments = []
         self.markers = []
+        self.marker_data = {}
         self.area = None
         self.value_labels = []
         self.grid_lines = []
         self.tooltip = None
         self.tooltip_visible = False
+        self._render_pending = None
+        self._animation_pending = None
+        self._sample_cache = None
 
         # Layout
         self.padding = 50  # Padding around the chart
@@ -118,6 +148,7 @@ class LineChart(ttk.Frame):
             bg=COLORS["background"]
         )
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.items = CanvasItemPool(self.canvas)
 
         # Create chart elements
         self._create_title()
@@ -127,6 +158,13 @@ class LineChart(ttk.Frame):
         self.canvas.bind("<Motion>", self._on_mouse_move)
         self.canvas.bind("<Leave>", self._on_mouse_leave)
 
+        # Zoom and resize resample the series
+        self.canvas.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.canvas.bind("<Button-4>", self._on_mouse_wheel)
+        self.canvas.bind("<Button-5>", self._on_mouse_wheel)
+        self.canvas.bind("<Double-Button-1>", lambda e: self.reset_zoom())
+        self.canvas.bind("<Configure>", self._on_resize)
+
     def _create_title(self):
         """Create the chart title."""
         self.canvas.create_text(
@@ -135,7 +173,7 @@ class LineChart(ttk.Frame):
             text=self.title,
             fill=COLORS["text"],
             font=("Helvetica", 14, "bold"),
-            tags=("title",)
+            tags=("title", "frame")
         )
 
     def _create_chart_area(self):
@@ -153,7 +191,7 @@ class LineChart(ttk.Frame):
             fill=COLORS["background"],
             outline=COLORS["border"],
             width=1,
-            tags=("chart_bg",)
+            tags=("chart_bg", "frame")
         )
 
         # Create x-axis
@@ -162,7 +200,7 @@ class LineChart(ttk.Frame):
             *self.x_axis,
             fill=COLORS["text"],
             width=2,
-            tags=("x_axis",)
+            tags=("x_axis", "frame")
         )
 
         # Create y-axis
@@ -171,7 +209,7 @@ class LineChart(ttk.Frame):
             *self.y_axis,
             fill=COLORS["text"],
             width=2,
-            tags=("y_axis",)
+            tags=("y_axis", "frame")
         )
 
         # Add axis labels
@@ -182,7 +220,7 @@ class LineChart(ttk.Frame):
                 text=self.x_label,
                 fill=COLORS["text"],
                 font=("Helvetica", 10),
-                tags=("x_label",)
+                tags=("x_label", "frame")
             )
 
         if self.y_label:
@@ -193,20 +231,29 @@ class LineChart(ttk.Frame):
                 fill=COLORS["text"],
                 font=("Helvetica", 10),
                 angle=90,  # Rotated text
-                tags=("y_label",)
+                tags=("y_label", "frame")
             )
 
     def render(self):
-        """Render the chart with the current data."""
+        """
+        Render the chart with the current data.
+
+        Canvas items are kept per data label and tick and only updated where their
+        coordinates or text changed; items for labels that disappeared are deleted.
+        """
         if not self.data:
             return
 
-        # Clear previous elements
-        self._clear_chart_elements()
+        self.items.begin()
+        self.line_segments = []
+        self.markers = []
+        self.area = None
+        self.value_labels = []
+        self.grid_lines = []
+        self.marker_data = {}
 
-        # Calculate value range for y-axis
-        max_value = max(item.get(self.y_key, 0) for item in self.data)
-        min_value = min(item.get(self.y_key, 0) for item in self.data)
+        # Reduce the visible range to what the chart area can show
+        positions, samples, min_value, max_value = self._sample_points()
 
         # Add padding to value range
         value_range = max_value - min_value
@@ -241,8 +288,9 @@ class LineChart(ttk.Frame):
 
             # Draw grid line
             if self.show_grid and i > 0:
-                grid_line = self.canvas.create_line(
-                    left, y_pos, right, y_pos,
+                grid_line = self.items.line(
+                    ("grid_line", i),
+                    (left, y_pos, right, y_pos),
                     fill=COLORS["border"],
                     dash=(2, 4),
                     tags=("grid_line",)
@@ -250,15 +298,17 @@ class LineChart(ttk.Frame):
                 self.grid_lines.append(grid_line)
 
             # Draw y-axis tick
-            tick = self.canvas.create_line(
-                left - 5, y_pos, left, y_pos,
+            self.items.line(
+                ("y_tick", i),
+                (left - 5, y_pos, left, y_pos),
                 fill=COLORS["text"],
                 tags=("y_tick",)
             )
 
             # Draw y-axis label
             format_str = "{:.0f}" if value == int(value) else "{:.1f}"
-            label = self.canvas.create_text(
+            self.items.text(
+                ("y_label", i),
                 left - 10,
                 y_pos,
                 text=format_str.format(value),
@@ -269,23 +319,29 @@ class LineChart(ttk.Frame):
             )
 
         # Calculate x-axis positions
+        keys = unique_keys(item.get(self.x_key, f"Item {i}") for i, item in enumerate(samples))
         x_positions = []
-        for i, item in enumerate(self.data):
-            x_value = item.get(self.x_key, f"Item {i}")
-            x_pos = left + (i / (len(self.data) - 1 or 1)) * chart_width if len(self.data) > 1 else (left + right) // 2
-            x_positions.append((x_pos, x_value))
+        for position, key in zip(positions, keys):
+            x_pos = left + position * chart_width if len(samples) > 1 else (left + right) // 2
+            x_positions.append((x_pos, key[0]))
+
+        # Draw x-axis labels, thinned out so they do not overlap
+        label_step = max(1, math.ceil(len(x_positions) * MIN_LABEL_SPACING / max(1, chart_width)))
+        for i, (key, (x_pos, x_value)) in enumerate(zip(keys, x_positions)):
+            if i % label_step:
+                continue
 
-        # Draw x-axis labels
-        for i, (x_pos, x_value) in enumerate(x_positions):
             # Draw x-axis tick
-            self.canvas.create_line(
-                x_pos, bottom, x_pos, bottom + 5,
+            self.items.line(
+                ("x_tick", key),
+                (x_pos, bottom, x_pos, bottom + 5),
                 fill=COLORS["text"],
                 tags=("x_tick",)
             )
 
             # Draw x-axis label
-            self.canvas.create_text(
+            self.items.text(
+                ("x_label", key),
                 x_pos,
                 bottom + 15,
                 text=str(x_value),
@@ -298,13 +354,9 @@ class LineChart(ttk.Frame):
 
         # Calculate y positions and create points
         points = []
-        for i, item in enumerate(self.data):
+        for i, item in enumerate(samples):
             x_pos = x_positions[i][0]
-            y_value = item.get(self.y_key, 0)
-            try:
-                y_value = float(y_value)
-            except (ValueError, TypeError):
-                y_value = 0
+            y_value = self._numeric_value(item)
 
             # Calculate y position
             full_y_pos = bottom - ((y_value - min_value) / value_range) * chart_height
@@ -329,15 +381,11 @@ class LineChart(ttk.Frame):
             polygon_points.extend([points[-1][0], bottom, points[0][0], bottom])
 
             # Create area with transparent fill
-            if self.animate:
-                # Use transparency based on animation step
-                alpha = int(180 * (self.animation_step / self.animation_steps))
-                area_color = f"{self.area_color}80"  # 50% transparent
-            else:
-                area_color = f"{self.area_color}80"  # 50% transparent
+            area_color = f"{self.area_color}80"  # 50% transparent
 
-            self.area = self.canvas.create_polygon(
-                *polygon_points,
+            self.area = self.items.polygon(
+                "area",
+                polygon_points,
                 fill=area_color,
                 outline="",
                 tags=("area",)
@@ -348,8 +396,9 @@ class LineChart(ttk.Frame):
             x1, y1, _ = points[i]
             x2, y2, _ = points[i + 1]
 
-            line = self.canvas.create_line(
-                x1, y1, x2, y2,
+            line = self.items.line(
+                ("line_segment", keys[i]),
+                (x1, y1, x2, y2),
                 fill=self.line_color,
                 width=self.line_width,
                 smooth=True,
@@ -360,9 +409,10 @@ class LineChart(ttk.Frame):
         # Draw markers and value labels
         for i, (x_pos, y_pos, y_value) in enumerate(points):
             if self.show_markers:
-                marker = self.canvas.create_oval(
-                    x_pos - self.marker_size, y_pos - self.marker_size,
-                    x_pos + self.marker_size, y_pos + self.marker_size,
+                marker = self.items.oval(
+                    ("marker", keys[i]),
+                    (x_pos - self.marker_size, y_pos - self.marker_size,
+                     x_pos + self.marker_size, y_pos + self.marker_size),
                     fill=COLORS["background"],
                     outline=self.line_color,
                     width=2,
@@ -370,15 +420,16 @@ class LineChart(ttk.Frame):
                 )
                 self.markers.append(marker)
 
-                # Store data with the marker for tooltips
-                self.canvas.itemconfig(marker, data=(x_positions[i][1], y_value))
+                # Keep data with the marker for tooltips
+                self.marker_data[marker] = (x_positions[i][1], y_value)
 
             if self.show_values:
                 # Format value text
                 value_text = str(int(y_value)) if y_value == int(y_value) else f"{y_value:.1f}"
 
                 # Create value label
-                value_label = self.canvas.create_text(
+                value_label = self.items.text(
+                    ("value_label", keys[i]),
                     x_pos,
                     y_pos - self.marker_size - 8,
                     text=value_text,
@@ -389,56 +440,181 @@ class LineChart(ttk.Frame):
                 )
                 self.value_labels.append(value_label)
 
-        # Start animation if needed
-        if self.animate and self.animation_step < self.animation_steps:
-            self.animation_step += 1
-            self.after(self.animation_duration // self.animation_steps, self.render)
+        self.items.end()
 
-    def _clear_chart_elements(self):
-        """Clear the chart elements."""
-        # Clear line segments
-        for line in self.line_segments:
-            self.canvas.delete(line)
-        self.line_segments = []
+        # Continue animation if needed
+        if self.animate and self.animation_step < self.animation_steps and self._animation_pending is None:
+            self._animation_pending = self.after(
+                self.animation_duration // self.animation_steps, self._next_animation_step)
 
-        # Clear markers
-        for marker in self.markers:
-            self.canvas.delete(marker)
-        self.markers = []
+    def _sample_points(self):
+        """
+        Get the points to draw for the visible range.
 
-        # Clear area
-        if self.area:
-            self.canvas.delete(self.area)
-            self.area = None
+        Ranges longer than the point budget are reduced with LTTB. The result is
+        cached until the data, zoom or chart size changes, so animation frames and
+        repeated renders do not resample.
 
-        # Clear value labels
-        for label in self.value_labels:
-            self.canvas.delete(label)
-        self.value_labels = []
+        Returns:
+            Tuple of (x positions as fractions of the chart width, data items,
+            smallest value, largest value)
+        """
+        size = len(self.data)
+        start, end = self.view_range or (0, size)
+        start, end = max(0, min(start, size - 1)), max(1, min(end, size))
+        left, _, right, _ = self.chart_area
+        budget = max(3, self.max_points or int(right - left))
+
+        cache_key = (size, start, end, budget)
+        if self._sample_cache is not None and self._sample_cache[0] == cache_key:
+            return self._sample_cache[1]
+
+        window = self.data[start:end]
+        values = np.fromiter((self._numeric_value(item) for item in window), dtype=np.float64, count=len(window))
+        if len(window) > budget:
+            indices = lttb_indices(values, budget)
+        else:
+            indices = np.arange(len(window))
+
+        span = max(1, len(window) - 1)
+        result = (
+            (indices / span).tolist(),
+            [window[i] for i in indices],
+            float(values.min()),
+            float(values.max())
+        )
+        self._sample_cache = (cache_key, result)
+        return result
 
-        # Clear grid lines
-        for line in self.grid_lines:
-            self.canvas.delete(line)
-        self.grid_lines = []
+    def _numeric_value(self, item) -> float:
+        """
+        Get the y value of a data item as a number.
+
+        Args:
+            item: Data dictionary
+
+        Returns:
+            The value, or 0 if it is not numeric
+        """
+        try:
+            return float(item.get(self.y_key, 0))
+        except (ValueError, TypeError):
+            return 0.0
+
+    def zoom(self, factor: float, anchor: float = 0.5):
+        """
+        Zoom the visible range of the series.
 
-        # Clear existing x-axis labels and ticks
-        self.canvas.delete("x_label")
-        self.canvas.delete("x_tick")
+        Args:
+            factor: Share of the current range to show (below 1 zooms in)
+            anchor: Position within the chart width, 0 to 1, that stays in place
+        """
+        size = len(self.data)
+        start, end = self.view_range or (0, size)
+        span = end - start
+        new_span = max(min(MIN_ZOOM_POINTS, size), int(round(span * factor)))
+
+        if new_span >= size:
+            self.view_range = None
+        else:
+            center = start + anchor * span
+            new_start = int(round(center - anchor * new_span))
+            new_start = max(0, min(new_start, size - new_span))
+            self.view_range = (new_start, new_start + new_span)
+
+        if self.view_range != (start, end):
+            self._schedule_render()
+
+    def reset_zoom(self):
+        """Show the whole series again."""
+        if self.view_range is not None:
+            self.view_range = None
+            self._schedule_render()
+
+    def _on_mouse_wheel(self, event):
+        """
+        Zoom around the cursor on mouse wheel movement.
+
+        Args:
+            event: The mouse wheel event
+        """
+        if not self.data or not self.chart_area:
+            return
+        zoom_in = event.num == 4 or getattr(event, "delta", 0) > 0
+        left, _, right, _ = self.chart_area
+        anchor = min(1.0, max(0.0, (event.x - left) / max(1, right - left)))
+        self.zoom(ZOOM_STEP if zoom_in else 1 / ZOOM_STEP, anchor)
+
+    def _on_resize(self, event):
+        """
+        Lay the chart out again for a new canvas size.
+
+        Args:
+            event: The configure event
+        """
+        border = int(self.canvas.cget("highlightthickness")) + int(self.canvas.cget("borderwidth"))
+        width, height = event.width - 2 * border, event.height - 2 * border
+        if width < 100 or height < 100 or (width, height) == (self.chart_width, self.chart_height):
+            return
 
-        # Clear existing y-axis labels and ticks
-        self.canvas.delete("y_label")
-        self.canvas.delete("y_tick")
+        self.chart_width, self.chart_height = width, height
+        self.canvas.delete("frame")
+        self._create_title()
+        self._create_chart_area()
+        self._schedule_render()
+
+    def _next_animation_step(self):
+        """Advance the initial animation by one frame."""
+        self._animation_pending = None
+        self.animation_step += 1
+        self.render()
+
+    def _clear_chart_elements(self):
+        """Clear the chart elements."""
+        self.items.clear()
+        self.line_segments = []
+        self.markers = []
+        self.area = None
+        self.value_labels = []
+        self.grid_lines = []
+        self.marker_data = {}
 
     def update_data(self, data: List[Dict[str, Any]]):
         """
         Update the chart with new data.
 
+        The redraw happens once the event loop is idle, so several updates in a row
+        cost a single render, and the existing points move to their new values rather
+        than being rebuilt.
+
         Args:
             data: List of dictionaries with chart data
         """
         self.data = data
-        self.animation_step = 0  # Reset animation
-        self.render()
+        self.view_range = None
+        self._sample_cache = None
+        self._schedule_render()
+
+    def _schedule_render(self):
+        """Redraw the chart once the event loop is idle."""
+        if self._render_pending is None:
+            self._render_pending = self.after_idle(self._render_when_idle)
+
+    def _render_when_idle(self):
+        """Run a redraw scheduled by update_data."""
+        self._render_pending = None
+        if self.data:
+            self.render()
+        else:
+            self._clear_chart_elements()
+
+    def destroy(self):
+        """Cancel pending redraws and destroy the chart."""
+        for pending in (self._render_pending, self._animation_pending):
+            if pending is not None:
+                self.after_cancel(pending)
+        self._render_pending = self._animation_pending = None
+        super().destroy()
 
     def _create_tooltip(self, x: int, y: int, text: str):
         """
@@ -488,9 +664,9 @@ class LineChart(ttk.Frame):
             bbox = self.canvas.bbox(marker)
             if bbox and bbox[0] <= event.x <= bbox[2] and bbox[1] <= event.y <= bbox[3]:
                 # Get data from marker
-                data = self.canvas.itemcget(marker, "data")
+                data = self.marker_data.get(marker)
                 if data:
-                    x_value, y_value = eval(data)
+                    x_value, y_value = data
                     tooltip_text = f"{x_value}: {y_value}"
                     self._create_tooltip(event.x + 10, event.y - 10, tooltip_text)
                 return
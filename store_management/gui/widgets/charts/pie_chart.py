@@ -11,6 +11,7 @@ from tkinter import ttk
 from typing import Any, Dict, List, Optional, Tuple
 
 from gui.theme import COLORS
+from gui.widgets.charts.canvas_items import CanvasItemPool, unique_keys
 
 
 class PieChart(ttk.Frame):
@@ -74,8 +75,12 @@ class PieChart(ttk.Frame):
         self.labels = []
         self.percentage_labels = []
         self.legend_items = []
+        self.segment_data = {}
+        self.items = None
         self.tooltip = None
         self.tooltip_visible = False
+        self._render_pending = None
+        self._animation_pending = None
 
         # Layout
         self.padding = 40  # Padding around the chart
@@ -103,6 +108,7 @@ class PieChart(ttk.Frame):
             bg=COLORS["background"]
         )
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.items = CanvasItemPool(self.canvas)
 
         # Create chart elements
         self._create_title()
@@ -123,19 +129,29 @@ class PieChart(ttk.Frame):
         )
 
     def render(self):
-        """Render the chart with the current data."""
+        """
+        Render the chart with the current data.
+
+        Canvas items are kept per segment label and only updated where their shape,
+        color or text changed; items for labels that disappeared are deleted.
+        """
         if not self.data:
             return
 
-        # Clear previous elements
-        self._clear_chart_elements()
+        self.items.begin()
+        self.segments = []
+        self.labels = []
+        self.percentage_labels = []
+        self.legend_items = []
+        self.segment_data = {}
 
         # Filter out zero or negative values
         filtered_data = [item for item in self.data if item.get(self.value_key, 0) > 0]
 
         if not filtered_data:
             # Display "No Data" message if no valid data
-            self.canvas.create_text(
+            self.items.text(
+                "no_data",
                 self.chart_width // 2,
                 self.chart_height // 2,
                 text="No Data",
@@ -143,6 +159,7 @@ class PieChart(ttk.Frame):
                 font=("Helvetica", 12),
                 tags=("no_data",)
             )
+            self.items.end()
             return
 
         # Calculate total value
@@ -150,6 +167,7 @@ class PieChart(ttk.Frame):
 
         if total_value <= 0:
             # Cannot create pie chart with non-positive total
+            self.items.end()
             return
 
         # Calculate chart center and radius
@@ -170,9 +188,10 @@ class PieChart(ttk.Frame):
         # Prepare segments for animation
         segment_data = []
 
-        for i, item in enumerate(filtered_data):
+        keys = unique_keys(item.get(self.label_key, f"Item {i}") for i, item in enumerate(filtered_data))
+        for i, (item, key) in enumerate(zip(filtered_data, keys)):
             value = item.get(self.value_key, 0)
-            label = item.get(self.label_key, f"Item {i}")
+            label = key[0]
 
             # Calculate segment angles
             angle = (value / total_value) * 360
@@ -184,6 +203,7 @@ class PieChart(ttk.Frame):
 
             # Store segment data
             segment_data.append({
+                "key": key,
                 "start_angle": start_angle,
                 "end_angle": end_angle,
                 "color": color,
@@ -197,6 +217,8 @@ class PieChart(ttk.Frame):
 
         # Draw segments with animation if needed
         for i, segment in enumerate(segment_data):
+            key = segment["key"]
+
             # Calculate animation angles
             if self.animate:
                 current_end_angle = segment["start_angle"] + (
@@ -211,20 +233,24 @@ class PieChart(ttk.Frame):
                 continue
 
             # Create segment
-            pie_segment = self._create_arc(
-                center_x, center_y,
-                radius, inner_radius,
-                segment["start_angle"],
-                current_end_angle,
-                segment["color"]
+            pie_segment = self.items.polygon(
+                ("segment", key),
+                self._arc_coords(
+                    center_x, center_y,
+                    radius, inner_radius,
+                    segment["start_angle"],
+                    current_end_angle
+                ),
+                fill=segment["color"],
+                outline=COLORS["background"],
+                width=1,
+                smooth=True,
+                tags=(f"segment_{i}", "segment")
             )
 
-            # Store the segment
+            # Store the segment and its data for tooltips
             self.segments.append(pie_segment)
-
-            # Store segment data for tooltips
-            self.canvas.itemconfig(pie_segment, tags=(f"segment_{i}", "segment"))
-            self.canvas.itemconfig(pie_segment, data=(segment["label"], segment["value"], segment["percentage"]))
+            self.segment_data[pie_segment] = (segment["label"], segment["value"], segment["percentage"])
 
             # Add label and percentage if needed and segment is big enough
             if (self.show_labels or self.show_percentages) and (segment["end_angle"] - segment["start_angle"] >= 10):
@@ -238,11 +264,12 @@ class PieChart(ttk.Frame):
                 # Add label
                 if self.show_labels:
                     # Truncate long labels
-                    display_label = segment["label"]
+                    display_label = str(segment["label"])
                     if len(display_label) > 10:
                         display_label = display_label[:10] + "..."
 
-                    label = self.canvas.create_text(
+                    label = self.items.text(
+                        ("label", key),
                         label_x, label_y,
                         text=display_label,
                         fill="white",  # Use white for visibility on colored segments
@@ -259,7 +286,8 @@ class PieChart(ttk.Frame):
                     # Adjust position for percentage
                     perc_y = label_y + 12 if self.show_labels else label_y
 
-                    percentage = self.canvas.create_text(
+                    percentage = self.items.text(
+                        ("percentage", key),
                         label_x, perc_y,
                         text=percentage_text,
                         fill="white",  # Use white for visibility on colored segments
@@ -276,17 +304,21 @@ class PieChart(ttk.Frame):
             legend_spacing = 25
 
             for i, segment in enumerate(segment_data):
+                key = segment["key"]
+
                 # Create legend color box
-                color_box = self.canvas.create_rectangle(
-                    legend_x, legend_y + i * legend_spacing,
-                              legend_x + 15, legend_y + i * legend_spacing + 15,
+                color_box = self.items.rectangle(
+                    ("legend_box", key),
+                    (legend_x, legend_y + i * legend_spacing,
+                     legend_x + 15, legend_y + i * legend_spacing + 15),
                     fill=segment["color"],
                     outline=COLORS["border"],
                     tags=(f"legend_box_{i}", "legend")
                 )
 
                 # Create legend label
-                legend_label = self.canvas.create_text(
+                legend_label = self.items.text(
+                    ("legend_label", key),
                     legend_x + 20, legend_y + i * legend_spacing + 7,
                     text=segment["label"],
                     fill=COLORS["text"],
@@ -296,7 +328,8 @@ class PieChart(ttk.Frame):
                 )
 
                 # Create legend percentage
-                legend_percentage = self.canvas.create_text(
+                legend_percentage = self.items.text(
+                    ("legend_percentage", key),
                     legend_x + 120, legend_y + i * legend_spacing + 7,
                     text=f"{segment['percentage']:.1f}%",
                     fill=COLORS["text"],
@@ -307,14 +340,22 @@ class PieChart(ttk.Frame):
 
                 self.legend_items.extend([color_box, legend_label, legend_percentage])
 
+        self.items.end()
+
         # Continue animation if needed
-        if self.animate and self.animation_step < self.animation_steps:
-            self.animation_step += 1
-            self.after(self.animation_duration // self.animation_steps, self.render)
+        if self.animate and self.animation_step < self.animation_steps and self._animation_pending is None:
+            self._animation_pending = self.after(
+                self.animation_duration // self.animation_steps, self._next_animation_step)
+
+    def _next_animation_step(self):
+        """Advance the initial animation by one frame."""
+        self._animation_pending = None
+        self.animation_step += 1
+        self.render()
 
-    def _create_arc(self, center_x, center_y, radius, inner_radius, start_angle, end_angle, fill_color):
+    def _arc_coords(self, center_x, center_y, radius, inner_radius, start_angle, end_angle):
         """
-        Create a pie segment or donut segment.
+        Calculate the outline of a pie segment or donut segment.
 
         Args:
             center_x: X coordinate of center
@@ -323,10 +364,9 @@ class PieChart(ttk.Frame):
             inner_radius: Inner radius (0 for pie chart)
             start_angle: Start angle in degrees
             end_angle: End angle in degrees
-            fill_color: Segment color
 
         Returns:
-            Canvas polygon ID
+            Flat list of polygon coordinates
         """
         # Convert angles to radians
         start_angle_rad = math.radians(start_angle - 90)  # -90 to start at 12 o'clock
@@ -369,54 +409,51 @@ class PieChart(ttk.Frame):
             # Regular pie chart - add center point
             points = outer_points + [(center_x, center_y)]
 
-        # Create polygon for segment
+        # Flatten the outline into polygon coordinates
         coords = []
         for x, y in points:
             coords.extend([x, y])
-
-        return self.canvas.create_polygon(
-            *coords,
-            fill=fill_color,
-            outline=COLORS["background"],
-            width=1,
-            smooth=True
-        )
+        return coords
 
     def _clear_chart_elements(self):
         """Clear the chart elements."""
-        # Clear segments
-        for segment in self.segments:
-            self.canvas.delete(segment)
+        self.items.clear()
         self.segments = []
-
-        # Clear labels
-        for label in self.labels:
-            self.canvas.delete(label)
         self.labels = []
-
-        # Clear percentage labels
-        for label in self.percentage_labels:
-            self.canvas.delete(label)
         self.percentage_labels = []
-
-        # Clear legend items
-        for item in self.legend_items:
-            self.canvas.delete(item)
         self.legend_items = []
-
-        # Clear no data message
-        self.canvas.delete("no_data")
+        self.segment_data = {}
 
     def update_data(self, data: List[Dict[str, Any]]):
         """
         Update the chart with new data.
 
+        The redraw happens once the event loop is idle, so several updates in a row
+        cost a single render, and the existing segments are reshaped rather than
+        rebuilt.
+
         Args:
             data: List of dictionaries with chart data
         """
         self.data = data
-        self.animation_step = 0  # Reset animation
-        self.render()
+        if self._render_pending is None:
+            self._render_pending = self.after_idle(self._render_when_idle)
+
+    def _render_when_idle(self):
+        """Run a redraw scheduled by update_data."""
+        self._render_pending = None
+        if self.data:
+            self.render()
+        else:
+            self._clear_chart_elements()
+
+    def destroy(self):
+        """Cancel pending redraws and destroy the chart."""
+        for pending in (self._render_pending, self._animation_pending):
+            if pending is not None:
+                self.after_cancel(pending)
+        self._render_pending = self._animation_pending = None
+        super().destroy()
 
     def _create_tooltip(self, x: int, y: int, text: str):
         """
@@ -467,9 +504,9 @@ class PieChart(ttk.Frame):
             tags = self.canvas.gettags(segment_id)
             if "segment" in tags:
                 # Get data from segment
-                data = self.canvas.itemcget(segment_id, "data")
+                data = self.segment_data.get(segment_id)
                 if data:
-                    label, value, percentage = eval(data)
+                    label, value, percentage = data
                     tooltip_text = f"{label}: {value} ({percentage:.1f}%)"
                     self._create_tooltip(event.x + 10, event.y - 10, tooltip_text)
                 return
@@ -2,11 +2,14 @@
 """
 Enhanced Treeview widget with sorting, filtering, and improved interaction.
 Extends the standard ttk.Treeview with additional functionality.
+
+In virtual mode rows live in a backing store and only the rows visible in the
+viewport exist as Tk items; scrolling rewrites those items in place.
 """
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from gui import theme, config
 
@@ -19,6 +22,7 @@ class EnhancedTreeview(ttk.Treeview):
     - Selection tracking
     - Double-click handling
     - Status-based styling
+    - Optional virtual mode for large row counts
     """
 
     def __init__(
@@ -29,6 +33,7 @@ class EnhancedTreeview(ttk.Treeview):
             on_select: Optional[Callable[[], None]] = None,
             on_double_click: Optional[Callable[[], None]] = None,
             status_column: Optional[str] = None,
+            virtual: bool = False,
             **kwargs
     ):
         """
@@ -41,6 +46,9 @@ class EnhancedTreeview(ttk.Treeview):
             on_select: Callback when an item is selected
             on_double_click: Callback when an item is double-clicked
             status_column: Column containing status values for styling
+            virtual: Keep rows in a backing store and only materialize visible rows.
+                Sorting and filtering then run against the store instead of calling on_sort,
+                unless the store holds only one page of a larger result (see set_total_rows).
             **kwargs: Additional arguments for ttk.Treeview
         """
         super().__init__(parent, columns=columns, **kwargs)
@@ -51,6 +59,26 @@ class EnhancedTreeview(ttk.Treeview):
         self.on_double_click_callback = on_double_click
         self.status_column = status_column
         self.columns = columns
+        self._status_index = columns.index(status_column) if status_column in columns else None
+
+        # Rows inserted through insert_item, for alternating row colors
+        self._row_count = 0
+
+        # Virtual mode state: row values and IDs in insertion order, the indexes of the
+        # rows currently shown (filtered and sorted), the Tk items recycled for the
+        # viewport, and the position of the first visible row
+        self.virtual = virtual
+        self._rows: List[Sequence[Any]] = []
+        self._row_ids: List[str] = []
+        self._view: List[int] = []
+        self._filter: Optional[Callable[[Sequence[Any]], bool]] = None
+        self._pool: List[str] = []
+        self._pool_rows: Dict[str, int] = {}
+        self._offset = 0
+        self._selected_ids: set = set()
+        self._render_pending = None
+        # Size of the full result when the store holds only one page of it
+        self._total_rows: Optional[int] = None
 
         # Create scrollbars
         self._create_scrollbars(parent)
@@ -64,6 +92,9 @@ class EnhancedTreeview(ttk.Treeview):
         self.bind("<<TreeviewSelect>>", self._on_select)
         self.bind("<Double-1>", self._on_double_click)
 
+        if self.virtual:
+            self._setup_virtual_scrolling()
+
         # Configure tag styles for status values
         self._setup_tags()
 
@@ -78,10 +109,16 @@ class EnhancedTreeview(ttk.Treeview):
         Args:
             parent: The parent widget
         """
-        # Create vertical scrollbar
-        scrollbar_y = ttk.Scrollbar(parent, orient="vertical", command=self.yview)
+        # Create vertical scrollbar; in virtual mode it tracks the backing store, not the Tk items
+        scrollbar_y = ttk.Scrollbar(
+            parent,
+            orient="vertical",
+            command=self._virtual_yview if self.virtual else self.yview
+        )
         scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
-        self.configure(yscrollcommand=scrollbar_y.set)
+        self.scrollbar_y = scrollbar_y
+        if not self.virtual:
+            self.configure(yscrollcommand=scrollbar_y.set)
 
         # Create horizontal scrollbar
         scrollbar_x = ttk.Scrollbar(parent, orient="horizontal", command=self.xview)
@@ -128,6 +165,12 @@ class EnhancedTreeview(ttk.Treeview):
         # Update column headers to show sort direction
         self._update_sort_indicators()
 
+        # Sort locally when the store holds every row; a single page of a larger
+        # result has to be sorted by the source through the callback
+        if self.virtual and not self.is_partial():
+            self.sort_rows(column, self.sort_direction)
+            return
+
         # Call sort callback if provided
         if self.on_sort_callback:
             self.on_sort_callback(column, self.sort_direction)
@@ -152,6 +195,10 @@ class EnhancedTreeview(ttk.Treeview):
         Args:
             event: The TreeviewSelect event
         """
+        if self.virtual and not self._sync_selection():
+            # Selection only moved with the recycled rows during a scroll
+            return
+
         if self.on_select_callback:
             self.on_select_callback()
 
@@ -172,6 +219,9 @@ class EnhancedTreeview(ttk.Treeview):
         """
         Insert an item into the treeview with proper styling.
 
+        In virtual mode the row is appended to the backing store and the viewport
+        is redrawn once the current batch of inserts is done.
+
         Args:
             item_id: The item identifier
             values: List of values for the item
@@ -179,26 +229,350 @@ class EnhancedTreeview(ttk.Treeview):
         Returns:
             The item identifier
         """
-        # Determine row tags (for alternating colors)
-        row_count = len(self.get_children())
-        row_tag = "even_row" if row_count % 2 == 0 else "odd_row"
-
-        # Determine status tag if applicable
-        tags = [row_tag]
-        if self.status_column and self.status_column in self.columns:
-            status_index = self.columns.index(self.status_column)
-            if status_index < len(values):
-                status_value = str(values[status_index]).lower()
-                status_tag = f"status_{status_value}"
-                tags.append(status_tag)
+        if self.virtual:
+            index = len(self._rows)
+            self._rows.append(tuple(values))
+            self._row_ids.append(str(item_id))
+            if self._filter is None or self._filter(self._rows[index]):
+                self._view.append(index)
+            self._schedule_render()
+            return str(item_id)
+
+        tags = self._row_tags(self._row_count, values)
+        self._row_count += 1
 
         # Insert the item
         return self.insert("", "end", iid=str(item_id), values=values, tags=tags)
 
     def clear(self):
         """Clear all items from the treeview."""
-        for item in self.get_children():
-            self.delete(item)
+        if self.virtual:
+            self._rows = []
+            self._row_ids = []
+            self._view = []
+            self._offset = 0
+            self._selected_ids = set()
+            self._schedule_render()
+            return
+
+        children = self.get_children()
+        if children:
+            self.delete(*children)
+        self._row_count = 0
+
+    def _row_tags(self, position, values):
+        """
+        Build the tags for a row.
+
+        Args:
+            position: Display position of the row, for alternating colors
+            values: List of values for the row
+
+        Returns:
+            List of tag names
+        """
+        tags = ["even_row" if position % 2 == 0 else "odd_row"]
+        if self._status_index is not None and self._status_index < len(values):
+            tags.append(f"status_{str(values[self._status_index]).lower()}")
+        return tags
+
+    # Virtual mode
+
+    def set_total_rows(self, total: Optional[int]):
+        """
+        Set the size of the full result the backing store shows a page of.
+
+        Args:
+            total: Total row count, or None if the store holds every row
+        """
+        self._total_rows = total
+
+    def is_partial(self) -> bool:
+        """
+        Check whether the backing store holds only part of the result.
+
+        Returns:
+            True if the total row count exceeds the loaded rows
+        """
+        return self._total_rows is not None and self._total_rows > len(self._rows)
+
+    def sort_rows(self, column, direction="asc"):
+        """
+        Sort the backing store by a column.
+
+        Numbers sort numerically and before text; empty values sort last.
+
+        Args:
+            column: The column identifier
+            direction: 'asc' or 'desc'
+        """
+        if not self.virtual or column not in self.columns:
+            return
+
+        self.sort_column = column
+        self.sort_direction = direction
+        index = self.columns.index(column)
+        rows = self._rows
+
+        def sort_key(row_index):
+            value = rows[row_index][index] if index < len(rows[row_index]) else None
+            if value is None or value == "":
+                return (2, "")
+            if isinstance(value, (int, float)):
+                return (0, value)
+            try:
+                return (0, float(value))
+            except (TypeError, ValueError):
+                return (1, str(value).lower())
+
+        self._view.sort(key=sort_key, reverse=direction == "desc")
+        self._offset = 0
+        self._render()
+
+    def set_filter(self, predicate: Optional[Callable[[Sequence[Any]], bool]]):
+        """
+        Show only rows whose values match a predicate.
+
+        Args:
+            predicate: Function taking a row's values and returning True to show it,
+                or None to show every row
+        """
+        if not self.virtual:
+            return
+
+        self._filter = predicate
+        self._view = [
+            index for index, row in enumerate(self._rows)
+            if predicate is None or predicate(row)
+        ]
+        if self.sort_column:
+            self.sort_rows(self.sort_column, self.sort_direction)
+        else:
+            self._offset = 0
+            self._render()
+
+    def iter_rows(self) -> Iterator[Tuple[str, Sequence[Any]]]:
+        """
+        Iterate over the rows currently shown, in display order.
+
+        Returns:
+            Iterator of (item_id, values) pairs
+        """
+        if not self.virtual:
+            for iid in self.get_children():
+                yield iid, self.item(iid, "values")
+            return
+
+        for index in self._view:
+            yield self._row_ids[index], self._rows[index]
+
+    def row_count(self) -> int:
+        """
+        Get the number of rows currently shown.
+
+        Returns:
+            Number of rows after filtering
+        """
+        return len(self._view) if self.virtual else len(self.get_children())
+
+    def select_item_id(self, item_id):
+        """
+        Select a row by item ID and scroll it into view.
+
+        Args:
+            item_id: The item identifier
+
+        Returns:
+            True if the row was found
+        """
+        item_id = str(item_id)
+        if not self.virtual:
+            if not self.exists(item_id):
+                return False
+            self.selection_set(item_id)
+            self.see(item_id)
+            return True
+
+        try:
+            index = self._row_ids.index(item_id)
+            position = self._view.index(index)
+        except ValueError:
+            return False
+
+        self._selected_ids = {item_id}
+        visible = max(1, len(self._pool))
+        if not self._offset <= position < self._offset + visible:
+            self._offset = position
+        self._render()
+        return True
+
+    def _setup_virtual_scrolling(self):
+        """Route scrolling and resizing through the backing store."""
+        self.bind("<Configure>", lambda event: self._schedule_render(), add="+")
+        self.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.bind("<Button-4>", lambda event: self._scroll_rows(-3))
+        self.bind("<Button-5>", lambda event: self._scroll_rows(3))
+        self.bind("<Prior>", lambda event: self._scroll_pages(-1))
+        self.bind("<Next>", lambda event: self._scroll_pages(1))
+        self.bind("<Up>", self._on_key_up)
+        self.bind("<Down>", self._on_key_down)
+
+    def _schedule_render(self):
+        """Redraw the viewport once the current burst of changes is done."""
+        if self._render_pending is None:
+            self._render_pending = self.after_idle(self._render)
+
+    def _visible_row_count(self):
+        """
+        Get the number of rows that fit in the viewport.
+
+        Returns:
+            Number of visible rows
+        """
+        if self._pool:
+            bbox = self.bbox(self._pool[0])
+            if bbox:
+                top, height = bbox[1], bbox[3]
+                return max(1, (self.winfo_height() - top) // max(1, height))
+        return max(1, int(self.cget("height") or 10))
+
+    def _render(self):
+        """Rewrite the recycled Tk items with the rows at the current scroll position."""
+        self._render_pending = None
+        total = len(self._view)
+        visible = self._visible_row_count()
+        self._offset = max(0, min(self._offset, total - visible))
+
+        # Grow or shrink the item pool to the number of rows on screen
+        wanted = min(visible, total)
+        while len(self._pool) < wanted:
+            self._pool.append(self.insert("", "end", values=()))
+        if len(self._pool) > wanted:
+            self.delete(*self._pool[wanted:])
+            del self._pool[wanted:]
+
+        self._pool_rows = {}
+        selected = []
+        for position, iid in enumerate(self._pool):
+            index = self._view[self._offset + position]
+            values = self._rows[index]
+            self.item(iid, values=values, tags=self._row_tags(self._offset + position, values))
+            self._pool_rows[iid] = index
+            if self._row_ids[index] in self._selected_ids:
+                selected.append(iid)
+
+        # Keep the Tk items pinned at the top; scrolling is done by rewriting them
+        self.yview_moveto(0)
+
+        if tuple(self.selection()) != tuple(selected):
+            self.selection_set(selected)
+
+        if total:
+            self.scrollbar_y.set(self._offset / total, min(1.0, (self._offset + wanted) / total))
+        else:
+            self.scrollbar_y.set(0.0, 1.0)
+
+    def _sync_selection(self):
+        """
+        Merge the Tk selection on the visible rows into the selected row IDs.
+
+        Returns:
+            True if the set of selected rows changed
+        """
+        visible_ids = {self._row_ids[index] for index in self._pool_rows.values()}
+        selected_ids = (self._selected_ids - visible_ids) | {
+            self._row_ids[self._pool_rows[iid]] for iid in self.selection() if iid in self._pool_rows
+        }
+        changed = selected_ids != self._selected_ids
+        self._selected_ids = selected_ids
+        return changed
+
+    def _scroll_rows(self, count):
+        """
+        Scroll the viewport by a number of rows.
+
+        Args:
+            count: Rows to scroll, negative to scroll up
+        """
+        offset = self._offset
+        self._offset = max(0, min(self._offset + count, len(self._view) - len(self._pool)))
+        if self._offset != offset:
+            self._render()
+        return "break"
+
+    def _scroll_pages(self, count):
+        """
+        Scroll the viewport by a number of pages.
+
+        Args:
+            count: Pages to scroll, negative to scroll up
+        """
+        return self._scroll_rows(count * max(1, len(self._pool) - 1))
+
+    def _virtual_yview(self, *args):
+        """
+        Handle scrollbar commands in virtual mode.
+
+        Args:
+            *args: Scrollbar command ('moveto', fraction) or ('scroll', count, 'units'|'pages')
+        """
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._offset = int(float(args[1]) * len(self._view))
+            self._render()
+        elif args[0] == "scroll":
+            count = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                self._scroll_pages(count)
+            else:
+                self._scroll_rows(count)
+
+    def _on_mouse_wheel(self, event):
+        """
+        Scroll the viewport with the mouse wheel.
+
+        Args:
+            event: The MouseWheel event
+        """
+        return self._scroll_rows(-3 if event.delta > 0 else 3)
+
+    def _on_key_up(self, event):
+        """
+        Scroll up when moving the focus above the first visible row.
+
+        Args:
+            event: The Up key event
+        """
+        if self._pool and self.focus() == self._pool[0] and self._offset > 0:
+            self._move_selection(-1)
+            return "break"
+
+    def _on_key_down(self, event):
+        """
+        Scroll down when moving the focus below the last visible row.
+
+        Args:
+            event: The Down key event
+        """
+        if self._pool and self.focus() == self._pool[-1] and self._offset + len(self._pool) < len(self._view):
+            self._move_selection(1)
+            return "break"
+
+    def _move_selection(self, count):
+        """
+        Scroll by rows while keeping keyboard focus and selection on the edge row.
+
+        Args:
+            count: Rows to move, negative to move up
+        """
+        edge = self._pool[0] if count < 0 else self._pool[-1]
+        self._scroll_rows(count)
+        self._selected_ids = {self._row_ids[self._pool_rows[edge]]}
+        self._render()
+        self.focus(edge)
+        if self.on_select_callback:
+            self.on_select_callback()
 
     def set_column_widths(self, widths):
         """
@@ -218,6 +592,12 @@ class EnhancedTreeview(ttk.Treeview):
         Returns:
             List of values for the selected item, or None if no selection
         """
+        if self.virtual:
+            selected = self.get_selected_ids()
+            if not selected:
+                return None
+            return self._rows[self._row_ids.index(selected[0])]
+
         selection = self.selection()
         if not selection:
             return None
@@ -231,8 +611,23 @@ class EnhancedTreeview(ttk.Treeview):
         Returns:
             The ID of the selected item, or None if no selection
         """
-        selection = self.selection()
+        selection = self.get_selected_ids()
         if not selection:
             return None
 
-        return selection[0]
\ No newline at end of file
+        return selection[0]
+
+    def get_selected_ids(self):
+        """
+        Get the IDs of all selected items, including rows scrolled out of view.
+
+        Returns:
+            List of selected item IDs in display order
+        """
+        if not self.virtual:
+            return list(self.selection())
+
+        # Visible selection first, so the row the user just clicked comes first
+        visible = [self._row_ids[self._pool_rows[iid]] for iid in self.selection() if iid in self._pool_rows]
+        hidden = [item_id for item_id in self._row_ids if item_id in self._selected_ids and item_id not in visible]
+        return visible + hidden
\ No newline at end of file
@@ -47,6 +47,9 @@ class SearchFrame(ttk.LabelFrame):
     """
     Frame for search and filter controls.
     Provides a customizable search interface for list views.
+
+    In incremental mode the search runs as the user types: edits are debounced and the
+    callback fires once the fields have been left alone for ``debounce_ms``.
     """
 
     def __init__(
@@ -54,7 +57,9 @@ class SearchFrame(ttk.LabelFrame):
             parent,
             search_fields: List[Dict[str, Any]],
             on_search: Callable[[Dict[str, Any]], None],
-            title: str = "Search"
+            title: str = "Search",
+            incremental: bool = False,
+            debounce_ms: int = config.SEARCH_DEBOUNCE_MS
     ):
         """
         Initialize the search frame.
@@ -64,13 +69,19 @@ class SearchFrame(ttk.LabelFrame):
             search_fields: List of search field configurations
             on_search: Callback when search is performed (receives search criteria)
             title: Title for the frame
+            incremental: Whether to search while the user types
+            debounce_ms: Quiet period after the last edit before an incremental search runs
         """
         super().__init__(parent, text=title, padding=5)
 
         self.parent = parent
         self.on_search_callback = on_search
+        self.incremental = incremental
+        self.debounce_ms = debounce_ms
         self.search_fields = []
         self.field_widgets = {}
+        self._pending_search = None
+        self._last_criteria = None
 
         # Convert field configurations to SearchField objects
         for field_config in search_fields:
@@ -167,6 +178,11 @@ class SearchFrame(ttk.LabelFrame):
             # Store reference to widget
             self.field_widgets[field.name] = field.widget
 
+            if self.incremental:
+                field.var.trace_add("write", self._schedule_search)
+            if isinstance(field.widget, ttk.Entry):
+                field.widget.bind("<Return>", lambda e: self.on_search())
+
             # Move to next column
             col += 1
             if col >= columns:
@@ -244,14 +260,34 @@ class SearchFrame(ttk.LabelFrame):
 
         return var, widget
 
-    def on_search(self):
-        """Handle search button click."""
-        # Collect search criteria
+    def text_field_names(self):
+        """
+        Get the names of the free-text search fields.
+
+        Returns:
+            List of field names matched by substring
+        """
+        return [field.name for field in self.search_fields if field.field_type == "text"]
+
+    def collect_criteria(self):
+        """
+        Collect the non-empty field values.
+
+        Returns:
+            Dictionary of field name -> stripped value pairs
+        """
         criteria = {}
         for field in self.search_fields:
             value = field.var.get().strip()
             if value:  # Only include non-empty values
                 criteria[field.name] = value
+        return criteria
+
+    def on_search(self):
+        """Handle search button click."""
+        self._cancel_pending_search()
+        criteria = self.collect_criteria()
+        self._last_criteria = criteria
 
         # Call search callback
         if self.on_search_callback:
@@ -263,10 +299,44 @@ class SearchFrame(ttk.LabelFrame):
         for field in self.search_fields:
             field.var.set("")
 
+        # Clearing the fields schedules an incremental search; run it now instead
+        self._cancel_pending_search()
+        self._last_criteria = {}
+
         # Perform search with empty criteria
         if self.on_search_callback:
             self.on_search_callback({})
 
+    def destroy(self):
+        """Cancel any pending search and destroy the frame."""
+        self._cancel_pending_search()
+        super().destroy()
+
+    def _schedule_search(self, *args):
+        """Restart the debounce timer after a field edit."""
+        self._cancel_pending_search()
+        self._pending_search = self.after(self.debounce_ms, self._run_pending_search)
+
+    def _cancel_pending_search(self):
+        """Stop a debounced search from running."""
+        if self._pending_search is not None:
+            try:
+                self.after_cancel(self._pending_search)
+            except tk.TclError:
+                pass
+            self._pending_search = None
+
+    def _run_pending_search(self):
+        """Run a debounced search unless the criteria are unchanged."""
+        self._pending_search = None
+        criteria = self.collect_criteria()
+        # Edits that only add surrounding whitespace do not change the search
+        if criteria == self._last_criteria:
+            return
+        self._last_criteria = criteria
+        if self.on_search_callback:
+            self.on_search_callback(criteria)
+
     def validate_number(self, value):
         """
         Validate a number input.
@@ -2,17 +2,28 @@
 import logging
 import os
 import sys
-import time
 import traceback
 import tkinter as tk
 import tkinter.messagebox
 from pathlib import Path
 
-from initialize_database import initialize_database
-from gui.main_window import MainWindow
-from utils.circular_import_resolver import register_lazy_import
-from utils.logging_config import setup_logging
-from config.settings import ConfigurationManager, Environment, get_database_path
+from utils.startup_profiler import StartupProfiler
+
+# Created before the application modules are imported so their import time is measured
+_profiler = StartupProfiler.from_environment()
+
+# Modules needed before the window exists; the database seeding code and the main
+# window (with everything it imports) are loaded by main() when they are needed
+with _profiler.phase("core imports"):
+    from gui import config as gui_config
+    from gui.utils import event_bus
+    from utils.circular_import_resolver import register_lazy_import
+    from utils.logging_config import setup_logging
+    from utils.warmup import Warmup, set_warmup
+    from config.settings import ConfigurationManager, Environment, get_database_path
+
+# Closes the window once it has painted; used to measure startup
+EXIT_AFTER_FIRST_PAINT_FLAG = "--exit-after-first-paint"
 
 
 
@@ -47,15 +58,135 @@ def _validate_environment():
 
 
 
+def _configure_models():
+    """Import every model and configure the SQLAlchemy mappers.
+
+    Raises:
+        RuntimeError: If the models cannot be configured
+    """
+    from database.relationship_configurator import configure_model_relationships
+    if not configure_model_relationships():
+        raise RuntimeError("Failed to configure database models")
+
+
+def _check_mappers():
+    """Log model relationships whose back references cannot be resolved."""
+    from database.mapper_diagnostics import find_problematic_backrefs
+    for model, details in find_problematic_backrefs().items():
+        logging.warning(f"Model {model} has a problematic back reference: {details}")
+
+
+def _verify_schema(database_path):
+    """Create missing tables and run diagnostics unless the schema is unchanged.
+
+    Args:
+        database_path: Path of the database file; the fingerprint cache sits next to it
+    """
+    from database.models.base import Base
+    from database.schema_fingerprint import ensure_schema
+    from database.sqlalchemy.session import get_engine
+    ensure_schema(get_engine(), Base.metadata, f"{database_path}.schema.json", diagnostics=_check_mappers)
+
+
+def _link_storage_locations():
+    """Attach inventory rows saved with only a location code to the storage location hierarchy."""
+    from sqlalchemy.orm import Session
+    from database.repositories.storage_location_repository import StorageLocationRepository
+    from database.sqlalchemy.session import get_engine
+    # get_db_session waits for this warm-up, so the step opens its own session
+    with Session(bind=get_engine()) as session:
+        linked = StorageLocationRepository(session).link_inventory_by_code()
+        session.commit()
+    if linked:
+        logging.info(f"Linked {linked} inventory records to storage locations")
+
+
+def _build_service_graph():
+    """Build the DI container and its construction plans, then make it global."""
+    from di import set_container
+    from di.setup import build_container
+    container = build_container()
+    container.prepare()
+    set_container(container)
+
+
+def _create_warmup(database_path):
+    """Create the data layer warm-up run before the first view touches the database.
+
+    Args:
+        database_path: Path of the database file
+
+    Returns:
+        The warm-up, registered as the one data access waits on
+    """
+    warmup = Warmup([
+        ("model configuration", _configure_models),
+        ("schema verification", lambda: _verify_schema(database_path)),
+        ("storage locations", _link_storage_locations),
+        ("service graph", _build_service_graph),
+    ])
+    set_warmup(warmup)
+    return warmup
+
+
+def _bind_first_paint(root, callback):
+    """Call a callback once, after the root window has been mapped and drawn.
+
+    Tk sends ``<Map>`` and ``<Expose>`` when the window appears on screen; the
+    pending redraws are flushed before the callback runs.
+
+    Args:
+        root: The Tk root window
+        callback: Called with no arguments on the first paint
+    """
+    painted = []
+
+    def on_event(event):
+        # Child widgets report their own events through the root's binding tag
+        if event.widget is not root or painted:
+            return
+        painted.append(True)
+        root.update_idletasks()
+        callback()
+
+    # The bindings stay in place as no-ops; unbinding by id would drop other handlers
+    for sequence in ("<Map>", "<Expose>"):
+        root.bind(sequence, on_event, add="+")
+
+
+def _on_first_paint(root, warmup):
+    """Report startup time once the main window has painted, then warm up the data layer.
+
+    Args:
+        root: The Tk root window
+        warmup: The data layer warm-up; started here unless it already ran
+    """
+    warmup.start()
+
+    first_paint = _profiler.mark_first_paint()
+    logging.info(f"Application painted its first window in {first_paint:.4f} seconds.")
+    if first_paint > gui_config.STARTUP_FIRST_PAINT_BUDGET:
+        logging.warning(f"Startup exceeded its budget of {gui_config.STARTUP_FIRST_PAINT_BUDGET:.1f} seconds; "
+                        f"run with --profile-startup to see where the time goes.")
+
+    if _profiler.profiling:
+        logging.info(_profiler.report())
+        _profiler.write_report(str(Path(__file__).resolve().parent / "logs" / "startup_profile.txt"))
+
+    if EXIT_AFTER_FIRST_PAINT_FLAG in sys.argv:
+        print(f"first paint: {first_paint:.4f}s")
+        root.destroy()
+
+
 def main():
     """Main application entry point with comprehensive error handling.
     Manages the entire application lifecycle from startup to shutdown.
     """
+    warmup = None
     try:
-        start_time = time.time()
-
         # Configure Logging
-        setup_logging()
+        with _profiler.phase("logging"):
+            setup_logging()
         logging.info("Application starting...")
 
         # Configure Python Path for Module Resolution
@@ -65,30 +196,49 @@ def main():
         _register_lazy_component_imports()
 
         # Initialize Configuration and validate environment settings
-        ConfigurationManager()  # Initialize configuration manager (singleton)
-        _validate_environment()
+        with _profiler.phase("configuration"):
+            ConfigurationManager()  # Initialize configuration manager (singleton)
+            _validate_environment()
 
         # Initialize Database (Create if not exist)
         database_path = get_database_path()
         if not Path(database_path).exists():
             logging.info("Database does not exist, creating and seeding...")
-            initialize_database()
+            with _profiler.phase("database initialization"):
+                from initialize_database import initialize_database
+                initialize_database()
             logging.info("Database creation and seeding complete.")
         else:
             logging.info("Database exists, skipping initialization.")
 
+        # Views load their data on worker threads that wait for this warm-up, so in
+        # deferred startup it only starts once the window has painted
+        warmup = _create_warmup(database_path)
+        if not gui_config.STARTUP_DEFERRED_WARMUP:
+            with _profiler.phase("data layer warm-up"):
+                warmup.start(background=False)
+
+        with _profiler.phase("main window imports"):
+            from gui.main_window import MainWindow
+
         # Tkinter GUI Setup
-        root = tk.Tk()
-        config = ConfigurationManager()
-        app_title = getattr(config, 'APP_NAME', 'HideSync')
-        root.title(app_title)
+        with _profiler.phase("root window"):
+            root = tk.Tk()
+            config = ConfigurationManager()
+            app_title = getattr(config, 'APP_NAME', 'HideSync')
+            root.title(app_title)
+
+            # Dispatch GUI events from the event loop, once per frame
+            event_bus.attach(root, deferred=gui_config.EVENT_BUS_DEFERRED)
 
-        main_window = MainWindow(root)
-        main_window.pack(fill=tk.BOTH, expand=True)
+        with _profiler.phase("main window"):
+            main_window = MainWindow(root)
+            main_window.build()
 
-        # Calculate Startup Time
-        startup_time = time.time() - start_time
-        logging.info(f"Application started in {startup_time:.4f} seconds.")
+        # Mark first paint and start the deferred warm-up once the window is on screen;
+        # the fallback starts the warm-up even if the window is never mapped
+        _bind_first_paint(root, lambda: _on_first_paint(root, warmup))
+        root.after(int(gui_config.STARTUP_FIRST_PAINT_BUDGET * 1000), warmup.start)
 
         # Start Tkinter main loop
         root.mainloop()
@@ -107,6 +257,9 @@ def main():
     finally:
         # Shutdown Procedures
         logging.info("Application shutting down...")
+        if warmup is not None:
+            # Release workers waiting on a warm-up that never started
+            warmup.cancel()
         # Add any necessary cleanup code here (e.g., closing database connections)
         logging.info("Application shutdown complete.")
 
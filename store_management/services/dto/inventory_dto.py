@@ -157,9 +157,9 @@ class LocationHistoryDTO:
         return cls(
             id=model.id,
             inventory_id=model.inventory_id,
-            previous_location=model.previous_location if hasattr(model, 'previous_location') else None,
-            new_location=model.new_location,
-            timestamp=model.timestamp,
+            previous_location=model.from_location,
+            new_location=model.to_location,
+            timestamp=model.move_date,
             notes=model.notes if hasattr(model, 'notes') else None
         )
 
@@ -62,6 +62,29 @@ class HardwareService(MaterialService):
             self.logger.error(f"Error retrieving hardware materials: {str(e)}")
             raise
 
+    def get_list_rows(self, fields: List[str], offset: int = 0, limit: int = 100,
+                      sort_column: Optional[str] = None, sort_direction: str = "asc",
+                      **criteria) -> List[tuple]:
+        """Get one page of the hardware list, selecting only the listed columns."""
+        try:
+            # Ensure only hardware materials are listed
+            criteria['material_type'] = 'HARDWARE'
+            return self.hardware_repository.get_list_rows(
+                fields, skip=offset, limit=limit, sort_by=sort_column, sort_dir=sort_direction, **criteria)
+        except Exception as e:
+            self.logger.error(f"Error retrieving hardware list rows: {str(e)}")
+            raise
+
+    def count_list_rows(self, **criteria) -> int:
+        """Count the rows of the hardware list."""
+        try:
+            # Ensure only hardware materials are listed
+            criteria['material_type'] = 'HARDWARE'
+            return self.hardware_repository.count_list_rows(**criteria)
+        except Exception as e:
+            self.logger.error(f"Error counting hardware list rows: {str(e)}")
+            raise
+
     def create(self, hardware_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new hardware material."""
         try:
@@ -1,14 +1,19 @@
 # services/implementations/inventory_service.py
 # Implementation of the inventory service interface
 
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Iterator, TextIO, Tuple, Union
 from datetime import datetime
+from itertools import islice
+import csv
 import logging
+
 from sqlalchemy.orm import Session
 
+from database.repositories.base_repository import EntityNotFoundError
 from database.repositories.inventory_repository import InventoryRepository
 from database.repositories.material_repository import MaterialRepository
 from database.repositories.product_repository import ProductRepository
+from database.repositories.storage_location_repository import StorageLocationRepository
 from database.repositories.tool_repository import ToolRepository
 from database.models.enums import InventoryStatus, TransactionType, InventoryAdjustmentType
 from services.base_service import BaseService
@@ -16,6 +21,16 @@ from services.exceptions import ValidationError, NotFoundError
 from services.dto.inventory_dto import InventoryDTO, InventoryTransactionDTO
 
 from di.inject import inject
+from utils.lazy_import import lazy_module
+
+# numpy is imported on first use, not at application startup
+np = lazy_module("numpy")
+
+# Rows read from a physical count file per chunk
+COUNT_CHUNK_SIZE = 5000
+
+# Columns a physical count file must provide
+COUNT_FILE_COLUMNS = ('item_type', 'item_id', 'counted_quantity')
 
 
 class InventoryService(BaseService):
@@ -26,7 +41,8 @@ class InventoryService(BaseService):
                  inventory_repository: Optional[InventoryRepository] = None,
                  material_repository: Optional[MaterialRepository] = None,
                  product_repository: Optional[ProductRepository] = None,
-                 tool_repository: Optional[ToolRepository] = None):
+                 tool_repository: Optional[ToolRepository] = None,
+                 storage_location_repository: Optional[StorageLocationRepository] = None):
         """Initialize the inventory service.
 
         Args:
@@ -35,12 +51,14 @@ class InventoryService(BaseService):
             material_repository: Optional MaterialRepository instance
             product_repository: Optional ProductRepository instance
             tool_repository: Optional ToolRepository instance
+            storage_location_repository: Optional StorageLocationRepository instance
         """
         super().__init__(session)
         self.inventory_repository = inventory_repository or InventoryRepository(session)
         self.material_repository = material_repository or MaterialRepository(session)
         self.product_repository = product_repository or ProductRepository(session)
         self.tool_repository = tool_repository or ToolRepository(session)
+        self.storage_location_repository = storage_location_repository or StorageLocationRepository(session)
         self.logger = logging.getLogger(__name__)
 
     def get_count(self, search_criteria=None):
@@ -137,7 +155,7 @@ class InventoryService(BaseService):
 
             # Create inventory entry
             with self.transaction():
-                inventory = self.inventory_repository.create(inventory_data)
+                inventory = self.inventory_repository.create(self._resolve_location(inventory_data))
 
                 # Log initial inventory transaction if quantity > 0
                 if inventory.quantity > 0:
@@ -200,7 +218,8 @@ class InventoryService(BaseService):
                     }
                     self.inventory_repository.create_transaction(transaction_data)
 
-                updated_inventory = self.inventory_repository.update(inventory_id, inventory_data)
+                updated_inventory = self.inventory_repository.update(inventory_id,
+                                                                     self._resolve_location(inventory_data))
                 return InventoryDTO.from_model(updated_inventory).to_dict()
         except (NotFoundError, ValidationError):
             raise
@@ -333,12 +352,50 @@ class InventoryService(BaseService):
             List of inventory items with low stock
         """
         try:
-            low_stock_items = self.inventory_repository.get_low_stock(threshold)
-            return [InventoryDTO.from_model(item, include_item_details=True).to_dict() for item in low_stock_items]
+            return self.inventory_repository.get_low_stock_items(threshold)
         except Exception as e:
             self.logger.error(f"Error retrieving low stock items: {str(e)}")
             raise
 
+    def get_low_stock_count(self) -> int:
+        """Get the number of items at or below their reorder thresholds but still in stock.
+
+        Returns:
+            Count of low stock items
+        """
+        try:
+            counts = self.inventory_repository.get_low_stock_counts()
+            return sum(count for status, count in counts.items()
+                       if status != InventoryStatus.OUT_OF_STOCK.value)
+        except Exception as e:
+            self.logger.error(f"Error counting low stock items: {str(e)}")
+            raise
+
+    def get_out_of_stock_count(self) -> int:
+        """Get the number of items that are out of stock.
+
+        Returns:
+            Count of out of stock items
+        """
+        try:
+            counts = self.inventory_repository.get_low_stock_counts()
+            return counts.get(InventoryStatus.OUT_OF_STOCK.value, 0)
+        except Exception as e:
+            self.logger.error(f"Error counting out of stock items: {str(e)}")
+            raise
+
+    def get_in_stock_count(self) -> int:
+        """Get the number of items with stock above their reorder thresholds.
+
+        Returns:
+            Count of in stock items
+        """
+        try:
+            return self.inventory_repository.count(low_stock=False)
+        except Exception as e:
+            self.logger.error(f"Error counting in stock items: {str(e)}")
+            raise
+
     def log_transaction(self, transaction_data: Dict[str, Any]) -> Dict[str, Any]:
         """Log an inventory transaction.
 
@@ -417,28 +474,121 @@ class InventoryService(BaseService):
             if not inventory:
                 raise NotFoundError(f"Inventory entry with ID {inventory_id} not found")
 
-            # Update storage location
+            # Update storage location and record the move
             with self.transaction():
-                old_location = inventory.storage_location
+                if not location:
+                    updated_inventory = self.inventory_repository.update(
+                        inventory_id, {'storage_location': None, 'location_id': None}
+                    )
+                    return InventoryDTO.from_model(updated_inventory).to_dict()
+
+                self.inventory_repository.relocate_items(
+                    [inventory_id], location, notes='Location updated through inventory service'
+                )
+                return InventoryDTO.from_model(inventory).to_dict()
+        except NotFoundError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error updating storage location for inventory entry {inventory_id}: {str(e)}")
+            raise
 
-                inventory_data = {'storage_location': location}
-                updated_inventory = self.inventory_repository.update(inventory_id, inventory_data)
+    def get_storage_locations(self) -> List[Dict[str, Any]]:
+        """Get all storage locations with their precomputed occupancy.
 
-                # Log location change
-                location_history_data = {
-                    'inventory_id': inventory.id,
-                    'previous_location': old_location,
-                    'new_location': location,
-                    'timestamp': datetime.now(),
-                    'notes': 'Location updated through inventory service'
-                }
-                self.inventory_repository.create_location_history(location_history_data)
+        Returns:
+            List of location dicts in hierarchy order
+        """
+        try:
+            return [
+                self._storage_location_to_dict(location)
+                for location in self.storage_location_repository.get_tree()
+            ]
+        except Exception as e:
+            self.logger.error(f"Error retrieving storage locations: {str(e)}")
+            raise
 
-                return InventoryDTO.from_model(updated_inventory).to_dict()
+    def get_storage_location_details(self, location: str) -> Dict[str, Any]:
+        """Get a storage location with the inventory stored in it and its descendants.
+
+        Args:
+            location: Location code, optionally prefixed with its type ('SHELF:A-B-3')
+
+        Returns:
+            Location dict with an 'items' list and the subtree's total value
+
+        Raises:
+            NotFoundError: If the location does not exist
+        """
+        try:
+            storage_location = self.storage_location_repository.get_by_code(self._location_code(location))
+            if not storage_location:
+                raise NotFoundError(f"Storage location '{location}' not found")
+
+            details = self._storage_location_to_dict(storage_location)
+            details['items'] = self.storage_location_repository.get_items_in_subtree(storage_location.id)
+            details['total_value'] = sum(item['value'] for item in details['items'])
+            return details
         except NotFoundError:
             raise
         except Exception as e:
-            self.logger.error(f"Error updating storage location for inventory entry {inventory_id}: {str(e)}")
+            self.logger.error(f"Error retrieving storage location '{location}': {str(e)}")
+            raise
+
+    def move_all_items(self, source_location: str, dest_location: str) -> int:
+        """Move everything stored in one location to another.
+
+        Args:
+            source_location: Source location, optionally prefixed with its type
+            dest_location: Destination location, optionally prefixed with its type
+
+        Returns:
+            Number of inventory records moved
+
+        Raises:
+            NotFoundError: If the source location does not exist
+            ValidationError: If the move fails
+        """
+        return self._relocate_contents(source_location, dest_location, similar_only=False)
+
+    def consolidate_items(self, source_location: str, dest_location: str) -> int:
+        """Move items to a location that already stores items of the same type.
+
+        Args:
+            source_location: Source location, optionally prefixed with its type
+            dest_location: Destination location, optionally prefixed with its type
+
+        Returns:
+            Number of inventory records moved
+
+        Raises:
+            NotFoundError: If the source location does not exist
+            ValidationError: If the move fails
+        """
+        return self._relocate_contents(source_location, dest_location, similar_only=True)
+
+    def move_items(self, source_location: str, dest_location: str, item_ids: List[int]) -> int:
+        """Move selected inventory records from one location to another.
+
+        Args:
+            source_location: Source location, optionally prefixed with its type
+            dest_location: Destination location, optionally prefixed with its type
+            item_ids: IDs of the inventory records to move
+
+        Returns:
+            Number of inventory records moved
+
+        Raises:
+            ValidationError: If the move fails
+        """
+        try:
+            with self.transaction():
+                return self.inventory_repository.relocate_items(
+                    item_ids,
+                    self._location_code(dest_location),
+                    notes=f"Moved from {self._location_code(source_location)}"
+                )
+        except Exception as e:
+            self.logger.error(f"Error moving items from {source_location} to {dest_location}: {str(e)}")
             raise
 
     def update_status(self, inventory_id: int, status: str) -> Dict[str, Any]:
@@ -533,8 +683,181 @@ class InventoryService(BaseService):
             self.logger.error(f"Error getting availability for {item_type} {item_id}: {str(e)}")
             raise
 
+    def reconcile_physical_count(self, source: Union[str, TextIO], item_type: Optional[str] = None,
+                                 dry_run: bool = False, reason: Optional[str] = None,
+                                 chunk_size: int = COUNT_CHUNK_SIZE) -> Dict[str, Any]:
+        """Reconcile a physical count file against inventory.
+
+        The file is a CSV with item_type, item_id and counted_quantity columns. It is read
+        in chunks and matched against a hash index built from one column query, so neither
+        the file nor the inventory is ever held as ORM objects. Counts for the same item are
+        summed, as an item may be counted in several places. Variances are computed over the
+        whole index at once and applied as bulk adjustments with their ledger entries.
+        Records whose quantity changed after the index was read are skipped and listed
+        in the report rather than overwritten.
+
+        Args:
+            source: Path to the CSV file, or an open text stream
+            item_type: Optional item type the count covers
+            dry_run: If True, only report variances without adjusting inventory
+            reason: Optional reason recorded in the ledger
+            chunk_size: Number of file rows read per chunk
+
+        Returns:
+            Variance report dict
+
+        Raises:
+            ValidationError: If the file is missing required columns
+        """
+        try:
+            index_rows = self.inventory_repository.get_count_index(item_type)
+            positions = {(row[1], row[2]): position for position, row in enumerate(index_rows)}
+            size = len(index_rows)
+
+            inventory_ids = np.fromiter((row[0] for row in index_rows), dtype=np.int64, count=size)
+            system_quantity = np.fromiter((row[3] or 0.0 for row in index_rows), dtype=np.float64, count=size)
+            unit_price = np.fromiter((row[4] or 0.0 for row in index_rows), dtype=np.float64, count=size)
+            counted_quantity = np.zeros(size, dtype=np.float64)
+            counted = np.zeros(size, dtype=bool)
+
+            rows_read = 0
+            unmatched: List[Dict[str, Any]] = []
+            invalid: List[Dict[str, Any]] = []
+
+            for chunk in self._read_count_chunks(source, chunk_size):
+                chunk_positions = []
+                chunk_quantities = []
+                for line, row in chunk:
+                    rows_read += 1
+                    try:
+                        key = (row['item_type'].strip().lower(), int(row['item_id']))
+                        quantity = float(row['counted_quantity'])
+                    except (AttributeError, TypeError, ValueError):
+                        invalid.append({'line': line, 'row': row})
+                        continue
+
+                    position = positions.get(key)
+                    if position is None:
+                        unmatched.append({'line': line, 'item_type': key[0], 'item_id': key[1]})
+                        continue
+
+                    chunk_positions.append(position)
+                    chunk_quantities.append(quantity)
+
+                if chunk_positions:
+                    chunk_positions = np.asarray(chunk_positions, dtype=np.int64)
+                    np.add.at(counted_quantity, chunk_positions, np.asarray(chunk_quantities, dtype=np.float64))
+                    counted[chunk_positions] = True
+
+            variance = np.where(counted, counted_quantity - system_quantity, 0.0)
+            variance_value = variance * unit_price
+            changed = np.flatnonzero(counted & ~np.isclose(counted_quantity, system_quantity))
+            # Largest value discrepancies first
+            changed = changed[np.argsort(-np.abs(variance_value[changed]), kind='stable')]
+
+            variances = [
+                {
+                    'inventory_id': int(inventory_ids[position]),
+                    'item_type': index_rows[position][1],
+                    'item_id': index_rows[position][2],
+                    'system_quantity': float(system_quantity[position]),
+                    'counted_quantity': float(counted_quantity[position]),
+                    'variance': float(variance[position]),
+                    'variance_value': float(variance_value[position])
+                }
+                for position in changed
+            ]
+
+            adjusted_ids = set()
+            if not dry_run and variances:
+                with self.transaction():
+                    for start in range(0, len(variances), chunk_size):
+                        adjusted_ids.update(self.inventory_repository.apply_count_adjustments(
+                            [
+                                {
+                                    'inventory_id': entry['inventory_id'],
+                                    'quantity_before': entry['system_quantity'],
+                                    'quantity_after': entry['counted_quantity']
+                                }
+                                for entry in variances[start:start + chunk_size]
+                            ],
+                            InventoryAdjustmentType.PHYSICAL_COUNT,
+                            reason or 'Physical count reconciliation'
+                        ))
+            skipped = [] if dry_run else [
+                entry for entry in variances if entry['inventory_id'] not in adjusted_ids
+            ]
+
+            return {
+                'rows_read': rows_read,
+                'matched': int(counted.sum()),
+                'not_counted': int(size - counted.sum()),
+                'unmatched': unmatched,
+                'invalid': invalid,
+                'variances': variances,
+                'total_variance': float(variance.sum()),
+                'total_variance_value': float(variance_value.sum()),
+                'shrinkage_value': float(variance_value[variance_value < 0].sum()),
+                'adjusted': len(adjusted_ids),
+                'skipped': skipped,
+                'dry_run': dry_run
+            }
+        except ValidationError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error reconciling physical count: {str(e)}")
+            raise
+
+    def export_variance_report(self, report: Dict[str, Any], path: str) -> None:
+        """Write the variances of a reconciliation report to a CSV file.
+
+        Args:
+            report: Report returned by reconcile_physical_count
+            path: Destination file path
+        """
+        fields = ['inventory_id', 'item_type', 'item_id', 'system_quantity',
+                  'counted_quantity', 'variance', 'variance_value']
+        with open(path, 'w', newline='', encoding='utf-8') as report_file:
+            writer = csv.DictWriter(report_file, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(report['variances'])
+
     # Helper methods
 
+    def _read_count_chunks(self, source: Union[str, TextIO],
+                           chunk_size: int) -> Iterator[List[Tuple[int, Dict[str, str]]]]:
+        """Read a physical count CSV in chunks of (line number, row) pairs.
+
+        Args:
+            source: Path to the CSV file, or an open text stream
+            chunk_size: Number of rows per chunk
+
+        Yields:
+            Lists of (line number, row dict) pairs
+
+        Raises:
+            ValidationError: If the file is missing required columns
+        """
+        count_file = open(source, newline='', encoding='utf-8-sig') if isinstance(source, str) else source
+        try:
+            reader = csv.DictReader(count_file)
+            header = [name.strip().lower() for name in reader.fieldnames or []]
+            missing = [column for column in COUNT_FILE_COLUMNS if column not in header]
+            if missing:
+                raise ValidationError(f"Count file is missing columns: {', '.join(missing)}")
+            reader.fieldnames = header
+
+            # Line 1 is the header
+            rows = enumerate(reader, start=2)
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            if count_file is not source:
+                count_file.close()
+
     def _validate_inventory_data(self, data: Dict[str, Any], update: bool = False) -> None:
         """Validate inventory data.
 
@@ -577,6 +900,98 @@ class InventoryService(BaseService):
         if 'type' in data:
             self._validate_enum_value(TransactionType, data['type'], "transaction type")
 
+    def _relocate_contents(self, source_location: str, dest_location: str, similar_only: bool) -> int:
+        """Move the contents of one location to another in a single transaction.
+
+        Args:
+            source_location: Source location, optionally prefixed with its type
+            dest_location: Destination location, optionally prefixed with its type
+            similar_only: Only move item types already stored at the destination
+
+        Returns:
+            Number of inventory records moved
+
+        Raises:
+            NotFoundError: If the source location does not exist
+        """
+        source_code = self._location_code(source_location)
+        try:
+            with self.transaction():
+                return self.inventory_repository.relocate_location_contents(
+                    source_code,
+                    self._location_code(dest_location),
+                    similar_only=similar_only,
+                    notes=f"{'Consolidated' if similar_only else 'Moved'} from {source_code}"
+                )
+        except EntityNotFoundError as e:
+            raise NotFoundError(str(e))
+        except Exception as e:
+            self.logger.error(f"Error moving items from {source_location} to {dest_location}: {str(e)}")
+            raise
+
+    @staticmethod
+    def _location_code(location: str) -> str:
+        """Strip the optional type prefix the storage views add to location codes.
+
+        Args:
+            location: Location code, optionally prefixed with its type ('SHELF:A-B-3')
+
+        Returns:
+            The bare location code
+        """
+        return location.split(":", 1)[1] if ":" in location else location
+
+    def _resolve_location(self, inventory_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Link the storage location code in inventory data to its location in the hierarchy.
+
+        Args:
+            inventory_data: Dict of inventory properties; left unchanged
+
+        Returns:
+            Copy of the data with the canonical location code and its location_id, or
+            the data itself if it has no storage location
+        """
+        if 'storage_location' not in inventory_data:
+            return inventory_data
+
+        resolved = dict(inventory_data)
+        code = (inventory_data['storage_location'] or '').strip()
+        if not code:
+            resolved['storage_location'] = None
+            resolved['location_id'] = None
+            return resolved
+
+        location = self.storage_location_repository.get_or_create_by_code(self._location_code(code))
+        resolved['storage_location'] = location.code
+        resolved['location_id'] = location.id
+        return resolved
+
+    def _storage_location_to_dict(self, location) -> Dict[str, Any]:
+        """Convert a storage location to the dict shape used by the storage views.
+
+        Args:
+            location: StorageLocation model instance
+
+        Returns:
+            Dict with location code, hierarchy fields and occupancy
+        """
+        code = location.code
+        return {
+            'id': location.id,
+            'location': f"{location.location_type.name}:{code}" if location.location_type else code,
+            'code': code,
+            'name': location.name,
+            'level': location.level.value,
+            'parent_id': location.parent_id,
+            'depth': location.depth,
+            'items_count': location.item_count,
+            'total_quantity': location.total_quantity,
+            'capacity': location.capacity,
+            'fill_level': location.fill_level,
+            'description': location.description or "",
+            'last_updated': location.updated_at or location.created_at
+        }
+
     def _determine_inventory_status(self, quantity: float) -> str:
         """Determine inventory status based on quantity.
 
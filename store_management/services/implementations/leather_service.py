@@ -7,6 +7,7 @@ from database.repositories.leather_repository import LeatherRepository
 from database.repositories.supplier_repository import SupplierRepository
 from database.repositories.inventory_repository import InventoryRepository
 from database.repositories.material_repository import MaterialRepository
+from database.repositories.loader_profiles import DETAIL
 
 from database.models.enums import LeatherType, LeatherFinish, InventoryStatus, TransactionType
 
@@ -38,7 +39,7 @@ class LeatherService(MaterialService):
     def get_by_id(self, leather_id: int) -> Dict[str, Any]:
         """Get leather by ID."""
         try:
-            leather = self.leather_repository.get_by_id(leather_id)
+            leather = self.leather_repository.get_by_id(leather_id, profile=DETAIL)
             if not leather:
                 raise NotFoundError(f"Leather with ID {leather_id} not found")
             return LeatherDTO.from_model(leather, include_inventory=True, include_supplier=True).to_dict()
@@ -62,6 +63,29 @@ class LeatherService(MaterialService):
             self.logger.error(f"Error retrieving leather materials: {str(e)}")
             raise
 
+    def get_list_rows(self, fields: List[str], offset: int = 0, limit: int = 100,
+                      sort_column: Optional[str] = None, sort_direction: str = "asc",
+                      **criteria) -> List[tuple]:
+        """Get one page of the leather list, selecting only the listed columns."""
+        try:
+            # Ensure only leather materials are listed
+            criteria['material_type'] = 'LEATHER'
+            return self.leather_repository.get_list_rows(
+                fields, skip=offset, limit=limit, sort_by=sort_column, sort_dir=sort_direction, **criteria)
+        except Exception as e:
+            self.logger.error(f"Error retrieving leather list rows: {str(e)}")
+            raise
+
+    def count_list_rows(self, **criteria) -> int:
+        """Count the rows of the leather list."""
+        try:
+            # Ensure only leather materials are listed
+            criteria['material_type'] = 'LEATHER'
+            return self.leather_repository.count_list_rows(**criteria)
+        except Exception as e:
+            self.logger.error(f"Error counting leather list rows: {str(e)}")
+            raise
+
     def create(self, leather_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new leather material."""
         try:
@@ -73,6 +73,44 @@ class MaterialService(BaseService):
             self.logger.error(f"Error retrieving materials: {str(e)}")
             raise
 
+    def get_list_rows(self, fields: List[str], offset: int = 0, limit: int = 100,
+                      sort_column: Optional[str] = None, sort_direction: str = "asc",
+                      **criteria) -> List[tuple]:
+        """Get one page of the material list, selecting only the listed columns.
+
+        Args:
+            fields: List field names, in display order
+            offset: Number of rows to skip
+            limit: Maximum rows to return
+            sort_column: Field to sort by
+            sort_direction: Sort direction ('asc' or 'desc')
+            **criteria: Field name to value filters
+
+        Returns:
+            List of row namedtuples
+        """
+        try:
+            return self.material_repository.get_list_rows(
+                fields, skip=offset, limit=limit, sort_by=sort_column, sort_dir=sort_direction, **criteria)
+        except Exception as e:
+            self.logger.error(f"Error retrieving material list rows: {str(e)}")
+            raise
+
+    def count_list_rows(self, **criteria) -> int:
+        """Count the rows of the material list.
+
+        Args:
+            **criteria: Field name to value filters
+
+        Returns:
+            Number of matching rows
+        """
+        try:
+            return self.material_repository.count_list_rows(**criteria)
+        except Exception as e:
+            self.logger.error(f"Error counting material list rows: {str(e)}")
+            raise
+
     def create(self, material_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new material.
 
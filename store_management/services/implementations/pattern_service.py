@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from database.repositories.pattern_repository import PatternRepository
 from database.repositories.component_repository import ComponentRepository
 from database.repositories.product_repository import ProductRepository
+from database.repositories.loader_profiles import DETAIL
 
 from database.models.enums import SkillLevel, ProjectType
 
@@ -34,7 +35,7 @@ class PatternService(BaseService):
     def get_by_id(self, pattern_id: int) -> Dict[str, Any]:
         """Get pattern by ID."""
         try:
-            pattern = self.pattern_repository.get_by_id(pattern_id)
+            pattern = self.pattern_repository.get_by_id(pattern_id, profile=DETAIL)
             if not pattern:
                 raise NotFoundError(f"Pattern with ID {pattern_id} not found")
             return PatternDTO.from_model(pattern, include_components=True).to_dict()
@@ -9,6 +9,7 @@ from database.repositories.supplier_repository import SupplierRepository
 from database.repositories.material_repository import MaterialRepository
 from database.repositories.tool_repository import ToolRepository
 from database.repositories.inventory_repository import InventoryRepository
+from database.repositories.loader_profiles import DETAIL
 
 from database.models.enums import PurchaseStatus, InventoryStatus, TransactionType
 
@@ -43,7 +44,7 @@ class PurchaseService(BaseService):
     def get_by_id(self, purchase_id: int) -> Dict[str, Any]:
         """Get purchase by ID."""
         try:
-            purchase = self.purchase_repository.get_by_id(purchase_id)
+            purchase = self.purchase_repository.get_by_id(purchase_id, profile=DETAIL)
             if not purchase:
                 raise NotFoundError(f"Purchase with ID {purchase_id} not found")
             return PurchaseDTO.from_model(purchase, include_supplier=True, include_items=True).to_dict()
@@ -529,127 +530,84 @@ class PurchaseService(BaseService):
             self.logger.error(f"Error generating purchase report: {str(e)}")
             raise
 
-    def auto_generate_for_low_stock(self) -> Dict[str, Any]:
-        """Auto-generate purchase orders for low stock items."""
+    def auto_generate_for_low_stock(self, dry_run: bool = False) -> Dict[str, Any]:
+        """Auto-generate purchase orders for low stock items.
+
+        Candidates and order quantities come from one joined query. Orders are grouped
+        by supplier in memory and written with bulk inserts.
+
+        Args:
+            dry_run: If True, return the reorder plan without creating any purchases
+
+        Returns:
+            Dict with a summary message, the per-supplier plan and created purchase IDs
+        """
         try:
-            # Get low stock items
-            low_stock_materials = self.material_repository.get_low_stock()
-            low_stock_tools = self.tool_repository.get_low_stock()
+            candidates = self.inventory_repository.get_reorder_candidates()
+            plan = self._build_reorder_plan(candidates)
 
-            if not (low_stock_materials or low_stock_tools):
+            if not plan:
                 return {
                     'message': 'No low stock items found',
-                    'purchases_created': 0
+                    'purchases_created': 0,
+                    'plan': []
                 }
 
-            # Group items by supplier
-            supplier_items = {}
-
-            # Add materials
-            for material in low_stock_materials:
-                supplier_id = getattr(material, 'supplier_id', None)
-                if not supplier_id:
-                    continue
-
-                if supplier_id not in supplier_items:
-                    supplier_items[supplier_id] = {
-                        'materials': [],
-                        'tools': []
-                    }
-
-                # Calculate quantity to order
-                inventory = self.inventory_repository.get_by_item('material', material.id)
-                current_quantity = inventory.quantity if inventory else 0
-                min_stock = getattr(material, 'min_stock_level', 1)
-                max_stock = getattr(material, 'max_stock_level', min_stock * 3)
-                order_quantity = max_stock - current_quantity
-
-                if order_quantity <= 0:
-                    continue
-
-                supplier_items[supplier_id]['materials'].append({
-                    'item_id': material.id,
-                    'item_type': 'material',
-                    'name': material.name,
-                    'quantity': order_quantity,
-                    'price': getattr(material, 'cost_price', None)
-                })
-
-            # Add tools
-            for tool in low_stock_tools:
-                supplier_id = getattr(tool, 'supplier_id', None)
-                if not supplier_id:
-                    continue
-
-                if supplier_id not in supplier_items:
-                    supplier_items[supplier_id] = {
-                        'materials': [],
-                        'tools': []
-                    }
-
-                # Calculate quantity to order
-                inventory = self.inventory_repository.get_by_item('tool', tool.id)
-                current_quantity = inventory.quantity if inventory else 0
-                min_stock = getattr(tool, 'min_stock_level', 1)
-                max_stock = getattr(tool, 'max_stock_level', min_stock * 2)
-                order_quantity = max_stock - current_quantity
-
-                if order_quantity <= 0:
-                    continue
-
-                supplier_items[supplier_id]['tools'].append({
-                    'item_id': tool.id,
-                    'item_type': 'tool',
-                    'name': tool.name,
-                    'quantity': order_quantity,
-                    'price': getattr(tool, 'purchase_price', None)
-                })
-
-            # Create purchases for each supplier
-            purchases_created = 0
-            purchase_ids = []
+            if dry_run:
+                return {
+                    'message': f'Would create {len(plan)} purchase orders for low stock items',
+                    'purchases_created': 0,
+                    'purchase_ids': [],
+                    'plan': plan,
+                    'dry_run': True
+                }
 
             with self.transaction():
-                for supplier_id, items in supplier_items.items():
-                    all_items = items['materials'] + items['tools']
-                    if not all_items:
-                        continue
-
-                    # Create purchase
-                    purchase_data = {
-                        'supplier_id': supplier_id,
-                        'status': PurchaseStatus.DRAFT.value,
-                        'notes': 'Auto-generated for low stock items'
-                    }
-
-                    purchase = self.purchase_repository.create(purchase_data)
-                    purchases_created += 1
-                    purchase_ids.append(purchase.id)
-
-                    # Add items to purchase
-                    for item in all_items:
-                        item_data = {
-                            'purchase_id': purchase.id,
-                            'item_id': item['item_id'],
-                            'item_type': item['item_type'],
-                            'quantity': item['quantity'],
-                            'price': item['price'],
-                            'quantity_received': 0
-                        }
-                        self.purchase_item_repository.create(item_data)
-
-                    # Update purchase total
-                    self._update_purchase_total(purchase.id)
+                purchase_ids = self.purchase_repository.bulk_create_with_items(plan)
 
             return {
-                'message': f'Created {purchases_created} purchase orders for low stock items',
-                'purchases_created': purchases_created,
-                'purchase_ids': purchase_ids
+                'message': f'Created {len(purchase_ids)} purchase orders for low stock items',
+                'purchases_created': len(purchase_ids),
+                'purchase_ids': purchase_ids,
+                'plan': plan
             }
         except Exception as e:
             self.logger.error(f"Error auto-generating purchases for low stock items: {str(e)}")
             raise
 
+    def _build_reorder_plan(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Group reorder candidates into one draft purchase per supplier.
+
+        Args:
+            candidates: Reorder candidates from InventoryRepository.get_reorder_candidates
+
+        Returns:
+            List of purchase plans with supplier_id, status, notes, items and estimated total
+        """
+        supplier_items: Dict[int, List[Dict[str, Any]]] = {}
+        for candidate in candidates:
+            supplier_id = candidate.get('supplier_id')
+            if not supplier_id:
+                continue
+            supplier_items.setdefault(supplier_id, []).append({
+                'item_id': candidate['item_id'],
+                'item_type': candidate['item_type'],
+                'name': candidate['name'],
+                'quantity': candidate['quantity'],
+                'price': candidate['price'] or 0.0
+            })
+
+        return [
+            {
+                'supplier_id': supplier_id,
+                'status': PurchaseStatus.DRAFT,
+                'notes': 'Auto-generated for low stock items',
+                'items': items,
+                'estimated_total': sum(item['price'] * item['quantity'] for item in items)
+            }
+            for supplier_id, items in supplier_items.items()
+        ]
+
     def _update_purchase_total(self, purchase_id: int) -> None:
         """Update purchase total amount based on items and fees.
 
@@ -433,6 +433,58 @@ class SalesService(BaseService, ISalesService):
             self.logger.error(f"Error retrieving sales between {start_date} and {end_date}: {str(e)}")
             raise
 
+    def get_recent_sales(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Get the most recent sales.
+
+        Args:
+            limit: Maximum number of sales to return
+
+        Returns:
+            List of sales, newest first
+        """
+        try:
+            sales_list = self.sales_repository.get_recent_sales(limit)
+            return [SalesDTO.from_model(sale).to_dict() for sale in sales_list]
+        except Exception as e:
+            self.logger.error(f"Error retrieving recent sales: {str(e)}")
+            raise
+
+    def get_monthly_sales_totals(self, months: int = 6,
+                                 end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Get total sales for each of the last few calendar months.
+
+        Args:
+            months: Number of months to include, counting the month of end_date
+            end_date: End of the range, defaults to now
+
+        Returns:
+            List of dicts with period ('YYYY-MM'), month (short name) and value,
+            oldest first, with zero for months without sales
+        """
+        end_date = end_date or datetime.now()
+
+        # Walk back from the end month to get each month's first day
+        month_starts = []
+        year, month = end_date.year, end_date.month
+        for _ in range(months):
+            month_starts.append(datetime(year, month, 1))
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+        month_starts.reverse()
+
+        try:
+            totals = self.sales_repository.get_monthly_sales_totals(month_starts[0], end_date)
+            return [
+                {
+                    'period': start.strftime('%Y-%m'),
+                    'month': start.strftime('%b'),
+                    'value': totals.get(start.strftime('%Y-%m'), 0.0)
+                }
+                for start in month_starts
+            ]
+        except Exception as e:
+            self.logger.error(f"Error retrieving monthly sales totals: {str(e)}")
+            raise
+
     def calculate_total(self, sales_id: int) -> float:
         """Calculate total amount for a sale.
 
@@ -7,6 +7,7 @@ from database.repositories.supplies_repository import SuppliesRepository
 from database.repositories.supplier_repository import SupplierRepository
 from database.repositories.inventory_repository import InventoryRepository
 from database.repositories.material_repository import MaterialRepository
+from database.repositories.loader_profiles import DETAIL
 
 from database.models.enums import MaterialType, InventoryStatus, TransactionType
 
@@ -38,7 +39,7 @@ class SuppliesService(MaterialService):
     def get_by_id(self, supplies_id: int) -> Dict[str, Any]:
         """Get supplies by ID."""
         try:
-            supplies = self.supplies_repository.get_by_id(supplies_id)
+            supplies = self.supplies_repository.get_by_id(supplies_id, profile=DETAIL)
             if not supplies:
                 raise NotFoundError(f"Supplies with ID {supplies_id} not found")
             return SuppliesDTO.from_model(supplies, include_inventory=True, include_supplier=True).to_dict()
@@ -62,6 +63,29 @@ class SuppliesService(MaterialService):
             self.logger.error(f"Error retrieving supplies materials: {str(e)}")
             raise
 
+    def get_list_rows(self, fields: List[str], offset: int = 0, limit: int = 100,
+                      sort_column: Optional[str] = None, sort_direction: str = "asc",
+                      **criteria) -> List[tuple]:
+        """Get one page of the supplies list, selecting only the listed columns."""
+        try:
+            # Ensure only supplies materials are listed
+            criteria['material_type'] = 'SUPPLIES'
+            return self.supplies_repository.get_list_rows(
+                fields, skip=offset, limit=limit, sort_by=sort_column, sort_dir=sort_direction, **criteria)
+        except Exception as e:
+            self.logger.error(f"Error retrieving supplies list rows: {str(e)}")
+            raise
+
+    def count_list_rows(self, **criteria) -> int:
+        """Count the rows of the supplies list."""
+        try:
+            # Ensure only supplies materials are listed
+            criteria['material_type'] = 'SUPPLIES'
+            return self.supplies_repository.count_list_rows(**criteria)
+        except Exception as e:
+            self.logger.error(f"Error counting supplies list rows: {str(e)}")
+            raise
+
     def create(self, supplies_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new supplies material."""
         try:
@@ -8,6 +8,7 @@ from database.repositories.supplier_repository import SupplierRepository
 from database.repositories.inventory_repository import InventoryRepository
 from database.repositories.tool_list_repository import ToolListRepository
 from database.repositories.tool_maintenance_repository import ToolMaintenanceRepository
+from database.repositories.loader_profiles import DETAIL
 
 from database.models.enums import ToolCategory, InventoryStatus, TransactionType
 
@@ -40,7 +41,7 @@ class ToolService(BaseService):
     def get_by_id(self, tool_id: int) -> Dict[str, Any]:
         """Get tool by ID."""
         try:
-            tool = self.tool_repository.get_by_id(tool_id)
+            tool = self.tool_repository.get_by_id(tool_id, profile=DETAIL)
             if not tool:
                 raise NotFoundError(f"Tool with ID {tool_id} not found")
             return ToolDTO.from_model(tool, include_inventory=True, include_supplier=True).to_dict()
@@ -1,7 +1,7 @@
 # services/interfaces/inventory_service.py
 # Protocol definition for inventory service
 
-from typing import Protocol, List, Optional, Dict, Any, Union
+from typing import Protocol, List, Optional, Dict, Any, TextIO, Union
 from datetime import datetime
 
 
@@ -120,6 +120,30 @@ class IInventoryService(Protocol):
         """
         ...
 
+    def get_low_stock_count(self) -> int:
+        """Get the number of items at or below their reorder thresholds but still in stock.
+
+        Returns:
+            Count of low stock items
+        """
+        ...
+
+    def get_out_of_stock_count(self) -> int:
+        """Get the number of items that are out of stock.
+
+        Returns:
+            Count of out of stock items
+        """
+        ...
+
+    def get_in_stock_count(self) -> int:
+        """Get the number of items with stock above their reorder thresholds.
+
+        Returns:
+            Count of in stock items
+        """
+        ...
+
     def log_transaction(self, transaction_data: Dict[str, Any]) -> Dict[str, Any]:
         """Log an inventory transaction.
 
@@ -168,6 +192,76 @@ class IInventoryService(Protocol):
         """
         ...
 
+    def get_storage_locations(self) -> List[Dict[str, Any]]:
+        """Get all storage locations with their precomputed occupancy.
+
+        Returns:
+            List of location dicts in hierarchy order
+        """
+        ...
+
+    def get_storage_location_details(self, location: str) -> Dict[str, Any]:
+        """Get a storage location with the inventory stored in it and its descendants.
+
+        Args:
+            location: Location code, optionally prefixed with its type ('SHELF:A-B-3')
+
+        Returns:
+            Location dict with an 'items' list and the subtree's total value
+
+        Raises:
+            NotFoundError: If the location does not exist
+        """
+        ...
+
+    def move_all_items(self, source_location: str, dest_location: str) -> int:
+        """Move everything stored in one location to another.
+
+        Args:
+            source_location: Source location, optionally prefixed with its type
+            dest_location: Destination location, optionally prefixed with its type
+
+        Returns:
+            Number of inventory records moved
+
+        Raises:
+            NotFoundError: If the source location does not exist
+            ValidationError: If the move fails
+        """
+        ...
+
+    def consolidate_items(self, source_location: str, dest_location: str) -> int:
+        """Move items to a location that already stores items of the same type.
+
+        Args:
+            source_location: Source location, optionally prefixed with its type
+            dest_location: Destination location, optionally prefixed with its type
+
+        Returns:
+            Number of inventory records moved
+
+        Raises:
+            NotFoundError: If the source location does not exist
+            ValidationError: If the move fails
+        """
+        ...
+
+    def move_items(self, source_location: str, dest_location: str, item_ids: List[int]) -> int:
+        """Move selected inventory records from one location to another.
+
+        Args:
+            source_location: Source location, optionally prefixed with its type
+            dest_location: Destination location, optionally prefixed with its type
+            item_ids: IDs of the inventory records to move
+
+        Returns:
+            Number of inventory records moved
+
+        Raises:
+            ValidationError: If the move fails
+        """
+        ...
+
     def update_status(self, inventory_id: int, status: str) -> Dict[str, Any]:
         """Update status for an inventory entry.
 
@@ -184,6 +278,37 @@ class IInventoryService(Protocol):
         """
         ...
 
+    def reconcile_physical_count(self, source: Union[str, TextIO], item_type: Optional[str] = None,
+                                 dry_run: bool = False, reason: Optional[str] = None,
+                                 chunk_size: int = 5000) -> Dict[str, Any]:
+        """Reconcile a physical count file against inventory.
+
+        Args:
+            source: Path to a CSV with item_type, item_id and counted_quantity columns,
+                or an open text stream
+            item_type: Optional item type the count covers
+            dry_run: If True, only report variances without adjusting inventory
+            reason: Optional reason recorded in the ledger
+            chunk_size: Number of file rows read per chunk
+
+        Returns:
+            Variance report dict; records whose quantity changed after they were
+            compared are not adjusted and are listed under 'skipped'
+
+        Raises:
+            ValidationError: If the file is missing required columns
+        """
+        ...
+
+    def export_variance_report(self, report: Dict[str, Any], path: str) -> None:
+        """Write the variances of a reconciliation report to a CSV file.
+
+        Args:
+            report: Report returned by reconcile_physical_count
+            path: Destination file path
+        """
+        ...
+
     def get_item_availability(self, item_type: str, item_id: int) -> Dict[str, Any]:
         """Get availability information for an item.
 
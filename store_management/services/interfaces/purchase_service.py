@@ -71,6 +71,6 @@ class IPurchaseService(Protocol):
         """Generate purchase report between dates."""
         ...
 
-    def auto_generate_for_low_stock(self) -> Dict[str, Any]:
-        """Auto-generate purchase orders for low stock items."""
+    def auto_generate_for_low_stock(self, dry_run: bool = False) -> Dict[str, Any]:
+        """Auto-generate purchase orders for low stock items, or only plan them if dry_run."""
         ...
\ No newline at end of file
@@ -180,6 +180,30 @@ class ISalesService(Protocol):
         """
         ...
 
+    def get_recent_sales(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Get the most recent sales.
+
+        Args:
+            limit: Maximum number of sales to return
+
+        Returns:
+            List of sales, newest first
+        """
+        ...
+
+    def get_monthly_sales_totals(self, months: int = 6,
+                                 end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Get total sales for each of the last few calendar months.
+
+        Args:
+            months: Number of months to include, counting the month of end_date
+            end_date: End of the range, defaults to now
+
+        Returns:
+            List of dicts with period ('YYYY-MM'), month (short name) and value, oldest first
+        """
+        ...
+
     def calculate_total(self, sales_id: int) -> float:
         """Calculate total amount for a sale.
 
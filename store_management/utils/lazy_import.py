@@ -0,0 +1,97 @@
+# utils/lazy_import.py
+"""
+Lazy module proxies for heavy optional dependencies.
+
+Modules such as numpy, pandas and openpyxl take tens to hundreds of milliseconds to
+import but are only needed once a chart is drawn or a report exported. Binding them
+through a proxy keeps them out of application startup:
+
+    np = lazy_module("numpy")
+
+The module is imported on the first attribute access, after which the proxy holds
+the module's attributes itself and costs nothing extra. A missing module raises
+ImportError at first use rather than when the importing module loads.
+"""
+
+import importlib
+import logging
+import sys
+import time
+import types
+from typing import Union
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str):
+        """
+        Initialize the proxy.
+
+        Args:
+            name: Dotted name of the module to import
+        """
+        super().__init__(name)
+        self.__dict__["_lazy_loaded"] = False
+
+    def _load(self) -> types.ModuleType:
+        """
+        Import the module and copy its attributes onto the proxy.
+
+        Returns:
+            The real module
+        """
+        started = time.perf_counter()
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        self.__dict__["_lazy_loaded"] = True
+        logger.debug(f"Lazily imported {self.__name__} in {(time.perf_counter() - started) * 1000:.1f} ms")
+        return module
+
+    def __getattr__(self, name: str):
+        # Only called for attributes not copied from the module yet
+        if self.__dict__["_lazy_loaded"]:
+            raise AttributeError(f"module '{self.__name__}' has no attribute '{name}'")
+        return getattr(self._load(), name)
+
+    def __dir__(self):
+        if not self.__dict__["_lazy_loaded"]:
+            self._load()
+        return super().__dir__()
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_loaded"] else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_module(name: str) -> Union[types.ModuleType, LazyModule]:
+    """
+    Get a module that is imported on first use.
+
+    Args:
+        name: Dotted name of the module
+
+    Returns:
+        The module itself if it is already imported, otherwise a lazy proxy for it
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def is_loaded(module: types.ModuleType) -> bool:
+    """
+    Check whether a module (or lazy proxy) has been imported.
+
+    Args:
+        module: Module or lazy proxy
+
+    Returns:
+        True if the real module has been imported
+    """
+    if isinstance(module, LazyModule):
+        return module.__dict__["_lazy_loaded"]
+    return True
@@ -0,0 +1,242 @@
+# utils/startup_profiler.py
+"""
+Startup profiling for the application entry point.
+
+Every startup phase is timed, and the time from process start to the first paint of
+the main window is logged on each run. In profiling mode (``--profile-startup`` or the
+STORE_MANAGEMENT_PROFILE_STARTUP environment variable) an ``-X importtime``-style
+tree of every module imported before the first paint is recorded as well, and the
+full report is written to ``logs/startup_profile.txt``.
+"""
+
+import importlib.abc
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "STORE_MANAGEMENT_PROFILE_STARTUP"
+PROFILE_FLAG = "--profile-startup"
+
+# (depth, module name, self seconds, cumulative seconds), in completion order
+ImportRecord = Tuple[int, str, float, float]
+
+
+class _TimedLoader:
+    """Loader wrapper that times ``exec_module`` for an ImportTimer."""
+
+    def __init__(self, loader, timer: "ImportTimer", name: str):
+        self._loader = loader
+        self._timer = timer
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        self._timer.run(self._name, self._loader.exec_module, module)
+
+    def __getattr__(self, name: str):
+        return getattr(self._loader, name)
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """
+    Meta path finder recording how long each module takes to import.
+
+    Like ``python -X importtime``, each record has the time spent in the module itself
+    and the cumulative time including the modules it imported, and nesting depth
+    reflects which module triggered which import.
+    """
+
+    def __init__(self):
+        """Initialize the timer."""
+        self.records: List[ImportRecord] = []
+        self._local = threading.local()
+
+    def install(self) -> None:
+        """Start timing imports."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        """Stop timing imports."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path=None, target=None):
+        finding = getattr(self._local, "finding", None)
+        if finding is None:
+            finding = self._local.finding = set()
+        if fullname in finding:
+            return None
+
+        finding.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            finding.discard(fullname)
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def run(self, name: str, exec_module, module) -> None:
+        """
+        Execute a module, recording its self and cumulative time.
+
+        Args:
+            name: Module name
+            exec_module: The real loader's ``exec_module``
+            module: Module being executed
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - started
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.records.append((len(stack), name, elapsed - children, elapsed))
+
+    def format_tree(self) -> str:
+        """
+        Format the records the way ``-X importtime`` prints them.
+
+        Returns:
+            One line per imported module
+        """
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for depth, name, self_time, cumulative in self.records:
+            lines.append(f"import time: {self_time * 1e6:>9.0f} | {cumulative * 1e6:>10.0f} | {'  ' * depth}{name}")
+        return "\n".join(lines)
+
+    def slowest(self, count: int = 15) -> List[ImportRecord]:
+        """
+        Get the imports with the highest cumulative time.
+
+        Args:
+            count: Number of records to return
+
+        Returns:
+            Records sorted by cumulative time, slowest first
+        """
+        return sorted(self.records, key=lambda record: record[3], reverse=True)[:count]
+
+
+class StartupProfiler:
+    """Times startup phases and the first paint, and optionally the import tree."""
+
+    def __init__(self, profile_imports: bool = False):
+        """
+        Initialize the profiler.
+
+        Args:
+            profile_imports: Record an import time tree until the first paint
+        """
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.first_paint: Optional[float] = None
+        self.import_timer: Optional[ImportTimer] = None
+        if profile_imports:
+            self.import_timer = ImportTimer()
+            self.import_timer.install()
+
+    @classmethod
+    def from_environment(cls, argv: Optional[Sequence[str]] = None) -> "StartupProfiler":
+        """
+        Create a profiler, recording imports if profiling was requested.
+
+        Args:
+            argv: Command line arguments (defaults to ``sys.argv``)
+
+        Returns:
+            The profiler
+        """
+        argv = sys.argv if argv is None else argv
+        return cls(profile_imports=PROFILE_FLAG in argv or bool(os.environ.get(PROFILE_ENV)))
+
+    @property
+    def profiling(self) -> bool:
+        """Whether imports are being recorded."""
+        return self.import_timer is not None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a startup phase.
+
+        Args:
+            name: Phase name shown in the report
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    def mark_first_paint(self) -> float:
+        """
+        Record that the main window has painted, and stop recording imports.
+
+        Returns:
+            Seconds from profiler creation to the first paint
+        """
+        if self.first_paint is None:
+            self.first_paint = time.perf_counter() - self.started
+            if self.import_timer is not None:
+                self.import_timer.uninstall()
+        return self.first_paint
+
+    def report(self) -> str:
+        """
+        Format the startup report.
+
+        Returns:
+            Phase times, time to first paint and, when profiling, the import tree
+        """
+        lines = ["Startup phases:"]
+        for name, seconds in self.phases:
+            lines.append(f"  {name:<30}{seconds * 1000:>10.1f} ms")
+        if self.first_paint is not None:
+            lines.append(f"  {'time to first paint':<30}{self.first_paint * 1000:>10.1f} ms")
+
+        if self.import_timer is not None:
+            lines.append("")
+            lines.append("Slowest imports (cumulative):")
+            for _, name, _, cumulative in self.import_timer.slowest():
+                lines.append(f"  {name:<50}{cumulative * 1000:>10.1f} ms")
+            lines.append("")
+            lines.append(self.import_timer.format_tree())
+        return "\n".join(lines)
+
+    def write_report(self, path: str) -> None:
+        """
+        Write the startup report to a file.
+
+        Args:
+            path: Report file path
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.report())
+            f.write("\n")
+        logger.info(f"Startup profile written to {path}")
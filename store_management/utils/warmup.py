@@ -0,0 +1,220 @@
+# utils/warmup.py
+"""
+Data layer warm-up behind a readiness future.
+
+Importing the models, configuring the SQLAlchemy mappers, checking the schema and
+building the DI graph take long enough to delay the first paint noticeably. In
+deferred startup, main.py registers these steps as a Warmup before the window is
+built and starts them on a background thread once the window has painted:
+
+    warmup = Warmup([("model configuration", configure_models), ...])
+    set_warmup(warmup)
+    ...
+    warmup.start()
+
+Code that needs the data layer (``di.get_container`` and ``get_db_session``) calls
+``require_ready`` first, so the first view touching the database waits for the
+warm-up instead of racing it. Views load their data on background workers, so it is
+those workers that wait, not the Tk event loop. Waits are bounded: a warm-up that
+has not finished within DEFAULT_READY_TIMEOUT raises DataLayerNotReadyError instead
+of blocking the worker forever.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# A named warm-up step
+WarmupStep = Tuple[str, Callable[[], Any]]
+
+# Seconds data access waits for the warm-up before giving up
+DEFAULT_READY_TIMEOUT = 60.0
+
+
+class DataLayerNotReadyError(RuntimeError):
+    """Raised when the data layer warm-up has not finished in time."""
+    pass
+
+
+class Warmup:
+    """Runs warm-up steps once and exposes their completion as a future."""
+
+    def __init__(self, steps: Sequence[WarmupStep]):
+        """
+        Initialize the warm-up.
+
+        Args:
+            steps: Named callables, run in order
+        """
+        self.steps = list(steps)
+        self.future: Future = Future()
+        self.timings: List[Tuple[str, float]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self, background: bool = True) -> Future:
+        """
+        Run the steps, unless they have already been started.
+
+        Args:
+            background: Run on a daemon thread; False runs them on the calling thread
+
+        Returns:
+            The readiness future
+        """
+        with self._lock:
+            if self._thread is not None or self.future.done() or self.future.running():
+                return self.future
+            if not background:
+                self._thread = threading.current_thread()
+            else:
+                self._thread = threading.Thread(target=self._run, name="warmup", daemon=True)
+                self._thread.start()
+                return self.future
+
+        self._run()
+        return self.future
+
+    def _run(self) -> None:
+        """Run every step, then resolve the future with the first error, if any."""
+        if not self.future.set_running_or_notify_cancel():
+            return
+
+        started = time.perf_counter()
+        first_error = None
+        for name, step in self.steps:
+            step_started = time.perf_counter()
+            try:
+                step()
+            except Exception as e:
+                # Later steps may not depend on this one, so keep going
+                logger.error(f"Warm-up step '{name}' failed: {str(e)}")
+                first_error = first_error or e
+            elapsed = time.perf_counter() - step_started
+            self.timings.append((name, elapsed))
+            logger.debug(f"Warm-up step '{name}' took {elapsed * 1000:.1f} ms")
+
+        logger.info(f"Data layer warm-up finished in {(time.perf_counter() - started) * 1000:.1f} ms")
+        if first_error is not None:
+            self.future.set_exception(first_error)
+        else:
+            self.future.set_result(True)
+
+    def cancel(self) -> bool:
+        """
+        Cancel the warm-up if it has not started, releasing anything waiting on it.
+
+        Returns:
+            True if the warm-up was cancelled
+        """
+        return self.future.cancel()
+
+    def is_ready(self) -> bool:
+        """Whether every step has finished successfully."""
+        return self.future.done() and not self.future.cancelled() and self.future.exception() is None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the warm-up to finish.
+
+        Returns immediately when called by the steps themselves, so they can use
+        the code that waits on them.
+
+        Args:
+            timeout: Seconds to wait, or None to wait until it finishes
+
+        Returns:
+            True if the warm-up succeeded, False if it failed, was cancelled or timed out
+        """
+        if threading.current_thread() is self._thread and not self.future.done():
+            return True
+
+        try:
+            self.future.result(timeout)
+            return True
+        except FutureTimeoutError:
+            logger.warning(f"Data layer not ready after {timeout} seconds")
+            return False
+        except CancelledError:
+            return False
+        except Exception:
+            # Already logged by the failing step
+            return False
+
+
+# Warm-up of the running application, if it defers one
+_warmup: Optional[Warmup] = None
+
+
+def set_warmup(warmup: Optional[Warmup]) -> None:
+    """
+    Set the application warm-up that ``wait_until_ready`` waits on.
+
+    Args:
+        warmup: The warm-up, or None to clear it
+    """
+    global _warmup
+    _warmup = warmup
+
+
+def get_warmup() -> Optional[Warmup]:
+    """
+    Get the application warm-up.
+
+    Returns:
+        The warm-up, or None if the application has none
+    """
+    return _warmup
+
+
+def wait_until_ready(timeout: Optional[float] = DEFAULT_READY_TIMEOUT) -> bool:
+    """
+    Wait for the application warm-up, if there is one.
+
+    Args:
+        timeout: Seconds to wait, or None to wait until it finishes
+
+    Returns:
+        True if there is no warm-up or it succeeded, False otherwise
+    """
+    warmup = _warmup
+    if warmup is None:
+        return True
+    return warmup.wait(timeout)
+
+
+def require_ready(timeout: Optional[float] = DEFAULT_READY_TIMEOUT) -> None:
+    """
+    Wait for the application warm-up, raising if it does not finish in time.
+
+    A warm-up that finished with a failed step does not raise; the step has already
+    been logged and the code that needs it reports its own error.
+
+    Args:
+        timeout: Seconds to wait, or None to wait until it finishes
+
+    Raises:
+        DataLayerNotReadyError: If the warm-up is still pending or running after the timeout
+    """
+    warmup = _warmup
+    if warmup is None or warmup.wait(timeout) or warmup.future.done():
+        return
+    started = warmup.future.running()
+    raise DataLayerNotReadyError(
+        f"Data layer warm-up {'still running' if started else 'not started'} after {timeout} seconds")
+
+
+def is_ready() -> bool:
+    """
+    Check whether the data layer is ready without waiting.
+
+    Returns:
+        True if there is no warm-up or it has succeeded
+    """
+    warmup = _warmup
+    return warmup is None or warmup.is_ready()
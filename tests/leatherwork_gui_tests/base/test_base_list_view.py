@@ -0,0 +1,89 @@
+# tests/leatherwork_gui_tests/base/test_base_list_view.py
+"""
+Unit tests for the background page loads of the base list view.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+# Add the project root to the Python path
+import sys
+import os
+
+project_root = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    '..', '..', '..', 'store_management'
+))
+sys.path.insert(0, project_root)
+
+from gui.base.base_list_view import BaseListView
+from gui.utils.page_cache import PageCache
+from gui.utils.search_cache import SearchCache
+
+
+class RecordingService:
+    """List service recording the arguments of its queries."""
+
+    def __init__(self):
+        self.calls = []
+
+    def count_list_rows(self, **criteria):
+        self.calls.append(("count", criteria))
+        return 1
+
+    def get_list_rows(self, columns, offset, limit, sort_column, sort_direction, **criteria):
+        self.calls.append(("rows", dict(criteria, sort=(sort_column, sort_direction))))
+        return [{"id": 1, "name": "Row"}]
+
+
+class TestBackgroundLoad(unittest.TestCase):
+    """Worker queries use the criteria and sort the load was started with."""
+
+    def _view(self):
+        # The load logic needs no Tk widgets
+        view = object.__new__(BaseListView)
+        view.service_name = "IRecordingService"
+        view.current_page, view.page_size = 1, 10
+        view.filter_criteria = {"status": "active"}
+        view.sort_column, view.sort_direction = "name", "asc"
+        view.columns = [("id", "ID", 50), ("name", "Name", 100)]
+        view.search_frame = None
+        view.search_cache, view.page_cache = SearchCache(), PageCache()
+        view._prefetcher = None
+        view.tasks = []
+        view.run_in_background = lambda task, on_done, on_error=None: view.tasks.append(task)
+        return view
+
+    def test_worker_queries_use_the_snapshot(self):
+        view = self._view()
+        view.load_data()
+
+        # The user changes the filter and sort while the load is queued
+        view.filter_criteria = {"status": "archived"}
+        view.sort_column, view.sort_direction = "id", "desc"
+
+        service = RecordingService()
+        with patch("gui.base.base_list_view.get_worker_service", return_value=service):
+            _, page_data = view.tasks[0]()
+
+        self.assertEqual(page_data, (1, 1, [(1, [1, "Row"])]))
+        self.assertEqual(service.calls, [
+            ("count", {"status": "active"}),
+            ("rows", {"status": "active", "sort": ("name", "asc")}),
+        ])
+
+    def test_partial_pages_are_sorted_by_the_service(self):
+        view = self._view()
+        view.current_page = 3
+        view.treeview = Mock()
+        view.update_pagination_display = Mock()
+        view.display_page((500, 3, [(1, [1, "Row"])]))
+        view.treeview.set_total_rows.assert_called_once_with(500)
+
+        view.on_sort("id", "desc")
+        self.assertEqual((view.sort_column, view.sort_direction, view.current_page), ("id", "desc", 1))
+        self.assertEqual(len(view.tasks), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+# tests/leatherwork_gui_tests/utils/test_background_loader.py
+"""
+Unit tests for the BackgroundLoader utility in the Leatherworking ERP.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+# Add project root to path
+import sys
+import os
+
+project_root = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    '..', '..', '..', 'store_management'
+))
+sys.path.insert(0, project_root)
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from gui.utils import background_loader
+from gui.utils.background_loader import BackgroundLoader, get_worker_session
+
+
+class FakeWidget:
+    """Stand-in for a Tk widget that runs after() callbacks when pumped."""
+
+    def __init__(self):
+        self.callbacks = {}
+        self.next_id = 0
+
+    def after(self, delay, callback):
+        self.next_id += 1
+        self.callbacks[self.next_id] = callback
+        return self.next_id
+
+    def after_cancel(self, callback_id):
+        self.callbacks.pop(callback_id, None)
+
+    def pump(self, until, timeout=5.0):
+        """Run scheduled callbacks until the condition holds."""
+        deadline = time.monotonic() + timeout
+        while not until():
+            if time.monotonic() > deadline:
+                raise AssertionError("Timed out waiting for background load")
+            for callback_id in list(self.callbacks):
+                self.callbacks.pop(callback_id)()
+            time.sleep(0.005)
+
+
+class TestBackgroundLoader(unittest.TestCase):
+    """
+    Test suite for BackgroundLoader.
+    Covers result delivery, supersession, errors and cancellation.
+    """
+
+    def setUp(self):
+        self.widget = FakeWidget()
+        self.busy_states = []
+        self.loader = BackgroundLoader(self.widget, on_busy=self.busy_states.append)
+
+    def tearDown(self):
+        self.loader.cancel()
+
+    def test_result_delivered_on_polling_thread(self):
+        """Results arrive through after() on the thread that pumps the widget."""
+        results = []
+        main_thread = threading.current_thread()
+
+        self.loader.submit("load", lambda: threading.current_thread(), results.append)
+        self.widget.pump(lambda: results)
+
+        self.assertIsNot(results[0], main_thread)
+        self.assertEqual(self.busy_states, [True, False])
+        self.assertFalse(self.loader.busy)
+
+    def test_newer_request_supersedes_older(self):
+        """Only the newest load for a key is delivered."""
+        release = threading.Event()
+        results = []
+
+        def slow():
+            release.wait(5)
+            return "stale"
+
+        self.loader.submit("load", slow, results.append)
+        self.loader.submit("load", lambda: "fresh", results.append)
+        release.set()
+        self.widget.pump(lambda: not self.loader.busy)
+        time.sleep(0.05)
+        self.widget.pump(lambda: True)
+
+        self.assertEqual(results, ["fresh"])
+        self.assertEqual(self.busy_states, [True, False])
+
+    def test_error_goes_to_error_callback(self):
+        """Exceptions raised on the worker are handed to on_error."""
+        errors = []
+
+        def failing():
+            raise ValueError("boom")
+
+        self.loader.submit("load", failing, lambda result: self.fail("unexpected result"), errors.append)
+        self.widget.pump(lambda: errors)
+
+        self.assertIsInstance(errors[0], ValueError)
+
+    def test_each_task_gets_its_own_session(self):
+        """Worker sessions are committed and closed when their task ends."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        factory = sessionmaker(bind=engine)
+        sessions, results, errors = [], [], []
+
+        def write(value):
+            session = get_worker_session()
+            self.assertIs(session, get_worker_session())
+            sessions.append(session)
+            session.execute(text("CREATE TABLE IF NOT EXISTS t (v INTEGER)"))
+            session.execute(text("INSERT INTO t VALUES (:v)"), {"v": value})
+            if value < 0:
+                raise ValueError("rejected")
+            return value
+
+        with patch("database.sqlalchemy.session.get_db_session", factory):
+            self.loader.submit("first", lambda: write(1), results.append)
+            self.widget.pump(lambda: results)
+            self.loader.submit("second", lambda: write(-1), results.append, errors.append)
+            self.widget.pump(lambda: errors)
+
+        self.assertIsNot(sessions[0], sessions[1])
+        self.assertFalse(any(session.in_transaction() for session in sessions))
+        with engine.connect() as connection:
+            self.assertEqual(connection.execute(text("SELECT v FROM t")).scalars().all(), [1])
+
+    def test_cancel_interrupts_running_query(self):
+        """Cancelling a running load aborts its SQLite query."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
+        factory = sessionmaker(bind=engine)
+        started = threading.Event()
+        finished = []
+
+        def long_query():
+            session = get_worker_session()
+            started.set()
+            try:
+                session.execute(text(
+                    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) "
+                    "SELECT count(*) FROM n"
+                )).scalar()
+            finally:
+                finished.append(time.monotonic())
+
+        with patch("database.sqlalchemy.session.get_db_session", factory):
+            self.loader.submit("load", long_query, lambda result: self.fail("unexpected result"))
+            self.assertTrue(started.wait(5))
+            time.sleep(0.05)
+            cancelled_at = time.monotonic()
+            self.loader.cancel("load")
+
+            deadline = time.monotonic() + 5
+            while not finished and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        self.assertTrue(finished)
+        self.assertLess(finished[0] - cancelled_at, 1.0)
+        self.assertEqual(self.busy_states, [True, False])
+        background_loader.shutdown(wait=True)
+
+    def test_connection_returned_to_pool_is_unbound(self):
+        """A task that commits mid-way cannot interrupt the connection it gave back."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        factory = sessionmaker(bind=engine)
+        bound, results = [], []
+
+        def commit_midway():
+            session = get_worker_session()
+            load_task = background_loader._worker_state.task
+            session.execute(text("SELECT 1"))
+            bound.append(load_task.interrupt is not None)
+            session.commit()
+            bound.append(load_task.interrupt is not None)
+            session.execute(text("SELECT 1"))
+            bound.append(load_task.interrupt is not None)
+            return load_task
+
+        with patch("database.sqlalchemy.session.get_db_session", factory):
+            self.loader.submit("load", commit_midway, results.append)
+            self.widget.pump(lambda: results)
+
+        self.assertEqual(bound, [True, False, True])
+        self.assertIsNone(results[0].interrupt)
+        self.assertNotIn(results[0], background_loader._bound_tasks.values())
+
+
+if __name__ == '__main__':
+    unittest.main()
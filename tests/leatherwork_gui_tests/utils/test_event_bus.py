@@ -0,0 +1,163 @@
+# tests/leatherwork_gui_tests/utils/test_event_bus.py
+"""
+Unit tests for the EventBus utility in the Leatherworking ERP.
+"""
+
+import gc
+import unittest
+
+# Add project root to path
+import sys
+import os
+
+project_root = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    '..', '..', '..', 'store_management'
+))
+sys.path.insert(0, project_root)
+
+from gui.utils.event_bus import PRIORITY_HIGH, EventBus
+
+
+class FakeRoot:
+    """Stand-in for a Tk root that runs idle callbacks on demand."""
+
+    def __init__(self):
+        self.idle_callbacks = []
+
+    def after_idle(self, callback):
+        self.idle_callbacks.append(callback)
+
+    def run_idle(self):
+        callbacks, self.idle_callbacks = self.idle_callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+class Listener:
+    """Subscriber recording the events it receives."""
+
+    def __init__(self, exists=True):
+        self.received = []
+        self.exists = exists
+
+    def on_event(self, data):
+        self.received.append(data)
+
+    def winfo_exists(self):
+        return self.exists
+
+
+class TestEventBus(unittest.TestCase):
+    """Tests for subscription, priorities and deferred dispatch."""
+
+    def setUp(self):
+        self.bus = EventBus()
+        self.calls = []
+
+    def test_publish_without_root_dispatches_immediately(self):
+        self.bus.subscribe("topic", self.calls.append)
+        self.bus.publish("topic", 1)
+        self.assertEqual(self.calls, [1])
+
+    def test_higher_priority_subscribers_run_first(self):
+        self.bus.subscribe("topic", lambda data: self.calls.append("normal"))
+        self.bus.subscribe("topic", lambda data: self.calls.append("high"), priority=PRIORITY_HIGH)
+        self.bus.subscribe("topic", lambda data: self.calls.append("normal 2"))
+        self.bus.publish("topic")
+        self.assertEqual(self.calls, ["high", "normal", "normal 2"])
+
+    def test_failing_handler_does_not_stop_others(self):
+        self.bus.subscribe("topic", lambda data: 1 / 0)
+        self.bus.subscribe("topic", self.calls.append)
+        self.bus.publish("topic", "data")
+        self.assertEqual(self.calls, ["data"])
+
+    def test_bound_methods_are_held_weakly(self):
+        listener = Listener()
+        self.bus.subscribe("topic", listener.on_event)
+        self.assertEqual(self.bus.subscriber_count("topic"), 1)
+
+        del listener
+        gc.collect()
+        self.assertEqual(self.bus.subscriber_count("topic"), 0)
+        self.bus.publish("topic")
+        self.assertNotIn("topic", self.bus._subscribers)
+
+    def test_destroyed_widgets_are_dropped(self):
+        listener = Listener()
+        self.bus.subscribe("topic", listener.on_event)
+        listener.exists = False
+        self.bus.publish("topic", 1)
+        self.assertEqual(listener.received, [])
+        self.assertEqual(self.bus.subscriber_count("topic"), 0)
+
+    def test_unsubscribe_bound_method(self):
+        listener = Listener()
+        self.bus.subscribe("topic", listener.on_event)
+        self.bus.unsubscribe("topic", listener.on_event)
+        self.bus.publish("topic", 1)
+        self.assertEqual(listener.received, [])
+
+    def test_bulk_publish_is_coalesced_into_one_dispatch(self):
+        root = FakeRoot()
+        self.bus.attach(root)
+        listener = Listener()
+        self.bus.subscribe("inventory_updated", listener.on_event)
+
+        for row in range(500):
+            self.bus.publish("inventory_updated", {"row": row}, key="reload")
+        self.assertEqual(listener.received, [])
+        self.assertEqual(len(root.idle_callbacks), 1)
+
+        root.run_idle()
+        self.assertEqual(listener.received, [{"row": 499}])
+        stats = self.bus.get_stats()["inventory_updated"]
+        self.assertEqual((stats["published"], stats["coalesced"], stats["handler_calls"]), (500, 499, 1))
+
+    def test_default_key_keeps_events_about_different_records(self):
+        root = FakeRoot()
+        self.bus.attach(root)
+        self.bus.subscribe("pattern_updated", self.calls.append)
+
+        for pattern_id in (1, 2, 1, 3, 2):
+            self.bus.publish("pattern_updated", {"pattern_id": pattern_id})
+        self.bus.publish("pattern_updated", {"ids": [4, 5]})
+        self.bus.publish("pattern_updated", {"ids": [4, 5]})
+        # Payloads that cannot be hashed are never coalesced
+        self.bus.publish("pattern_updated", {"data": bytearray(b"x")})
+        self.bus.publish("pattern_updated", {"data": bytearray(b"x")})
+
+        root.run_idle()
+        self.assertEqual(self.calls[:4], [{"pattern_id": 1}, {"pattern_id": 2}, {"pattern_id": 3}, {"ids": [4, 5]}])
+        self.assertEqual(len(self.calls), 6)
+        self.assertEqual(self.bus.get_stats()["pattern_updated"]["coalesced"], 3)
+
+    def test_distinct_keys_are_delivered_separately(self):
+        root = FakeRoot()
+        self.bus.attach(root)
+        self.bus.subscribe("topic", self.calls.append)
+
+        for key in (1, 2, 1):
+            self.bus.publish("topic", key, key=key)
+        self.bus.publish("topic", "now", immediate=True)
+        self.assertEqual(self.calls, ["now"])
+
+        root.run_idle()
+        self.assertEqual(self.calls, ["now", 1, 2])
+
+    def test_events_published_by_handlers_wait_for_next_frame(self):
+        root = FakeRoot()
+        self.bus.attach(root)
+        self.bus.subscribe("first", lambda data: self.bus.publish("second"))
+        self.bus.subscribe("second", self.calls.append)
+
+        self.bus.publish("first")
+        root.run_idle()
+        self.assertEqual(self.calls, [])
+        root.run_idle()
+        self.assertEqual(self.calls, [None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+# tests/leatherwork_gui_tests/utils/test_page_cache.py
+"""
+Unit tests for the PageCache utility in the Leatherworking ERP.
+"""
+
+import unittest
+
+# Add project root to path
+import sys
+import os
+
+project_root = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    '..', '..', '..', 'store_management'
+))
+sys.path.insert(0, project_root)
+
+from gui.utils.page_cache import PageCache, page_key
+
+
+class TestPageCache(unittest.TestCase):
+    """Tests for the list page cache."""
+
+    def setUp(self):
+        self.cache = PageCache(max_pages=2, timeout=60)
+
+    def test_key_covers_filters_sort_and_page(self):
+        key = page_key({"status": "active"}, "id", "asc", 50, 1)
+        self.assertEqual(key, page_key({"status": "active"}, "id", "asc", 50, 1))
+        self.assertNotEqual(key, page_key({"status": "sold"}, "id", "asc", 50, 1))
+        self.assertNotEqual(key, page_key({"status": "active"}, "id", "desc", 50, 1))
+        self.assertNotEqual(key, page_key({"status": "active"}, "id", "asc", 100, 1))
+        self.assertNotEqual(key, page_key({"status": "active"}, "id", "asc", 50, 2))
+
+    def test_key_accepts_unhashable_filters(self):
+        key = page_key({"filters": {"date_range": [None, None]}}, "id", "asc", 50, 1)
+        self.cache.put(key, (0, 1, []))
+        self.assertIn(key, self.cache)
+
+    def test_least_recently_used_page_is_dropped(self):
+        first, second, third = (page_key({}, "id", "asc", 50, page) for page in (1, 2, 3))
+        self.cache.put(first, (150, 1, ["a"]))
+        self.cache.put(second, (150, 2, ["b"]))
+        self.assertEqual(self.cache.get(first), (150, 1, ["a"]))
+
+        self.cache.put(third, (150, 3, ["c"]))
+        self.assertIn(first, self.cache)
+        self.assertNotIn(second, self.cache)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_expired_pages_miss(self):
+        key = page_key({}, "id", "asc", 50, 1)
+        self.cache.put(key, (0, 1, []))
+        self.cache.timeout = -1
+        self.assertIsNone(self.cache.get(key))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_clear(self):
+        self.cache.put(page_key({}, "id", "asc", 50, 1), (0, 1, []))
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# tests/leatherwork_gui_tests/utils/test_search_cache.py
+"""
+Unit tests for the SearchCache utility in the Leatherworking ERP.
+"""
+
+import unittest
+
+# Add project root to path
+import sys
+import os
+
+project_root = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    '..', '..', '..', 'store_management'
+))
+sys.path.insert(0, project_root)
+
+from gui.utils.search_cache import SearchCache, search_key
+
+TEXT_FIELDS = ["name", "description"]
+
+
+def make_rows(items):
+    """Build cached rows the way BaseListView does."""
+    return [(item["id"], [item["id"], item["name"]],
+             {name: search_key(item, name) for name in TEXT_FIELDS})
+            for item in items]
+
+
+class TestSearchCache(unittest.TestCase):
+    """Tests for client-side narrowing of cached search results."""
+
+    def setUp(self):
+        self.cache = SearchCache(max_entries=3, timeout=60)
+        self.items = [
+            {"id": 1, "name": "Bridle Leather", "description": "Veg tan", "status": "active"},
+            {"id": 2, "name": "Brick Red Suede", "description": None, "status": "active"},
+            {"id": 3, "name": "Ribbon", "description": "Bridge binding", "status": "active"},
+        ]
+        self.cache.store({"name": "bri"}, ("id", "asc"), make_rows(self.items))
+
+    def test_longer_term_is_filtered_from_cache(self):
+        rows = self.cache.narrow({"name": "BRID"}, ("id", "asc"), TEXT_FIELDS)
+        self.assertEqual([row[0] for row in rows], [1])
+
+    def test_new_text_field_is_narrowed(self):
+        rows = self.cache.narrow({"name": "bri", "description": "bind"}, ("id", "asc"), TEXT_FIELDS)
+        self.assertEqual([row[0] for row in rows], [3])
+
+    def test_unrelated_query_misses(self):
+        self.assertIsNone(self.cache.narrow({"name": "br"}, ("id", "asc"), TEXT_FIELDS))
+        self.assertIsNone(self.cache.narrow({"name": "leather"}, ("id", "asc"), TEXT_FIELDS))
+
+    def test_non_text_criteria_and_context_must_match(self):
+        self.assertIsNone(self.cache.narrow({"name": "brid", "status": "active"}, ("id", "asc"), TEXT_FIELDS))
+        self.assertIsNone(self.cache.narrow({"name": "brid"}, ("name", "desc"), TEXT_FIELDS))
+
+    def test_missing_field_cannot_be_narrowed(self):
+        self.assertIsNone(self.cache.narrow({"name": "bri", "sku": "x"}, ("id", "asc"), TEXT_FIELDS + ["sku"]))
+
+    def test_expired_and_cleared_entries_miss(self):
+        self.cache.timeout = -1
+        self.assertIsNone(self.cache.narrow({"name": "brid"}, ("id", "asc"), TEXT_FIELDS))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_least_recently_used_entries_are_dropped(self):
+        for term in ("x", "y", "z"):
+            self.cache.store({"name": term}, ("id", "asc"), [])
+        self.assertIsNone(self.cache.narrow({"name": "brid"}, ("id", "asc"), TEXT_FIELDS))
+        self.assertEqual(len(self.cache), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
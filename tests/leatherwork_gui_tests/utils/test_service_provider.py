@@ -28,7 +28,7 @@ from gui.utils.service_provider import (
 )
 
 # Import DI modules for testing
-from di import initialize, resolve, Container, set_container, clear_container
+from di import initialize, resolve, Container, Lifetime, set_container, clear_container
 
 
 class MockService:
@@ -109,6 +109,13 @@ class TestServiceProvider(unittest.TestCase):
         self.assertIsNotNone(service)
         self.assertTrue(hasattr(service, 'mock_generated'))
 
+    def test_get_service_without_interface_prefix(self):
+        """
+        Test that a name without the "I" prefix resolves the interface registration.
+        """
+        service = ServiceProvider.get_service("MockService")
+        self.assertIs(service, ServiceProvider.get_service("IMockService"))
+
     def test_get_service_not_found(self):
         """
         Test service resolution failure.
@@ -198,5 +205,62 @@ class TestServiceProvider(unittest.TestCase):
         )
 
 
+class SessionBoundService:
+    """Scoped service recording the session it was created with."""
+
+    def __init__(self, session):
+        self.session = session
+
+    def save(self, fail=False):
+        if fail:
+            raise ValueError("Save failed")
+        return self.session
+
+
+class TestServiceProviderUnitOfWork(unittest.TestCase):
+    """
+    Tests that scoped services are resolved per unit of work and never cached.
+    """
+
+    def setUp(self):
+        container = Container()
+        container.register_factory("Session", lambda c: Mock(), Lifetime.SCOPED)
+        container.register_factory(
+            "ISessionBoundService", lambda c: SessionBoundService(c.resolve("Session")), Lifetime.SCOPED
+        )
+        set_container(container)
+        ServiceProvider.clear_cache()
+        self.addCleanup(clear_container)
+
+    def test_scoped_services_are_not_cached(self):
+        ServiceProvider.get_service("ISessionBoundService")
+        self.assertNotIn("ISessionBoundService", ServiceProvider._service_cache)
+
+    def test_each_operation_commits_and_closes_its_own_session(self):
+        first = ServiceProvider.execute_service_operation("ISessionBoundService", "save")
+        second = ServiceProvider.execute_service_operation("ISessionBoundService", "save")
+
+        self.assertIsNot(first, second)
+        for session in (first, second):
+            session.commit.assert_called_once_with()
+            session.close.assert_called_once_with()
+
+    def test_failed_operation_rolls_back(self):
+        sessions = []
+        container = Container()
+        container.register_factory("Session", lambda c: sessions.append(Mock()) or sessions[-1], Lifetime.SCOPED)
+        container.register_factory(
+            "ISessionBoundService", lambda c: SessionBoundService(c.resolve("Session")), Lifetime.SCOPED
+        )
+        set_container(container)
+
+        with self.assertRaises(ServiceProviderError):
+            ServiceProvider.execute_service_operation("ISessionBoundService", "save", fail=True)
+
+        sessions[0].rollback.assert_called_once_with()
+        sessions[0].commit.assert_not_called()
+        sessions[0].close.assert_called_once_with()
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
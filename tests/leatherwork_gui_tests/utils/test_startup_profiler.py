@@ -0,0 +1,153 @@
+# tests/leatherwork_gui_tests/utils/test_startup_profiler.py
+"""
+Unit tests for lazy imports, the startup profiler and the first paint budget.
+"""
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import tkinter as tk
+import unittest
+
+project_root = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    '..', '..', '..', 'store_management'
+))
+sys.path.insert(0, project_root)
+
+from gui import config as gui_config
+from utils.lazy_import import LazyModule, is_loaded, lazy_module
+from utils.startup_profiler import ImportTimer, StartupProfiler
+
+# Modules that must not be imported before the main window first paints
+HEAVY_MODULES = ("numpy", "pandas", "openpyxl", "PIL", "cairosvg", "initialize_database")
+
+
+def _run_python(code_or_args, timeout=120):
+    """Run Python in a fresh process from the store_management directory."""
+    args = ["-c", code_or_args] if isinstance(code_or_args, str) else list(code_or_args)
+    env = dict(os.environ, PYTHONPATH=project_root)
+    return subprocess.run(
+        [sys.executable] + args, cwd=project_root, env=env,
+        capture_output=True, text=True, timeout=timeout
+    )
+
+
+class TestLazyModule(unittest.TestCase):
+    """Tests for lazy module proxies."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        with open(os.path.join(self.directory.name, "lazy_probe_module.py"), "w") as f:
+            f.write("VALUE = 42\n")
+        sys.path.insert(0, self.directory.name)
+        self.addCleanup(sys.path.remove, self.directory.name)
+        self.addCleanup(sys.modules.pop, "lazy_probe_module", None)
+
+    def test_import_is_deferred_until_first_attribute_access(self):
+        module = lazy_module("lazy_probe_module")
+        self.assertIsInstance(module, LazyModule)
+        self.assertFalse(is_loaded(module))
+        self.assertNotIn("lazy_probe_module", sys.modules)
+
+        self.assertEqual(module.VALUE, 42)
+        self.assertTrue(is_loaded(module))
+        self.assertIn("lazy_probe_module", sys.modules)
+
+    def test_imported_module_is_returned_directly(self):
+        self.assertIs(lazy_module("os"), os)
+        self.assertTrue(is_loaded(os))
+
+    def test_missing_module_fails_on_first_use(self):
+        module = lazy_module("lazy_probe_missing_module")
+        with self.assertRaises(ImportError):
+            module.anything
+
+
+class TestStartupProfiler(unittest.TestCase):
+    """Tests for the import timer and phase report."""
+
+    def test_import_timer_records_nested_imports(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        with open(os.path.join(directory.name, "timer_probe_outer.py"), "w") as f:
+            f.write("import timer_probe_inner\n")
+        with open(os.path.join(directory.name, "timer_probe_inner.py"), "w") as f:
+            f.write("VALUE = 1\n")
+        sys.path.insert(0, directory.name)
+        self.addCleanup(sys.path.remove, directory.name)
+        for name in ("timer_probe_outer", "timer_probe_inner"):
+            self.addCleanup(sys.modules.pop, name, None)
+
+        timer = ImportTimer()
+        timer.install()
+        try:
+            import timer_probe_outer  # noqa: F401
+        finally:
+            timer.uninstall()
+
+        records = {name: (depth, self_time, cumulative) for depth, name, self_time, cumulative in timer.records}
+        self.assertEqual(records["timer_probe_inner"][0], records["timer_probe_outer"][0] + 1)
+        self.assertGreaterEqual(records["timer_probe_outer"][2], records["timer_probe_inner"][2])
+        self.assertIn("timer_probe_outer", timer.format_tree())
+
+    def test_report_lists_phases_and_first_paint(self):
+        profiler = StartupProfiler()
+        with profiler.phase("configuration"):
+            pass
+        profiler.mark_first_paint()
+
+        report = profiler.report()
+        self.assertIn("configuration", report)
+        self.assertIn("time to first paint", report)
+        self.assertFalse(profiler.profiling)
+
+
+class TestStartupBudget(unittest.TestCase):
+    """Regression tests keeping heavy work out of application startup."""
+
+    def test_startup_imports_leave_heavy_modules_unloaded(self):
+        result = _run_python(
+            "import sys, main, gui.main_window\n"
+            f"print('loaded:', [m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("loaded: []", result.stdout)
+
+    def test_first_paint_callback_runs_once_after_map(self):
+        try:
+            root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("No display available")
+        self.addCleanup(root.destroy)
+
+        from main import _bind_first_paint
+        calls = []
+        _bind_first_paint(root, lambda: calls.append(root.winfo_ismapped()))
+        tk.Label(root, text="child").pack()
+        root.deiconify()
+        root.wait_visibility()
+        root.update()
+        root.withdraw()
+        root.deiconify()
+        root.update()
+
+        self.assertEqual(calls, [1])
+
+    def test_first_paint_within_budget(self):
+        try:
+            tk.Tk().destroy()
+        except tk.TclError:
+            self.skipTest("No display available")
+
+        result = _run_python(["main.py", "--exit-after-first-paint"])
+        match = re.search(r"first paint: ([0-9.]+)s", result.stdout)
+        self.assertIsNotNone(match, result.stdout + result.stderr)
+        self.assertLess(float(match.group(1)), gui_config.STARTUP_FIRST_PAINT_BUDGET)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# tests/leatherwork_gui_tests/utils/test_tile_cache.py
+"""
+Unit tests for the TileCache utility in the Leatherworking ERP.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add project root to path
+import sys
+
+project_root = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    '..', '..', '..', 'store_management'
+))
+sys.path.insert(0, project_root)
+
+from PIL import Image
+
+from gui.utils.tile_cache import TileCache, file_digest, tile_grid
+from gui.views.patterns.pattern_file_viewer import render_pattern_page
+
+
+class TestTileCache(unittest.TestCase):
+    """Tests for the in-memory and on-disk tile cache."""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = TileCache(cache_dir=self.cache_dir, max_tiles=2, tile_size=100)
+        self.image = Image.new("RGB", (250, 120), "white")
+        self.image.putpixel((240, 110), (255, 0, 0))
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_tile_grid_covers_partial_tiles(self):
+        self.assertEqual(tile_grid(250, 120, 100), (3, 2))
+        self.assertEqual(tile_grid(200, 100, 100), (2, 1))
+
+    def test_least_recently_used_tile_is_dropped(self):
+        self.cache.put(("f", 0, 0, 0), "a")
+        self.cache.put(("f", 0, 1, 0), "b")
+        self.assertEqual(self.cache.get(("f", 0, 0, 0)), "a")
+
+        self.cache.put(("f", 0, 2, 0), "c")
+        self.assertIn(("f", 0, 0, 0), self.cache)
+        self.assertNotIn(("f", 0, 1, 0), self.cache)
+
+    def test_level_is_cut_into_tiles_and_reloaded_from_disk(self):
+        tiles = self.cache.store_level("f", 3, self.image)
+        self.assertEqual(len(tiles), 6)
+        self.assertEqual(tiles[("f", 3, 2, 1)].size, (50, 20))
+        self.assertEqual(len(self.cache), 0)
+
+        tile = self.cache.load(("f", 3, 2, 1))
+        self.assertEqual(tile.getpixel((40, 10)), (255, 0, 0))
+        self.assertIn(("f", 3, 2, 1), self.cache)
+        self.assertIsNone(self.cache.load(("f", 4, 0, 0)))
+
+    def test_rendered_level_size_is_recorded_on_disk(self):
+        self.assertIsNone(self.cache.level_size("f", 3))
+        self.cache.store_level("f", 3, self.image)
+        self.assertEqual(self.cache.level_size("f", 3), (250, 120))
+
+        reopened = TileCache(cache_dir=self.cache_dir, tile_size=100)
+        self.assertEqual(reopened.level_size("f", 3), (250, 120))
+        self.assertIsNone(reopened.level_size("f", 4))
+
+    def test_overview_round_trip(self):
+        self.assertIsNone(self.cache.load_overview("f"))
+        self.cache.store_overview("f", self.image.resize((25, 12)), self.image.size)
+
+        overview, size = self.cache.load_overview("f")
+        self.assertEqual(size, (250, 120))
+        self.assertEqual(overview.size, (25, 12))
+
+    def test_prune_removes_least_recently_used_files(self):
+        self.cache.disk_max_bytes = 0
+        self.cache.store_level("old", 0, self.image)
+        os.utime(os.path.join(self.cache_dir, "old"), (0, 0))
+        self.cache.store_overview("new", self.image, self.image.size)
+
+        self.assertEqual(os.listdir(self.cache_dir), ["new"])
+
+    def test_render_scales_images(self):
+        buffer = io.BytesIO()
+        self.image.save(buffer, "PNG")
+        content = buffer.getvalue()
+
+        self.assertEqual(render_pattern_page(content, "png", 1.0).size, (250, 120))
+        self.assertEqual(render_pattern_page(content, "png", 1.2).size, (300, 144))
+        self.assertEqual(file_digest(content), file_digest(bytes(content)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+# tests/leatherwork_gui_tests/utils/test_view_cache.py
+"""
+Unit tests for the ViewCache utility in the Leatherworking ERP.
+"""
+
+import unittest
+
+# Add project root to path
+import sys
+import os
+
+project_root = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    '..', '..', '..', 'store_management'
+))
+sys.path.insert(0, project_root)
+
+from gui.utils.event_bus import publish
+from gui.utils.view_cache import ViewCache
+
+
+class FakeWidget:
+    """Stand-in for a Tk container that records packing and destruction."""
+
+    def __init__(self, children=0, rows=0):
+        self.packed = True
+        self.destroyed = False
+        self.rows = rows
+        self.children = [FakeWidget() for _ in range(children)]
+
+    def pack(self, **kwargs):
+        self.packed = True
+
+    def pack_forget(self):
+        self.packed = False
+
+    def destroy(self):
+        self.destroyed = True
+
+    def winfo_class(self):
+        return 'Treeview' if self.rows else 'TFrame'
+
+    def winfo_children(self):
+        return self.children
+
+    def get_children(self):
+        return tuple(range(self.rows))
+
+
+class FakeView:
+    """Stand-in for a view that records destruction."""
+
+    def __init__(self):
+        self.destroyed = False
+
+    def destroy(self):
+        self.destroyed = True
+
+
+class FakeListView(FakeView):
+    """Stand-in for a list view that drops its own cached pages for a topic."""
+
+    invalidation_topics = ("test.sale_updated",)
+
+    def __init__(self):
+        super().__init__()
+        self.refreshed = 0
+
+    def refresh(self):
+        self.refreshed += 1
+
+
+class TestViewCache(unittest.TestCase):
+    """
+    Test suite for ViewCache.
+    Covers reuse, LRU eviction, memory budget and event bus invalidation.
+    """
+
+    def setUp(self):
+        self.cache = ViewCache(
+            max_views=3,
+            memory_budget_kb=1000,
+            invalidation_topics={"inventory": ["test.inventory_updated"],
+                                 "sales": ["test.sale_updated", "test.customer_updated"]},
+            excluded_views=["reports"])
+
+    def tearDown(self):
+        self.cache.close()
+
+    def _put(self, name, view_class=FakeView, **widget_kwargs):
+        self.cache.hide_all()
+        view, container = view_class(), FakeWidget(**widget_kwargs)
+        self.cache.put(name, view, container)
+        return view, container
+
+    def test_hidden_view_is_shown_again_without_rebuild(self):
+        """Navigating back shows the same view instance instead of rebuilding it."""
+        view, container = self._put("inventory")
+        self._put("sales")
+
+        self.assertFalse(container.packed)
+        self.cache.hide_all()
+        self.assertIs(self.cache.show("inventory"), view)
+        self.assertTrue(container.packed)
+        self.assertFalse(container.destroyed)
+
+    def test_least_recently_shown_view_is_evicted(self):
+        """Going over max_views destroys the least recently shown view."""
+        inventory_view, inventory_container = self._put("inventory")
+        self._put("sales")
+        self.cache.hide_all()
+        self.cache.show("inventory")
+        self._put("projects")
+        self._put("purchases")
+
+        self.assertNotIn("sales", self.cache)
+        self.assertIn("inventory", self.cache)
+        self.assertEqual(len(self.cache), 3)
+        self.assertFalse(inventory_view.destroyed)
+
+    def test_memory_budget_evicts_large_views(self):
+        """Views are evicted once the estimated footprint exceeds the budget."""
+        large_view, _ = self._put("inventory", children=1, rows=900)
+        self._put("sales", children=1, rows=200)
+
+        self.assertNotIn("inventory", self.cache)
+        self.assertTrue(large_view.destroyed)
+        self.assertIn("sales", self.cache)
+
+    def test_invalidation_destroys_hidden_view_and_defers_visible_one(self):
+        """Event bus topics drop hidden views at once and visible views on next show."""
+        view, container = self._put("inventory")
+        publish("test.inventory_updated", {})
+
+        # Still visible, so it stays on screen until navigated away from
+        self.assertFalse(view.destroyed)
+        self._put("sales")
+        self.assertTrue(view.destroyed)
+        self.assertIsNone(self.cache.show("inventory"))
+
+        view, _ = self._put("inventory")
+        self._put("sales")
+        publish("test.inventory_updated", {})
+        self.assertTrue(view.destroyed)
+        self.assertNotIn("inventory", self.cache)
+
+    def test_views_handling_a_topic_are_reloaded_instead_of_rebuilt(self):
+        """Views listing a topic in invalidation_topics are kept and refreshed on show."""
+        view, _ = self._put("sales", view_class=FakeListView)
+        publish("test.sale_updated", {})
+
+        # The visible view is not marked stale by a change it handles itself
+        self._put("inventory")
+        self.assertFalse(view.destroyed)
+        self.cache.hide_all()
+        self.assertIs(self.cache.show("sales"), view)
+        self.assertEqual(view.refreshed, 0)
+
+        self._put("inventory")
+        publish("test.sale_updated", {})
+        self.assertFalse(view.destroyed)
+        self.cache.hide_all()
+        self.assertIs(self.cache.show("sales"), view)
+        self.assertEqual(view.refreshed, 1)
+
+        # Topics the view does not handle still rebuild it
+        self._put("inventory")
+        publish("test.customer_updated", {})
+        self.assertTrue(view.destroyed)
+        self.assertNotIn("sales", self.cache)
+
+    def test_views_with_data_and_excluded_views_are_not_cacheable(self):
+        """Detail views and report views are always rebuilt."""
+        self.assertTrue(self.cache.is_cacheable("inventory"))
+        self.assertTrue(self.cache.is_cacheable("inventory", {}))
+        self.assertFalse(self.cache.is_cacheable("inventory", {"entity_id": 3}))
+        self.assertFalse(self.cache.is_cacheable("reports"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+# tests/leatherwork_gui_tests/utils/test_warmup.py
+"""
+Unit tests for the data layer warm-up and its readiness future.
+"""
+
+import threading
+import unittest
+
+# Add project root to path
+import sys
+import os
+
+project_root = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    '..', '..', '..', 'store_management'
+))
+sys.path.insert(0, project_root)
+
+from di.container import Container, clear_container, get_container, set_container
+from utils.warmup import DataLayerNotReadyError, Warmup, require_ready, set_warmup, wait_until_ready
+
+
+class TestWarmup(unittest.TestCase):
+    """Tests for running warm-up steps and waiting on them."""
+
+    def setUp(self):
+        self.addCleanup(set_warmup, None)
+        self.calls = []
+
+    def test_steps_run_in_order(self):
+        warmup = Warmup([("first", lambda: self.calls.append(1)), ("second", lambda: self.calls.append(2))])
+        warmup.start(background=False)
+        self.assertEqual(self.calls, [1, 2])
+        self.assertTrue(warmup.is_ready())
+        self.assertEqual([name for name, _ in warmup.timings], ["first", "second"])
+
+    def test_waiters_block_until_background_steps_finish(self):
+        release = threading.Event()
+        warmup = Warmup([("slow", release.wait)])
+        set_warmup(warmup)
+        warmup.start()
+
+        self.assertFalse(wait_until_ready(timeout=0.05))
+        release.set()
+        self.assertTrue(wait_until_ready(timeout=5))
+
+    def test_steps_can_use_code_that_waits(self):
+        warmup = Warmup([("nested", lambda: self.calls.append(wait_until_ready(timeout=1)))])
+        set_warmup(warmup)
+        warmup.start().result(timeout=5)
+        self.assertEqual(self.calls, [True])
+
+    def test_failed_step_does_not_stop_later_steps(self):
+        warmup = Warmup([("broken", lambda: 1 / 0), ("after", lambda: self.calls.append("after"))])
+        set_warmup(warmup)
+        warmup.start(background=False)
+
+        self.assertEqual(self.calls, ["after"])
+        self.assertFalse(warmup.is_ready())
+        self.assertFalse(wait_until_ready())
+
+    def test_cancel_releases_waiters_of_unstarted_warmup(self):
+        warmup = Warmup([("never", lambda: self.calls.append("ran"))])
+        set_warmup(warmup)
+        self.assertTrue(warmup.cancel())
+        self.assertFalse(wait_until_ready(timeout=1))
+        warmup.start(background=False)
+        self.assertEqual(self.calls, [])
+
+    def test_without_warmup_nothing_waits(self):
+        self.assertTrue(wait_until_ready(timeout=0))
+        require_ready(timeout=0)
+
+    def test_require_ready_raises_when_warmup_does_not_finish(self):
+        set_warmup(Warmup([("never started", lambda: None)]))
+        with self.assertRaisesRegex(DataLayerNotReadyError, "not started"):
+            require_ready(timeout=0.05)
+
+        release = threading.Event()
+        self.addCleanup(release.set)
+        warmup = Warmup([("slow", release.wait)])
+        set_warmup(warmup)
+        warmup.start()
+        with self.assertRaisesRegex(DataLayerNotReadyError, "still running"):
+            require_ready(timeout=0.05)
+
+        release.set()
+        require_ready(timeout=5)
+
+    def test_require_ready_returns_after_failed_step(self):
+        warmup = Warmup([("broken", lambda: 1 / 0)])
+        set_warmup(warmup)
+        warmup.start(background=False)
+        require_ready(timeout=0)
+
+    def test_get_container_waits_for_service_graph(self):
+        clear_container()
+        self.addCleanup(clear_container)
+        container = Container()
+        release = threading.Event()
+
+        def build_graph():
+            release.wait()
+            set_container(container)
+
+        warmup = Warmup([("service graph", build_graph)])
+        set_warmup(warmup)
+        warmup.start()
+
+        resolved = []
+        waiter = threading.Thread(target=lambda: resolved.append(get_container()))
+        waiter.start()
+        release.set()
+        waiter.join(timeout=5)
+        self.assertEqual(resolved, [container])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+# tests/leatherwork_gui_tests/views/diagnostics/test_memory_diagnostics_dialog.py
+"""
+Unit tests for the memory diagnostics dialog in the Leatherworking ERP.
+"""
+
+import tkinter as tk
+import unittest
+
+# Add project root to path
+import sys
+import os
+
+project_root = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    '..', '..', '..', '..', 'store_management'
+))
+sys.path.insert(0, project_root)
+
+from gui.views.diagnostics.memory_diagnostics_dialog import (
+    MemoryDiagnosticsDialog,
+    format_bytes,
+    session_rows,
+)
+
+
+class TestMemoryDiagnosticsDialog(unittest.TestCase):
+    """Tests for the figures shown by the memory diagnostics dialog."""
+
+    def test_format_bytes(self):
+        self.assertEqual(format_bytes(512), "512 B")
+        self.assertEqual(format_bytes(2048), "2.0 KB")
+        self.assertEqual(format_bytes(3 * 1024 * 1024), "3.0 MB")
+
+    def test_session_rows_follow_column_order(self):
+        stats = [{"session": "session 1", "size": 6, "peak_size": 150, "units_of_work": 3, "sweeps": 2,
+                  "expunged": 144, "oversized": 0, "last_sweep_ms": 1.234}]
+        self.assertEqual(session_rows(stats), [("session 1", 6, 150, 3, 2, 144, 0, "1.2")])
+
+    def test_dialog_shows_and_closes(self):
+        try:
+            root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("No display available")
+        root.withdraw()
+        self.addCleanup(root.destroy)
+
+        dialog = MemoryDiagnosticsDialog(root)
+        dialog.show()
+        self.assertIsNotNone(dialog._refresh_id)
+        dialog.close()
+        self.assertIsNone(dialog._refresh_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
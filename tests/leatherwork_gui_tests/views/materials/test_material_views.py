@@ -0,0 +1,42 @@
+# tests/leatherwork_gui_tests/views/materials/test_material_views.py
+"""
+Unit tests for how the material list views display projected list rows.
+"""
+
+import unittest
+from collections import namedtuple
+
+# Add the project root to the Python path
+import sys
+import os
+
+project_root = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    '..', '..', '..', '..', 'store_management'
+))
+sys.path.insert(0, project_root)
+
+from gui.views.materials.hardware_view import HardwareView
+from gui.views.materials.leather_view import LeatherView
+from gui.views.materials.supplies_view import SuppliesView
+
+
+class TestProjectedRows(unittest.TestCase):
+    """Projected rows are shown as selected, including their inventory columns."""
+
+    def test_inventory_columns_come_from_the_row(self):
+        for view_class in (LeatherView, HardwareView, SuppliesView):
+            with self.subTest(view=view_class.__name__):
+                # The values only depend on the columns, so no Tk widgets are needed
+                view = object.__new__(view_class)
+                view.columns = [("id", "ID", 60), ("name", "Name", 200), ("supplier_name", "Supplier", 150),
+                                ("inventory_status", "Status", 100), ("quantity", "Quantity", 80)]
+                Row = namedtuple("Row", [column[0] for column in view.columns])
+
+                values = view.extract_item_values(Row(1, "Veg tan", None, "IN_STOCK", 4))
+
+                self.assertEqual(values, [1, "Veg tan", "", "IN_STOCK", 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
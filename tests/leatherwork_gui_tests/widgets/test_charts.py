@@ -0,0 +1,240 @@
+# tests/leatherwork_gui_tests/widgets/test_charts.py
+"""
+Unit tests for incremental rendering in the canvas chart widgets.
+"""
+
+import unittest
+import tkinter as tk
+import sys
+import os
+
+import numpy as np
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    '..', '..', '..', 'store_management'
+))
+sys.path.insert(0, project_root)
+
+from gui.widgets.charts.bar_chart import BarChart
+from gui.widgets.charts.canvas_items import CanvasItemPool, unique_keys
+from gui.widgets.charts.downsampling import lttb_indices
+from gui.widgets.charts.heatmap import HeatmapChart
+from gui.widgets.charts.line_chart import LineChart
+from gui.widgets.charts.pie_chart import PieChart
+
+
+def _create_root():
+    """Create a hidden root window, or None when no display is available."""
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    root.withdraw()
+    return root
+
+
+class FakeCanvas:
+    """Stand-in for a Tk canvas that records item calls."""
+
+    def __init__(self):
+        self.next_id = 0
+        self.calls = []
+        self.deleted = []
+
+    def _create(self, kind, *coords, **options):
+        self.next_id += 1
+        self.calls.append(("create", kind))
+        return self.next_id
+
+    def create_line(self, *coords, **options):
+        return self._create("line", *coords, **options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", *coords, **options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._create("rectangle", *coords, **options)
+
+    def coords(self, item_id, *coords):
+        self.calls.append(("coords", item_id))
+
+    def itemconfig(self, item_id, **options):
+        self.calls.append(("itemconfig", item_id, tuple(sorted(options))))
+
+    def delete(self, item_id):
+        self.deleted.append(item_id)
+
+
+class TestCanvasItemPool(unittest.TestCase):
+    """Tests for keyed canvas item reuse."""
+
+    def setUp(self):
+        self.canvas = FakeCanvas()
+        self.pool = CanvasItemPool(self.canvas)
+
+    def _render(self, bars):
+        self.pool.begin()
+        ids = {label: self.pool.rectangle(("bar", label), (0, 100 - height, 10, 100), fill="blue")
+               for label, height in bars.items()}
+        self.pool.end()
+        return ids
+
+    def test_unchanged_items_are_not_touched(self):
+        first = self._render({"Jan": 10, "Feb": 20})
+        self.canvas.calls.clear()
+
+        second = self._render({"Jan": 10, "Feb": 20})
+        self.assertEqual(first, second)
+        self.assertEqual(self.canvas.calls, [])
+
+    def test_changed_items_are_updated_in_place(self):
+        first = self._render({"Jan": 10, "Feb": 20})
+        self.canvas.calls.clear()
+
+        second = self._render({"Jan": 10, "Feb": 30})
+        self.assertEqual(first, second)
+        self.assertEqual(self.canvas.calls, [("coords", first["Feb"])])
+
+        self.canvas.calls.clear()
+        self.pool.begin()
+        self.pool.rectangle(("bar", "Jan"), (0, 90, 10, 100), fill="red")
+        self.pool.end()
+        self.assertEqual(self.canvas.calls, [("itemconfig", first["Jan"], ("fill",))])
+
+    def test_items_not_drawn_are_deleted(self):
+        first = self._render({"Jan": 10, "Feb": 20})
+        self._render({"Jan": 10})
+        self.assertEqual(self.canvas.deleted, [first["Feb"]])
+        self.assertNotIn(("bar", "Feb"), self.pool)
+
+    def test_kind_change_recreates_item(self):
+        self.pool.begin()
+        old = self.pool.line("marker", (0, 0, 1, 1))
+        self.pool.end()
+        self.pool.begin()
+        new = self.pool.text("marker", 0, 0, text="x")
+        self.pool.end()
+        self.assertNotEqual(old, new)
+        self.assertEqual(self.canvas.deleted, [old])
+
+    def test_unique_keys_separate_repeated_labels(self):
+        self.assertEqual(unique_keys(["Jan", "Feb", "Jan"]), [("Jan", 0), ("Feb", 0), ("Jan", 1)])
+
+
+class TestLttbDownsampling(unittest.TestCase):
+    """Tests for Largest-Triangle-Three-Buckets downsampling."""
+
+    def test_short_series_is_kept(self):
+        self.assertEqual(lttb_indices([1, 2, 3], 10).tolist(), [0, 1, 2])
+
+    def test_reduces_to_threshold_keeping_endpoints_and_spikes(self):
+        values = np.sin(np.linspace(0, 20, 10000))
+        values[4321] = 50
+        indices = lttb_indices(values, 200)
+
+        self.assertEqual(len(indices), 200)
+        self.assertEqual((indices[0], indices[-1]), (0, 9999))
+        self.assertIn(4321, indices)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+
+    def test_tiny_threshold_keeps_endpoints(self):
+        self.assertEqual(lttb_indices(range(10), 2).tolist(), [0, 9])
+
+
+class TestHeatmapGrid(unittest.TestCase):
+    """Tests for the heatmap value grid, colormap and cell lookup."""
+
+    def setUp(self):
+        # Skip the widget constructor; the grid logic needs no canvas
+        self.chart = HeatmapChart.__new__(HeatmapChart)
+        self.chart.x_key, self.chart.y_key, self.chart.value_key = "x", "y", "value"
+        self.chart.color_min, self.chart.color_max = "#000000", "#ffffff"
+        self.chart.render = lambda: None
+        self.chart.update_data([
+            {"x": "Mon", "y": "A", "value": 0},
+            {"x": "Tue", "y": "A", "value": 10},
+            {"x": "Mon", "y": "B", "value": 5},
+        ])
+        self.chart.grid_origin = (100, 50)
+        self.chart.grid_cell_size = (20, 10)
+
+    def test_grid_marks_missing_cells(self):
+        grid = self.chart.grid_values
+        self.assertEqual(grid.shape, (2, 2))
+        self.assertEqual(grid[0].tolist(), [0.0, 10.0])
+        self.assertTrue(np.isnan(grid[1, 1]))
+
+    def test_color_grid_uses_colormap(self):
+        colors = self.chart._color_grid()
+        self.assertEqual(colors[0, 0].tolist(), [0, 0, 0])
+        self.assertEqual(colors[0, 1].tolist(), [255, 255, 255])
+        self.assertEqual(colors[1, 0].tolist(), [127, 127, 127])
+        self.assertEqual(colors[1, 1].tolist(), [255, 255, 255])
+
+    def test_cell_at_maps_position_to_cell(self):
+        self.assertEqual(self.chart._cell_at(100, 50), (0, 0))
+        self.assertEqual(self.chart._cell_at(125, 59), (0, 1))
+        self.assertEqual(self.chart._cell_at(119, 60), (1, 0))
+        self.assertIsNone(self.chart._cell_at(125, 65))  # No data
+        self.assertIsNone(self.chart._cell_at(99, 50))
+        self.assertIsNone(self.chart._cell_at(140, 50))
+
+
+class TestChartUpdates(unittest.TestCase):
+    """Tests for idle-batched, item-reusing chart updates."""
+
+    def setUp(self):
+        self.root = _create_root()
+        if self.root is None:
+            self.skipTest("No display available")
+
+    def tearDown(self):
+        if self.root is not None:
+            self.root.destroy()
+
+    def test_bar_chart_update_reuses_bars(self):
+        chart = BarChart(self.root, [{"label": "A", "value": 1}, {"label": "B", "value": 2}], animate=False)
+        bars = list(chart.bars)
+
+        chart.update_data([{"label": "A", "value": 3}, {"label": "B", "value": 2}])
+        chart.update_data([{"label": "A", "value": 4}, {"label": "B", "value": 2}])
+        self.assertEqual(chart.bars, bars)  # Nothing redrawn until idle
+
+        self.root.update_idletasks()
+        self.assertEqual(chart.bars, bars)
+        self.assertEqual(chart.bar_data[bars[0]], ("A", 4.0))
+
+    def test_pie_chart_drops_removed_segments(self):
+        chart = PieChart(self.root, [{"label": "A", "value": 1}, {"label": "B", "value": 1}], animate=False)
+        first_segment = chart.segments[0]
+
+        chart.update_data([{"label": "A", "value": 1}])
+        self.root.update_idletasks()
+        self.assertEqual(chart.segments, [first_segment])
+
+    def test_line_chart_draws_at_most_max_points(self):
+        data = [{"period": f"Day {i}", "value": i % 37} for i in range(5000)]
+        chart = LineChart(self.root, data, animate=False, max_points=100)
+        self.assertEqual(len(chart.markers), 100)
+
+        chart.zoom(0.01)
+        self.root.update_idletasks()
+        self.assertEqual(len(chart.markers), 50)
+
+        chart.reset_zoom()
+        self.root.update_idletasks()
+        self.assertEqual(len(chart.markers), 100)
+
+    def test_large_heatmap_renders_as_one_image(self):
+        data = [{"x": x, "y": y, "value": x * y} for x in range(60) for y in range(40)]
+        chart = HeatmapChart(self.root, data, x_key="x", y_key="y")
+        if not chart.use_raster():
+            self.skipTest("PIL is not available")
+        self.assertEqual(len(chart.canvas.find_withtag("cells")), 1)
+        self.assertEqual(chart.cells, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+# tests/leatherwork_gui_tests/widgets/test_enhanced_treeview.py
+"""
+Unit tests for the EnhancedTreeview widget, including virtual mode.
+"""
+
+import unittest
+import tkinter as tk
+from tkinter import ttk
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    '..', '..', '..', 'store_management'
+))
+sys.path.insert(0, project_root)
+
+from gui.widgets.enhanced_treeview import EnhancedTreeview
+
+
+def _create_root():
+    """Create a hidden root window, or None when no display is available."""
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    root.withdraw()
+    return root
+
+
+class TestEnhancedTreeview(unittest.TestCase):
+    """
+    Test suite for EnhancedTreeview.
+    Covers standard and virtual row handling.
+    """
+
+    def setUp(self):
+        """Create a root window and a frame to hold the treeview."""
+        self.root = _create_root()
+        if self.root is None:
+            self.skipTest("No display available")
+        self.frame = ttk.Frame(self.root)
+
+    def tearDown(self):
+        """Destroy the root window."""
+        self.root.destroy()
+
+    def _create(self, virtual):
+        tree = EnhancedTreeview(self.frame, columns=["id", "name", "status"],
+                                status_column="status", virtual=virtual, height=10)
+        self.root.update_idletasks()
+        return tree
+
+    def _load(self, tree, count):
+        for item_id in range(count):
+            tree.insert_item(item_id, (item_id, f"item {count - item_id}", "in_stock"))
+        self.root.update()
+
+    def test_standard_mode_alternates_rows_and_clears(self):
+        """Rows alternate colors and clear removes every item."""
+        tree = self._create(virtual=False)
+        self._load(tree, 4)
+
+        self.assertEqual(len(tree.get_children()), 4)
+        self.assertIn("odd_row", tree.item("1", "tags"))
+        self.assertIn("status_in_stock", tree.item("1", "tags"))
+
+        tree.clear()
+        self.assertEqual(tree.get_children(), ())
+        tree.insert_item(10, (10, "item", "in_stock"))
+        self.assertIn("even_row", tree.item("10", "tags"))
+
+    def test_virtual_mode_materializes_visible_rows_only(self):
+        """Only the viewport is backed by Tk items, whatever the row count."""
+        tree = self._create(virtual=True)
+        self._load(tree, 10000)
+
+        self.assertEqual(tree.row_count(), 10000)
+        self.assertLessEqual(len(tree.get_children()), 10)
+
+    def test_virtual_scroll_recycles_items_and_keeps_selection(self):
+        """Scrolling rewrites the same items and selection follows the row, not the item."""
+        tree = self._create(virtual=True)
+        self._load(tree, 1000)
+        children = tree.get_children()
+
+        tree.select_item_id(3)
+        self.root.update()
+        self.assertEqual(tree.get_selected_id(), "3")
+
+        tree._virtual_yview("moveto", "0.5")
+        self.assertEqual(tree.get_children(), children)
+        self.assertEqual(tree.item(children[0], "values")[0], "500")
+        self.assertEqual(tree.selection(), ())
+        self.assertEqual(tree.get_selected_id(), "3")
+
+    def test_virtual_sort_and_filter_use_backing_store(self):
+        """Sorting and filtering reorder the backing store without reloading."""
+        tree = self._create(virtual=True)
+        self._load(tree, 100)
+
+        tree.sort_rows("id", "desc")
+        self.assertEqual(tree.item(tree.get_children()[0], "values")[0], "99")
+
+        tree.set_filter(lambda values: values[0] % 10 == 0)
+        self.assertEqual(tree.row_count(), 10)
+        self.assertEqual([item_id for item_id, _ in tree.iter_rows()][:2], ["90", "80"])
+
+    def test_virtual_header_click_delegates_partial_results(self):
+        """A header click sorts locally only when the store holds every row."""
+        sorts = []
+        tree = EnhancedTreeview(self.frame, columns=["id", "name", "status"], virtual=True,
+                                on_sort=lambda column, direction: sorts.append((column, direction)))
+        self._load(tree, 10)
+
+        tree.set_total_rows(10)
+        tree._on_column_click("id")
+        tree._on_column_click("id")
+        self.assertEqual(sorts, [])
+        self.assertEqual(tree.item(tree.get_children()[0], "values")[0], "9")
+
+        tree.set_total_rows(1000)
+        tree._on_column_click("name")
+        self.assertEqual(sorts, [("name", "asc")])
+        self.assertEqual(tree.item(tree.get_children()[0], "values")[0], "9")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,32 +9,44 @@ from sqlalchemy.pool import StaticPool
 # Determine the project root directory
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 sys.path.insert(0, project_root)
+# Application code imports models as ``database.models``; use the same path so each
+# model is only declared once
+sys.path.insert(0, os.path.join(project_root, 'store_management'))
+
+# Relationships that are read without being loaded by a loader profile raise in tests;
+# the loader strategy is fixed when the models are imported
+os.environ.setdefault('STORE_MANAGEMENT_STRICT_LOADING', '1')
 
 # Explicit import of models to avoid potential circular import issues
-from store_management.database.models.base import Base
+from database.models.base import Base
 
 # Import specific models to ensure they are registered
-import store_management.database.models.component
-import store_management.database.models.component_material
-import store_management.database.models.customer
-import store_management.database.models.enums
-import store_management.database.models.inventory
-import store_management.database.models.material
-import store_management.database.models.pattern
-import store_management.database.models.picking_list
-import store_management.database.models.picking_list_item
-import store_management.database.models.product
-import store_management.database.models.project
-import store_management.database.models.project_component
-import store_management.database.models.purchase
-import store_management.database.models.purchase_item
-import store_management.database.models.relationship_tables
-import store_management.database.models.sales
-import store_management.database.models.sales_item
-import store_management.database.models.supplier
-import store_management.database.models.tool
-import store_management.database.models.tool_list
-import store_management.database.models.tool_list_item
+import database.models.component
+import database.models.component_material
+import database.models.customer
+import database.models.enums
+import database.models.inventory
+import database.models.inventory_transaction
+import database.models.location_history
+import database.models.material
+import database.models.pattern
+import database.models.picking_list
+import database.models.picking_list_item
+import database.models.product
+import database.models.project
+import database.models.project_component
+import database.models.purchase
+import database.models.purchase_item
+import database.models.relationship_tables
+import database.models.sales
+import database.models.sales_item
+import database.models.storage_location
+import database.models.supplier
+import database.models.tool
+import database.models.tool_checkout
+import database.models.tool_list
+import database.models.tool_list_item
+import database.models.tool_maintenance
 
 @pytest.fixture(scope='session')
 def engine():
@@ -72,4 +84,20 @@ def dbsession(engine, tables):
         yield session
     finally:
         session.close()
-        Session.remove()
\ No newline at end of file
+        Session.remove()
+
+
+@pytest.fixture
+def schema_session():
+    """
+    Session on a fresh in-memory SQLite database with the full application schema,
+    including indexes and triggers, for tests that exercise real repository queries.
+    """
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
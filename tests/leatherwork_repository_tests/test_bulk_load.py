@@ -0,0 +1,108 @@
+# tests/leatherwork_repository_tests/test_bulk_load.py
+import pytest
+from sqlalchemy import func, select
+
+from database.models.customer import Customer
+from database.models.enums import CustomerStatus, InventoryStatus
+from database.models.inventory import Inventory
+from database.models.material import Leather
+from database.models.product import Product
+from database.models.supplier import Supplier
+from database.repositories.bulk_load import BulkLoader, BulkLoadError
+from database.repositories.customer_repository import CustomerRepository
+
+
+INVENTORY_ROWS = [
+    {'item_type': 'material', 'item_id': 1, 'quantity': 0},
+    {'item_type': 'material', 'item_id': 2, 'quantity': 5, 'min_stock_level': 10},
+    {'item_type': 'product', 'item_id': 1, 'quantity': '8', 'reorder_point': 8},
+    {'item_type': 'tool', 'item_id': 1, 'quantity': 40, 'min_stock_level': 10, 'reorder_point': 20},
+]
+
+
+def _inventory_rows(session):
+    table = Inventory.__table__
+    return session.execute(select(table).order_by(table.c.item_type, table.c.item_id)).mappings().all()
+
+
+class TestBulkLoad:
+    def test_derived_columns_match_the_constructor(self, schema_session):
+        given_status = {'item_type': 'tool', 'item_id': 2, 'quantity': 3, 'status': 'abundant'}
+        loaded = BulkLoader(schema_session, Inventory).load([dict(row) for row in INVENTORY_ROWS] + [given_status])
+        assert loaded == len(INVENTORY_ROWS) + 1
+
+        rows = {(row['item_type'], row['item_id']): row for row in _inventory_rows(schema_session)}
+        for data in INVENTORY_ROWS:
+            constructed = Inventory(**{**data, 'quantity': float(data['quantity'])})
+            row = rows[(data['item_type'], data['item_id'])]
+            assert row['status'] == constructed.status
+            assert row['low_stock'] == constructed.low_stock
+            assert row['transaction_history'] == []
+            assert row['location_details'] == {}
+            assert row['created_at'] is not None
+
+        assert rows[('tool', 2)]['status'] == InventoryStatus.ABUNDANT
+        assert rows[('tool', 2)]['low_stock'] is False
+
+    def test_invalid_batch_reports_every_error_and_inserts_nothing(self, schema_session):
+        rows = [
+            {'item_type': 'material', 'item_id': 1, 'quantity': -1},
+            {'item_type': 'crate', 'item_id': 2, 'quantity': 1},
+            {'item_type': 'tool', 'item_id': 3, 'quantity': 1, 'reorder_quantity': 0},
+            {'item_type': 'tool', 'item_id': 4, 'quantity': 'lots', 'status': 'not a status'},
+            {'item_type': 'tool', 'item_id': 5, 'quantity': 1, 'storage_location': 'x' * 256},
+        ]
+        with pytest.raises(BulkLoadError) as error:
+            BulkLoader(schema_session, Inventory).load(rows)
+
+        assert [(row, key) for row, key, _ in error.value.errors] == [
+            (0, 'quantity'), (1, 'item_type'), (2, 'reorder_quantity'),
+            (3, 'quantity'), (3, 'status'), (4, 'storage_location'),
+        ]
+        assert _inventory_rows(schema_session) == []
+
+    def test_missing_required_values_and_unknown_columns_are_rejected(self, schema_session):
+        with pytest.raises(BulkLoadError) as error:
+            BulkLoader(schema_session, Customer).load([
+                {'first_name': 'Ann', 'last_name': 'Lee', 'email': 'ann@example.com', 'status': 'ACTIVE'},
+                {'first_name': 'Bob', 'email': 'bob@example.com', 'status': 'ACTIVE', 'nickname': 'B'},
+            ])
+
+        assert [(row, key) for row, key, _ in error.value.errors] == [(None, 'nickname')]
+
+        with pytest.raises(BulkLoadError) as error:
+            BulkLoader(schema_session, Customer).load([
+                {'first_name': 'Bob', 'email': 'bob@example.com', 'status': 'ACTIVE'},
+            ])
+        assert [(row, key) for row, key, _ in error.value.errors] == [(0, 'last_name')]
+
+    def test_repository_bulk_load_checks_lengths(self, schema_session):
+        repository = CustomerRepository(schema_session)
+        rows = [{'first_name': 'First', 'last_name': f'Last {i}', 'email': f'{i}@example.com',
+                 'status': 'active' if i % 2 else CustomerStatus.ACTIVE} for i in range(100)]
+        assert repository.bulk_load(rows) == 100
+        schema_session.commit()
+
+        assert schema_session.scalar(select(func.count()).select_from(Customer)) == 100
+        assert set(schema_session.scalars(select(Customer.status))) == {CustomerStatus.ACTIVE}
+
+        with pytest.raises(BulkLoadError, match="cannot exceed 255 characters"):
+            repository.bulk_load([{'first_name': 'First', 'last_name': 'Last', 'status': 'ACTIVE',
+                                   'email': 'a' * 250 + '@example.com'}])
+
+    def test_model_validation_rules_apply_to_bulk_loads(self, schema_session):
+        with pytest.raises(BulkLoadError) as error:
+            BulkLoader(schema_session, Product).load([
+                {'name': 'Wallet', 'price': 45.0},
+                {'name': '  ', 'price': -1},
+            ])
+        assert [(row, key) for row, key, _ in error.value.errors] == [(1, 'name'), (1, 'price')]
+
+        with pytest.raises(BulkLoadError) as error:
+            BulkLoader(schema_session, Supplier).load([{'name': 'Tandy'}])
+        assert [(row, key) for row, key, _ in error.value.errors] == [(0, 'contact_email')]
+
+        # Subclasses add their own checks to the ones they inherit
+        with pytest.raises(BulkLoadError) as error:
+            BulkLoader(schema_session, Leather).load([{'name': '', 'thickness': 0}])
+        assert [(row, key) for row, key, _ in error.value.errors] == [(0, 'name'), (0, 'thickness')]
@@ -0,0 +1,115 @@
+# tests/leatherwork_repository_tests/test_fixture_loader.py
+import gzip
+import json
+import os
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from database.exceptions import DatabaseError
+from database.fixture_loader import FixtureLoader, dump_fixtures, table_load_order
+from database.models.base import Base
+from database.models.customer import Customer
+from database.models.inventory import Inventory
+from database.models.sales import Sales
+from database.models.storage_location import StorageLocation
+
+SAMPLE_DATA = os.path.join(os.path.dirname(__file__), '..', '..', 'store_management', 'sample_data.json')
+
+
+@pytest.fixture
+def fixture_engine(tmp_path):
+    """Engine on a fresh SQLite database file with the application schema."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'fixtures.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _write_jsonl(path, rows):
+    with gzip.open(path, 'wt', encoding='utf-8') as file:
+        for row in rows:
+            file.write(json.dumps(row) + '\n')
+
+
+def _count(engine, model):
+    with engine.connect() as connection:
+        return connection.scalar(select(func.count()).select_from(model))
+
+
+class TestFixtureLoader:
+    def test_tables_are_ordered_parents_first(self):
+        order = table_load_order(Base.metadata, ['sales_items', 'products', 'sales', 'customers'])
+        assert order.index('customers') < order.index('sales') < order.index('sales_items')
+        assert order.index('products') < order.index('sales_items')
+
+        with pytest.raises(ValueError, match='no_such_table'):
+            table_load_order(Base.metadata, ['customers', 'no_such_table'])
+
+    def test_gzipped_jsonl_directory_loads_in_batches_and_restores_pragmas(self, fixture_engine, tmp_path):
+        directory = tmp_path / 'fixtures'
+        directory.mkdir()
+        # Children are listed first; the loader still inserts parents before them
+        _write_jsonl(directory / 'sales.jsonl.gz', [
+            {'customer_id': i % 10 + 1, 'total_amount': 10.0, 'status': 'COMPLETED', 'payment_status': 'PAID',
+             'created_at': '2024-01-02T03:04:05'} for i in range(250)
+        ])
+        _write_jsonl(directory / 'customers.jsonl.gz', [
+            {'id': i, 'first_name': 'First', 'last_name': f'Last {i}', 'email': f'{i}@example.com',
+             'status': 'ACTIVE'} for i in range(1, 11)
+        ])
+
+        counts = FixtureLoader(fixture_engine, batch_size=100).load_path(str(directory))
+
+        assert counts == {'customers': 10, 'sales': 250}
+        assert list(counts) == ['customers', 'sales']
+        assert _count(fixture_engine, Sales) == 250
+        with fixture_engine.connect() as connection:
+            assert connection.exec_driver_sql('PRAGMA journal_mode').scalar() == 'delete'
+            assert connection.exec_driver_sql('PRAGMA foreign_keys').scalar() == 0
+
+    def test_rows_referencing_missing_parents_roll_back_the_whole_load(self, fixture_engine):
+        sources = {
+            'customers': [{'id': 1, 'first_name': 'First', 'last_name': 'Last', 'email': 'a@example.com',
+                           'status': 'ACTIVE'}],
+            'sales': [{'customer_id': 2, 'total_amount': 10.0, 'status': 'COMPLETED', 'payment_status': 'PAID'}],
+        }
+        with pytest.raises(DatabaseError, match='missing parents in sales'):
+            FixtureLoader(fixture_engine).load(sources)
+
+        assert _count(fixture_engine, Customer) == 0
+
+    def test_sample_data_round_trips_through_dumped_fixtures(self, fixture_engine, tmp_path):
+        counts = FixtureLoader(fixture_engine, strict=False).load_path(SAMPLE_DATA)
+        assert counts['materials'] == 12
+        with fixture_engine.connect() as connection:
+            leather_type = connection.exec_driver_sql(
+                "SELECT leather_type FROM materials WHERE id = 1").scalar()
+        assert leather_type == 'VEGETABLE_TANNED'
+
+        dumped = dump_fixtures(fixture_engine, str(tmp_path / 'dump'))
+        assert {name: count for name, count in dumped.items() if count} == counts
+
+        copy = create_engine(f"sqlite:///{tmp_path / 'copy.db'}")
+        Base.metadata.create_all(copy)
+        try:
+            assert FixtureLoader(copy).load_path(str(tmp_path / 'dump')) == dumped
+            with fixture_engine.connect() as original, copy.connect() as restored:
+                query = select(Sales.__table__).order_by(Sales.id)
+                assert restored.execute(query).all() == original.execute(query).all()
+        finally:
+            copy.dispose()
+
+    def test_loading_sample_data_links_inventory_to_storage_locations(self, fixture_engine):
+        from initialize_database import load_sample_data
+
+        assert load_sample_data(sessionmaker(bind=fixture_engine), SAMPLE_DATA)
+        with fixture_engine.connect() as connection:
+            unlinked = connection.scalar(select(func.count()).select_from(Inventory).where(
+                Inventory.storage_location.isnot(None), Inventory.location_id.is_(None)))
+            occupied = connection.scalar(select(func.count()).select_from(StorageLocation).where(
+                StorageLocation.item_count > 0))
+        assert _count(fixture_engine, StorageLocation) > 0
+        assert unlinked == 0
+        assert occupied > 0
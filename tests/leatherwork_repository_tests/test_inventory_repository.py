@@ -310,4 +310,195 @@ class TestInventoryRepository:
 
             # Verify status was updated
             updated_inventory = repository.get_by_id(added_inventory.id)
-            assert updated_inventory.status == new_status
\ No newline at end of file
+            assert updated_inventory.status == new_status
+
+
+class TestInventoryStockTracking:
+    def _add(self, session, item_id, quantity, **kwargs):
+        from database.models.inventory import Inventory
+
+        inventory = Inventory(item_type='tool', item_id=item_id, quantity=quantity, **kwargs)
+        session.add(inventory)
+        session.flush()
+        return inventory
+
+    def test_low_stock_flag_set_on_create(self, schema_session):
+        low = self._add(schema_session, 1, 2, min_stock_level=5)
+        ok = self._add(schema_session, 2, 20, min_stock_level=5)
+
+        assert low.status == InventoryStatus.LOW_STOCK
+        assert low.low_stock is True
+        assert ok.status == InventoryStatus.IN_STOCK
+        assert ok.low_stock is False
+
+    def test_trigger_updates_status_for_raw_quantity_change(self, schema_session):
+        from sqlalchemy import text
+
+        inventory = self._add(schema_session, 1, 20, min_stock_level=5)
+        schema_session.commit()
+
+        schema_session.execute(text("UPDATE inventory SET quantity = 0 WHERE id = :id"), {'id': inventory.id})
+        row = schema_session.execute(
+            text("SELECT status, low_stock FROM inventory WHERE id = :id"), {'id': inventory.id}).one()
+
+        assert row.status == InventoryStatus.OUT_OF_STOCK.name
+        assert row.low_stock == 1
+
+    def test_apply_quantity_change_sets_status_in_same_statement(self, schema_session):
+        from database.repositories.inventory_repository import InventoryRepository
+
+        repository = InventoryRepository(schema_session)
+        inventory = self._add(schema_session, 1, 20, min_stock_level=5, reorder_point=10)
+
+        assert repository.apply_quantity_change(inventory.id, -12) == 1
+        assert inventory.quantity == 8
+        assert inventory.status == InventoryStatus.PENDING_REORDER
+        assert inventory.low_stock is True
+
+        # Changes that would go negative are rejected without touching the row
+        assert repository.apply_quantity_change(inventory.id, -100) == 0
+        assert inventory.quantity == 8
+
+    def test_low_stock_counts_and_items(self, schema_session):
+        from database.repositories.inventory_repository import InventoryRepository
+
+        repository = InventoryRepository(schema_session)
+        self._add(schema_session, 1, 0)
+        self._add(schema_session, 2, 3, min_stock_level=5)
+        self._add(schema_session, 3, 50, min_stock_level=5)
+
+        counts = repository.get_low_stock_counts()
+        items = repository.get_low_stock_items()
+
+        assert counts == {'out_of_stock': 1, 'low_stock': 1}
+        assert sorted(item['item_id'] for item in items) == [1, 2]
+
+    def test_update_inventory_status_repairs_rows(self, schema_session):
+        from sqlalchemy import text
+        from database.repositories.inventory_repository import InventoryRepository
+
+        repository = InventoryRepository(schema_session)
+        self._add(schema_session, 1, 3, min_stock_level=5)
+        self._add(schema_session, 2, 50, min_stock_level=5)
+        schema_session.execute(text("UPDATE inventory SET status = 'IN_STOCK'"))
+
+        result = repository.update_inventory_status()
+
+        assert result == {'out_of_stock': 0, 'low_stock': 1, 'in_stock': 1}
+        assert repository.get_low_stock_counts() == {'low_stock': 1}
+
+
+class TestInventoryRelocation:
+    def _setup(self, session):
+        from database.models.inventory import Inventory
+        from database.repositories.inventory_repository import InventoryRepository
+        from database.repositories.storage_location_repository import StorageLocationRepository
+
+        locations = StorageLocationRepository(session)
+        shelf = locations.get_or_create_by_code("A-B-1")
+        records = []
+        for item_id, item_type in enumerate(['tool', 'tool', 'material'], start=1):
+            inventory = Inventory(item_type=item_type, item_id=item_id, quantity=item_id,
+                                  location_id=shelf.id, storage_location=shelf.code)
+            session.add(inventory)
+            records.append(inventory)
+        session.flush()
+        return InventoryRepository(session), locations, records
+
+    def _history(self, session):
+        from sqlalchemy import text
+
+        return session.execute(text(
+            "SELECT inventory_id, from_location, to_location FROM location_history ORDER BY inventory_id"
+        )).all()
+
+    def test_relocate_location_contents(self, schema_session):
+        repository, locations, records = self._setup(schema_session)
+
+        assert repository.relocate_location_contents("A-B-1", "A-C-2") == 3
+
+        assert all(record.storage_location == "A-C-2" for record in records)
+        assert locations.get_by_code("A-B-1").item_count == 0
+        assert locations.get_by_code("A-C-2").item_count == 3
+        assert locations.get_by_code("A").item_count == 3
+        assert [tuple(row) for row in self._history(schema_session)] == [
+            (records[0].id, "A-B-1", "A-C-2"),
+            (records[1].id, "A-B-1", "A-C-2"),
+            (records[2].id, "A-B-1", "A-C-2"),
+        ]
+
+    def test_relocate_items_skips_rows_already_there(self, schema_session):
+        repository, locations, records = self._setup(schema_session)
+
+        assert repository.relocate_items([records[0].id], "A-C-2") == 1
+        assert repository.relocate_items([records[0].id, records[1].id], "A-C-2") == 1
+
+        assert locations.get_by_code("A-C-2").item_count == 2
+        assert len(self._history(schema_session)) == 2
+
+    def test_consolidate_moves_only_types_at_destination(self, schema_session):
+        repository, locations, records = self._setup(schema_session)
+        repository.relocate_items([records[0].id], "A-C-2")
+
+        assert repository.relocate_location_contents("A-B-1", "A-C-2", similar_only=True) == 1
+
+        assert records[1].storage_location == "A-C-2"
+        assert records[2].storage_location == "A-B-1"
+
+    def test_bulk_update_locations_groups_by_destination(self, schema_session):
+        repository, locations, records = self._setup(schema_session)
+
+        result = repository.bulk_update_locations([
+            {'inventory_id': records[0].id, 'new_location': "A-C-1"},
+            {'inventory_id': records[1].id, 'new_location': "A-C-2"},
+            {'inventory_id': records[2].id, 'new_location': "A-C-2"},
+        ])
+
+        assert result['updated_count'] == 3
+        assert locations.get_by_code("A-C").item_count == 3
+
+
+class TestPhysicalCountAdjustments:
+    def test_apply_count_adjustments_updates_status_and_ledger(self, schema_session):
+        from database.models.inventory import Inventory
+        from database.models.inventory_transaction import InventoryTransaction
+        from database.repositories.inventory_repository import InventoryRepository
+
+        repository = InventoryRepository(schema_session)
+        inventory = Inventory(item_type='tool', item_id=1, quantity=10, min_stock_level=5)
+        schema_session.add(inventory)
+        schema_session.flush()
+
+        assert [row[:4] for row in repository.get_count_index()] == [(inventory.id, 'tool', 1, 10)]
+
+        adjusted = repository.apply_count_adjustments(
+            [{'inventory_id': inventory.id, 'quantity_before': 10, 'quantity_after': 3}]
+        )
+
+        assert adjusted == [inventory.id]
+        assert inventory.quantity == 3
+        assert inventory.status == InventoryStatus.LOW_STOCK
+        assert inventory.low_stock is True
+        entry = schema_session.query(InventoryTransaction).one()
+        assert (entry.quantity_before, entry.quantity_after, entry.quantity_change) == (10, 3, -7)
+
+    def test_records_changed_since_the_count_are_skipped(self, schema_session):
+        from database.models.inventory import Inventory
+        from database.models.inventory_transaction import InventoryTransaction
+        from database.repositories.inventory_repository import InventoryRepository
+
+        repository = InventoryRepository(schema_session)
+        counted = Inventory(item_type='tool', item_id=1, quantity=10)
+        moved = Inventory(item_type='tool', item_id=2, quantity=8)
+        schema_session.add_all([counted, moved])
+        schema_session.flush()
+
+        # The second record was restocked from 10 to 8 after its system quantity was read
+        adjusted = repository.apply_count_adjustments([
+            {'inventory_id': counted.id, 'quantity_before': 10, 'quantity_after': 7},
+            {'inventory_id': moved.id, 'quantity_before': 10, 'quantity_after': 4},
+        ])
+
+        assert adjusted == [counted.id]
+        assert (counted.quantity, moved.quantity) == (7, 8)
+        assert [entry.inventory_id for entry in schema_session.query(InventoryTransaction)] == [counted.id]
@@ -0,0 +1,75 @@
+# tests/leatherwork_repository_tests/test_list_projection.py
+from datetime import datetime
+
+from sqlalchemy import insert
+
+from database.models.enums import InventoryStatus, MaterialType, MeasurementUnit, SupplierStatus
+
+
+class TestListProjection:
+    FIELDS = ['id', 'name', 'material_type', 'unit', 'supplier_name', 'inventory_status', 'quantity', 'cost']
+
+    def _seed_materials(self, session):
+        """Insert a supplier, three materials and inventory for two of them."""
+        from database.models.inventory import Inventory
+        from database.models.material import Material
+        from database.models.supplier import Supplier
+
+        now = datetime.now()
+        supplier_id = session.scalar(
+            insert(Supplier).returning(Supplier.id),
+            [{'name': 'Tannery', 'contact_email': 'tannery@example.com',
+              'status': SupplierStatus.ACTIVE, 'created_at': now}]
+        )
+        session.execute(insert(Material), [
+            {'id': 1, 'name': 'Veg Tan Side', 'material_type': MaterialType.LEATHER,
+             'unit': MeasurementUnit.SQUARE_FOOT, 'supplier_id': supplier_id, 'created_at': now},
+            {'id': 2, 'name': 'Brass Rivet', 'material_type': MaterialType.HARDWARE,
+             'unit': MeasurementUnit.PIECE, 'created_at': now},
+            {'id': 3, 'name': 'Chrome Tan Side', 'material_type': MaterialType.LEATHER,
+             'unit': MeasurementUnit.SQUARE_FOOT, 'supplier_id': supplier_id, 'created_at': now},
+        ])
+        session.execute(insert(Inventory), [
+            {'item_type': 'material', 'item_id': 1, 'quantity': 12.5, 'unit_cost': 8.0,
+             'status': InventoryStatus.IN_STOCK, 'created_at': now},
+            {'item_type': 'material', 'item_id': 2, 'quantity': 0, 'unit_cost': 0.1,
+             'status': InventoryStatus.OUT_OF_STOCK, 'created_at': now},
+        ])
+        session.commit()
+
+    def _repository(self, session):
+        from database.repositories.material_repository import MaterialRepository
+        return MaterialRepository(session)
+
+    def test_rows_hold_only_the_listed_columns(self, schema_session):
+        self._seed_materials(schema_session)
+        rows = self._repository(schema_session).get_list_rows(self.FIELDS)
+
+        assert len(rows) == 3
+        assert rows[0]._fields == tuple(self.FIELDS)
+        assert not hasattr(rows[0], '__dict__')
+        assert rows[0] == (1, 'Veg Tan Side', 'leather', MeasurementUnit.SQUARE_FOOT.value, 'Tannery',
+                           InventoryStatus.IN_STOCK.value, 12.5, 8.0)
+        assert rows[2].supplier_name == 'Tannery' and rows[2].quantity is None
+        assert len(schema_session.identity_map) == 0
+
+    def test_filters_search_and_sort(self, schema_session):
+        self._seed_materials(schema_session)
+        repository = self._repository(schema_session)
+
+        leather = repository.get_list_rows(['id'], material_type='LEATHER', sort_by='name', sort_dir='desc')
+        assert [row.id for row in leather] == [1, 3]
+        assert [row.id for row in repository.get_list_rows(['id'], supplier_name='tann')] == [1, 3]
+        assert [row.id for row in repository.get_list_rows(['id'], inventory_status='out_of_stock')] == [2]
+        assert [row.id for row in repository.get_list_rows(
+            ['id'], search_term='chrome', search_fields=['name', 'supplier_name'])] == [3]
+        assert [row.id for row in repository.get_list_rows(['id'], skip=1, limit=1)] == [2]
+
+        assert repository.count_list_rows(material_type='leather') == 2
+        assert repository.count_list_rows(material_type='no_such_type') == 0
+
+    def test_unknown_fields_are_empty(self, schema_session):
+        self._seed_materials(schema_session)
+        rows = self._repository(schema_session).get_list_rows(['id', 'not_a_column'], no_such_filter='x')
+
+        assert [tuple(row) for row in rows] == [(1, None), (2, None), (3, None)]
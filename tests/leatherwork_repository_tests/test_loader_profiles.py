@@ -0,0 +1,84 @@
+# tests/leatherwork_repository_tests/test_loader_profiles.py
+import pytest
+from datetime import datetime
+
+from sqlalchemy import event, insert
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import configure_mappers
+
+from database.models.base import Base, strict_loading_enabled
+from database.models.enums import SupplierStatus, ToolCategory
+from database.repositories.loader_profiles import DETAIL, LIST_ROW, PROFILE_NAMES, loader_options
+
+
+class TestLoaderProfiles:
+    def _seed_tools(self, session, count):
+        """Insert one supplier and tools supplied by it."""
+        from database.models.supplier import Supplier
+        from database.models.tool import Tool
+
+        now = datetime.now()
+        supplier_id = session.scalar(
+            insert(Supplier).returning(Supplier.id),
+            [{'name': 'Tool Supplier', 'contact_email': 'tools@example.com',
+              'status': SupplierStatus.ACTIVE, 'created_at': now}]
+        )
+        session.execute(insert(Tool), [
+            {'id': n + 1, 'name': f'Tool {n}', 'tool_category': ToolCategory.CUTTING,
+             'supplier_id': supplier_id, 'created_at': now}
+            for n in range(count)
+        ])
+        session.commit()
+
+    def _count_statements(self, session):
+        statements = []
+        event.listen(session.get_bind(), 'before_cursor_execute',
+                     lambda *args: statements.append(args[2]))
+        return statements
+
+    def test_every_profile_resolves(self):
+        configure_mappers()
+        for mapper in Base.registry.mappers:
+            for profile in PROFILE_NAMES:
+                loader_options(mapper.class_, profile)
+
+    def test_unknown_profile_is_rejected(self):
+        from database.models.tool import Tool
+
+        with pytest.raises(ValueError):
+            loader_options(Tool, 'everything')
+
+    def test_relationships_are_not_loaded_by_default(self, schema_session):
+        from database.repositories.tool_repository import ToolRepository
+
+        if not strict_loading_enabled():
+            pytest.skip("Strict loading is switched off")
+
+        self._seed_tools(schema_session, 1)
+        tool = ToolRepository(schema_session).get_by_id(1)
+
+        with pytest.raises(InvalidRequestError):
+            tool.supplier
+
+    def test_detail_profile_loads_relationships(self, schema_session):
+        from database.repositories.tool_repository import ToolRepository
+
+        self._seed_tools(schema_session, 1)
+        tool = ToolRepository(schema_session).get_by_id(1, profile=DETAIL)
+
+        assert tool.supplier.name == 'Tool Supplier'
+        assert tool.maintenance_records == []
+        assert tool.checkouts == []
+
+    def test_list_row_profile_loads_a_page_in_one_query(self, schema_session):
+        from database.repositories.tool_repository import ToolRepository
+
+        self._seed_tools(schema_session, 50)
+        statements = self._count_statements(schema_session)
+
+        tools = ToolRepository(schema_session).get_all(limit=50, profile=LIST_ROW)
+        names = {tool.supplier.name for tool in tools}
+
+        assert len(tools) == 50
+        assert names == {'Tool Supplier'}
+        assert len(statements) == 1
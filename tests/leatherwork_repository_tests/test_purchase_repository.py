@@ -2,6 +2,7 @@
 import pytest
 from datetime import datetime, timedelta
 from database.models.enums import (
+    InventoryStatus,
     PurchaseStatus,
     SupplierStatus,
     MaterialType,
@@ -579,4 +580,65 @@ class TestPurchaseRepository:
         assert all(p.supplier_id == supplier2.id for p in supplier2_purchases)
         assert any(p.reference_number == "PO-S1-001" for p in supplier1_purchases)
         assert any(p.reference_number == "PO-S1-002" for p in supplier1_purchases)
-        assert any(p.reference_number == "PO-S2-001" for p in supplier2_purchases)
\ No newline at end of file
+        assert any(p.reference_number == "PO-S2-001" for p in supplier2_purchases)
+
+class TestPurchaseReorderPlanning:
+    def _seed_catalogue(self, session, tool_count):
+        """Insert a supplier and tools with low-stock inventory using Core inserts."""
+        from sqlalchemy import insert
+        from database.models.inventory import Inventory
+        from database.models.supplier import Supplier
+        from database.models.tool import Tool
+
+        now = datetime.now()
+        supplier_ids = session.scalars(
+            insert(Supplier).returning(Supplier.id, sort_by_parameter_order=True),
+            [{'name': f'Supplier {n}', 'contact_email': f's{n}@example.com',
+              'status': SupplierStatus.ACTIVE, 'created_at': now} for n in range(2)]
+        ).all()
+        if not tool_count:
+            return supplier_ids
+        session.execute(insert(Tool), [
+            {'id': n + 1, 'name': f'Tool {n}', 'tool_category': ToolCategory.CUTTING,
+             'supplier_id': supplier_ids[n % 2], 'purchase_price': 2.5, 'created_at': now}
+            for n in range(tool_count)
+        ])
+        session.execute(insert(Inventory), [
+            {'item_type': 'tool', 'item_id': n + 1, 'quantity': 1.0, 'min_stock_level': 4.0,
+             'status': InventoryStatus.LOW_STOCK, 'created_at': now}
+            for n in range(tool_count)
+        ])
+        return supplier_ids
+
+    def test_reorder_candidates_computed_in_one_query(self, schema_session):
+        from database.repositories.inventory_repository import InventoryRepository
+
+        self._seed_catalogue(schema_session, 4)
+
+        candidates = InventoryRepository(schema_session).get_reorder_candidates()
+
+        assert len(candidates) == 4
+        # Tools are topped up to twice their minimum level: 2 * 4 - 1
+        assert {c['quantity'] for c in candidates} == {7.0}
+        assert {c['price'] for c in candidates} == {2.5}
+
+    def test_bulk_create_with_items_sets_totals_in_sql(self, schema_session):
+        from database.models.purchase import Purchase
+        from database.models.purchase_item import PurchaseItem
+        from database.repositories.purchase_repository import PurchaseRepository
+
+        supplier_ids = self._seed_catalogue(schema_session, 0)
+        orders = [
+            {'supplier_id': supplier_ids[0], 'items': [
+                {'item_type': 'tool', 'item_id': 1, 'quantity': 2, 'price': 3.0},
+                {'item_type': 'material', 'item_id': 2, 'quantity': 1, 'price': 4.0}]},
+            {'supplier_id': supplier_ids[1], 'items': [
+                {'item_type': 'tool', 'item_id': 3, 'quantity': 5, 'price': 1.0}]},
+        ]
+
+        purchase_ids = PurchaseRepository(schema_session).bulk_create_with_items(orders)
+
+        totals = dict(schema_session.query(Purchase.id, Purchase.total_amount).all())
+        assert [totals[pid] for pid in purchase_ids] == [10.0, 5.0]
+        assert schema_session.query(PurchaseItem).count() == 3
+        assert schema_session.get(Purchase, purchase_ids[0]).status == PurchaseStatus.DRAFT
@@ -244,4 +244,23 @@ class TestSalesRepository:
 
         # Verify the sales record was deleted
         assert result is True
-        assert repository.get_by_id(sales_id) is None
\ No newline at end of file
+        assert repository.get_by_id(sales_id) is None
+
+class TestSalesAggregates:
+    def test_get_monthly_sales_totals_groups_by_month(self, schema_session):
+        from sqlalchemy import text
+        from database.repositories.sales_repository import SalesRepository
+
+        for created_at, amount in [("2025-01-10 09:00:00", 100.0), ("2025-01-28 17:30:00", 50.0),
+                                   ("2025-03-02 12:00:00", 80.0), ("2024-12-31 23:00:00", 999.0)]:
+            schema_session.execute(
+                text("INSERT INTO sales (total_amount, status, payment_status, created_at, updated_at) "
+                     "VALUES (:amount, 'QUOTE_REQUEST', 'PENDING', :created_at, :created_at)"),
+                {'amount': amount, 'created_at': created_at}
+            )
+
+        totals = SalesRepository(schema_session).get_monthly_sales_totals(
+            datetime(2025, 1, 1), datetime(2025, 3, 31)
+        )
+
+        assert totals == {"2025-01": 150.0, "2025-03": 80.0}
@@ -0,0 +1,53 @@
+# tests/leatherwork_repository_tests/test_schema_fingerprint.py
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, text
+
+from database.models.base import Base
+from database.schema_fingerprint import compute_schema_fingerprint, ensure_schema
+
+
+class TestSchemaFingerprint:
+    def _engine(self, tmp_path):
+        return create_engine(f"sqlite:///{tmp_path / 'store.db'}")
+
+    def test_unchanged_schema_skips_create_all_and_diagnostics(self, tmp_path):
+        engine = self._engine(tmp_path)
+        cache_path = str(tmp_path / 'store.db.schema.json')
+        diagnostics = []
+
+        assert ensure_schema(engine, Base.metadata, cache_path, lambda: diagnostics.append(1))
+        assert not ensure_schema(engine, Base.metadata, cache_path, lambda: diagnostics.append(1))
+        assert diagnostics == [1]
+        engine.dispose()
+
+    def test_database_schema_change_reruns_checks(self, tmp_path):
+        engine = self._engine(tmp_path)
+        cache_path = str(tmp_path / 'store.db.schema.json')
+        ensure_schema(engine, Base.metadata, cache_path)
+
+        with engine.begin() as connection:
+            connection.execute(text("DROP TABLE tool_list_items"))
+
+        assert ensure_schema(engine, Base.metadata, cache_path)
+        with engine.connect() as connection:
+            assert connection.execute(
+                text("SELECT name FROM sqlite_master WHERE name = 'tool_list_items'")).scalar()
+        engine.dispose()
+
+    def test_fingerprint_changes_with_model_schema(self):
+        def metadata(*columns):
+            result = MetaData()
+            Table('items', result, Column('id', Integer, primary_key=True), *columns)
+            return result
+
+        base = compute_schema_fingerprint(metadata())
+        with_column = compute_schema_fingerprint(metadata(Column('name', String(50))))
+        with_index = compute_schema_fingerprint(metadata(Column('name', String(50), index=True)))
+
+        assert base == compute_schema_fingerprint(metadata())
+        assert len({base, with_column, with_index}) == 3
+
+    def test_without_cache_checks_always_run(self, tmp_path):
+        engine = self._engine(tmp_path)
+        assert ensure_schema(engine, Base.metadata)
+        assert ensure_schema(engine, Base.metadata)
+        engine.dispose()
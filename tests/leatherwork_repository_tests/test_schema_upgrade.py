@@ -0,0 +1,59 @@
+# tests/leatherwork_repository_tests/test_schema_upgrade.py
+from sqlalchemy import MetaData, Table, create_engine, inspect, text
+
+from database.models.base import Base
+from database.models.inventory import Inventory
+from database.schema_fingerprint import ensure_schema
+from database.schema_upgrade import upgrade_schema
+
+# Inventory columns added after databases were first created
+ADDED_COLUMNS = ('low_stock', 'location_id')
+
+
+def _create_old_database(engine):
+    """Create the schema with the inventory table as it was before the added columns."""
+    old = MetaData()
+    Table('inventory', old, *[column._copy() for column in Inventory.__table__.columns
+                              if column.name not in ADDED_COLUMNS])
+    Base.metadata.create_all(engine, tables=[table for name, table in Base.metadata.tables.items()
+                                             if name != 'inventory'])
+    old.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO inventory (item_type, item_id, quantity, status, storage_location, created_at) VALUES "
+            "('tool', 1, 0, 'OUT_OF_STOCK', 'A-B', '2024-01-01'), ('tool', 2, 9, 'IN_STOCK', NULL, '2024-01-01')"))
+
+
+class TestSchemaUpgrade:
+    def test_existing_inventory_table_gains_columns_triggers_and_low_stock(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+        _create_old_database(engine)
+
+        assert ensure_schema(engine, Base.metadata, str(tmp_path / 'old.db.schema.json'))
+
+        columns = {column['name'] for column in inspect(engine).get_columns('inventory')}
+        assert set(ADDED_COLUMNS) <= columns
+        indexes = {index['name'] for index in inspect(engine).get_indexes('inventory')}
+        assert 'ix_inventory_low_stock' in indexes
+        with engine.begin() as connection:
+            assert connection.execute(
+                text("SELECT item_id, low_stock FROM inventory ORDER BY item_id")).all() == [(1, 1), (2, 0)]
+            assert connection.execute(text(
+                "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_inventory_stock_quantity'"
+            )).scalar() == 1
+
+            # The trigger now keeps the flag in step with raw SQL writes
+            connection.execute(text("UPDATE inventory SET quantity = 0 WHERE item_id = 2"))
+            assert connection.execute(text("SELECT low_stock FROM inventory WHERE item_id = 2")).scalar() == 1
+
+        # Occupancy triggers follow rows linked to a location from now on
+        with engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO storage_locations (name, code, level, path, depth, item_count, total_quantity, created_at) "
+                "VALUES ('A', 'A', 'ZONE', '/1/', 0, 0, 0, '2024-01-01')"))
+            connection.execute(text("UPDATE inventory SET location_id = 1 WHERE item_id = 2"))
+            assert connection.execute(text("SELECT item_count FROM storage_locations")).scalar() == 1
+
+        # Running it again changes nothing
+        assert upgrade_schema(engine, Base.metadata) == []
+        engine.dispose()
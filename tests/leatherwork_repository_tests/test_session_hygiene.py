@@ -0,0 +1,122 @@
+# tests/leatherwork_repository_tests/test_session_hygiene.py
+import gc
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, selectinload
+
+from database.models.enums import CustomerStatus, PaymentStatus, SaleStatus
+from database.sqlalchemy import session_hygiene
+from database.sqlalchemy.session_hygiene import SessionHygiene, find_unreferenced
+
+
+@pytest.fixture
+def session(schema_session):
+    """Long-running style session on the schema database, without the cyclic collector."""
+    from database.models.customer import Customer
+    from database.models.sales import Sales
+
+    now = datetime.now()
+    schema_session.execute(insert(Customer), [
+        {'id': i, 'first_name': 'First', 'last_name': f'Last {i}', 'email': f'{i}@example.com',
+         'status': CustomerStatus.ACTIVE, 'created_at': now} for i in range(1, 51)
+    ])
+    schema_session.execute(insert(Sales), [
+        {'customer_id': i % 50 + 1, 'total_amount': 10.0, 'status': SaleStatus.QUOTE_REQUEST,
+         'payment_status': PaymentStatus.PENDING, 'created_at': now} for i in range(100)
+    ])
+    schema_session.commit()
+
+    session = Session(bind=schema_session.get_bind(), expire_on_commit=False)
+    gc.disable()
+    try:
+        yield session
+    finally:
+        gc.enable()
+        session.close()
+
+
+def _load_cyclic_customers(session):
+    """Load customers with their sales, linking both directions into reference cycles."""
+    from database.models.customer import Customer
+
+    customers = session.scalars(select(Customer).options(selectinload(Customer.sales))).all()
+    for customer in customers:
+        for sale in customer.sales:
+            assert sale.customer is customer
+    return customers
+
+
+class TestSessionHygiene:
+    def test_unreferenced_cycles_are_expunged_after_commit(self, session):
+        hygiene = SessionHygiene(sweep_threshold=0)
+        hygiene.install(session)
+
+        customers = _load_cyclic_customers(session)
+        held = customers[:2]
+        del customers
+        assert len(session.identity_map) == 150
+
+        session.commit()
+
+        # The held customers and the sales reachable from them stay attached
+        assert len(session.identity_map) == 6
+        assert all(customer in session for customer in held)
+        assert all(sale in session for customer in held for sale in customer.sales)
+        stats = hygiene.get_stats()[0]
+        assert (stats['expunged'], stats['peak_size'], stats['size']) == (144, 150, 6)
+        assert hygiene.count_objects_by_model() == {'Sales': 4, 'Customer': 2}
+
+    def test_cascade_never_detaches_held_objects(self, session):
+        from database.models.customer import Customer
+
+        customers = session.scalars(select(Customer).options(selectinload(Customer.sales))).all()
+        customer = customers[0]
+        held_sale, other_sale = customer.sales
+        # Only the other sale points back, so the customer is unreferenced but can
+        # cascade to the held sale
+        assert other_sale.customer is customer
+        del customers, customer, other_sale
+
+        unreferenced = find_unreferenced(session)
+        assert len(unreferenced) == 2 and all(obj is not held_sale for obj in unreferenced)
+        del unreferenced
+
+        SessionHygiene(sweep_threshold=0).sweep(session)
+        assert held_sale in session
+
+    def test_large_sessions_are_reported_without_detaching_objects(self, session):
+        hygiene = SessionHygiene(sweep_threshold=0, report_threshold=10)
+        hygiene.install(session)
+
+        customers = _load_cyclic_customers(session)
+        session.commit()
+
+        # Every customer is still held, so nothing leaves the session
+        assert len(session.identity_map) == 150
+        assert all(customer in session for customer in customers)
+        assert hygiene.get_stats()[0]['oversized'] == 1
+        # Held objects can still be refreshed from the database
+        session.refresh(customers[0])
+        assert customers[0].last_name == 'Last 1'
+
+    def test_nothing_is_expunged_when_reference_counts_are_unreliable(self, session, monkeypatch):
+        monkeypatch.setattr(session_hygiene, 'REFCOUNTS_RELIABLE', False)
+        customers = _load_cyclic_customers(session)
+        del customers
+
+        assert find_unreferenced(session) == []
+        assert SessionHygiene(sweep_threshold=0).sweep(session) == 0
+        assert len(session.identity_map) == 150
+
+    def test_small_sessions_are_not_swept(self, session):
+        hygiene = SessionHygiene(sweep_threshold=1000)
+        hygiene.install(session)
+
+        customers = _load_cyclic_customers(session)
+        del customers
+        session.commit()
+
+        assert len(session.identity_map) == 150
+        assert hygiene.get_stats()[0]['sweeps'] == 0
@@ -0,0 +1,144 @@
+# tests/leatherwork_repository_tests/test_storage_location_repository.py
+import pytest
+from sqlalchemy import text
+
+from database.models.enums import StorageLocationLevel
+from database.repositories.base_repository import ValidationError
+
+
+class TestStorageLocationRepository:
+    def _repository(self, session):
+        from database.repositories.storage_location_repository import StorageLocationRepository
+
+        return StorageLocationRepository(session)
+
+    def _add_inventory(self, session, item_id, quantity, location=None):
+        from database.models.inventory import Inventory
+
+        inventory = Inventory(item_type='tool', item_id=item_id, quantity=quantity,
+                              location_id=location.id if location else None,
+                              storage_location=location.code if location else None)
+        session.add(inventory)
+        session.flush()
+        return inventory
+
+    def _occupancy(self, session, code):
+        return session.execute(
+            text("SELECT item_count, total_quantity FROM storage_locations WHERE code = :code"),
+            {'code': code}
+        ).one()
+
+    def test_get_or_create_builds_hierarchy(self, schema_session):
+        repository = self._repository(schema_session)
+
+        bin_location = repository.get_or_create_by_code("A-B-3-12")
+        shelf = repository.get_by_code("A-B-3")
+        zone = repository.get_by_code("A")
+
+        assert bin_location.level == StorageLocationLevel.BIN
+        assert bin_location.depth == 3
+        assert bin_location.parent_id == shelf.id
+        assert zone.parent_id is None
+        assert bin_location.path.startswith(shelf.path)
+        assert repository.get_or_create_by_code("A-B-3-12").id == bin_location.id
+        assert [location.code for location in repository.get_tree()] == ["A", "A-B", "A-B-3", "A-B-3-12"]
+
+    def test_free_text_codes_are_kept_unparsed(self, schema_session):
+        repository = self._repository(schema_session)
+
+        deep = repository.get_or_create_by_code("A-B-3-12-1")
+        gap = repository.get_or_create_by_code("A--3")
+
+        assert (deep.code, deep.name, deep.parent_id, deep.depth) == ("A-B-3-12-1", "A B 3 12 1", None, 0)
+        assert gap.code == "A--3"
+        assert repository.get_by_code("A") is None
+        assert repository.get_or_create_by_code("A-B-3-12-1").id == deep.id
+
+        with pytest.raises(ValidationError):
+            repository.get_or_create_by_code(" ")
+        with pytest.raises(ValidationError):
+            repository.get_or_create_by_code("-")
+
+    def test_subtree_excludes_siblings_with_shared_prefix(self, schema_session):
+        repository = self._repository(schema_session)
+        locations = [repository.get_or_create_by_code(f"Z{i}") for i in range(12)]
+        repository.get_or_create_by_code("Z1-A")
+
+        subtree = repository.get_subtree(locations[1].id)
+
+        assert [location.code for location in subtree] == ["Z1", "Z1-A"]
+
+    def test_triggers_maintain_ancestor_occupancy(self, schema_session):
+        repository = self._repository(schema_session)
+        bin_one = repository.get_or_create_by_code("A-B-1")
+        bin_two = repository.get_or_create_by_code("A-C-1")
+
+        first = self._add_inventory(schema_session, 1, 5, bin_one)
+        self._add_inventory(schema_session, 2, 7, bin_two)
+
+        assert tuple(self._occupancy(schema_session, "A")) == (2, 12)
+        assert tuple(self._occupancy(schema_session, "A-B")) == (1, 5)
+
+        schema_session.execute(text("UPDATE inventory SET location_id = :loc, quantity = 8 WHERE id = :id"),
+                               {'loc': bin_two.id, 'id': first.id})
+        assert tuple(self._occupancy(schema_session, "A-B")) == (0, 0)
+        assert tuple(self._occupancy(schema_session, "A-C-1")) == (2, 15)
+        assert tuple(self._occupancy(schema_session, "A")) == (2, 15)
+
+        schema_session.execute(text("DELETE FROM inventory WHERE id = :id"), {'id': first.id})
+        assert tuple(self._occupancy(schema_session, "A")) == (1, 7)
+
+    def test_refresh_occupancy_matches_triggers(self, schema_session):
+        repository = self._repository(schema_session)
+        shelf = repository.get_or_create_by_code("A-B-1")
+        self._add_inventory(schema_session, 1, 5, shelf)
+        self._add_inventory(schema_session, 2, 3, shelf)
+        schema_session.execute(text("UPDATE storage_locations SET item_count = 0, total_quantity = 0"))
+
+        repository.refresh_occupancy()
+
+        assert tuple(self._occupancy(schema_session, "A")) == (2, 8)
+        assert tuple(self._occupancy(schema_session, "A-B-1")) == (2, 8)
+
+    def test_link_inventory_by_code_and_subtree_items(self, schema_session):
+        from database.models.inventory import Inventory
+        from database.repositories.inventory_repository import InventoryRepository
+
+        repository = self._repository(schema_session)
+        schema_session.add_all([
+            Inventory(item_type='tool', item_id=1, quantity=4, storage_location="A-B-1"),
+            Inventory(item_type='tool', item_id=2, quantity=6, storage_location="A-C-2"),
+        ])
+        schema_session.flush()
+
+        assert repository.link_inventory_by_code() == 2
+
+        zone = repository.get_by_code("A")
+        items = repository.get_items_in_subtree(zone.id)
+        assert sorted(item['item_id'] for item in items) == [1, 2]
+        assert tuple(self._occupancy(schema_session, "A")) == (2, 10)
+
+        aisle_items = InventoryRepository(schema_session).get_by_storage_location("A-B")
+        assert [inventory.item_id for inventory in aisle_items] == [1]
+
+    def test_link_inventory_keeps_free_text_and_skips_unusable_codes(self, schema_session):
+        from database.models.inventory import Inventory
+
+        repository = self._repository(schema_session)
+        schema_session.add_all([
+            Inventory(item_type='tool', item_id=1, quantity=1, storage_location="Back room-left-top-box-3"),
+            Inventory(item_type='tool', item_id=2, quantity=2, storage_location="A - B"),
+            Inventory(item_type='tool', item_id=3, quantity=3, storage_location="--"),
+        ])
+        schema_session.flush()
+
+        assert repository.link_inventory_by_code() == 2
+
+        rows = schema_session.execute(
+            text("SELECT item_id, storage_location, location_id FROM inventory ORDER BY item_id")
+        ).all()
+        assert [(row.item_id, row.storage_location) for row in rows] == [
+            (1, "Back room-left-top-box-3"), (2, "A-B"), (3, "--")]
+        assert rows[0].location_id == repository.get_by_code("Back room-left-top-box-3").id
+        assert rows[1].location_id == repository.get_by_code("A-B").id
+        assert rows[2].location_id is None
@@ -0,0 +1,99 @@
+# tests/leatherwork_services_tests/test_inventory_service.py
+import importlib
+import io
+import pkgutil
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from services.exceptions import ValidationError
+
+
+@pytest.fixture
+def inventory_service():
+    """Inventory service on a fresh in-memory database with the full schema."""
+    import database.models
+    from database.models.base import Base
+    from database.models.inventory import Inventory
+    from services.implementations.inventory_service import InventoryService
+
+    # Register every model so foreign keys between tables resolve
+    for module in pkgutil.iter_modules(database.models.__path__):
+        importlib.import_module(f"database.models.{module.name}")
+
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Inventory(item_type='tool', item_id=item_id, quantity=10)
+        for item_id in range(1, 6)
+    ])
+    session.commit()
+    try:
+        yield InventoryService(session)
+    finally:
+        session.close()
+        engine.dispose()
+
+
+class TestPhysicalCountReconciliation:
+    COUNT_FILE = (
+        "item_type,item_id,counted_quantity\n"
+        "tool,1,10\n"
+        "tool,2,4\n"
+        "tool,2,3\n"
+        "tool,3,12\n"
+        "tool,99,1\n"
+        "tool,x,1\n"
+    )
+
+    def test_dry_run_reports_variances(self, inventory_service):
+        report = inventory_service.reconcile_physical_count(
+            io.StringIO(self.COUNT_FILE), dry_run=True, chunk_size=2
+        )
+
+        assert report['rows_read'] == 6
+        assert report['matched'] == 3
+        assert report['not_counted'] == 2
+        assert [row['item_id'] for row in report['unmatched']] == [99]
+        assert [row['line'] for row in report['invalid']] == [7]
+        # Item 2 was counted in two places, so its counts are summed
+        assert {row['item_id']: row['variance'] for row in report['variances']} == {2: -3.0, 3: 2.0}
+        assert report['adjusted'] == 0
+        assert inventory_service.inventory_repository.get_by_item(2, 'tool').quantity == 10
+
+    def test_apply_adjusts_inventory(self, inventory_service):
+        report = inventory_service.reconcile_physical_count(io.StringIO(self.COUNT_FILE))
+
+        assert report['adjusted'] == 2
+        assert report['skipped'] == []
+        assert inventory_service.inventory_repository.get_by_item(2, 'tool').quantity == 7
+        assert inventory_service.inventory_repository.get_by_item(3, 'tool').quantity == 12
+        assert inventory_service.inventory_repository.get_by_item(4, 'tool').quantity == 10
+
+    def test_missing_columns_rejected(self, inventory_service):
+        with pytest.raises(ValidationError):
+            inventory_service.reconcile_physical_count(io.StringIO("item_id,quantity\n1,2\n"))
+
+
+
+class TestStorageLocationLinking:
+    def test_location_code_resolves_to_hierarchy(self, inventory_service):
+        data = {'item_type': 'tool', 'item_id': 6, 'storage_location': 'SHELF:A - B-3'}
+
+        resolved = inventory_service._resolve_location(data)
+
+        location = inventory_service.storage_location_repository.get_by_code('A-B-3')
+        assert resolved['storage_location'] == 'A-B-3'
+        assert resolved['location_id'] == location.id
+        assert 'location_id' not in data
+
+    def test_blank_location_clears_link(self, inventory_service):
+        assert inventory_service._resolve_location({'storage_location': ' '}) == {
+            'storage_location': None, 'location_id': None
+        }
+
+    def test_data_without_location_is_unchanged(self, inventory_service):
+        data = {'quantity': 3}
+        assert inventory_service._resolve_location(data) is data